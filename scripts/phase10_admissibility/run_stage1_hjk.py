@@ -23,6 +23,7 @@ from rich.table import Table  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
 from phase1_foundation.storage.metadata import MetadataStore  # noqa: E402
+from phase10_admissibility.checkpoint import DEFAULT_CHECKPOINT_DIR, LoopCheckpoint  # noqa: E402
 from phase10_admissibility.stage1_pipeline import (  # noqa: E402
     Stage1Config,
     build_reference_generators,
@@ -57,10 +58,22 @@ def parse_args() -> argparse.Namespace:
         default="H,J,K",
         help="Comma-separated list of methods to run (e.g., 'J,K'). Default is all: 'H,J,K'.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Run the Method J/K null generations in this many processes with per-run seeds.",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default=str(DEFAULT_CHECKPOINT_DIR),
+        help="Directory for mid-method checkpoints of the Method J/K run loops.",
+    )
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Re-run completed methods instead of resuming.",
+        help="Re-run completed methods instead of resuming (discards mid-method checkpoints).",
     )
     return parser.parse_args()
 
@@ -156,6 +169,13 @@ def _load_optional_bundle(
         return False, f"{dataset_id}: {exc}"
 
 
+def _loop_checkpoint(args: argparse.Namespace, name: str) -> LoopCheckpoint:
+    checkpoint = LoopCheckpoint(args.checkpoint_dir, name)
+    if args.force:
+        checkpoint.clear()
+    return checkpoint
+
+
 def _log(message: str) -> None:
     stamp = now_utc_iso().replace("T", " ").split(".")[0]
     console.print(f"[dim]{stamp}[/dim] {message}")
@@ -167,6 +187,7 @@ def run_stage1(args: argparse.Namespace) -> None:
         target_tokens=args.target_tokens,
         method_j_null_runs=args.method_j_null_runs,
         method_k_runs=args.method_k_runs,
+        workers=args.workers,
     )
     status_path = Path(args.status_path)
     status = _load_status(status_path, config, args.force)
@@ -189,7 +210,7 @@ def run_stage1(args: argparse.Namespace) -> None:
         "Requested config: "
         f"seed={config.seed}, target_tokens={config.target_tokens}, "
         f"method_j_null_runs={config.method_j_null_runs}, method_k_runs={config.method_k_runs}, "
-        f"force={args.force}"
+        f"workers={config.workers}, force={args.force}"
     )
 
     with active_run(config={"command": "run_phase10_stage1_hjk", "seed": config.seed}) as run:
@@ -313,6 +334,7 @@ def run_stage1(args: argparse.Namespace) -> None:
                 _save_status(status_path, status)
                 _log("Method J started")
                 try:
+                    checkpoint_j = _loop_checkpoint(args, "stage1_method_j")
                     generators_j = build_reference_generators(voynich_bundle.lines, config.seed)
                     j_result = run_method_j(
                         voynich_bundle=voynich_bundle,
@@ -321,6 +343,8 @@ def run_stage1(args: argparse.Namespace) -> None:
                         null_runs=config.method_j_null_runs,
                         seed=config.seed,
                         progress=_log,
+                        workers=config.workers,
+                        checkpoint=checkpoint_j,
                     )
                     save_j = ProvenanceWriter.save_results(
                         j_result,
@@ -337,6 +361,7 @@ def run_stage1(args: argparse.Namespace) -> None:
                         error=None,
                     )
                     _save_status(status_path, status)
+                    checkpoint_j.clear()
                     _log(f"Method J complete: decision={j_result.get('decision')}")
                 except Exception as exc:
                     _set_step(status, "method_j", "failed", error=str(exc))
@@ -365,6 +390,7 @@ def run_stage1(args: argparse.Namespace) -> None:
                 _save_status(status_path, status)
                 _log("Method K started")
                 try:
+                    checkpoint_k = _loop_checkpoint(args, "stage1_method_k")
                     k_result = run_method_k(
                         voynich_bundle=voynich_bundle,
                         latin_bundle=latin_bundle,
@@ -372,6 +398,8 @@ def run_stage1(args: argparse.Namespace) -> None:
                         num_runs=config.method_k_runs,
                         seed=config.seed,
                         progress=_log,
+                        workers=config.workers,
+                        checkpoint=checkpoint_k,
                     )
                     save_k = ProvenanceWriter.save_results(
                         k_result,
@@ -388,6 +416,7 @@ def run_stage1(args: argparse.Namespace) -> None:
                         error=None,
                     )
                     _save_status(status_path, status)
+                    checkpoint_k.clear()
                     _log(f"Method K complete: decision={k_result.get('decision')}")
                 except Exception as exc:
                     _set_step(status, "method_k", "failed", error=str(exc))
@@ -23,7 +23,13 @@ from rich.table import Table  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
 from phase1_foundation.storage.metadata import MetadataStore  # noqa: E402
+from phase10_admissibility.checkpoint import DEFAULT_CHECKPOINT_DIR, LoopCheckpoint  # noqa: E402
+from phase10_admissibility.feature_store import (  # noqa: E402
+    DEFAULT_FEATURE_STORE_DIR,
+    IllustrationFeatureStore,
+)
 from phase10_admissibility.stage2_pipeline import (  # noqa: E402
+    VISUAL_FEATURE_VERSION,
     Stage2Config,
     build_cross_linguistic_manifest,
     build_illustration_features,
@@ -49,7 +55,38 @@ def parse_args() -> argparse.Namespace:
         default="folios_full,tiff,folios_1000",
     )
     parser.add_argument("--image-max-side", type=int, default=1400)
+    parser.add_argument(
+        "--no-reduced-decode",
+        action="store_true",
+        help="Always decode scans at full resolution before resizing to --image-max-side.",
+    )
+    parser.add_argument(
+        "--image-workers",
+        type=int,
+        default=None,
+        help="Extract illustration features for new or changed scans in this many processes.",
+    )
+    parser.add_argument(
+        "--feature-store-dir",
+        type=str,
+        default=str(DEFAULT_FEATURE_STORE_DIR),
+        help="Per-scan illustration feature store; unchanged scans are not re-extracted.",
+    )
+    parser.add_argument(
+        "--prune-feature-store",
+        action="store_true",
+        help=(
+            "After extraction, delete feature store entries from older feature versions "
+            "and unused entries with this run's --image-max-side and decode mode."
+        ),
+    )
     parser.add_argument("--method-g-permutations", type=int, default=1000)
+    parser.add_argument(
+        "--method-g-stop-alpha",
+        type=float,
+        default=None,
+        help="Stop each Mantel test once neither p-value can fall below this.",
+    )
     parser.add_argument("--method-i-bootstrap", type=int, default=500)
     parser.add_argument("--method-i-min-languages", type=int, default=12)
     parser.add_argument("--language-token-cap", type=int, default=50000)
@@ -58,10 +95,16 @@ def parse_args() -> argparse.Namespace:
         type=str,
         default="results/data/phase10_admissibility/stage2_execution_status.json",
     )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default=str(DEFAULT_CHECKPOINT_DIR),
+        help="Directory for mid-method checkpoints of the Method G permutation tests.",
+    )
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Re-run completed steps instead of resuming.",
+        help="Re-run completed steps instead of resuming (discards mid-method checkpoints).",
     )
     return parser.parse_args()
 
@@ -84,7 +127,9 @@ def _default_status(config: Stage2Config) -> dict[str, Any]:
             "scan_resolution": config.scan_resolution,
             "scan_fallbacks": list(config.scan_fallbacks),
             "image_max_side": config.image_max_side,
+            "image_reduced_decode": config.image_reduced_decode,
             "method_g_permutations": config.method_g_permutations,
+            "method_g_stop_alpha": config.method_g_stop_alpha,
             "method_i_bootstrap": config.method_i_bootstrap,
             "method_i_min_languages": config.method_i_min_languages,
             "language_token_cap": config.language_token_cap,
@@ -181,6 +226,13 @@ def _write_json(path: Path, payload: dict[str, Any]) -> None:
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
+def _loop_checkpoint(args: argparse.Namespace, name: str) -> LoopCheckpoint:
+    checkpoint = LoopCheckpoint(args.checkpoint_dir, name)
+    if args.force:
+        checkpoint.clear()
+    return checkpoint
+
+
 def _log(message: str) -> None:
     stamp = now_utc_iso().replace("T", " ").split(".")[0]
     console.print(f"[dim]{stamp}[/dim] {message}")
@@ -192,7 +244,10 @@ def run_stage2(args: argparse.Namespace) -> None:
         scan_resolution=args.scan_resolution,
         scan_fallbacks=_parse_fallbacks(args.scan_fallbacks),
         image_max_side=args.image_max_side,
+        image_reduced_decode=not args.no_reduced_decode,
+        image_workers=args.image_workers,
         method_g_permutations=args.method_g_permutations,
+        method_g_stop_alpha=args.method_g_stop_alpha,
         method_i_bootstrap=args.method_i_bootstrap,
         method_i_min_languages=args.method_i_min_languages,
         language_token_cap=args.language_token_cap,
@@ -204,7 +259,9 @@ def run_stage2(args: argparse.Namespace) -> None:
         "scan_resolution": config.scan_resolution,
         "scan_fallbacks": list(config.scan_fallbacks),
         "image_max_side": config.image_max_side,
+        "image_reduced_decode": config.image_reduced_decode,
         "method_g_permutations": config.method_g_permutations,
+        "method_g_stop_alpha": config.method_g_stop_alpha,
         "method_i_bootstrap": config.method_i_bootstrap,
         "method_i_min_languages": config.method_i_min_languages,
         "language_token_cap": config.language_token_cap,
@@ -222,6 +279,7 @@ def run_stage2(args: argparse.Namespace) -> None:
         f"seed={config.seed}, resolution={config.scan_resolution}, "
         f"fallbacks={list(config.scan_fallbacks)}, image_max_side={config.image_max_side}, "
         f"method_g_permutations={config.method_g_permutations}, "
+        f"method_g_stop_alpha={config.method_g_stop_alpha}, "
         f"method_i_bootstrap={config.method_i_bootstrap}, "
         f"method_i_min_languages={config.method_i_min_languages}, "
         f"language_token_cap={config.language_token_cap}, force={args.force}"
@@ -300,6 +358,9 @@ def run_stage2(args: argparse.Namespace) -> None:
             )
             _save_status(status_path, status)
             _log("Illustration feature extraction started")
+            feature_store = IllustrationFeatureStore(
+                args.feature_store_dir, feature_version=VISUAL_FEATURE_VERSION
+            )
             illustration_features = build_illustration_features(
                 store=store,
                 scans_root=scans_root,
@@ -307,7 +368,13 @@ def run_stage2(args: argparse.Namespace) -> None:
                 fallback_resolutions=config.scan_fallbacks,
                 max_side=config.image_max_side,
                 progress=lambda msg: _log(f"[illustration] {msg}"),
+                feature_store=feature_store,
+                workers=config.image_workers,
+                reduced_decode=config.image_reduced_decode,
             )
+            if args.prune_feature_store:
+                pruned = feature_store.prune(config.image_max_side, config.image_reduced_decode)
+                _log(f"Pruned {pruned} stale illustration feature store entries")
             saved = ProvenanceWriter.save_results(
                 illustration_features,
                 Path("results/data/phase10_admissibility/illustration_features_machine.json"),
@@ -386,12 +453,15 @@ def run_stage2(args: argparse.Namespace) -> None:
             _set_step(status, "method_g", "running", started_at=now_utc_iso(), error=None)
             _save_status(status_path, status)
             _log("Method G started")
+            checkpoint = _loop_checkpoint(args, "stage2_method_g")
             method_g_result = run_method_g(
                 store=store,
                 illustration_features=illustration_features,
                 permutations=config.method_g_permutations,
                 seed=config.seed,
                 progress=lambda msg: _log(f"[method_g] {msg}"),
+                checkpoint=checkpoint,
+                stop_alpha=config.method_g_stop_alpha,
             )
             method_results["G"] = method_g_result
             saved = ProvenanceWriter.save_results(
@@ -408,6 +478,7 @@ def run_stage2(args: argparse.Namespace) -> None:
                 error=None,
             )
             _save_status(status_path, status)
+            checkpoint.clear()
             _log(f"Method G complete ({method_g_result.get('decision')})")
 
         # Step: Method I
@@ -23,6 +23,7 @@ from rich.table import Table  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
 from phase1_foundation.storage.metadata import MetadataStore  # noqa: E402
+from phase10_admissibility.checkpoint import DEFAULT_CHECKPOINT_DIR, LoopCheckpoint  # noqa: E402
 from phase10_admissibility.stage3_pipeline import (  # noqa: E402
     Stage3Config,
     build_stage3_markdown,
@@ -63,10 +64,19 @@ def parse_args() -> argparse.Namespace:
         type=str,
         default="results/data/phase10_admissibility/stage3_execution_status.json",
     )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default=str(DEFAULT_CHECKPOINT_DIR),
+        help="Directory for mid-method checkpoints of the Method F family searches.",
+    )
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Re-run completed Stage 3 steps instead of resuming.",
+        help=(
+            "Re-run completed Stage 3 steps instead of resuming "
+            "(discards mid-method checkpoints)."
+        ),
     )
     return parser.parse_args()
 
@@ -170,6 +180,13 @@ def _load_stage_summary(path: Path) -> dict[str, Any] | None:
     return results
 
 
+def _loop_checkpoint(args: argparse.Namespace, name: str) -> LoopCheckpoint:
+    checkpoint = LoopCheckpoint(args.checkpoint_dir, name)
+    if args.force:
+        checkpoint.clear()
+    return checkpoint
+
+
 def _log(message: str) -> None:
     stamp = now_utc_iso().replace("T", " ").split(".")[0]
     console.print(f"[dim]{stamp}[/dim] {message}")
@@ -281,10 +298,12 @@ def run_stage3(args: argparse.Namespace) -> None:
             _set_step(status, "method_f", "running", started_at=now_utc_iso(), error=None)
             _save_status(status_path, status)
             _log("Method F started")
+            checkpoint = _loop_checkpoint(args, "stage3_method_f")
             method_result = run_method_f(
                 store=store,
                 config=config,
                 progress=lambda msg: _log(f"[method_f] {msg}"),
+                checkpoint=checkpoint,
             )
             saved = ProvenanceWriter.save_results(
                 method_result,
@@ -300,6 +319,7 @@ def run_stage3(args: argparse.Namespace) -> None:
                 error=None,
             )
             _save_status(status_path, status)
+            checkpoint.clear()
             _log(f"Method F complete ({method_result.get('decision')})")
 
         # Stage summary
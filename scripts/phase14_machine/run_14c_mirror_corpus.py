@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Phase 14C: Mirror Corpus Generation and Validation."""
 
+import argparse
 import json
 import math
 import sys
@@ -29,6 +30,13 @@ def calculate_entropy(tokens):
     return -sum((c/total) * math.log2(c/total) for c in counts.values() if c > 0)
 
 def main():
+    parser = argparse.ArgumentParser(description="Run Phase 14C: Mirror Corpus Validation.")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Generate the mirror corpus in parallel scribe-block shards with this many processes.",
+    )
+    args = parser.parse_args()
+
     console.print("[bold magenta]Phase 14C: Mirror Corpus Validation (The 100% Fit Test)[/bold magenta]")
 
     if not PALETTE_PATH.exists():
@@ -47,7 +55,10 @@ def main():
 
     # 3. Generate Mirror Corpus
     console.print("Generating 100,000 synthetic lines from high-fidelity engine...")
-    syn_lines = emulator.generate_mirror_corpus(100000)
+    if args.workers:
+        syn_lines = emulator.generate_mirror_corpus_sharded(100000, workers=args.workers)
+    else:
+        syn_lines = emulator.generate_mirror_corpus(100000)
     syn_tokens = [t for l in syn_lines for t in l]
 
     # 4. Load Real Baseline for Final Comparison
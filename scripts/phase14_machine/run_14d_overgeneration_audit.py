@@ -5,6 +5,7 @@ Measures the 'Unattested Form Rate' (UFR) to ensure the lattice is a narrow
 gate, not a permissive nonsense generator.
 """
 
+import argparse
 import json
 import sys
 from collections import Counter
@@ -20,6 +21,7 @@ from phase1_foundation.core.data_loading import load_canonical_lines  # noqa: E4
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.storage.metadata import MetadataStore  # noqa: E402
 from phase14_machine.high_fidelity_emulator import HighFidelityVolvelle  # noqa: E402
+from phase14_machine.ngram_audit import NgramAudit  # noqa: E402
 
 DB_PATH = "sqlite:///data/voynich.db"
 PALETTE_PATH = project_root / "results/data/phase14_machine/full_palette_grid.json"
@@ -27,6 +29,13 @@ OUTPUT_PATH = project_root / "results/data/phase14_machine/overgeneration_audit.
 console = Console()
 
 def main():
+    parser = argparse.ArgumentParser(description="Run Phase 14D: Overgeneration Audit.")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Generate the mirror corpus in parallel scribe-block shards with this many processes.",
+    )
+    args = parser.parse_args()
+
     console.print("[bold magenta]Phase 14D: Overgeneration Audit (The Narrow Gate Test)[/bold magenta]")
 
     if not PALETTE_PATH.exists():
@@ -52,7 +61,10 @@ def main():
     # 4. Generate Large Synthetic Corpus
     num_lines = 100000
     console.print(f"Generating {num_lines} synthetic lines...")
-    syn_lines = emulator.generate_mirror_corpus(num_lines)
+    if args.workers:
+        syn_lines = emulator.generate_mirror_corpus_sharded(num_lines, workers=args.workers)
+    else:
+        syn_lines = emulator.generate_mirror_corpus(num_lines)
     syn_tokens = [t for l in syn_lines for t in l]
     syn_vocab = set(syn_tokens)
 
@@ -61,13 +73,8 @@ def main():
     ufr = len(unattested) / len(syn_vocab) if syn_vocab else 0
 
     # 5.1 Trigram Analysis (The Sequential Overgeneration)
-    def get_trigrams(lines):
-        return set(tuple(line[i:i+3]) for line in lines for i in range(len(line) - 2))
-
-    real_trigrams = get_trigrams(real_lines)
-    syn_trigrams = get_trigrams(syn_lines)
-    unattested_trigrams = syn_trigrams - real_trigrams
-    tufr = len(unattested_trigrams) / len(syn_trigrams) if syn_trigrams else 0
+    trigrams = NgramAudit(real_lines, orders=(3,)).update(syn_lines).results()[3]
+    tufr = trigrams["rate"]
 
     # Top unattested forms
     counts = Counter(syn_tokens)
@@ -79,9 +86,9 @@ def main():
         "num_syn_tokens": len(syn_vocab),
         "num_unattested_forms": len(unattested),
         "unattested_form_rate": ufr,
-        "num_real_trigrams": len(real_trigrams),
-        "num_syn_trigrams": len(syn_trigrams),
-        "num_unattested_trigrams": len(unattested_trigrams),
+        "num_real_trigrams": trigrams["real_count"],
+        "num_syn_trigrams": trigrams["syn_count"],
+        "num_unattested_trigrams": trigrams["unattested_count"],
         "trigram_unattested_rate": tufr,
         "top_unattested": top_unattested
     }
@@ -18,10 +18,11 @@ sys.path.insert(0, str(project_root / "src"))
 from phase1_foundation.core.data_loading import load_canonical_lines  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.storage.metadata import MetadataStore  # noqa: E402
-from phase14_machine.palette_solver import GlobalPaletteSolver  # noqa: E402
+from phase14_machine.palette_cache import PaletteCache  # noqa: E402
 
 DB_PATH = "sqlite:///data/voynich.db"
 OUTPUT_PATH = project_root / "results/data/phase14_machine/ablation_results.json"
+CACHE_DIR = project_root / "results/cache/phase14"
 console = Console()
 
 def calculate_mdl(total_tokens, vocab_bits, num_windows, lattice_map, window_contents):
@@ -45,15 +46,15 @@ def main():
     total_tokens = len(all_tokens)
 
     # 2. Solve Grid (Once)
-    solver = GlobalPaletteSolver()
-    solver.ingest_data([], real_lines, top_n=2000)
-    solved_pos = solver.solve_grid(iterations=20)
+    cache = PaletteCache(CACHE_DIR)
 
     # 3. Test different Window counts
     results = []
     for k in [10, 20, 50, 100, 200]:
         console.print(f"Testing K={k} windows...")
-        lattice_data = solver.cluster_lattice(solved_pos, num_windows=k)
+        lattice_data = cache.solve_lattice(
+            real_lines, top_n=2000, iterations=20, num_windows=k, reorder=False
+        )
 
         mdl = calculate_mdl(
             total_tokens,
@@ -19,10 +19,11 @@ from phase1_foundation.core.data_loading import load_canonical_lines  # noqa: E4
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.storage.metadata import MetadataStore  # noqa: E402
 from phase14_machine.evaluation_engine import EvaluationEngine  # noqa: E402
-from phase14_machine.palette_solver import GlobalPaletteSolver  # noqa: E402
+from phase14_machine.palette_cache import PaletteCache  # noqa: E402
 
 DB_PATH = "sqlite:///data/voynich.db"
 OUTPUT_PATH = project_root / "results/data/phase14_machine/minimality_sweep.json"
+CACHE_DIR = project_root / "results/cache/phase14"
 console = Console()
 
 def main():
@@ -35,26 +36,23 @@ def main():
     # real_tokens = [t for line in real_lines for t in line]
 
     # 2. Solve Grid (Once, for 2000 tokens for speed)
-    solver = GlobalPaletteSolver()
-    solver.ingest_data([], real_lines, top_n=2000)
-    solved_pos = solver.solve_grid(iterations=20)
+    cache = PaletteCache(CACHE_DIR)
+    solved_pos = cache.solve_grid(real_lines, top_n=2000, iterations=20)
 
     vocab = set(solved_pos.keys())
     engine = EvaluationEngine(vocab)
 
-    # 3. Sweep K
-    results = []
-    for k in [2, 5, 10, 25, 50, 75, 100, 200, 500]:
-        console.print(f"Testing Complexity K={k} windows...")
-        lattice_data = solver.cluster_lattice(solved_pos, num_windows=k)
-
-        # Admissibility
-        metrics = engine.calculate_admissibility(
-            real_lines,
-            lattice_data["word_to_window"],
-            lattice_data["window_contents"]
-        )
+    # 3. Sweep K (each K warm-started from the previous one)
+    ks = [2, 5, 10, 25, 50, 75, 100, 200, 500]
+    console.print(f"Testing Complexity K={ks} windows...")
+    sweep = cache.solve_lattice_sweep(real_lines, ks, top_n=2000, iterations=20, reorder=False)
+    lattices = [(sweep[k]["word_to_window"], sweep[k]["window_contents"]) for k in ks]
 
+    # Admissibility for every K in one pass over the corpus
+    all_metrics = engine.evaluate_many(real_lines, lattices)
+
+    results = []
+    for k, metrics in zip(ks, all_metrics, strict=True):
         # MDL Calculation
         # L(model) = K * avg_win_size * bits + edges * bits
         # Simplified: L(model) approx proportional to len(vocab) * log2(K)
@@ -37,7 +37,7 @@ from phase1_foundation.storage.metadata import (  # noqa: E402
     TranscriptionLineRecord,
     TranscriptionTokenRecord,
 )
-from phase14_machine.palette_solver import GlobalPaletteSolver  # noqa: E402
+from phase14_machine.palette_cache import PaletteCache  # noqa: E402
 
 DB_PATH = "sqlite:///data/voynich.db"
 SLIP_PATH = (
@@ -46,6 +46,7 @@ SLIP_PATH = (
 OUTPUT_PATH = (
     project_root / "results/data/phase14_machine/multisplit_holdout.json"
 )
+CACHE_DIR = project_root / "results/cache/phase14"
 console = Console()
 
 SECTIONS = {
@@ -325,11 +326,10 @@ def main():
 
         # ── Train Lattice ──
         console.print("  Training lattice on remaining sections...")
-        solver = GlobalPaletteSolver()
         # Conservative: transitions only (no slips) for holdout
-        solver.ingest_data([], train_lines, top_n=None)
-        solved_pos = solver.solve_grid(iterations=20)
-        lattice_data = solver.cluster_lattice(solved_pos, num_windows=50)
+        lattice_data = PaletteCache(CACHE_DIR).solve_lattice(
+            train_lines, top_n=None, iterations=20, num_windows=50, reorder=False
+        )
 
         lattice_map = lattice_data["word_to_window"]
         window_contents = lattice_data["window_contents"]
@@ -275,13 +275,14 @@ def main():
     console.print(f"Layout solved for {len(solved_pos)} tokens.")
 
     # ── 4. Sweep K values ──
+    # Each K is warm-started from the centroids of the previous one
+    lattices = solver.cluster_lattice_sweep(solved_pos, K_VALUES)
     sweep_results = []
 
     for k in K_VALUES:
         console.print(f"\n  [bold]K = {k}[/bold]")
 
-        # Re-cluster at this K
-        lattice_data = solver.cluster_lattice(solved_pos, num_windows=k)
+        lattice_data = lattices[k]
         lattice_map = lattice_data["word_to_window"]
         window_contents = lattice_data["window_contents"]
         num_windows = len(window_contents)
@@ -36,6 +36,7 @@ from phase1_foundation.storage.metadata import (  # noqa: E402
     TranscriptionTokenRecord,
 )
 from phase14_machine.high_fidelity_emulator import HighFidelityVolvelle  # noqa: E402
+from phase14_machine.ngram_audit import NgramAudit  # noqa: E402
 
 DB_PATH = "sqlite:///data/voynich.db"
 PALETTE_PATH = (
@@ -230,28 +231,18 @@ def compute_entropy_profile(lines):
 
 def compute_ngram_overlap(real_lines, syn_lines, max_n=5):
     """Compute n-gram overlap and overgeneration for n=2..max_n."""
+    audit = NgramAudit(real_lines, orders=range(2, max_n + 1)).update(syn_lines)
     results = {}
-    for n in range(2, max_n + 1):
-        real_ngrams = set()
-        syn_ngrams = set()
-        for line in real_lines:
-            for i in range(len(line) - n + 1):
-                real_ngrams.add(tuple(line[i:i + n]))
-        for line in syn_lines:
-            for i in range(len(line) - n + 1):
-                syn_ngrams.add(tuple(line[i:i + n]))
-
-        overlap = real_ngrams & syn_ngrams
-        syn_only = syn_ngrams - real_ngrams
-
+    for n, counts in audit.results().items():
+        real_unique, syn_unique, overlap = counts["real_count"], counts["syn_count"], counts["overlap"]
         results[f"{n}-gram"] = {
-            "real_unique": len(real_ngrams),
-            "syn_unique": len(syn_ngrams),
-            "overlap": len(overlap),
-            "overlap_frac_of_real": round(len(overlap) / len(real_ngrams), 4) if real_ngrams else 0,
-            "syn_unattested": len(syn_only),
-            "unattested_frac": round(len(syn_only) / len(syn_ngrams), 4) if syn_ngrams else 0,
-            "overgeneration_ratio": round(len(syn_ngrams) / len(real_ngrams), 2) if real_ngrams else 0,
+            "real_unique": real_unique,
+            "syn_unique": syn_unique,
+            "overlap": overlap,
+            "overlap_frac_of_real": round(overlap / real_unique, 4) if real_unique else 0,
+            "syn_unattested": counts["unattested_count"],
+            "unattested_frac": round(counts["rate"], 4) if syn_unique else 0,
+            "overgeneration_ratio": round(syn_unique / real_unique, 2) if real_unique else 0,
         }
     return results
 
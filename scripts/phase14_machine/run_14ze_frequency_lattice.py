@@ -30,6 +30,7 @@ from phase1_foundation.storage.metadata import (
     TranscriptionLineRecord,
     TranscriptionTokenRecord,
 )
+from phase14_machine.palette_cache import PaletteCache
 from phase14_machine.palette_solver import GlobalPaletteSolver
 
 console = Console()
@@ -40,6 +41,7 @@ DB_PATH = "sqlite:///data/voynich.db"
 SLIP_PATH = Path("results/data/phase12_mechanical/slip_detection_results.json")
 PALETTE_PATH = Path("results/data/phase14_machine/reordered_palette.json")
 OUTPUT_PATH = Path("results/data/phase14_machine/frequency_lattice.json")
+CACHE_DIR = Path("results/cache/phase14")
 
 SECTIONS = {
     "Herbal A": (1, 57),
@@ -320,14 +322,8 @@ def build_frequency_weighted_lattice(lines, slips, top_n=8000):
 
 def build_uniform_lattice(lines, slips, top_n=8000):
     """Build the standard uniform-weighted lattice (baseline)."""
-    solver = GlobalPaletteSolver()
-    solver.ingest_data(slips, lines, top_n=top_n)
-    solved_pos = solver.solve_grid(iterations=20)
-    lattice_data = solver.cluster_lattice(solved_pos, num_windows=NUM_WINDOWS)
-    reordered = solver.reorder_windows(
-        lattice_data["word_to_window"],
-        lattice_data["window_contents"],
-        lines,
+    reordered = PaletteCache(CACHE_DIR).solve_lattice(
+        lines, slips, top_n=top_n, iterations=20, num_windows=NUM_WINDOWS
     )
     return reordered["word_to_window"], reordered["window_contents"]
 
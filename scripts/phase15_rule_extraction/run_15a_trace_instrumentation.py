@@ -23,6 +23,8 @@ from phase14_machine.high_fidelity_emulator import HighFidelityVolvelle  # noqa:
 DB_PATH = "sqlite:///data/voynich.db"
 PALETTE_PATH = project_root / "results/data/phase14_machine/full_palette_grid.json"
 OUTPUT_PATH = project_root / "results/data/phase15_rule_extraction/choice_stream_trace.json"
+# Columnar copy of the same choices, read by 15C/15D/16B/17C when present
+COLUMNAR_PATH = OUTPUT_PATH.with_suffix(".npz")
 console = Console()
 
 def main():
@@ -57,11 +59,12 @@ def main():
 
     results = {
         "num_decisions": len(log),
-        "choices": log
+        "choices": log.to_records()
     }
 
     ProvenanceWriter.save_results(results, OUTPUT_PATH)
-    console.print(f"Artifact saved to: [bold]{OUTPUT_PATH}[/bold]")
+    log.save(COLUMNAR_PATH)
+    console.print(f"Artifact saved to: [bold]{OUTPUT_PATH}[/bold] (columnar: {COLUMNAR_PATH.name})")
 
 if __name__ == "__main__":
     with active_run(config={"seed": 42, "command": "run_15a_trace_instrumentation"}):
@@ -16,6 +16,7 @@ from rich.table import Table
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from phase1_foundation.core.choice_log import ChoiceLog  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
 from phase15_rule_extraction.bias import BiasAnalyzer  # noqa: E402
@@ -31,10 +32,13 @@ def main():
         console.print(f"[red]Error: Trace data not found at {TRACE_PATH}. Run 15A first.[/red]")
         return
 
-    # 1. Load Instrumented Trace
-    with open(TRACE_PATH) as f:
-        trace_data = json.load(f)["results"]
-    choices = trace_data["choices"]
+    # 1. Load Instrumented Trace (columnar copy when 15A wrote one)
+    if TRACE_PATH.with_suffix(".npz").exists():
+        choices = ChoiceLog.load(TRACE_PATH.with_suffix(".npz"))
+    else:
+        with open(TRACE_PATH) as f:
+            trace_data = json.load(f)["results"]
+        choices = trace_data["choices"]
 
     # 2. Analyze Bias & Compressibility
     analyzer = BiasAnalyzer(choices)
@@ -16,6 +16,7 @@ from rich.table import Table
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from phase1_foundation.core.choice_log import ChoiceLog  # noqa: E402
 from phase1_foundation.core.data_loading import load_canonical_lines  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
@@ -42,16 +43,19 @@ def main():
         console.print(f"[red]Error: Choice stream not found at {CHOICE_STREAM_PATH}. Run 15A first.[/red]")
         return
 
-    with open(CHOICE_STREAM_PATH) as f:
-        trace_data = json.load(f)
-
-    # Handle provenance-wrapped format
-    if "results" in trace_data:
-        choices = trace_data["results"].get("choices", [])
-        if not choices:
-            choices = trace_data["results"].get("choice_stream", [])
+    if CHOICE_STREAM_PATH.with_suffix(".npz").exists():
+        choices = ChoiceLog.load(CHOICE_STREAM_PATH.with_suffix(".npz"))
     else:
-        choices = trace_data if isinstance(trace_data, list) else []
+        with open(CHOICE_STREAM_PATH) as f:
+            trace_data = json.load(f)
+
+        # Handle provenance-wrapped format
+        if "results" in trace_data:
+            choices = trace_data["results"].get("choices", [])
+            if not choices:
+                choices = trace_data["results"].get("choice_stream", [])
+        else:
+            choices = trace_data if isinstance(trace_data, list) else []
 
     if not choices:
         console.print("[red]No choice records found in trace file.[/red]")
@@ -15,6 +15,7 @@ from rich.console import Console
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from phase1_foundation.core.choice_log import ChoiceLog  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
 from phase16_physical_grounding.correlation import EffortCorrelationAnalyzer  # noqa: E402
@@ -34,9 +35,12 @@ def main():
         console.print(f"[red]Error: Trace or Cost data missing at {TRACE_PATH} or {COST_PATH}[/red]")
         return
 
-    # 1. Load Data
-    with open(TRACE_PATH) as f:
-        choices = json.load(f)["results"]["choices"]
+    # 1. Load Data (columnar choice log when 15A wrote one)
+    if TRACE_PATH.with_suffix(".npz").exists():
+        choices = ChoiceLog.load(TRACE_PATH.with_suffix(".npz"))
+    else:
+        with open(TRACE_PATH) as f:
+            choices = json.load(f)["results"]["choices"]
     with open(COST_PATH) as f:
         costs = json.load(f)["results"]["word_costs"]
 
@@ -19,6 +19,7 @@ from rich.table import Table
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from phase1_foundation.core.choice_log import ChoiceLog  # noqa: E402
 from phase1_foundation.core.provenance import ProvenanceWriter  # noqa: E402
 from phase1_foundation.runs.manager import active_run  # noqa: E402
 from phase17_finality.residual import ResidualBandwidthAnalyzer  # noqa: E402
@@ -36,11 +37,14 @@ def main():
     if not CHOICE_STREAM_PATH.exists():
         console.print(f"[red]Error: Choice stream trace missing at {CHOICE_STREAM_PATH}.[/red]")
         return
-    with open(CHOICE_STREAM_PATH) as f:
-        trace_data = json.load(f)
-    choices = trace_data.get("results", trace_data).get("choices", [])
-    if not choices:
-        choices = trace_data.get("results", trace_data).get("choice_stream", [])
+    if CHOICE_STREAM_PATH.with_suffix(".npz").exists():
+        choices = ChoiceLog.load(CHOICE_STREAM_PATH.with_suffix(".npz"))
+    else:
+        with open(CHOICE_STREAM_PATH) as f:
+            trace_data = json.load(f)
+        choices = trace_data.get("results", trace_data).get("choices", [])
+        if not choices:
+            choices = trace_data.get("results", trace_data).get("choice_stream", [])
     console.print(f"Loaded {len(choices)} choice records.")
 
     # A1.1: Conditional entropy chain
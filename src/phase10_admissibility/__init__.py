@@ -1,5 +1,7 @@
 """Phase 10 admissibility workflows."""
 
+from .checkpoint import DEFAULT_CHECKPOINT_DIR, LoopCheckpoint
+from .feature_store import IllustrationFeatureStore
 from .stage1_pipeline import (
     CorpusBundle,
     Stage1Config,
@@ -38,6 +40,9 @@ from .stage4_pipeline import (
 )
 
 __all__ = [
+    "DEFAULT_CHECKPOINT_DIR",
+    "LoopCheckpoint",
+    "IllustrationFeatureStore",
     "CorpusBundle",
     "Stage1Config",
     "build_reference_generators",
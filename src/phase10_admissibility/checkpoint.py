@@ -0,0 +1,141 @@
+"""
+Resumable checkpoints for long-running Phase 10 loops.
+
+Null calibrations, synthetic runs, parameter scans and permutation tests
+all follow the same shape: a fixed number of iterations, driven by one or
+more seeded ``np.random.Generator`` streams, accumulating partial values
+and reporting through a ``progress`` callback. ``LoopCheckpoint`` persists
+that partial state (completed count, values so far, RNG bit-generator
+states) so an interrupted loop restarts where it stopped and reaches the
+same final result as an uninterrupted one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+DEFAULT_CHECKPOINT_DIR = Path("core_status/phase10_admissibility/checkpoints")
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+class LoopCheckpoint:
+    """
+    Periodic on-disk state of one resumable loop.
+
+    The file ``<directory>/<name>.json`` stores the loop's ``fingerprint``
+    (every input that determines its results), the number of completed
+    iterations, the partial values and the RNG states. ``resume`` ignores a
+    file whose fingerprint differs, so a changed config starts fresh rather
+    than mixing runs. ``child`` derives the checkpoint of a nested or
+    sibling loop (e.g. one per family or per permutation test).
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CHECKPOINT_DIR,
+        name: str = "checkpoint",
+        fingerprint: dict[str, Any] | None = None,
+        every: int = 10,
+    ) -> None:
+        self.directory = Path(directory)
+        self.name = name
+        self.fingerprint = _jsonable(dict(fingerprint or {}))
+        self.every = max(1, int(every))
+        self._last_saved = 0
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"{self.name}.json"
+
+    def child(self, name: str, every: int | None = None, **fingerprint: Any) -> LoopCheckpoint:
+        return LoopCheckpoint(
+            directory=self.directory,
+            name=f"{self.name}.{name}",
+            fingerprint={**self.fingerprint, **fingerprint},
+            every=self.every if every is None else every,
+        )
+
+    def resume(
+        self,
+        *rngs: np.random.Generator,
+        progress: Callable[[str], None] | None = None,
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Return ``(completed, values)`` from a matching checkpoint, restoring ``rngs``.
+
+        Returns ``(0, {})`` and leaves the generators untouched when there is
+        no checkpoint or it was written for a different fingerprint.
+        """
+        self._last_saved = 0
+        if not self.path.exists():
+            return 0, {}
+        with self.path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("fingerprint") != self.fingerprint:
+            return 0, {}
+        states = payload.get("rng_states", [])
+        if len(states) != len(rngs):
+            raise ValueError(
+                f"Checkpoint {self.path} holds {len(states)} RNG states, expected {len(rngs)}."
+            )
+        for rng, state in zip(rngs, states, strict=True):
+            rng.bit_generator.state = state
+        completed = int(payload["completed"])
+        self._last_saved = completed
+        if progress and completed:
+            progress(f"Resuming {self.name} from checkpoint at {completed}/{payload['total']}")
+        return completed, payload.get("values", {})
+
+    def update(
+        self,
+        completed: int,
+        total: int,
+        values: dict[str, Any],
+        *rngs: np.random.Generator,
+    ) -> None:
+        """Save once ``every`` more iterations have completed, and always on the last one."""
+        if completed - self._last_saved >= self.every or completed >= total:
+            self.save(completed, total, values, *rngs)
+
+    def save(
+        self,
+        completed: int,
+        total: int,
+        values: dict[str, Any],
+        *rngs: np.random.Generator,
+    ) -> None:
+        payload = {
+            "fingerprint": self.fingerprint,
+            "completed": int(completed),
+            "total": int(total),
+            "values": _jsonable(values),
+            "rng_states": [_jsonable(rng.bit_generator.state) for rng in rngs],
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, self.path)
+        self._last_saved = int(completed)
+
+    def clear(self) -> None:
+        """Delete this checkpoint and those of all its children."""
+        for path in [self.path, *self.directory.glob(f"{self.name}.*.json")]:
+            path.unlink(missing_ok=True)
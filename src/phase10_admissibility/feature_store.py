@@ -0,0 +1,145 @@
+"""
+Persistent store of per-scan illustration features (Phase 10 Method G).
+
+Decoding a folio scan and running the edge, threshold, component and
+contour passes dominates Stage 2 illustration extraction, yet the scans
+rarely change between runs. ``IllustrationFeatureStore`` keeps one JSON
+entry per extracted scan under ``results/cache/phase10/illustration_features/``::
+
+    <sha256>.json   {"checksum", "max_side", "feature_version", "reduced_decode", "features"}
+
+An entry is keyed by the SHA-256 of the scan bytes, ``max_side``, the
+feature-code version and the decode mode, so an edited or replaced scan, a
+different target size or a change to the extraction code each miss and
+are recomputed, while every other scan is reused as is. The store
+remembers which entries it read or wrote. ``prune`` deletes entries from
+an older feature version, and entries with the run's ``max_side`` and
+decode mode that the run did not use (replaced scans). Entries for other
+settings are kept.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEATURE_STORE_DIR = Path("results/cache/phase10/illustration_features")
+
+_CHUNK_BYTES = 1 << 20
+
+
+def file_checksum(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IllustrationFeatureStore:
+    """
+    Content-addressed on-disk store of visual feature dictionaries.
+
+    Args:
+        store_dir: Directory holding the ``.json`` entries.
+        feature_version: Version of the extraction code; part of every key.
+            Pass ``stage2_pipeline.VISUAL_FEATURE_VERSION``.
+    """
+
+    def __init__(self, store_dir: Path = DEFAULT_FEATURE_STORE_DIR, *, feature_version: int):
+        self.store_dir = Path(store_dir)
+        self.feature_version = int(feature_version)
+        self._used: set[str] = set()
+
+    def key(self, checksum: str, max_side: int, reduced_decode: bool) -> str:
+        parts = f"{checksum}:{int(max_side)}:{self.feature_version}:{int(bool(reduced_decode))}"
+        return hashlib.sha256(parts.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.store_dir / f"{key}.json"
+
+    def get(self, checksum: str, max_side: int, reduced_decode: bool) -> dict[str, float] | None:
+        key = self.key(checksum, max_side, reduced_decode)
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Discarding unreadable feature store entry %s: %s", path.name, exc)
+            path.unlink(missing_ok=True)
+            return None
+        self._used.add(key)
+        return {str(name): float(value) for name, value in payload["features"].items()}
+
+    def put(
+        self,
+        checksum: str,
+        max_side: int,
+        reduced_decode: bool,
+        features: dict[str, float],
+    ) -> None:
+        payload: dict[str, Any] = {
+            "checksum": checksum,
+            "max_side": int(max_side),
+            "feature_version": self.feature_version,
+            "reduced_decode": bool(reduced_decode),
+            "features": features,
+        }
+        key = self.key(checksum, max_side, reduced_decode)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._used.add(key)
+
+    def entries(self) -> list[Path]:
+        if not self.store_dir.is_dir():
+            return []
+        return sorted(self.store_dir.glob("*.json"))
+
+    def prune(self, max_side: int, reduced_decode: bool) -> int:
+        """
+        Delete stale entries; returns the count removed.
+
+        An entry is stale when it was written by another feature version,
+        or when it has this ``max_side`` and decode mode but was not read or
+        written through this store. Call this only after a run that looked
+        up every current scan.
+        """
+        removed = 0
+        for path in self.entries():
+            if path.stem in self._used:
+                continue
+            try:
+                with path.open("r", encoding="utf-8") as handle:
+                    payload = json.load(handle)
+                stale = int(payload["feature_version"]) != self.feature_version or (
+                    int(payload["max_side"]) == int(max_side)
+                    and bool(payload["reduced_decode"]) == bool(reduced_decode)
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                stale = True
+            if stale:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+        self._used.clear()
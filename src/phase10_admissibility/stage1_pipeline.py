@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import datetime
 import math
+import os
 import statistics
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 from sqlalchemy import func
 
+from phase1_foundation.core.encoded_corpus import EncodedCorpus
 from phase1_foundation.core.queries import get_lines_from_store
 from phase1_foundation.storage.metadata import (
     MetadataStore,
@@ -29,6 +32,7 @@ from phase4_inference.projection_diagnostics.line_reset_persistence import (
     LineResetPersistenceConfig,
     LineResetPersistenceGenerator,
 )
+from phase10_admissibility.checkpoint import LoopCheckpoint
 
 EXTRACTION_RULES: dict[str, str] = {
     "line_initial_tokens": "First token of each line",
@@ -44,6 +48,10 @@ EXTRACTION_RULES: dict[str, str] = {
 
 METHOD_J_EDGE_RULES = {"line_initial_tokens", "paragraph_initial_tokens"}
 
+# SeedSequence spawn keys that keep the per-run seeds of each method's null runs apart
+_METHOD_J_SEED_STREAM = 0
+_METHOD_K_SEED_STREAM = 1
+
 
 TYPOLOGY_PROTOTYPES: dict[str, dict[str, Any]] = {
     "alphabet": {
@@ -109,6 +117,7 @@ class Stage1Config:
     target_tokens: int = 120000
     method_j_null_runs: int = 100
     method_k_runs: int = 100
+    workers: int | None = None
 
 
 def now_utc_iso() -> str:
@@ -248,22 +257,35 @@ def type_token_ratio(sequence: list[str]) -> float:
     return float(len(set(sequence)) / len(sequence))
 
 
-def bigram_mutual_information(sequence: list[str]) -> float:
-    if len(sequence) < 2:
+def bigram_mutual_information(sequence: list[str] | EncodedCorpus) -> float:
+    """Mutual information between adjacent tokens of a flat token stream.
+
+    An ``EncodedCorpus`` is read as its concatenated token stream, like the
+    flattened lists the extraction rules produce.
+    """
+    ids = sequence.tokens if isinstance(sequence, EncodedCorpus) else _encode_tokens(sequence)
+    if len(ids) < 2:
         return 0.0
-    prev = sequence[:-1]
-    nxt = sequence[1:]
+    prev = ids[:-1].astype(np.int64)
+    nxt = ids[1:].astype(np.int64)
     n = len(prev)
 
-    prev_counts = Counter(prev)
-    next_counts = Counter(nxt)
-    joint_counts = Counter(zip(prev, nxt, strict=False))
+    vocab_size = int(ids.max()) + 1
+    prev_counts = np.bincount(prev, minlength=vocab_size)
+    next_counts = np.bincount(nxt, minlength=vocab_size)
+    codes, first, joint_counts = np.unique(
+        prev * vocab_size + nxt, return_index=True, return_counts=True
+    )
+    # Accumulate in first-seen order so the float sum is reproducible
+    # regardless of how the stream was encoded.
+    order = np.argsort(first, kind="stable")
 
     mi = 0.0
-    for (a, b), c_ab in joint_counts.items():
+    for code, c_ab in zip(codes[order].tolist(), joint_counts[order].tolist(), strict=True):
+        a, b = divmod(code, vocab_size)
         p_ab = c_ab / n
-        p_a = prev_counts[a] / n
-        p_b = next_counts[b] / n
+        p_a = int(prev_counts[a]) / n
+        p_b = int(next_counts[b]) / n
         mi += p_ab * math.log2(p_ab / (p_a * p_b))
     return float(mi)
 
@@ -657,6 +679,69 @@ def _stability_score(
     }
 
 
+def null_run_seeds(seed: int, stream: int, num_runs: int) -> list[int]:
+    """Generator seed for each null run, spawned from ``SeedSequence(seed)`` on ``stream``."""
+    children = np.random.SeedSequence(seed, spawn_key=(stream,)).spawn(num_runs)
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+
+_NULL_RUN_GENERATORS: dict[str, Any] = {}
+
+
+def _init_null_run_worker(generators: dict[str, Any]) -> None:
+    global _NULL_RUN_GENERATORS
+    _NULL_RUN_GENERATORS = generators
+
+
+_NullRunTask = tuple[str, str, int | None, str, str, int, int]
+
+
+def _null_run(task: _NullRunTask) -> dict[str, Any]:
+    """Generate one null corpus and measure it (Method J rule metrics or Method K features)."""
+    method, family, run_seed, dataset_id, label, target_tokens, lines_per_page = task
+    generator = _NULL_RUN_GENERATORS[family]
+    if run_seed is not None:
+        generator.reseed(run_seed)
+    bundle = generate_bundle_from_generator(
+        generator=generator,
+        dataset_id=dataset_id,
+        label=label,
+        target_tokens=target_tokens,
+        lines_per_page=lines_per_page,
+    )
+    if method == "J":
+        return _method_j_rule_metrics(bundle)
+    return _method_k_features(bundle)
+
+
+def _iter_null_runs(
+    generators: dict[str, Any],
+    tasks: list[_NullRunTask],
+    workers: int | None,
+) -> Iterator[dict[str, Any]]:
+    """Yield ``_null_run`` results in task order.
+
+    Tasks without a seed share each generator's running stream and must run
+    in this process, in order. Seeded tasks are independent; with more than
+    one worker they run in a process pool whose workers each receive the
+    fitted generators once.
+    """
+    global _NULL_RUN_GENERATORS
+    workers = min(workers or 1, os.cpu_count() or 1, max(1, len(tasks)))
+    if workers == 1:
+        previous, _NULL_RUN_GENERATORS = _NULL_RUN_GENERATORS, generators
+        try:
+            for task in tasks:
+                yield _null_run(task)
+        finally:
+            _NULL_RUN_GENERATORS = previous
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_null_run_worker, initargs=(generators,)
+    ) as pool:
+        yield from pool.map(_null_run, tasks)
+
+
 def run_method_j(
     voynich_bundle: CorpusBundle,
     generators: dict[str, Any],
@@ -664,7 +749,20 @@ def run_method_j(
     null_runs: int,
     seed: int,
     progress: Callable[[str], None] | None = None,
+    workers: int | None = None,
+    checkpoint: LoopCheckpoint | None = None,
 ) -> dict[str, Any]:
+    """
+    Method J: extraction-rule metrics of the Voynich against generator nulls.
+
+    With ``workers=None`` the null runs draw from each generator's shared
+    stream in sequence. With ``workers`` set, every run reseeds its
+    generator from ``null_run_seeds(seed, ...)`` and the runs are spread
+    over that many processes; results are gathered in run order, so the
+    output is the same for any worker count (but differs from the shared
+    stream). With a ``checkpoint``, the null calibration resumes from the
+    last saved run.
+    """
     if progress:
         progress(
             "Method J start: "
@@ -687,22 +785,47 @@ def run_method_j(
 
     families = sorted(generators.keys())
     family_counts = {family: 0 for family in families}
-    stride = max(1, null_runs // 20)
+    run_seeds = (
+        null_run_seeds(seed, _METHOD_J_SEED_STREAM, null_runs) if workers else [None] * null_runs
+    )
+    tasks = []
     for i in range(null_runs):
         family = families[i % len(families)]
         family_counts[family] += 1
-        bundle = generate_bundle_from_generator(
-            generator=generators[family],
-            dataset_id=f"{family}_null_{i + 1}",
-            label=f"{family} null {i + 1}",
+        tasks.append((
+            "J", family, run_seeds[i], f"{family}_null_{i + 1}", f"{family} null {i + 1}",
+            target_tokens, lines_per_page,
+        ))
+
+    rngs: list[np.random.Generator] = []
+    start = 0
+    if checkpoint:
+        # Shared-stream runs depend on where each generator's RNG stands; seeded runs do not
+        if not workers:
+            rngs = [generators[family].rng for family in families]
+        checkpoint = checkpoint.child(
+            "null_calibration",
+            method="J",
+            seed=seed,
             target_tokens=target_tokens,
-            lines_per_page=lines_per_page,
+            null_runs=null_runs,
+            null_seeding="per_run" if workers else "shared",
+            voynich_tokens=len(voynich_bundle.tokens),
         )
-        metrics_by_rule = _method_j_rule_metrics(bundle)
+        start, saved = checkpoint.resume(*rngs, progress=progress)
+        if start:
+            null_values = saved["null_values"]
+
+    stride = max(1, null_runs // 20)
+    runs = _iter_null_runs(generators, tasks[start:], workers)
+    for i, metrics_by_rule in enumerate(runs, start=start):
+        family = tasks[i][1]
         for rule, values in metrics_by_rule.items():
             metric_values = values["metrics"]
             for metric_name in null_values[rule]:
                 null_values[rule][metric_name].append(float(metric_values[metric_name]))
+        if checkpoint:
+            checkpoint.update(i + 1, null_runs, {"null_values": null_values}, *rngs)
         if progress and ((i + 1) % stride == 0 or i + 1 == null_runs):
             progress(f"Method J null calibration {i + 1}/{null_runs} (family={family})")
 
@@ -781,6 +904,7 @@ def run_method_j(
             "null_runs": null_runs,
             "family_counts": family_counts,
             "seed": seed,
+            **({"null_seeding": "per_run"} if workers else {}),
         },
         "voynich_rule_metrics": voynich_metrics,
         "null_summary": summary,
@@ -967,7 +1091,14 @@ def run_method_k(
     num_runs: int,
     seed: int,
     progress: Callable[[str], None] | None = None,
+    workers: int | None = None,
+    checkpoint: LoopCheckpoint | None = None,
 ) -> dict[str, Any]:
+    """
+    Method K: residual gap between the Voynich and the closest generator family.
+
+    ``workers`` and ``checkpoint`` control the synthetic runs as in ``run_method_j``.
+    """
     if progress:
         progress(
             "Method K start: "
@@ -1004,16 +1135,46 @@ def run_method_k(
         progress(f"Method K best generator family selected: {best_family}")
 
     synthetic_features: list[dict[str, float]] = []
-    stride = max(1, num_runs // 20)
-    for i in range(num_runs):
-        synthetic_bundle = generate_bundle_from_generator(
-            generator=best_generator,
-            dataset_id=f"{best_family}_run_{i + 1}",
-            label=f"{best_family} run {i + 1}",
+    run_seeds = (
+        null_run_seeds(seed, _METHOD_K_SEED_STREAM, num_runs) if workers else [None] * num_runs
+    )
+    tasks = [
+        (
+            "K",
+            best_family,
+            run_seeds[i],
+            f"{best_family}_run_{i + 1}",
+            f"{best_family} run {i + 1}",
+            target_tokens,
+            lines_per_page,
+        )
+        for i in range(num_runs)
+    ]
+    rngs: list[np.random.Generator] = []
+    start = 0
+    if checkpoint:
+        if not workers:
+            rngs = [best_generator.rng]
+        checkpoint = checkpoint.child(
+            "synthetic_runs",
+            method="K",
+            seed=seed,
             target_tokens=target_tokens,
-            lines_per_page=lines_per_page,
+            num_runs=num_runs,
+            null_seeding="per_run" if workers else "shared",
+            best_family=best_family,
+            voynich_tokens=len(voynich_bundle.tokens),
         )
-        synthetic_features.append(_method_k_features(synthetic_bundle))
+        start, saved = checkpoint.resume(*rngs, progress=progress)
+        if start:
+            synthetic_features = saved["synthetic_features"]
+
+    stride = max(1, num_runs // 20)
+    runs = _iter_null_runs({best_family: best_generator}, tasks[start:], workers)
+    for i, features in enumerate(runs, start=start):
+        synthetic_features.append(features)
+        if checkpoint:
+            checkpoint.update(i + 1, num_runs, {"synthetic_features": synthetic_features}, *rngs)
         if progress and ((i + 1) % stride == 0 or i + 1 == num_runs):
             progress(f"Method K synthetic run {i + 1}/{num_runs}")
 
@@ -1172,6 +1333,7 @@ def run_method_k(
             "target_tokens": target_tokens,
             "num_runs": num_runs,
             "seed": seed,
+            **({"null_seeding": "per_run"} if workers else {}),
         },
         "best_generator_family": best_family,
         "candidate_scores": candidate_scores,
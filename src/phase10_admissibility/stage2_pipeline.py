@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import datetime
 import math
+import os
 import re
 import statistics
 from collections import Counter, defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -22,6 +24,8 @@ from phase1_foundation.storage.metadata import (
     TranscriptionLineRecord,
     TranscriptionTokenRecord,
 )
+from phase10_admissibility.checkpoint import LoopCheckpoint
+from phase10_admissibility.feature_store import IllustrationFeatureStore, file_checksum
 from phase10_admissibility.stage1_pipeline import (
     compression_bits_per_token,
     conditional_entropy_metrics,
@@ -32,6 +36,13 @@ from phase10_admissibility.stage1_pipeline import (
 
 FOLIO_PATTERN = re.compile(r"^f(\d+)([rv])(\d*)$")
 SCAN_FOLIO_PATTERN = re.compile(r"(\d+)([rv])", re.IGNORECASE)
+# Bump when _extract_visual_features returns different values for the same scan
+VISUAL_FEATURE_VERSION = 1
+_REDUCED_READ_FLAGS: tuple[tuple[int, int], ...] = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
 # Unicode-aware word pattern: matches alphabetic runs across scripts.
 WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['-][^\W\d_]+)?", flags=re.UNICODE)
 _CJK_BLOCKS: tuple[tuple[int, int], ...] = (
@@ -77,7 +88,11 @@ class Stage2Config:
     scan_resolution: str = "folios_2000"
     scan_fallbacks: tuple[str, ...] = ("folios_full", "tiff", "folios_1000")
     image_max_side: int = 1400
+    image_reduced_decode: bool = False
+    image_workers: int | None = None
     method_g_permutations: int = 1000
+    # Stop a Mantel test early once its p-value cannot fall below this (None runs all)
+    method_g_stop_alpha: float | None = None
     method_i_bootstrap: int = 500
     method_i_min_languages: int = 12
     language_token_cap: int = 50000
@@ -250,18 +265,60 @@ def _safe_ratio(numerator: float, denominator: float) -> float:
     return float(numerator / denominator)
 
 
-def _extract_visual_features(image_path: Path, max_side: int) -> dict[str, float]:
-    image = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+def _reduced_read_flag(image_path: Path, max_side: int) -> tuple[int, int, int, int]:
+    """
+    Pick the coarsest JPEG DCT-domain reduction that still yields at least
+    ``max_side`` pixels, so the final resize only ever downsamples.
+
+    Returns ``(imread_flag, factor, height, width)`` where the size comes from
+    the file header; ``factor`` is 1 (full decode) when no reduction fits.
+    """
+    if image_path.suffix.lower() not in {".jpg", ".jpeg"}:
+        return cv2.IMREAD_COLOR, 1, 0, 0
+    try:
+        with Image.open(image_path) as header:
+            width, height = header.size
+    except Exception:
+        return cv2.IMREAD_COLOR, 1, 0, 0
+    for factor, flag in _REDUCED_READ_FLAGS:
+        if max(width, height) // factor >= max_side:
+            return flag, factor, height, width
+    return cv2.IMREAD_COLOR, 1, height, width
+
+
+def _read_scan(
+    image_path: Path, max_side: int, reduced_decode: bool
+) -> tuple[np.ndarray, int, int]:
+    """Decode a scan, returning the BGR image and the full-resolution height and width."""
+    flag, factor = cv2.IMREAD_COLOR, 1
+    if reduced_decode:
+        flag, factor, height, width = _reduced_read_flag(image_path, max_side)
+    image = cv2.imread(str(image_path), flag)
     if image is None:
         try:
             pil_image = Image.open(image_path).convert("RGB")
             image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
         except Exception as exc:
             raise RuntimeError(f"Failed to read image: {image_path}") from exc
-
-    original_h, original_w = image.shape[:2]
+        factor = 1
+    if factor == 1:
+        return image, int(image.shape[0]), int(image.shape[1])
+    # imread applies EXIF orientation, which the raw header size does not
+    if abs(image.shape[0] - height / factor) > abs(image.shape[0] - width / factor):
+        height, width = width, height
+    return image, height, width
+
+
+def _extract_visual_features(
+    image_path: Path, max_side: int, reduced_decode: bool = False
+) -> dict[str, float]:
+    image, original_h, original_w = _read_scan(image_path, max_side, reduced_decode)
     scale = min(1.0, float(max_side) / max(original_h, original_w))
-    if scale < 1.0:
+    if image.shape[:2] != (original_h, original_w):
+        # Reduced decode: finish at the size the full-resolution path would produce
+        target = (max(1, round(original_w * scale)), max(1, round(original_h * scale)))
+        image = cv2.resize(image, dsize=target, interpolation=cv2.INTER_AREA)
+    elif scale < 1.0:
         image = cv2.resize(image, dsize=None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
 
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -362,6 +419,25 @@ def _extract_visual_features(image_path: Path, max_side: int) -> dict[str, float
     return features
 
 
+def _extract_scan_features(task: tuple[str, int, bool]) -> dict[str, float]:
+    path, max_side, reduced_decode = task
+    return _extract_visual_features(Path(path), max_side=max_side, reduced_decode=reduced_decode)
+
+
+def _extract_scans(
+    tasks: list[tuple[str, int, bool]],
+    workers: int | None,
+) -> Iterator[dict[str, float]]:
+    """Yield visual features for each task in order, in a process pool when ``workers`` > 1."""
+    workers = min(workers or 1, os.cpu_count() or 1, max(1, len(tasks)))
+    if workers == 1:
+        for task in tasks:
+            yield _extract_scan_features(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_extract_scan_features, tasks)
+
+
 def _load_folio_token_map(
     store: MetadataStore,
     dataset_id: str = "voynich_real",
@@ -404,7 +480,20 @@ def build_illustration_features(
     fallback_resolutions: tuple[str, ...],
     max_side: int,
     progress: Callable[[str], None] | None = None,
+    feature_store: IllustrationFeatureStore | None = None,
+    workers: int | None = None,
+    reduced_decode: bool = False,
 ) -> dict[str, Any]:
+    """
+    Visual features for every transcribed folio with a matching scan.
+
+    Each distinct scan is decoded once. With a ``feature_store``, scans
+    whose checksum, ``max_side`` and feature version already have an entry
+    are reused and only new or changed scans are extracted; ``workers``
+    spreads those extractions over a process pool. ``reduced_decode`` lets
+    JPEG scans be decoded at 1/2, 1/4 or 1/8 resolution when that still
+    covers ``max_side``.
+    """
     if progress:
         progress(
             "Illustration feature extraction start: "
@@ -415,29 +504,57 @@ def build_illustration_features(
     folios = sorted(token_map.keys(), key=folio_sort_key)
     scan_index = _build_scan_index(scans_root, resolution, fallback_resolutions)
 
-    features_by_folio: dict[str, dict[str, Any]] = {}
+    matches: dict[str, dict[str, Any]] = {}
     missing_scan: list[str] = []
-    stride = max(1, len(folios) // 20)
-
-    for idx, folio_id in enumerate(folios):
+    for folio_id in folios:
         match = _match_scan_for_folio(folio_id, scan_index)
         if match is None:
             missing_scan.append(folio_id)
-            continue
+        else:
+            matches[folio_id] = match
+
+    scan_paths = sorted({str(match["chosen"]["path"]) for match in matches.values()})
+    checksums: dict[str, str] = {}
+    features_by_scan: dict[str, dict[str, float]] = {}
+    if feature_store is not None:
+        for path in scan_paths:
+            checksums[path] = file_checksum(Path(path))
+            cached = feature_store.get(checksums[path], max_side, reduced_decode)
+            if cached is not None:
+                features_by_scan[path] = cached
+    pending = [path for path in scan_paths if path not in features_by_scan]
+    if progress:
+        progress(
+            "Illustration scans: "
+            f"unique={len(scan_paths)}, cached={len(features_by_scan)}, to_extract={len(pending)}"
+        )
+
+    stride = max(1, len(pending) // 20)
+    tasks = [(path, max_side, reduced_decode) for path in pending]
+    for idx, visual_features in enumerate(_extract_scans(tasks, workers)):
+        path = pending[idx]
+        features_by_scan[path] = visual_features
+        if feature_store is not None:
+            feature_store.put(checksums[path], max_side, reduced_decode, visual_features)
+        if progress and ((idx + 1) % stride == 0 or idx + 1 == len(pending)):
+            progress(f"Illustration feature extraction {idx + 1}/{len(pending)} scans")
+
+    features_by_folio: dict[str, dict[str, Any]] = {}
+    for folio_id, match in matches.items():
         chosen = match["chosen"]
         scan_path = Path(chosen["path"])
-        visual_features = _extract_visual_features(scan_path, max_side=max_side)
-        features_by_folio[folio_id] = {
+        record = {
             "folio_id": folio_id,
             "section": section_for_folio(folio_id),
             "scan_path": str(scan_path),
             "scan_resolution": str(chosen["resolution"]),
             "scan_candidate_count": int(match["candidate_count"]),
             "token_count": len(token_map.get(folio_id, [])),
-            "visual_features": visual_features,
+            "visual_features": dict(features_by_scan[str(scan_path)]),
         }
-        if progress and ((idx + 1) % stride == 0 or idx + 1 == len(folios)):
-            progress(f"Illustration feature extraction {idx + 1}/{len(folios)} folios")
+        if str(scan_path) in checksums:
+            record["scan_sha256"] = checksums[str(scan_path)]
+        features_by_folio[folio_id] = record
 
     if progress:
         progress(
@@ -452,12 +569,16 @@ def build_illustration_features(
             "resolution": resolution,
             "fallback_resolutions": list(fallback_resolutions),
             "max_side": max_side,
+            "feature_version": VISUAL_FEATURE_VERSION,
+            "reduced_decode": reduced_decode,
         },
         "coverage": {
             "folio_total": len(folios),
             "folio_processed": len(features_by_folio),
             "missing_scan_count": len(missing_scan),
             "missing_scan_folios": sorted(missing_scan, key=folio_sort_key),
+            "scans_extracted": len(pending),
+            "scans_reused": len(scan_paths) - len(pending),
         },
         "folios": features_by_folio,
     }
@@ -511,51 +632,122 @@ def _demean_matrix_by_group(matrix: np.ndarray, groups: list[str]) -> np.ndarray
     return out / norms
 
 
-def _groupwise_permutation_indices(groups: list[str], rng: np.random.Generator) -> np.ndarray:
+def _group_index_arrays(groups: list[str]) -> list[np.ndarray]:
+    """Positions of each group with more than one member, in sorted group order."""
     groups_arr = np.array(groups)
-    out = np.arange(groups_arr.size)
+    out = []
     for group in sorted(set(groups)):
         idx = np.where(groups_arr == group)[0]
-        if idx.size <= 1:
-            continue
+        if idx.size > 1:
+            out.append(idx)
+    return out
+
+
+def _groupwise_permutation_indices(
+    group_indices: list[np.ndarray], n: int, rng: np.random.Generator
+) -> np.ndarray:
+    out = np.arange(n)
+    for idx in group_indices:
         shuffled = np.array(idx, copy=True)
         rng.shuffle(shuffled)
         out[idx] = shuffled
     return out
 
 
+def _permutation_block(
+    rng: np.random.Generator,
+    n: int,
+    group_indices: list[np.ndarray] | None,
+    size: int,
+) -> np.ndarray:
+    """``size`` permutations, drawn in the same order as one-at-a-time sampling."""
+    block = np.empty((size, n), dtype=np.int64)
+    for row in range(size):
+        block[row] = (
+            rng.permutation(n)
+            if group_indices is None
+            else _groupwise_permutation_indices(group_indices, n, rng)
+        )
+    return block
+
+
 def mantel_correlation(
     visual_distance: np.ndarray,
     text_distance: np.ndarray,
     permutations: int,
     seed: int,
     groups: list[str] | None = None,
+    checkpoint: LoopCheckpoint | None = None,
+    progress: Callable[[str], None] | None = None,
+    stop_alpha: float | None = None,
+    block_size: int = 128,
 ) -> dict[str, Any]:
+    """
+    Mantel test of the upper-triangle correlation between two distance matrices.
+
+    Permutations are evaluated in blocks of ``block_size``: the permuted
+    upper-triangle entries of every row are gathered from the flattened
+    text matrix in one indexing step, and their correlations with the
+    pre-standardized visual entries come from a single matrix product.
+
+    With ``stop_alpha`` set, the test stops once both the one-sided and the
+    two-sided p-value over all ``permutations`` are bound to stay at or
+    above ``stop_alpha`` whatever the remaining permutations give. The
+    result then adds ``permutations_done`` and ``stopped_early``; after an
+    early stop the p-values come from the ``permutations_done`` evaluated
+    permutations and the null summary statistics, which a truncated null
+    cannot estimate reliably, are ``None``.
+    """
     if visual_distance.shape != text_distance.shape:
         raise ValueError("Distance matrices must share shape for Mantel correlation.")
     n = int(visual_distance.shape[0])
     if n < 3:
         raise ValueError("Need at least 3 folios for Mantel correlation.")
 
-    tri = np.triu_indices(n, k=1)
-    x = visual_distance[tri]
-    y = text_distance[tri]
+    rows, cols = np.triu_indices(n, k=1)
+    x = visual_distance[rows, cols]
+    y = text_distance[rows, cols]
     observed = float(np.corrcoef(x, y)[0, 1])
 
+    x_centered = x - x.mean()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_unit = x_centered / np.linalg.norm(x_centered)
+    flat_text = np.ascontiguousarray(text_distance, dtype=np.float64).ravel()
+    group_indices = None if groups is None else _group_index_arrays(groups)
+
     rng = np.random.default_rng(seed)
     null = np.empty(permutations, dtype=np.float64)
-    for idx in range(permutations):
-        perm = (
-            rng.permutation(n)
-            if groups is None
-            else _groupwise_permutation_indices(groups, rng)
+    done = 0
+    if checkpoint:
+        done, saved = checkpoint.resume(rng, progress=progress)
+        if done:
+            null[:done] = saved["null"]
+
+    def settled() -> bool:
+        # Even if no remaining permutation reached the observed value, neither
+        # final p-value could drop under stop_alpha
+        exceedances = min(
+            int(np.sum(null[:done] >= observed)),
+            int(np.sum(np.abs(null[:done]) >= abs(observed))),
         )
-        y_perm = text_distance[np.ix_(perm, perm)][tri]
-        null[idx] = float(np.corrcoef(x, y_perm)[0, 1])
-
-    p_one_sided = float((np.sum(null >= observed) + 1) / (permutations + 1))
-    p_two_sided = float((np.sum(np.abs(null) >= abs(observed)) + 1) / (permutations + 1))
-    return {
+        return (exceedances + 1) / (permutations + 1) >= stop_alpha
+
+    while done < permutations and not (stop_alpha is not None and done and settled()):
+        size = min(max(1, block_size), permutations - done)
+        perms = _permutation_block(rng, n, group_indices, size)
+        # Row k holds text_distance[np.ix_(perm, perm)][rows, cols] for the k-th permutation
+        y_perm = flat_text[perms[:, rows] * n + perms[:, cols]]
+        y_perm -= y_perm.mean(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            null[done : done + size] = (y_perm @ x_unit) / np.linalg.norm(y_perm, axis=1)
+        done += size
+        if checkpoint:
+            checkpoint.update(done, permutations, {"null": null[:done]}, rng)
+
+    null = null[:done]
+    p_one_sided = float((np.sum(null >= observed) + 1) / (done + 1))
+    p_two_sided = float((np.sum(np.abs(null) >= abs(observed)) + 1) / (done + 1))
+    result: dict[str, Any] = {
         "r_observed": observed,
         "p_one_sided": p_one_sided,
         "p_two_sided": p_two_sided,
@@ -565,6 +757,13 @@ def mantel_correlation(
         "null_q95": float(np.quantile(null, 0.95)),
         "permutations": permutations,
     }
+    if stop_alpha is not None:
+        result["permutations_done"] = done
+        result["stopped_early"] = done < permutations
+        if result["stopped_early"]:
+            for key in ("null_mean", "null_std", "null_q05", "null_q95"):
+                result[key] = None
+    return result
 
 
 def run_method_g(
@@ -573,6 +772,8 @@ def run_method_g(
     permutations: int,
     seed: int,
     progress: Callable[[str], None] | None = None,
+    checkpoint: LoopCheckpoint | None = None,
+    stop_alpha: float | None = None,
 ) -> dict[str, Any]:
     if progress:
         progress(
@@ -612,12 +813,27 @@ def run_method_g(
     if progress:
         progress("Method G distance matrices computed")
 
+    def permutation_checkpoint(name: str) -> LoopCheckpoint | None:
+        if not checkpoint:
+            return None
+        return checkpoint.child(
+            f"method_g_{name}",
+            every=max(1, permutations // 20),
+            method="G",
+            seed=seed,
+            permutations=permutations,
+            folios=folios,
+        )
+
     full = mantel_correlation(
         visual_distance=visual_distance,
         text_distance=text_distance,
         permutations=permutations,
         seed=seed,
         groups=None,
+        stop_alpha=stop_alpha,
+        checkpoint=permutation_checkpoint("full"),
+        progress=progress,
     )
     if progress:
         progress(
@@ -631,6 +847,9 @@ def run_method_g(
         permutations=permutations,
         seed=seed + 1,
         groups=section_labels,
+        stop_alpha=stop_alpha,
+        checkpoint=permutation_checkpoint("within_section"),
+        progress=progress,
     )
     if progress:
         progress(
@@ -648,6 +867,9 @@ def run_method_g(
         permutations=permutations,
         seed=seed + 2,
         groups=section_labels,
+        stop_alpha=stop_alpha,
+        checkpoint=permutation_checkpoint("residual"),
+        progress=progress,
     )
     if progress:
         progress(
@@ -689,6 +911,7 @@ def run_method_g(
         "config": {
             "permutations": permutations,
             "seed": seed,
+            **({"stop_alpha": stop_alpha} if stop_alpha is not None else {}),
         },
         "folio_count": len(folios),
         "sections_present": sorted(set(section_labels)),
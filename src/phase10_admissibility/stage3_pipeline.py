@@ -3,12 +3,13 @@ from __future__ import annotations
 import datetime
 import math
 import zlib
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any
 
 import numpy as np
 
 from phase1_foundation.storage.metadata import MetadataStore
+from phase10_admissibility.checkpoint import LoopCheckpoint
 from phase10_admissibility.stage1_pipeline import load_dataset_bundle
 
 
@@ -24,6 +25,8 @@ class Stage3Config:
     null_block_min: int = 2
     null_block_max: int = 12
     symbol_alphabet_size: int = 64
+    # Parameter tuples decoded together; bounds the (batch x tokens) symbol matrices
+    decode_batch_size: int = 128
 
 
 @dataclass
@@ -216,6 +219,65 @@ def _symbol_compression_ratio(symbols: np.ndarray) -> float:
     return float(len(compressed) / len(payload))
 
 
+def _row_counts(symbols: np.ndarray, alphabet_size: int) -> np.ndarray:
+    """Per-row symbol counts of a (batch x length) matrix via one offset-encoded bincount."""
+    rows = symbols.shape[0]
+    offsets = (np.arange(rows, dtype=np.int64) * alphabet_size)[:, None]
+    counts = np.bincount((symbols + offsets).ravel(), minlength=rows * alphabet_size)
+    return counts.reshape(rows, alphabet_size).astype(np.float64)
+
+
+def _entropy_from_row_counts(counts: np.ndarray) -> np.ndarray:
+    totals = counts.sum(axis=1, keepdims=True)
+    probs = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+    logs = np.log2(probs, out=np.zeros_like(probs), where=probs > 0)
+    return -np.sum(probs * logs, axis=1)
+
+
+def _batch_symbol_entropy(symbols: np.ndarray, alphabet_size: int) -> np.ndarray:
+    """Row-wise ``_symbol_entropy``."""
+    return _entropy_from_row_counts(_row_counts(symbols, alphabet_size))
+
+
+def _batch_symbol_bigram_mi(symbols: np.ndarray, alphabet_size: int) -> np.ndarray:
+    """Row-wise ``_symbol_bigram_mi``, counting (prev, next) pairs as combined codes."""
+    rows, length = symbols.shape
+    if length < 2:
+        return np.zeros(rows, dtype=np.float64)
+    prev = symbols[:, :-1]
+    nxt = symbols[:, 1:]
+    n = float(length - 1)
+    pairs = alphabet_size * alphabet_size
+    offsets = (np.arange(rows, dtype=np.int64) * pairs)[:, None]
+    joint = np.bincount((prev * alphabet_size + nxt + offsets).ravel(), minlength=rows * pairs)
+    p_ab = joint.reshape(rows, alphabet_size, alphabet_size) / n
+    p_a = _row_counts(prev, alphabet_size) / n
+    p_b = _row_counts(nxt, alphabet_size) / n
+    expected = p_a[:, :, None] * p_b[:, None, :]
+    ratio = np.divide(p_ab, expected, out=np.ones_like(p_ab), where=p_ab > 0)
+    return np.sum(p_ab * np.log2(ratio), axis=(1, 2))
+
+
+def _batch_symbol_zipf_alpha(
+    symbols: np.ndarray, alphabet_size: int, rank_limit: int = 64
+) -> np.ndarray:
+    """Row-wise ``_symbol_zipf_alpha``: closed-form least-squares slope over each row's ranks."""
+    counts = _row_counts(symbols, alphabet_size)
+    freqs = -np.sort(-counts, axis=1)[:, :rank_limit]
+    observed = (counts > 0).sum(axis=1)
+    limit = np.minimum(observed, freqs.shape[1]).astype(np.float64)
+    mask = np.arange(freqs.shape[1])[None, :] < limit[:, None]
+    x = np.where(mask, np.log(np.arange(1, freqs.shape[1] + 1, dtype=np.float64))[None, :], 0.0)
+    y = np.log(np.where(mask, freqs, 1.0))
+    sum_x = x.sum(axis=1)
+    sum_y = y.sum(axis=1)
+    denom = limit * (x * x).sum(axis=1) - sum_x * sum_x
+    numer = limit * (x * y).sum(axis=1) - sum_x * sum_y
+    valid = observed > 5
+    slope = np.divide(numer, denom, out=np.zeros_like(numer), where=valid & (denom != 0))
+    return np.where(valid, -slope, 0.0)
+
+
 def _sample_null_indices(
     rng: np.random.Generator,
     length: int,
@@ -385,6 +447,99 @@ def _decode_symbols(
     raise ValueError(f"Unknown Method F mechanism family: {family}")
 
 
+def _decode_table_batch(
+    attrs: TokenAttributes,
+    params: np.ndarray,
+    alphabet_size: int,
+    source_indices: np.ndarray | None = None,
+) -> np.ndarray:
+    width, step_r, step_c, offset, attr_idx, mix, bias = (params[:, [k]] for k in range(7))
+    idx = attrs.index[None, :]
+    if source_indices is None:
+        source = attrs.attr_stack[attr_idx[:, 0]]
+    else:
+        source = attrs.attr_stack[attr_idx, source_indices]
+
+    grille = (step_r * (idx // width) + step_c * (idx % width) + offset) % width
+    return (source + mix * grille + bias) % alphabet_size
+
+
+def _decode_slot_batch(
+    attrs: TokenAttributes,
+    params: np.ndarray,
+    alphabet_size: int,
+    source_indices: np.ndarray | None = None,
+) -> np.ndarray:
+    period, attr_a, attr_b, attr_c, phase_mix, block_mix, bias = (params[:, [k]] for k in range(7))
+    idx = attrs.index[None, :]
+    if source_indices is None:
+        a = attrs.attr_stack[attr_a[:, 0]]
+        b = attrs.attr_stack[attr_b[:, 0]]
+        c = attrs.attr_stack[attr_c[:, 0]]
+    else:
+        a = attrs.attr_stack[attr_a, source_indices]
+        b = attrs.attr_stack[attr_b, source_indices]
+        c = attrs.attr_stack[attr_c, source_indices]
+
+    phase = idx % period
+    cut1 = np.maximum(1, period // 3)
+    cut2 = np.maximum(cut1 + 1, (2 * period) // 3)
+    base = np.where(phase < cut1, a, np.where(phase < cut2, b, c))
+    return (base + phase_mix * phase + block_mix * (idx // period) + bias) % alphabet_size
+
+
+def _decode_markov_batch(
+    attrs: TokenAttributes,
+    params: np.ndarray,
+    alphabet_size: int,
+    source_indices: np.ndarray | None = None,
+) -> np.ndarray:
+    lag, attr_curr, attr_prev, prev_mix, phase_mix, phase_mod, bias = (
+        params[:, [k]] for k in range(7)
+    )
+    idx = attrs.index[None, :]
+    if source_indices is None:
+        curr = attrs.attr_stack[attr_curr[:, 0]]
+        prev = attrs.attr_stack[attr_prev[:, 0]]
+    else:
+        curr = attrs.attr_stack[attr_curr, source_indices]
+        prev = attrs.attr_stack[attr_prev, source_indices]
+
+    # np.roll by ``lag`` with the wrapped-around head replaced by the unshifted values
+    shifted_idx = np.where(idx >= lag, idx - lag, idx)
+    prev_shift = np.take_along_axis(prev, shifted_idx, axis=1)
+    return (
+        curr + prev_mix * prev_shift + phase_mix * (idx % np.maximum(1, phase_mod)) + bias
+    ) % alphabet_size
+
+
+def _decode_symbols_batch(
+    family: str,
+    attrs: TokenAttributes,
+    params: np.ndarray,
+    alphabet_size: int,
+    source_indices: np.ndarray | None = None,
+) -> np.ndarray:
+    """Decode a (batch x 7) block of parameter tuples into a (batch x length) symbol matrix.
+
+    Row ``i`` equals ``_decode_symbols(family, attrs, tuple(params[i]), ...)``, with
+    ``source_indices`` (if given) holding one row of resampled positions per tuple.
+    """
+    params = np.asarray(params, dtype=np.int64).reshape(-1, 7)
+    if family == "table_grille":
+        return _decode_table_batch(attrs, params, alphabet_size, source_indices)
+    if family == "slot_logic":
+        return _decode_slot_batch(attrs, params, alphabet_size, source_indices)
+    if family == "constrained_markov":
+        return _decode_markov_batch(attrs, params, alphabet_size, source_indices)
+    raise ValueError(f"Unknown Method F mechanism family: {family}")
+
+
+def _batch_bounds(total: int, batch_size: int, start: int = 0) -> list[tuple[int, int]]:
+    batch_size = max(1, batch_size)
+    return [(lo, min(lo + batch_size, total)) for lo in range(start, total, batch_size)]
+
+
 def _estimate_space_size(family: str, attr_count: int, alphabet_size: int) -> int:
     if family == "table_grille":
         return 27 * 11 * 11 * 31 * attr_count * 31 * alphabet_size
@@ -461,32 +616,57 @@ def _family_null_metrics(
     config: Stage3Config,
     rng: np.random.Generator,
     progress: callable[[str], None] | None = None,
+    checkpoint: LoopCheckpoint | None = None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     null_entropy = np.empty(config.null_sequences, dtype=np.float64)
     null_bigram = np.empty(config.null_sequences, dtype=np.float64)
     null_zipf = np.empty(config.null_sequences, dtype=np.float64)
+    param_block = np.asarray(params, dtype=np.int64)
     stride = max(1, config.null_sequences // 10)
 
-    for idx in range(config.null_sequences):
-        param = params[int(rng.integers(0, len(params)))]
-        source_idx = _sample_null_indices(
-            rng=rng,
-            length=attrs.length,
-            block_min=config.null_block_min,
-            block_max=config.null_block_max,
-        )
-        symbols = _decode_symbols(
+    done = 0
+    if checkpoint:
+        done, saved = checkpoint.resume(rng, progress=progress)
+        if done:
+            null_entropy[:done] = saved["entropy"]
+            null_bigram[:done] = saved["bigram"]
+            null_zipf[:done] = saved["zipf"]
+
+    for start, stop in _batch_bounds(config.null_sequences, config.decode_batch_size, done):
+        # Draw in the same order as one-at-a-time sampling so the RNG stream is unchanged
+        picks = np.empty(stop - start, dtype=np.int64)
+        source_idx = np.empty((stop - start, attrs.length), dtype=np.int64)
+        for row in range(stop - start):
+            picks[row] = int(rng.integers(0, len(params)))
+            source_idx[row] = _sample_null_indices(
+                rng=rng,
+                length=attrs.length,
+                block_min=config.null_block_min,
+                block_max=config.null_block_max,
+            )
+        symbols = _decode_symbols_batch(
             family=family,
             attrs=attrs,
-            param=param,
+            params=param_block[picks],
             alphabet_size=config.symbol_alphabet_size,
             source_indices=source_idx,
         )
-        null_entropy[idx] = _symbol_entropy(symbols, config.symbol_alphabet_size)
-        null_bigram[idx] = _symbol_bigram_mi(symbols, config.symbol_alphabet_size)
-        null_zipf[idx] = _symbol_zipf_alpha(symbols)
-        if progress and ((idx + 1) % stride == 0 or idx + 1 == config.null_sequences):
-            progress(f"[{family}] null calibration {idx + 1}/{config.null_sequences}")
+        null_entropy[start:stop] = _batch_symbol_entropy(symbols, config.symbol_alphabet_size)
+        null_bigram[start:stop] = _batch_symbol_bigram_mi(symbols, config.symbol_alphabet_size)
+        null_zipf[start:stop] = _batch_symbol_zipf_alpha(symbols, config.symbol_alphabet_size)
+        if checkpoint:
+            checkpoint.update(
+                stop,
+                config.null_sequences,
+                {
+                    "entropy": null_entropy[:stop],
+                    "bigram": null_bigram[:stop],
+                    "zipf": null_zipf[:stop],
+                },
+                rng,
+            )
+        if progress and (stop // stride > start // stride or stop == config.null_sequences):
+            progress(f"[{family}] null calibration {stop}/{config.null_sequences}")
 
     return null_entropy, null_bigram, null_zipf
 
@@ -497,20 +677,28 @@ def _family_real_entropy_scan(
     attrs: TokenAttributes,
     config: Stage3Config,
     progress: callable[[str], None] | None = None,
+    checkpoint: LoopCheckpoint | None = None,
 ) -> np.ndarray:
     values = np.empty(len(params), dtype=np.float64)
+    param_block = np.asarray(params, dtype=np.int64)
     stride = max(1, len(params) // 10)
-    for idx, param in enumerate(params):
-        symbols = _decode_symbols(
+    done = 0
+    if checkpoint:
+        done, saved = checkpoint.resume(progress=progress)
+        if done:
+            values[:done] = saved["entropy"]
+    for start, stop in _batch_bounds(len(params), config.decode_batch_size, done):
+        symbols = _decode_symbols_batch(
             family=family,
             attrs=attrs,
-            param=param,
+            params=param_block[start:stop],
             alphabet_size=config.symbol_alphabet_size,
-            source_indices=None,
         )
-        values[idx] = _symbol_entropy(symbols, config.symbol_alphabet_size)
-        if progress and ((idx + 1) % stride == 0 or idx + 1 == len(params)):
-            progress(f"[{family}] parameter scan {idx + 1}/{len(params)}")
+        values[start:stop] = _batch_symbol_entropy(symbols, config.symbol_alphabet_size)
+        if checkpoint:
+            checkpoint.update(stop, len(params), {"entropy": values[:stop]})
+        if progress and (stop // stride > start // stride or stop == len(params)):
+            progress(f"[{family}] parameter scan {stop}/{len(params)}")
     return values
 
 
@@ -521,6 +709,7 @@ def _family_search(
     config: Stage3Config,
     seed: int,
     progress: callable[[str], None] | None = None,
+    checkpoint: LoopCheckpoint | None = None,
 ) -> dict[str, Any]:
     if progress:
         progress(
@@ -528,7 +717,16 @@ def _family_search(
         )
 
     rng = np.random.default_rng(seed)
-    real_entropy = _family_real_entropy_scan(family, params, attrs, config, progress)
+    real_entropy = _family_real_entropy_scan(
+        family,
+        params,
+        attrs,
+        config,
+        progress,
+        checkpoint=checkpoint.child(f"{family}_scan", every=max(1, len(params) // 20))
+        if checkpoint
+        else None,
+    )
     null_entropy, null_bigram, null_zipf = _family_null_metrics(
         family=family,
         params=params,
@@ -536,6 +734,9 @@ def _family_search(
         config=config,
         rng=rng,
         progress=progress,
+        checkpoint=checkpoint.child(f"{family}_null", every=max(1, config.null_sequences // 20))
+        if checkpoint
+        else None,
     )
 
     threshold = float(np.quantile(null_entropy, 0.01))
@@ -580,21 +781,16 @@ def _family_search(
             attr_count=attrs.attr_stack.shape[0],
             alphabet_size=config.symbol_alphabet_size,
         )
-        perturb_pass = 0
-        perturb_entropy: list[float] = []
-        for pert in perturb_params:
-            pert_symbols = _decode_symbols(
-                family=family,
-                attrs=attrs,
-                param=pert,
-                alphabet_size=config.symbol_alphabet_size,
-                source_indices=None,
-            )
-            pert_ent = _symbol_entropy(pert_symbols, config.symbol_alphabet_size)
-            pert_bmi = _symbol_bigram_mi(pert_symbols, config.symbol_alphabet_size)
-            perturb_entropy.append(float(pert_ent))
-            if pert_ent <= threshold and pert_bmi >= null_bigram_q95 * 0.9:
-                perturb_pass += 1
+        pert_symbols = _decode_symbols_batch(
+            family=family,
+            attrs=attrs,
+            params=np.asarray(perturb_params, dtype=np.int64),
+            alphabet_size=config.symbol_alphabet_size,
+        )
+        pert_ent = _batch_symbol_entropy(pert_symbols, config.symbol_alphabet_size)
+        pert_bmi = _batch_symbol_bigram_mi(pert_symbols, config.symbol_alphabet_size)
+        perturb_entropy = [float(value) for value in pert_ent]
+        perturb_pass = int(np.sum((pert_ent <= threshold) & (pert_bmi >= null_bigram_q95 * 0.9)))
 
         stability_rate = float(perturb_pass / max(len(perturb_params), 1))
         stable = bool(stability_rate >= 0.7)
@@ -705,6 +901,7 @@ def run_method_f(
     store: MetadataStore,
     config: Stage3Config,
     progress: callable[[str], None] | None = None,
+    checkpoint: LoopCheckpoint | None = None,
 ) -> dict[str, Any]:
     voynich_bundle = load_dataset_bundle(store, "voynich_real", "Voynich (Real)")
     token_cap = max(1000, config.target_tokens)
@@ -752,6 +949,9 @@ def run_method_f(
         ),
     }
 
+    if checkpoint:
+        checkpoint = checkpoint.child("method_f", token_count=len(tokens), **asdict(config))
+
     family_results: dict[str, dict[str, Any]] = {}
     for family_idx, family in enumerate(["table_grille", "slot_logic", "constrained_markov"]):
         family_results[family] = _family_search(
@@ -761,6 +961,7 @@ def run_method_f(
             config=config,
             seed=config.seed + 100 + family_idx,
             progress=progress,
+            checkpoint=checkpoint,
         )
 
     family_decisions = {key: value["decision"] for key, value in family_results.items()}
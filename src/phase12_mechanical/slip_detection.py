@@ -9,6 +9,10 @@ import logging
 from collections import Counter, defaultdict
 from typing import Any
 
+import numpy as np
+
+from phase1_foundation.core.encoded_corpus import LinesLike, as_encoded
+
 logger = logging.getLogger(__name__)
 
 class MechanicalSlipDetector:
@@ -36,20 +40,30 @@ class MechanicalSlipDetector:
         # Counts for significance
         self.transition_counts: Counter[tuple[tuple[str, int], str]] = Counter()
 
-    def build_model(self, lines: list[list[str]]) -> None:
+    def build_model(self, lines: LinesLike) -> None:
         """
         Builds the global empirical lattice from all lines.
         
         Args:
-            lines: A list of tokenized manuscript lines.
+            lines: A list of tokenized manuscript lines, or an EncodedCorpus.
         """
-        for line in lines:
-            for i in range(len(line) - 1):
-                prev = line[i]
-                curr = line[i+1]
-                pos = i + 1
-                ctx = (prev, pos)
-                self.transition_counts[(ctx, curr)] += 1
+        corpus = as_encoded(lines)
+        pos = corpus.bigram_positions()
+        if pos.size:
+            # Count (prev_id, position, curr_id) triples in one pass and only
+            # decode the distinct ones.
+            prev = corpus.tokens[pos].astype(np.int64)
+            curr = corpus.tokens[pos + 1].astype(np.int64)
+            position = corpus.position_in_line()[pos + 1]
+            n_vocab = corpus.vocab_size
+            n_pos = int(position.max()) + 1
+            codes = (prev * n_pos + position) * n_vocab + curr
+            uniq, counts = np.unique(codes, return_counts=True)
+            vocab = corpus.vocab
+            for code, count in zip(uniq.tolist(), counts.tolist(), strict=True):
+                rest, c = divmod(code, n_vocab)
+                p, q = divmod(rest, n_pos)
+                self.transition_counts[((vocab[p], q), vocab[c])] += count
 
         # Filter by min_transition_count to avoid single-occurrence noise
         for (ctx, curr), count in self.transition_counts.items():
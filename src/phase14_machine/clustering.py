@@ -0,0 +1,261 @@
+"""
+Clustering backends for lattice windows and mask states (Phase 14)
+
+``kmeans`` is the original ``KMeans(n_init=10, random_state=seed)``.
+``minibatch`` uses ``MiniBatchKMeans`` for large point sets. ``gram`` runs
+Lloyd iterations on a cached matrix of pairwise inner products, so each
+iteration costs O(n^2 k) regardless of the feature dimension; it suits few
+high-dimensional points such as the 2,500-dimensional transition profiles
+of ``StateSpaceSolver`` (and is limited to ``GRAM_MAX_POINTS`` points).
+
+``KMeansSweep`` fits a grid of K values. Each K after the first starts from
+the centroids of the nearest smaller K already fitted, plus new centroids
+drawn by greedy D^2 (k-means++) sampling against them. That warm start
+and a single fresh k-means++ start replace the ``N_INIT`` fresh starts of
+an independent fit, and the lower-inertia result is kept. Every random draw comes from
+``np.random.default_rng((seed, k))`` or sklearn's ``random_state=seed``, so
+a sweep is deterministic for a given seed and K grid.
+
+Points may be a dense array or a ``scipy.sparse`` matrix; sparse input
+stays sparse (as CSR) and only centroids and the Gram matrix are dense.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.sparse import issparse
+
+from phase1_foundation.config import get_cluster_method
+
+# Largest point set the gram backend will cache pairwise products for
+GRAM_MAX_POINTS = 5000
+
+N_INIT = 10
+_MAX_ITER = 300
+
+
+@dataclass
+class ClusterResult:
+    """Labels (int64, one per point), centers (k, d) and within-cluster sum of squares."""
+    labels: np.ndarray
+    centers: np.ndarray
+    inertia: float
+
+
+def _as_points(X):
+    """Float64 points; sparse matrices are converted to CSR rather than densified."""
+    if issparse(X):
+        return X.tocsr().astype(np.float64)
+    return np.asarray(X, dtype=np.float64)
+
+
+def _row_sq_norms(X) -> np.ndarray:
+    if issparse(X):
+        return np.asarray(X.multiply(X).sum(axis=1)).ravel()
+    return (X ** 2).sum(axis=1)
+
+
+def _sklearn_kmeans(X: np.ndarray, k: int, method: str, seed: int | None,
+                    init: np.ndarray | None = None, n_init: int = N_INIT) -> ClusterResult:
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+
+    if init is not None:
+        n_init = 1
+    if method == "kmeans":
+        model = KMeans(n_clusters=k, random_state=seed, n_init=n_init,
+                       init="k-means++" if init is None else init)
+    else:
+        model = MiniBatchKMeans(n_clusters=k, random_state=seed, n_init=min(n_init, 3),
+                                init="k-means++" if init is None else init,
+                                batch_size=min(X.shape[0], 4096))
+    labels = model.fit_predict(X)
+    return ClusterResult(labels.astype(np.int64), model.cluster_centers_, float(model.inertia_))
+
+
+class _GramKMeans:
+    """Lloyd's algorithm expressed through the Gram matrix ``G = X X^T``.
+
+    A centroid is a weight vector over points (``X^T w``), so point-centroid
+    distances are ``G_ii - 2 (G W)_ij + (W^T G W)_jj``.
+    """
+
+    def __init__(self, X: np.ndarray):
+        if X.shape[0] > GRAM_MAX_POINTS:
+            raise ValueError(
+                f"The gram backend caches an n x n matrix; {X.shape[0]} points exceeds GRAM_MAX_POINTS={GRAM_MAX_POINTS}"
+            )
+        self.X = X
+        self.G = (X @ X.T).toarray() if issparse(X) else X @ X.T
+        self.diag = np.diag(self.G).copy()
+
+    def distances(self, W: np.ndarray) -> np.ndarray:
+        GW = self.G @ W
+        return np.maximum(self.diag[:, None] - 2.0 * GW + np.einsum("ij,ij->j", W, GW)[None, :], 0.0)
+
+    def _memberships(self, labels: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        counts = np.bincount(labels, minlength=k)
+        W = np.zeros((len(labels), k))
+        W[np.arange(len(labels)), labels] = 1.0
+        return W / np.maximum(counts, 1)[None, :], counts
+
+    def lloyd(self, W: np.ndarray) -> ClusterResult:
+        k = W.shape[1]
+        labels = None
+        for _ in range(_MAX_ITER):
+            dist = self.distances(W)
+            new_labels = np.argmin(dist, axis=1)
+            W, counts = self._memberships(new_labels, k)
+            # Reseed empty clusters with the points farthest from their centroid
+            empty = np.flatnonzero(counts == 0)
+            if empty.size:
+                farthest = np.argsort(-dist[np.arange(len(dist)), new_labels], kind="stable")[:empty.size]
+                new_labels[farthest] = empty
+                W, counts = self._memberships(new_labels, k)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+        inertia = float(self.distances(W)[np.arange(len(labels)), labels].sum())
+        return ClusterResult(labels.astype(np.int64), np.asarray(W.T @ self.X), inertia)
+
+    def seeds(self, k: int, rng: np.random.Generator, W: np.ndarray | None = None) -> np.ndarray:
+        """Extend centroid weights ``W`` (or nothing) to ``k`` columns by greedy D^2 sampling."""
+        n = self.X.shape[0]
+
+        def point_distances(c: int) -> np.ndarray:
+            return np.maximum(self.diag + self.diag[c] - 2.0 * self.G[:, c], 0.0)
+
+        if W is None:
+            first = int(rng.integers(n))
+            cols = [np.eye(1, n, first).ravel()]
+            closest = point_distances(first)
+        else:
+            cols = [W[:, j] for j in range(W.shape[1])]
+            closest = self.distances(W).min(axis=1)
+        while len(cols) < k:
+            pick, closest = _greedy_pick(closest, point_distances, rng)
+            cols.append(np.eye(1, n, pick).ravel())
+        return np.stack(cols, axis=1)
+
+    def fit(self, k: int, seed: int | None, n_init: int = N_INIT) -> ClusterResult:
+        rng = np.random.default_rng((seed if seed is not None else 0, k))
+        best = None
+        for _ in range(n_init):
+            result = self.lloyd(self.seeds(k, rng))
+            if best is None or result.inertia < best.inertia:
+                best = result
+        return best
+
+
+def _greedy_pick(closest: np.ndarray, candidate_distances, rng: np.random.Generator) -> tuple[int, np.ndarray]:
+    """Greedy k-means++ step: of ``2 + log k`` D^2 samples keep the one that lowers the potential most."""
+    n = closest.size
+    total = closest.sum()
+    n_trials = 2 + int(np.log(max(n, 2)))
+    if total > 0:
+        candidates = rng.choice(n, size=n_trials, p=closest / total)
+    else:
+        candidates = rng.integers(n, size=n_trials)
+    best, best_closest = -1, None
+    for c in candidates:
+        updated = np.minimum(closest, candidate_distances(int(c)))
+        if best_closest is None or updated.sum() < best_closest.sum():
+            best, best_closest = int(c), updated
+    return best, best_closest
+
+
+def _extend_centers(X: np.ndarray, sq_norms: np.ndarray, centers: np.ndarray, k: int,
+                    rng: np.random.Generator) -> np.ndarray:
+    """Add ``k - len(centers)`` centers by greedy D^2 sampling against the existing ones."""
+    cross = sq_norms[:, None] - 2.0 * np.asarray(X @ centers.T) + (centers ** 2).sum(axis=1)[None, :]
+    closest = np.maximum(cross.min(axis=1), 0.0)
+    if issparse(X):
+        def distances(c: int) -> np.ndarray:
+            return np.maximum(sq_norms + sq_norms[c] - 2.0 * (X @ X[c].T).toarray().ravel(), 0.0)
+
+        def row(c: int) -> np.ndarray:
+            return X[c].toarray().ravel()
+    else:
+        def distances(c: int) -> np.ndarray:
+            return ((X - X[c]) ** 2).sum(axis=1)
+
+        def row(c: int) -> np.ndarray:
+            return X[c]
+    added = []
+    while len(centers) + len(added) < k:
+        pick, closest = _greedy_pick(closest, distances, rng)
+        added.append(row(pick))
+    return np.concatenate([centers, np.array(added).reshape(-1, X.shape[1])])
+
+
+def kmeans(X: np.ndarray, k: int, method: str | None = None, seed: int | None = 42) -> ClusterResult:
+    """
+    Cluster the rows of ``X`` into ``k`` groups.
+
+    Args:
+        method: One of ``config.CLUSTER_METHODS``. Defaults to the
+            ``PHASE14_CLUSTER_METHOD`` environment variable, then ``"kmeans"``.
+        seed: Random state for initialization.
+    """
+    X = _as_points(X)
+    method = get_cluster_method(method)
+    if method == "gram":
+        return _GramKMeans(X).fit(k, seed)
+    return _sklearn_kmeans(X, k, method, seed, None)
+
+
+class KMeansSweep:
+    """
+    Warm-started clustering of one point set over many K values.
+
+    Args:
+        X: Points, shape (n, d), dense or ``scipy.sparse``.
+        method: Clustering backend (see ``kmeans``).
+        seed: Random state shared by every K.
+        warm_start: Start each K from the nearest smaller fitted K. When
+            False every K is an independent ``kmeans`` call.
+    """
+
+    def __init__(self, X: np.ndarray, method: str | None = None, seed: int | None = 42,
+                 warm_start: bool = True):
+        self.X = _as_points(X)
+        self.method = get_cluster_method(method)
+        self.seed = seed
+        self.warm_start = warm_start
+        self.sq_norms = _row_sq_norms(self.X)
+        self._gram = _GramKMeans(self.X) if self.method == "gram" else None
+        self.results: dict[int, ClusterResult] = {}
+
+    def fit(self, k: int) -> ClusterResult:
+        """Cluster at ``k``, reusing a cached result or warm-starting from a smaller K."""
+        if k in self.results:
+            return self.results[k]
+        smaller = [j for j in self.results if j < k]
+        if not self.warm_start or not smaller:
+            if self._gram is not None:
+                result = self._gram.fit(k, self.seed)
+            else:
+                result = _sklearn_kmeans(self.X, k, self.method, self.seed, None)
+        else:
+            previous = self.results[max(smaller)]
+            rng = np.random.default_rng((self.seed if self.seed is not None else 0, k))
+            # One warm and one fresh initialization instead of N_INIT fresh ones;
+            # the fresh run guards against warm starts stuck in a split/merge minimum
+            if self._gram is not None:
+                W, _counts = self._gram._memberships(previous.labels, len(previous.centers))
+                warm = self._gram.lloyd(self._gram.seeds(k, rng, W))
+                cold = self._gram.fit(k, self.seed, n_init=1)
+            else:
+                init = _extend_centers(self.X, self.sq_norms, previous.centers, k, rng)
+                warm = _sklearn_kmeans(self.X, k, self.method, self.seed, init)
+                cold = _sklearn_kmeans(self.X, k, self.method, self.seed, n_init=1)
+            result = warm if warm.inertia <= cold.inertia else cold
+        self.results[k] = result
+        return result
+
+    def fit_many(self, ks: Iterable[int]) -> dict[int, ClusterResult]:
+        """Fit every K in ascending order; returns results keyed by K in input order."""
+        ks = list(ks)
+        for k in sorted(set(ks)):
+            self.fit(k)
+        return {k: self.results[k] for k in ks}
@@ -5,10 +5,389 @@ A centralized measurement framework for calculating model coverage,
 admissibility, MDL (Description Length), and overgeneration.
 """
 
+import copy
 import math
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
 from typing import Any
 
+import numpy as np
+
+from phase1_foundation.core.encoded_corpus import EncodedCorpus, LinesLike, as_encoded
+
+# Suffix classes used by fuzzy (scribe-bias) drift matching
+_FUZZY_SUFFIXES = ["dy", "in", "y", "m", "ol"]
+
+
+class CompiledLattice:
+    """
+    Integer-encoded lattice for repeated admissibility scoring.
+
+    Built once from ``lattice_map``, ``window_contents`` and the engine's
+    vocabulary, so each ``admissibility`` call is a walk over int IDs
+    instead of list scans over window contents.
+
+    Attributes:
+        lattice_map / window_contents / vocab: The inputs, kept for ``shifted``.
+        words: Word for each integer ID (sorted).
+        word_ids: Inverse of ``words``.
+        in_vocab: Whether each word is inside the lexicon clamp.
+        word_window: Window ID of each word that sits in exactly one window.
+        window_count: Number of distinct windows containing each word.
+        multi_windows: Window sets for words that sit in several windows.
+        next_window: ``lattice_map`` target per word ID (valid where ``has_next``).
+        has_next: Whether each word has a ``lattice_map`` target.
+        word_suffix_mask / window_suffix_mask: Bitsets over ``_FUZZY_SUFFIXES``
+            for each word and each window ID in ``range(num_windows)``.
+        strict_chance / drift_chance: Chance baselines for this lattice.
+    """
+
+    def __init__(self,
+                 lattice_map: dict[str, int],
+                 window_contents: dict[int, list[str]],
+                 vocab: set[str]):
+        self.lattice_map = lattice_map
+        self.window_contents = window_contents
+        self.vocab = vocab
+        self.num_windows = len(window_contents)
+        self.words = sorted(set(vocab) | set(lattice_map) | {w for ws in window_contents.values() for w in ws})
+        self.word_ids = {word: i for i, word in enumerate(self.words)}
+        n_words = len(self.words)
+
+        self.in_vocab = np.zeros(n_words, dtype=bool)
+        self.in_vocab[[self.word_ids[w] for w in vocab]] = True
+
+        windows_of: dict[int, set[int]] = defaultdict(set)
+        for wid, words in window_contents.items():
+            for word in words:
+                windows_of[self.word_ids[word]].add(wid)
+        self.word_window = np.full(n_words, -1, dtype=np.int64)
+        self.window_count = np.zeros(n_words, dtype=np.int32)
+        self.multi_windows: dict[int, frozenset[int]] = {}
+        for word_id, wids in windows_of.items():
+            self.window_count[word_id] = len(wids)
+            if len(wids) == 1:
+                self.word_window[word_id] = next(iter(wids))
+            else:
+                self.multi_windows[word_id] = frozenset(wids)
+
+        self.has_next = np.array([word in lattice_map for word in self.words], dtype=bool)
+        self.next_window = np.array([lattice_map.get(word, 0) for word in self.words], dtype=np.int64)
+
+        self.word_suffix_mask = np.array(
+            [self._suffix_mask(word) for word in self.words], dtype=np.int64
+        )
+        self.window_suffix_mask = np.zeros(self.num_windows, dtype=np.int64)
+        for wid in range(self.num_windows):
+            for word in window_contents.get(wid, []):
+                self.window_suffix_mask[wid] |= self._suffix_mask(word)
+
+        # Chance baseline: probability a random vocab word falls in k
+        # windows by vocabulary overlap
+        total_lattice_vocab = len({w for ws in window_contents.values() for w in ws})
+        total_words = sum(len(v) for v in window_contents.values())
+        avg_window_size = total_words / self.num_windows if self.num_windows > 0 else 0
+        self.strict_chance = avg_window_size / total_lattice_vocab if total_lattice_vocab > 0 else 0
+        self.drift_chance = min(1.0, 3 * self.strict_chance)  # 3 windows checked
+
+    def shifted(self, offset: int) -> "CompiledLattice":
+        """
+        The same lattice under a mask offset.
+
+        Every window lookup is shifted by ``offset``: window ``w`` holds the
+        words of window ``(w + offset) % num_windows`` and each lattice target
+        ``t`` becomes ``(t - offset) % num_windows``. Requires window IDs
+        ``0..num_windows - 1``.
+        """
+        n = self.num_windows
+        if set(self.window_contents) != set(range(n)):
+            raise ValueError("Mask offsets require window IDs 0..num_windows-1")
+
+        # Word IDs, suffix bitsets and baselines are offset-invariant.
+        lattice = copy.copy(self)
+        lattice.lattice_map = {word: (target - offset) % n for word, target in self.lattice_map.items()}
+        lattice.window_contents = {w: self.window_contents[(w + offset) % n] for w in range(n)}
+        lattice.word_window = np.where(self.window_count == 1, (self.word_window - offset) % n, -1)
+        lattice.multi_windows = {
+            word_id: frozenset((w - offset) % n for w in wids) for word_id, wids in self.multi_windows.items()
+        }
+        lattice.next_window = (self.next_window - offset) % n
+        lattice.window_suffix_mask = np.roll(self.window_suffix_mask, -offset)
+        return lattice
+
+    @staticmethod
+    def _suffix_mask(word: str) -> int:
+        mask = 0
+        for bit, sfx in enumerate(_FUZZY_SUFFIXES):
+            if word.endswith(sfx):
+                mask |= 1 << bit
+        return mask
+
+    def admissibility(self,
+                      lines: LinesLike,
+                      fuzzy_suffix: bool = False,
+                      suffix_window_map: dict[str, int] | None = None) -> dict[str, Any]:
+        """Strict/drift/OOV admissibility; see ``EvaluationEngine.calculate_admissibility``."""
+        corpus = as_encoded(lines)
+
+        # Per corpus type: lattice word ID for clamped words, else the
+        # suffix-predicted window for OOV recovery.
+        type_word: list[int] = []
+        type_pred: list[int | None] = []
+        for token in corpus.vocab:
+            word_id = self.word_ids.get(token, -1)
+            if word_id >= 0 and not self.in_vocab[word_id]:
+                word_id = -1
+            type_word.append(word_id)
+            type_pred.append(
+                EvaluationEngine.resolve_oov_window(token, suffix_window_map)
+                if word_id < 0 and suffix_window_map is not None else None
+            )
+
+        word_window = self.word_window.tolist()
+        window_count = self.window_count.tolist()
+        multi_windows = self.multi_windows
+        next_window = [t if ok else None for t, ok in zip(self.next_window.tolist(), self.has_next.tolist(), strict=True)]
+        word_mask = self.word_suffix_mask.tolist()
+        window_mask = self.window_suffix_mask.tolist()
+        num_wins = self.num_windows
+        track_oov = suffix_window_map is not None
+
+        strict_admissible = 0
+        drift_admissible = 0
+        total_transitions = 0
+        oov_total = 0
+        oov_recovered = 0
+        oov_admissible = 0
+        current_window = 0
+
+        # The window state carries across line boundaries, so the walk runs
+        # over the flat token stream.
+        for type_id in corpus.tokens.tolist():
+            word = type_word[type_id]
+            if word < 0:
+                if track_oov:
+                    oov_total += 1
+                    predicted_win = type_pred[type_id]
+                    if predicted_win is not None:
+                        oov_recovered += 1
+                        # Admissible if the predicted window is within ±1 drift
+                        if predicted_win in (
+                            (current_window - 1) % num_wins,
+                            current_window % num_wins,
+                            (current_window + 1) % num_wins,
+                        ):
+                            oov_admissible += 1
+                        current_window = predicted_win
+                continue
+
+            total_transitions += 1
+            count = window_count[word]
+
+            # Strict (offset=0 only)
+            if (count == 1 and word_window[word] == current_window) or (
+                count > 1 and current_window in multi_windows[word]
+            ):
+                strict_admissible += 1
+                drift_admissible += 1
+                target = next_window[word]
+                current_window = target if target is not None else (current_window + 1) % num_wins
+                continue
+
+            # Drift (±1)
+            is_drift = False
+            for offset in (-1, 1):
+                check_win = (current_window + offset) % num_wins
+                if (count == 1 and word_window[word] == check_win) or (
+                    count > 1 and check_win in multi_windows[word]
+                ) or (fuzzy_suffix and word_mask[word] & window_mask[check_win]):
+                    is_drift = True
+                    current_window = check_win
+                    break
+
+            target = next_window[word]
+            if is_drift:
+                drift_admissible += 1
+                current_window = target if target is not None else (current_window + 1) % num_wins
+            elif target is not None:
+                # Snap to real window if word is known, to recover
+                current_window = target
+
+        return self._result(
+            strict_admissible,
+            drift_admissible,
+            total_transitions,
+            (oov_total, oov_recovered, oov_admissible) if track_oov else None,
+        )
+
+    def _result(self,
+                strict_admissible: int,
+                drift_admissible: int,
+                total_transitions: int,
+                oov: tuple[int, int, int] | None) -> dict[str, Any]:
+        """Admissibility dict from raw counts; ``oov`` is (total, recovered, admissible)."""
+        n = total_transitions
+        strict_rate = strict_admissible / n if n > 0 else 0
+        drift_rate = drift_admissible / n if n > 0 else 0
+        result = {
+            "strict_admissibility": strict_rate,
+            "drift_admissibility": drift_rate,
+            "admissibility_rate": drift_rate,
+            "strict_chance_baseline": self.strict_chance,
+            "drift_chance_baseline": self.drift_chance,
+            "total_clamped_tokens": n,
+        }
+
+        if oov is not None:
+            oov_total, oov_recovered, oov_admissible = oov
+            total_consolidated = n + oov_recovered
+            consolidated_admissible = drift_admissible + oov_admissible
+            result["oov_total"] = oov_total
+            result["oov_recovered"] = oov_recovered
+            result["oov_admissible"] = oov_admissible
+            result["consolidated_admissibility"] = (
+                consolidated_admissible / total_consolidated
+                if total_consolidated > 0 else 0
+            )
+
+        return result
+
+
+def _batched_admissibility(corpus: EncodedCorpus,
+                           configs: list[CompiledLattice],
+                           vocab: set[str],
+                           fuzzy_suffix: bool,
+                           suffix_window_map: dict[str, int] | None) -> list[tuple]:
+    """
+    Raw admissibility counts for several lattices over one corpus.
+
+    Returns ``(strict, drift, total, oov)`` per config, where ``oov`` is
+    ``(total, recovered, admissible)`` or None, matching
+    ``CompiledLattice.admissibility`` exactly.
+    """
+    types = corpus.vocab
+    n_types = len(types)
+    n_cfg = len(configs)
+
+    # (K x types) tables gathered from each compiled lattice
+    word_window = np.zeros((n_cfg, n_types), dtype=np.int64)
+    window_count = np.zeros((n_cfg, n_types), dtype=np.int32)
+    target = np.zeros((n_cfg, n_types), dtype=np.int64)
+    has_target = np.zeros((n_cfg, n_types), dtype=bool)
+    multi: list[dict[int, frozenset[int]]] = []
+    num_wins = np.array([config.num_windows for config in configs], dtype=np.int64)
+    window_mask = np.zeros((n_cfg, int(num_wins.max())), dtype=np.int64)
+    ids_by_table: dict[int, np.ndarray] = {}
+    for k, config in enumerate(configs):
+        # Shifted lattices share their word table, so map corpus types once
+        ids = ids_by_table.get(id(config.word_ids))
+        if ids is None:
+            ids = np.array([config.word_ids.get(t, -1) for t in types], dtype=np.int64)
+            ids_by_table[id(config.word_ids)] = ids
+        known = np.flatnonzero(ids >= 0)
+        word_window[k, known] = config.word_window[ids[known]]
+        window_count[k, known] = config.window_count[ids[known]]
+        target[k, known] = config.next_window[ids[known]]
+        has_target[k, known] = config.has_next[ids[known]]
+        multi.append({
+            type_id: config.multi_windows[ids[type_id]]
+            for type_id in known.tolist() if ids[type_id] in config.multi_windows
+        })
+        window_mask[k, :config.num_windows] = config.window_suffix_mask
+    type_mask = np.array([CompiledLattice._suffix_mask(t) for t in types], dtype=np.int64)
+    in_vocab = np.array([t in vocab for t in types], dtype=bool)
+
+    tokens = corpus.tokens
+    is_word = in_vocab[tokens]
+    n_transitions = int(is_word.sum())
+    events = is_word
+    oov_counts = None
+    if suffix_window_map is not None:
+        preds = [EvaluationEngine.resolve_oov_window(t, suffix_window_map) for t in types]
+        has_pred = np.array([p is not None for p in preds], dtype=bool) & ~in_vocab
+        pred = np.array([p if p is not None else 0 for p in preds], dtype=np.int64)
+        is_recovered = has_pred[tokens]
+        oov_counts = (int((~is_word).sum()), int(is_recovered.sum()))
+        events = is_word | is_recovered
+
+    ev_types = tokens[events].astype(np.int64)
+    ev_word = is_word[events]
+    n_ev = ev_types.size
+    if n_ev == 0:
+        oov = (oov_counts[0], oov_counts[1], 0) if oov_counts is not None else None
+        return [(0, 0, n_transitions, oov) for _ in configs]
+
+    def member(ks, ts, wins):
+        hit = (window_count[ks, ts] == 1) & (word_window[ks, ts] == wins)
+        for j in np.flatnonzero(window_count[ks, ts] > 1).tolist():
+            hit[j] = int(wins[j]) in multi[ks[j]][ts[j]]
+        return hit
+
+    def matches(ks, ts, wins):
+        hit = member(ks, ts, wins)
+        if fuzzy_suffix:
+            hit |= (type_mask[ts] & window_mask[ks, wins]) != 0
+        return hit
+
+    def step(ks, ts, before):
+        """Next state after a word without a lattice target."""
+        n = num_wins[ks]
+        left = (before - 1) % n
+        right = (before + 1) % n
+        return np.where(
+            member(ks, ts, before), (before + 1) % n,
+            np.where(matches(ks, ts, left), (left + 1) % n,
+                     np.where(matches(ks, ts, right), (right + 1) % n, before)),
+        )
+
+    # Events that fix the next state regardless of the previous one:
+    # words with a lattice target and suffix-recovered OOV tokens.
+    resets = np.where(ev_word, has_target[:, ev_types], True)
+    after = np.where(ev_word, target[:, ev_types], pred[ev_types] if oov_counts is not None else 0)
+
+    positions = np.arange(n_ev)
+    last_reset = np.maximum.accumulate(np.where(resets, positions, -1), axis=1)
+    prev_reset = np.concatenate([np.full((n_cfg, 1), -1), last_reset[:, :-1]], axis=1)
+    depth = positions - prev_reset - 1
+    rows = np.arange(n_cfg)[:, None]
+
+    before = np.where(prev_reset >= 0, after[rows, np.maximum(prev_reset, 0)], 0)
+    # Walk runs of unmapped words one depth level at a time
+    for d in range(1, int(depth.max()) + 1):
+        ks, idx = np.nonzero(depth == d)
+        prev = idx - 1
+        after[ks, prev] = step(ks, ev_types[prev], before[ks, prev])
+        before[ks, idx] = after[ks, prev]
+
+    counts = []
+    ks_all = np.repeat(np.arange(n_cfg), n_ev)
+    ts_all = np.tile(ev_types, n_cfg)
+    b_all = before.ravel()
+    word_all = np.tile(ev_word, n_cfg)
+    n_all = num_wins[ks_all]
+
+    strict = np.zeros(n_cfg * n_ev, dtype=bool)
+    drift = np.zeros(n_cfg * n_ev, dtype=bool)
+    w = np.flatnonzero(word_all)
+    kw, tw, bw, nw = ks_all[w], ts_all[w], b_all[w], n_all[w]
+    strict[w] = member(kw, tw, bw)
+    drift[w] = strict[w] | matches(kw, tw, (bw - 1) % nw) | matches(kw, tw, (bw + 1) % nw)
+    strict = strict.reshape(n_cfg, n_ev).sum(axis=1)
+    drift = drift.reshape(n_cfg, n_ev).sum(axis=1)
+
+    oov_adm = np.zeros(n_cfg, dtype=np.int64)
+    if oov_counts is not None:
+        o = np.flatnonzero(~word_all)
+        if o.size:
+            po, bo, no = pred[ts_all[o]], b_all[o], n_all[o]
+            ok = (po == (bo - 1) % no) | (po == bo % no) | (po == (bo + 1) % no)
+            oov_adm = np.bincount(ks_all[o], weights=ok, minlength=n_cfg).astype(np.int64)
+
+    for k in range(n_cfg):
+        oov = (oov_counts[0], oov_counts[1], int(oov_adm[k])) if oov_counts is not None else None
+        counts.append((int(strict[k]), int(drift[k]), n_transitions, oov))
+    return counts
+
 
 class EvaluationEngine:
     """
@@ -61,19 +440,35 @@ class EvaluationEngine:
         covered = sum(1 for t in tokens if t in self.vocab)
         return covered / len(tokens)
 
+    def compile_lattice(self,
+                        lattice_map: dict[str, int],
+                        window_contents: dict[int, list[str]]) -> CompiledLattice:
+        """
+        Compiles a lattice against this engine's vocabulary for repeated scoring.
+
+        Args:
+            lattice_map: Mapping from word to its predicted next window ID.
+            window_contents: Mapping from window ID to the list of words in that window.
+
+        Returns:
+            A CompiledLattice accepted by ``calculate_admissibility``.
+        """
+        return CompiledLattice(lattice_map, window_contents, self.vocab)
+
     def calculate_admissibility(self,
-                               lines: list[list[str]],
+                               lines: LinesLike,
                                lattice_map: dict[str, int],
                                window_contents: dict[int, list[str]],
                                fuzzy_suffix: bool = False,
-                               suffix_window_map: dict[str, int] | None = None) -> dict[str, Any]:
+                               suffix_window_map: dict[str, int] | None = None,
+                               compiled: CompiledLattice | None = None) -> dict[str, Any]:
         """
         Measures how often real transitions follow the physical lattice constraints.
         Reports both strict (offset=0 only) and drift (±1) admissibility rates,
         plus a chance baseline for each.
 
         Args:
-            lines: The real manuscript lines (tokens).
+            lines: The real manuscript lines (tokens), or an EncodedCorpus.
             lattice_map: Mapping from word to its predicted next window ID.
             window_contents: Mapping from window ID to the list of words in that window.
             fuzzy_suffix: If True, allows admissibility if any word in the target window
@@ -81,6 +476,9 @@ class EvaluationEngine:
             suffix_window_map: Optional mapping from suffix → predicted window ID for
                 OOV recovery (Phase 14O). When provided, OOV words are assigned windows
                 via suffix class instead of being skipped.
+            compiled: A ``CompiledLattice`` from ``compile_lattice`` for this
+                lattice. Pass it when scoring the same lattice repeatedly;
+                ``lattice_map`` and ``window_contents`` are then ignored.
 
         Returns:
             A dictionary containing strict and drift admissibility rates,
@@ -88,117 +486,69 @@ class EvaluationEngine:
             When suffix_window_map is provided, also includes oov_total,
             oov_recovered, and consolidated_admissibility.
         """
-        strict_admissible = 0
-        drift_admissible = 0
-        total_transitions = 0
-        oov_total = 0
-        oov_recovered = 0
-        oov_admissible = 0
-        current_window = 0
-
-        num_wins = len(window_contents)
-        suffixes = ["dy", "in", "y", "m", "ol"]
+        if compiled is None:
+            compiled = self.compile_lattice(lattice_map, window_contents)
+        return compiled.admissibility(lines, fuzzy_suffix, suffix_window_map)
+
+    def evaluate_many(self,
+                      corpus: LinesLike,
+                      lattices: Sequence[CompiledLattice | tuple[dict[str, int], dict[int, list[str]]]] | None = None,
+                      *,
+                      offsets: Sequence[int] | None = None,
+                      lattice: CompiledLattice | tuple[dict[str, int], dict[int, list[str]]] | None = None,
+                      fuzzy_suffix: bool = False,
+                      suffix_window_map: dict[str, int] | None = None) -> list[dict[str, Any]]:
+        """
+        Scores one corpus against many lattice configurations in a single pass.
 
-        # Precompute chance baseline: probability a random vocab word
-        # falls in k windows by vocabulary overlap
-        all_window_words = set()
-        for _wid, words in window_contents.items():
-            all_window_words.update(words)
-        total_lattice_vocab = len(all_window_words)
-        total_words = sum(len(v) for v in window_contents.values())
-        avg_window_size = total_words / num_wins if num_wins > 0 else 0
-        strict_chance = avg_window_size / total_lattice_vocab if total_lattice_vocab > 0 else 0
-        drift_chance = min(1.0, 3 * strict_chance)  # 3 windows checked
-
-        for line in lines:
-            for word in line:
-                if word not in self.vocab:
-                    # OOV recovery via suffix map
-                    if suffix_window_map is not None:
-                        oov_total += 1
-                        predicted_win = self.resolve_oov_window(word, suffix_window_map)
-                        if predicted_win is not None:
-                            oov_recovered += 1
-                            # Check if the predicted window is admissible (±1 drift)
-                            for offset in [-1, 0, 1]:
-                                check_win = (current_window + offset) % num_wins
-                                if check_win == predicted_win:
-                                    oov_admissible += 1
-                                    current_window = predicted_win
-                                    break
-                            else:
-                                # Not admissible — snap to predicted window
-                                current_window = predicted_win
-                        # If no suffix match, skip as before
-                    continue
-
-                total_transitions += 1
-                is_strict = False
-                is_drift = False
-
-                # Check strict (offset=0 only)
-                win_words = window_contents.get(current_window, [])
-                if word in win_words:
-                    is_strict = True
-                    is_drift = True
+        Either pass ``lattices`` (CompiledLattice objects or
+        ``(lattice_map, window_contents)`` pairs), or one ``lattice`` plus
+        ``offsets``, which scores ``lattice.shifted(offset)`` for each offset.
 
-                # Check drift (±1) if not already strict
-                if not is_drift:
-                    for offset in [-1, 1]:
-                        check_win = (current_window + offset) % num_wins
-                        drift_words = window_contents.get(check_win, [])
-                        if word in drift_words:
-                            is_drift = True
-                            current_window = check_win
-                            break
-
-                        if fuzzy_suffix:
-                            for s in suffixes:
-                                if word.endswith(s) and any(
-                                    w.endswith(s) for w in drift_words
-                                ):
-                                        is_drift = True
-                                        current_window = check_win
-                                        break
-                            if is_drift:
-                                break
-
-                if is_strict:
-                    strict_admissible += 1
-                    drift_admissible += 1
-                    current_window = lattice_map.get(word, (current_window + 1) % num_wins)
-                elif is_drift:
-                    drift_admissible += 1
-                    current_window = lattice_map.get(word, (current_window + 1) % num_wins)
-                else:
-                    # Snap to real window if word is known, to recover
-                    if word in lattice_map:
-                        current_window = lattice_map[word]
+        All configurations share one (K x corpus vocabulary) set of window,
+        target and suffix tables. The window state only depends on the
+        previous token when that token has no lattice target, so states are
+        resolved for every configuration and token at once and then refined
+        over runs of unmapped words; per-token work is an array gather.
 
-        n = total_transitions
-        strict_rate = strict_admissible / n if n > 0 else 0
-        drift_rate = drift_admissible / n if n > 0 else 0
-        result = {
-            "strict_admissibility": strict_rate,
-            "drift_admissibility": drift_rate,
-            "admissibility_rate": drift_rate,
-            "strict_chance_baseline": strict_chance,
-            "drift_chance_baseline": drift_chance,
-            "total_clamped_tokens": n,
-        }
+        Args:
+            corpus: The real manuscript lines (tokens), or an EncodedCorpus.
+            lattices: Configurations to score.
+            offsets: Mask offsets applied to ``lattice``.
+            lattice: Base configuration for ``offsets``.
+            fuzzy_suffix: As in ``calculate_admissibility``.
+            suffix_window_map: As in ``calculate_admissibility``.
 
-        if suffix_window_map is not None:
-            total_consolidated = n + oov_recovered
-            consolidated_admissible = drift_admissible + oov_admissible
-            result["oov_total"] = oov_total
-            result["oov_recovered"] = oov_recovered
-            result["oov_admissible"] = oov_admissible
-            result["consolidated_admissibility"] = (
-                consolidated_admissible / total_consolidated
-                if total_consolidated > 0 else 0
+        Returns:
+            One ``calculate_admissibility`` result dict per configuration, in order.
+        """
+        if (lattices is None) == (offsets is None):
+            raise ValueError("Pass either lattices or offsets (with lattice)")
+        if offsets is not None:
+            if lattice is None:
+                raise ValueError("offsets require a base lattice")
+            base = lattice if isinstance(lattice, CompiledLattice) else self.compile_lattice(*lattice)
+            configs = [base.shifted(offset) for offset in offsets]
+        else:
+            configs = [
+                lat if isinstance(lat, CompiledLattice) else self.compile_lattice(*lat)
+                for lat in lattices
+            ]
+
+        corpus = as_encoded(corpus)
+        results: list[dict[str, Any] | None] = [None] * len(configs)
+        # The modular drift arithmetic needs at least one window.
+        batched = [k for k, config in enumerate(configs) if config.num_windows > 0]
+        for k, config in enumerate(configs):
+            if config.num_windows == 0:
+                results[k] = config.admissibility(corpus, fuzzy_suffix, suffix_window_map)
+        if batched:
+            counts = _batched_admissibility(
+                corpus, [configs[k] for k in batched], self.vocab, fuzzy_suffix, suffix_window_map
             )
-
-        return result
+            for k, (strict, drift, n, oov) in zip(batched, counts, strict=True):
+                results[k] = configs[k]._result(strict, drift, n, oov)
+        return results
 
     def calculate_markov_residual_entropy(self, tokens: list[str]) -> float:
         """
@@ -314,3 +664,31 @@ class EvaluationEngine:
                 "rate": rate
             }
         return res
+
+    def calculate_overgeneration_streaming(self,
+                                           syn_lines: Iterable[Sequence[str]],
+                                           real_lines: LinesLike,
+                                           max_n: int = 3) -> dict[str, Any]:
+        """
+        ``calculate_overgeneration`` over hashed n-grams, in one streaming pass.
+
+        ``syn_lines`` may be a generator; it is read once, in chunks, and only
+        64-bit n-gram hashes are kept (see ``phase14_machine.ngram_audit``).
+        Counts are exact up to 64-bit hash collisions.
+
+        Args:
+            syn_lines: Generated synthetic lines (any iterable or ``EncodedCorpus``).
+            real_lines: Actual manuscript lines.
+            max_n: Highest n-gram order; orders 2..max_n are reported.
+
+        Returns:
+            The ``calculate_overgeneration`` entries under ``"BUR"`` and
+            ``"TUR"``, and ``"<n>-gram"`` for higher orders, each also
+            carrying the ``overlap`` count.
+        """
+        from phase14_machine.ngram_audit import NgramAudit
+
+        audit = NgramAudit(real_lines, orders=range(2, max_n + 1), vocab=self.vocab)
+        audit.update(syn_lines)
+        labels = {2: "BUR", 3: "TUR"}
+        return {labels.get(n, f"{n}-gram"): counts for n, counts in audit.results().items()}
@@ -4,11 +4,40 @@ High-Fidelity Voynich Engine (Phase 14)
 A full-scale mechanical emulator using a Lattice-Modulated Window system.
 """
 
+import contextlib
+import os
 import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from phase1_foundation.core.choice_log import KIND_TRACE, ChoiceLog
+from phase1_foundation.core.encoded_corpus import EncodedCorpus
 from phase14_machine.evaluation_engine import EvaluationEngine
 
+# Lines per scribe section; the scribe swaps at the start of each block
+SCRIBE_BLOCK_LINES = 5000
+
+# Candidates the scribe scans per token (see generate_token)
+NUM_CANDIDATES = 20
+
+# Lines generated per vectorized block; a multiple of the 20-line mask period
+FAST_BLOCK_LINES = 20000
+
+_MAX_LINE_LENGTH = 10
+
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(x: np.ndarray) -> np.ndarray:
+    """Set bits per element of a uint64 array."""
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(x)
+    return _POPCOUNT8[x.view(np.uint8)].reshape(*x.shape, 8).sum(axis=-1, dtype=np.uint8)
+
 
 class HighFidelityVolvelle:
     """
@@ -20,6 +49,7 @@ class HighFidelityVolvelle:
         num_windows: The total number of discrete windows in the physical model.
         mask_state: The current rotation/shift of the mask disc (0 to num_windows-1).
         current_scribe: The profile of the scribe agent (Hand 1 or Hand 2).
+        choice_log: ``ChoiceLog`` of generated (with ``log_choices``) and traced tokens.
     """
     def __init__(self,
                  lattice_map: dict[str, int],
@@ -35,7 +65,8 @@ class HighFidelityVolvelle:
             lattice_map: Mapping from token to next window index.
             window_contents: Mapping from window index to token list.
             seed: Optional seed for reproducibility.
-            log_choices: If True, records the context of every generated token.
+            log_choices: If True, records the context of every generated token
+                in ``choice_log`` (a columnar ``ChoiceLog``).
             offset_corrections: Optional per-window mode offset corrections
                 from Phase 14I. Maps window_id → signed offset. When provided,
                 the emulator shifts the next-window lookup by the correction
@@ -44,14 +75,15 @@ class HighFidelityVolvelle:
                 (Phase 14O). When provided, OOV words use suffix-predicted windows
                 instead of linear +1 fallback.
         """
+        self.seed = seed
         self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
         self.lattice_map = lattice_map
         # Ensure window indices are integers for modulo math
         self.window_contents = {int(k): v for k, v in window_contents.items()}
         self.num_windows = len(self.window_contents)
         self.mask_state = 0
         self.log_choices = log_choices
-        self.choice_log: list[dict[str, Any]] = []
         self.offset_corrections = offset_corrections or {}
         self.suffix_window_map = suffix_window_map
 
@@ -60,7 +92,9 @@ class HighFidelityVolvelle:
             "Hand 1": {"drift": 15, "suffix_weights": {"dy": 12.0, "in": 4.0, "y": 8.0, "m": 3.0}},
             "Hand 2": {"drift": 25, "suffix_weights": {"in": 20.0, "dy": 2.0, "m": 10.0, "y": 5.0}}
         }
+        self.choice_log = ChoiceLog(scribes=list(self.scribe_profiles))
         self.current_scribe = "Hand 1"
+        self._fast_tables: dict[str, Any] | None = None
 
     def set_scribe(self, hand: str) -> None:
         """Sets the active scribe profile."""
@@ -117,16 +151,16 @@ class HighFidelityVolvelle:
         if self.log_choices:
             # Find the original index of the chosen word in the window
             chosen_orig_idx = col.index(chosen_word)
-            self.choice_log.append({
-                "window_id": modulated_idx,
-                "candidates_count": len(col),
-                "chosen_word": chosen_word,
-                "chosen_index": chosen_orig_idx,
-                "token_pos": pos,
-                "prev_word": prev_word,
-                "mask_state": self.mask_state,
-                "scribe": self.current_scribe
-            })
+            self.choice_log.record(
+                window_id=modulated_idx,
+                chosen_index=chosen_orig_idx,
+                candidates_count=len(col),
+                token_pos=pos,
+                word=chosen_word,
+                prev_word=prev_word,
+                mask_state=self.mask_state,
+                scribe=self.current_scribe,
+            )
 
         return chosen_word
 
@@ -161,6 +195,17 @@ class HighFidelityVolvelle:
 
         return line
 
+    def _iter_mirror_lines(self, start: int, stop: int):
+        """Yield lines ``start`` to ``stop - 1`` of a mirror corpus from the current state."""
+        for i in range(start, stop):
+            # Simulate section-level scribe shifts
+            if i % SCRIBE_BLOCK_LINES == 0:
+                self.set_scribe("Hand 1" if self.current_scribe == "Hand 2" else "Hand 2")
+            # Simulate frequent mask rotations (full-range disc rotation)
+            if i % 20 == 0:
+                self.set_mask(self.rng.randint(0, self.num_windows - 1))
+            yield self.generate_line(length=self.rng.randint(4, 10))
+
     def generate_mirror_corpus(self, num_lines: int) -> list[list[str]]:
         """
         Generates a large-scale synthetic corpus mirroring the manuscript.
@@ -171,17 +216,236 @@ class HighFidelityVolvelle:
         Returns:
             A list of lines, each being a list of tokens.
         """
-        corpus = []
-        for i in range(num_lines):
-            # Simulate section-level scribe shifts
-            if i % 5000 == 0:
-                self.set_scribe("Hand 1" if self.current_scribe == "Hand 2" else "Hand 2")
-            # Simulate frequent mask rotations (full-range disc rotation)
-            if i % 20 == 0:
-                self.set_mask(self.rng.randint(0, self.num_windows - 1))
-            corpus.append(self.generate_line(length=self.rng.randint(4, 10)))
+        return list(self._iter_mirror_lines(0, num_lines))
+
+    def generate_mirror_corpus_sharded(self,
+                                       num_lines: int,
+                                       workers: int | None = None,
+                                       shard_dir: Path | None = None) -> list[list[str]]:
+        """
+        ``generate_mirror_corpus`` split into scribe blocks across processes.
+
+        Each ``SCRIBE_BLOCK_LINES`` block starts with a scribe swap and a
+        mask rotation, so it only depends on the scribe it inherits. Block
+        ``b`` runs the per-token generator on its own ``random.Random``
+        seeded from child ``b`` of ``SeedSequence(seed).spawn``, and streams
+        its lines to ``shard-<b>.txt`` (tab-separated tokens, one line per
+        row). The shards are concatenated in block order, so the corpus
+        depends only on the seed, not on the worker count. It is a
+        different stream from ``generate_mirror_corpus``.
+
+        Worker emulators do not record choices, so with ``log_choices``
+        enabled this falls back to ``generate_mirror_corpus``, which does.
+
+        Args:
+            num_lines: Total lines to generate.
+            workers: Worker processes (default ``os.cpu_count()``); 1 runs
+                the blocks in this process.
+            shard_dir: Directory to keep the shards in. A temporary
+                directory is used (and removed) when omitted.
+
+        Returns:
+            A list of lines, each being a list of tokens.
+        """
+        if self.log_choices:
+            return self.generate_mirror_corpus(num_lines)
+        num_blocks = -(-num_lines // SCRIBE_BLOCK_LINES)
+        children = np.random.SeedSequence(self.seed).spawn(num_blocks)
+        scribe = self.current_scribe
+        tasks = []
+        for block, child in enumerate(children):
+            start = block * SCRIBE_BLOCK_LINES
+            tasks.append((
+                int(child.generate_state(1, dtype=np.uint64)[0]),
+                scribe,
+                start,
+                min(start + SCRIBE_BLOCK_LINES, num_lines),
+                f"shard-{block:05d}.txt",
+            ))
+            scribe = "Hand 1" if scribe == "Hand 2" else "Hand 2"
+
+        emulator_args = {
+            "lattice_map": self.lattice_map,
+            "window_contents": self.window_contents,
+            "offset_corrections": self.offset_corrections,
+            "suffix_window_map": self.suffix_window_map,
+        }
+        if shard_dir is None:
+            shard_context = tempfile.TemporaryDirectory()
+        else:
+            shard_context = contextlib.nullcontext(shard_dir)
+        with shard_context as shard_path:
+            out_dir = Path(shard_path)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            tasks = [(*task, str(out_dir / name)) for *task, name in tasks]
+
+            workers = min(workers or os.cpu_count() or 1, max(1, num_blocks))
+            if workers == 1:
+                _init_shard_worker(emulator_args)
+                masks = [_generate_shard(task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_shard_worker, initargs=(emulator_args,)
+                ) as pool:
+                    masks = list(pool.map(_generate_shard, tasks))
+
+            corpus = []
+            for *_task, path in tasks:
+                with open(path, encoding="utf-8") as f:
+                    corpus.extend(row.rstrip("\n").split("\t") for row in f)
+
+        if tasks:
+            self.current_scribe = scribe
+            self.mask_state = masks[-1]
         return corpus
 
+    def _build_fast_tables(self) -> dict[str, Any]:
+        """Integer tables for ``generate_corpus_fast``.
+
+        Word IDs index ``vocab``; ``"???"`` (empty window) is appended last
+        and one extra all-zero mask row stands for "no previous word".
+        """
+        index: dict[str, int] = {}
+        for words in self.window_contents.values():
+            for w in words:
+                index.setdefault(w, len(index))
+        vocab = [*index, "???"]
+        index["???"] = len(index)
+        n_windows = self.num_windows
+
+        # Effective column for each modulated window (generate_token falls back to window 0)
+        columns = [
+            [index[w] for w in self.window_contents.get(m, self.window_contents.get(0, []))]
+            for m in range(n_windows)
+        ]
+        col_len = np.array([len(c) for c in columns], dtype=np.int64)
+        col_start = np.concatenate([[0], np.cumsum(col_len)[:-1]]).astype(np.int64)
+        # Trailing "???" keeps the gather valid for empty columns
+        col_words = np.array([w for c in columns for w in c] + [index["???"]], dtype=np.int64)
+
+        suffix_weight = np.ones((len(self.scribe_profiles), len(vocab)))
+        for s_idx, profile in enumerate(self.scribe_profiles.values()):
+            for w_idx, word in enumerate(vocab):
+                for sfx, weight in profile["suffix_weights"].items():
+                    if word.endswith(sfx):
+                        suffix_weight[s_idx, w_idx] += weight
+
+        chars = sorted({c for word in vocab for c in word})
+        bit = {c: i for i, c in enumerate(chars)}
+        char_mask = np.zeros((len(vocab) + 1, max(1, -(-len(chars) // 64))), dtype=np.uint64)
+        for w_idx, word in enumerate(vocab):
+            for c in set(word):
+                char_mask[w_idx, bit[c] // 64] |= np.uint64(1 << (bit[c] % 64))
+
+        def corrected(window: int) -> int:
+            return (window + self.offset_corrections.get(window, 0)) % n_windows
+
+        # Next window per word, or -1 to advance the current window by one
+        next_window = np.full(len(vocab), -1, dtype=np.int64)
+        for w_idx, word in enumerate(vocab):
+            nxt = self.lattice_map.get(word)
+            if nxt is None and self.suffix_window_map:
+                nxt = EvaluationEngine.resolve_oov_window(word, self.suffix_window_map)
+            if nxt is not None:
+                next_window[w_idx] = corrected(nxt)
+        fallback_window = np.array([corrected((c + 1) % n_windows) for c in range(n_windows)], dtype=np.int64)
+
+        return {
+            "vocab": vocab,
+            "col_len": col_len,
+            "col_start": col_start,
+            "col_words": col_words,
+            "suffix_weight": suffix_weight,
+            "char_mask": char_mask,
+            "next_window": next_window,
+            "fallback_window": fallback_window,
+        }
+
+    def generate_corpus_fast(self, num_lines: int, encoded: bool = False) -> list[list[str]] | EncodedCorpus:
+        """
+        Vectorized ``generate_mirror_corpus`` driven by ``np_rng``.
+
+        Uses the same model (section-level scribe shifts, a mask rotation
+        every 20 lines, 4-10 tokens per line, 20 weighted candidates per
+        token) but advances whole blocks of lines one token position at a
+        time. Suffix weights are looked up per word and the repetition
+        echo is a popcount over per-word character bitmasks. Output is
+        reproducible for a given seed but is not the same stream as
+        ``generate_mirror_corpus``.
+
+        With ``log_choices`` enabled this falls back to the per-token path,
+        which is the one that records choice context.
+
+        Args:
+            num_lines: Total lines to generate.
+            encoded: Return an ``EncodedCorpus`` instead of decoded lines.
+
+        Returns:
+            A list of lines (or the equivalent ``EncodedCorpus``).
+        """
+        if self.log_choices:
+            corpus = self.generate_mirror_corpus(num_lines)
+            return EncodedCorpus.from_lines(corpus) if encoded else corpus
+        if self.num_windows == 0:
+            raise ValueError("Cannot generate from an emulator with no windows")
+        if self._fast_tables is None:
+            self._fast_tables = self._build_fast_tables()
+        t = self._fast_tables
+        rng = self.np_rng
+        n_windows = self.num_windows
+        no_prev = len(t["vocab"])
+        scribes = list(self.scribe_profiles)
+
+        token_blocks = []
+        length_blocks = []
+        scribe = scribes.index(self.current_scribe)
+        mask = self.mask_state
+        for start in range(0, num_lines, FAST_BLOCK_LINES):
+            line_no = np.arange(start, min(start + FAST_BLOCK_LINES, num_lines))
+            n = line_no.size
+            # Scribe toggles at the start of every scribe block, including line 0
+            line_scribe = (scribe + line_no // SCRIBE_BLOCK_LINES + 1) % 2
+            line_mask = np.repeat(rng.integers(0, n_windows, size=-(-n // 20)), 20)[:n]
+            lengths = rng.integers(4, _MAX_LINE_LENGTH + 1, size=n)
+            current = rng.integers(0, n_windows, size=n)
+            prev = np.full(n, no_prev, dtype=np.int64)
+            tokens = np.zeros((n, _MAX_LINE_LENGTH), dtype=np.int64)
+
+            for p in range(_MAX_LINE_LENGTH):
+                rows = np.flatnonzero(lengths > p)
+                modulated = (current[rows] + line_mask[rows]) % n_windows
+                col_len = t["col_len"][modulated]
+                picks = (rng.random((rows.size, NUM_CANDIDATES)) * col_len[:, None]).astype(np.int64)
+                filled = col_len > 0
+                cand = t["col_words"][np.where(filled[:, None], t["col_start"][modulated][:, None] + picks, 0)]
+
+                weights = t["suffix_weight"][line_scribe[rows][:, None], cand]
+                overlap = _popcount(t["char_mask"][cand] & t["char_mask"][prev[rows]][:, None, :]).sum(axis=-1)
+                weights += 2.0 * overlap
+                cum = np.cumsum(weights, axis=1)
+                draw = rng.random(rows.size) * cum[:, -1]
+                choice = np.minimum((cum <= draw[:, None]).sum(axis=1), NUM_CANDIDATES - 1)
+                chosen = np.where(filled, cand[np.arange(rows.size), choice], no_prev - 1)
+
+                nxt = t["next_window"][chosen]
+                current[rows] = np.where(nxt >= 0, nxt, t["fallback_window"][current[rows]])
+                prev[rows] = chosen
+                tokens[rows, p] = chosen
+
+            token_blocks.append(tokens[np.arange(_MAX_LINE_LENGTH) < lengths[:, None]])
+            length_blocks.append(lengths)
+            scribe_end, mask = int(line_scribe[-1]), int(line_mask[-1])
+        if num_lines > 0:
+            self.current_scribe = scribes[scribe_end]
+            self.mask_state = mask
+
+        lengths = np.concatenate(length_blocks) if length_blocks else np.zeros(0, dtype=np.int64)
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = np.concatenate(token_blocks) if token_blocks else np.zeros(0, dtype=np.int64)
+        corpus = EncodedCorpus(list(t["vocab"]), flat, offsets)
+        return corpus if encoded else corpus.to_lines()
+
     def trace_lines(self, lines: list[list[str]]) -> None:
         """
         Traces the real manuscript lines through the lattice and logs 
@@ -204,17 +468,17 @@ class HighFidelityVolvelle:
                         )
                         if predicted_win is not None:
                             if self.log_choices:
-                                self.choice_log.append({
-                                    "type": "real_trace",
-                                    "line_no": l_idx,
-                                    "token_pos": p_idx,
-                                    "window_id": predicted_win,
-                                    "candidates_count": 0,
-                                    "chosen_word": word,
-                                    "chosen_index": -1,
-                                    "prev_word": prev_word,
-                                    "oov_recovered": True,
-                                })
+                                self.choice_log.record(
+                                    window_id=predicted_win,
+                                    chosen_index=-1,
+                                    candidates_count=0,
+                                    token_pos=p_idx,
+                                    word=word,
+                                    prev_word=prev_word,
+                                    kind=KIND_TRACE,
+                                    line_no=l_idx,
+                                    oov_recovered=True,
+                                )
                             current_window = predicted_win
                             prev_word = word
                             continue
@@ -232,16 +496,16 @@ class HighFidelityVolvelle:
                 if found_win is not None:
                     # Log the choice
                     chosen_orig_idx = self.window_contents[found_win].index(word)
-                    self.choice_log.append({
-                        "type": "real_trace",
-                        "line_no": l_idx,
-                        "token_pos": p_idx,
-                        "window_id": found_win,
-                        "candidates_count": len(self.window_contents[found_win]),
-                        "chosen_word": word,
-                        "chosen_index": chosen_orig_idx,
-                        "prev_word": prev_word,
-                    })
+                    self.choice_log.record(
+                        window_id=found_win,
+                        chosen_index=chosen_orig_idx,
+                        candidates_count=len(self.window_contents[found_win]),
+                        token_pos=p_idx,
+                        word=word,
+                        prev_word=prev_word,
+                        kind=KIND_TRACE,
+                        line_no=l_idx,
+                    )
 
                 # Advance machine to next predicted window
                 next_window = self.lattice_map.get(word)
@@ -253,3 +517,24 @@ class HighFidelityVolvelle:
                     next_window = (current_window + 1) % self.num_windows
                 current_window = next_window
                 prev_word = word
+
+
+_SHARD_EMULATOR_ARGS: dict[str, Any] = {}
+
+
+def _init_shard_worker(emulator_args: dict[str, Any]) -> None:
+    global _SHARD_EMULATOR_ARGS
+    _SHARD_EMULATOR_ARGS = emulator_args
+
+
+def _generate_shard(task: tuple[int, str, int, int, str]) -> int:
+    """Write one scribe block to its shard; returns the final mask state."""
+    seed, scribe, start, stop, path = task
+    emulator = HighFidelityVolvelle(seed=seed, **_SHARD_EMULATOR_ARGS)
+    # The block's first line swaps to the other scribe
+    emulator.current_scribe = scribe
+    with open(path, "w", encoding="utf-8") as f:
+        for line in emulator._iter_mirror_lines(start, stop):
+            f.write("\t".join(line))
+            f.write("\n")
+    return emulator.mask_state
@@ -0,0 +1,261 @@
+"""
+Force-directed layout backends for the Global Palette Solver (Phase 14)
+
+``networkx`` reproduces the original ``nx.spring_layout`` batches. ``fr``
+is a sparse NumPy Fruchterman-Reingold: attraction is summed over the edge
+list and, above ``EXACT_REPULSION_MAX_NODES``, repulsion is grid
+approximated (exact within the 3x3 cell neighbourhood, cell centroids
+beyond it), so an iteration costs roughly O(N + E + (N / occupancy)^2)
+instead of O(N^2). ``spectral_fr`` starts the same solver from a spectral
+embedding of the adjacency graph instead of uniform noise.
+
+All backends are deterministic for a given seed and report progress
+through an optional ``progress(completed, total)`` callback.
+"""
+
+from collections.abc import Callable
+
+import networkx as nx
+import numpy as np
+
+LayoutProgress = Callable[[int, int], None]
+
+# Above this many nodes the fr backends approximate far-field repulsion
+EXACT_REPULSION_MAX_NODES = 1000
+
+# Mean number of nodes per grid cell for approximated repulsion
+GRID_OCCUPANCY = 8
+
+_MIN_DISTANCE = 0.01
+_CHUNK = 512
+
+
+def graph_arrays(G: nx.Graph, weight: str = "weight") -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Symmetric COO edge arrays for ``G``.
+
+    Returns:
+        ``(nodes, rows, cols, weights)``; each undirected edge appears in
+        both directions and self-loops (which exert no force) are dropped.
+    """
+    nodes = list(G.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = [(index[u], index[v], float(d.get(weight, 1.0))) for u, v, d in G.edges(data=True) if u != v]
+    if not edges:
+        empty = np.zeros(0, dtype=np.int64)
+        return nodes, empty, empty, np.zeros(0)
+    u, v, w = (np.array(col) for col in zip(*edges, strict=True))
+    return nodes, np.concatenate([u, v]), np.concatenate([v, u]), np.concatenate([w, w])
+
+
+def rescale(pos: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Center on the origin and scale the largest coordinate to ``scale`` (as networkx)."""
+    pos = pos - pos.mean(axis=0)
+    lim = np.abs(pos).max() if pos.size else 0.0
+    if lim > 0:
+        pos *= scale / lim
+    return pos
+
+
+def _exact_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    disp = np.zeros_like(pos)
+    for start in range(0, len(pos), _CHUNK):
+        delta = pos[start:start + _CHUNK, None, :] - pos[None, :, :]
+        distance = np.maximum(np.linalg.norm(delta, axis=-1), _MIN_DISTANCE)
+        disp[start:start + _CHUNK] = np.einsum("ijk,ij->ik", delta, k * k / distance**2)
+    return disp
+
+
+def _grid_repulsion(pos: np.ndarray, k: float, occupancy: int = GRID_OCCUPANCY) -> np.ndarray:
+    """Repulsion with exact near-field pairs and cell-centroid far field."""
+    n = len(pos)
+    g = max(1, int(np.sqrt(n / occupancy)))
+    lo = pos.min(axis=0)
+    span = max(float(np.ptp(pos[:, 0])), float(np.ptp(pos[:, 1])), 1e-12)
+    cell_xy = np.clip(((pos - lo) / span * g).astype(np.int64), 0, g - 1)
+    cell = cell_xy[:, 0] * g + cell_xy[:, 1]
+
+    order = np.argsort(cell, kind="stable")
+    counts = np.bincount(cell, minlength=g * g)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    # Far field: cell-to-cell interactions between non-adjacent occupied cells
+    occupied = np.flatnonzero(counts)
+    mass = counts[occupied].astype(np.float64)
+    centroid = np.stack([
+        np.bincount(cell, weights=pos[:, 0], minlength=g * g)[occupied],
+        np.bincount(cell, weights=pos[:, 1], minlength=g * g)[occupied],
+    ], axis=1) / mass[:, None]
+    ox, oy = occupied // g, occupied % g
+    far = np.zeros((g * g, 2))
+    for start in range(0, len(occupied), _CHUNK):
+        sl = slice(start, start + _CHUNK)
+        delta = centroid[sl, None, :] - centroid[None, :, :]
+        distance = np.maximum(np.linalg.norm(delta, axis=-1), _MIN_DISTANCE)
+        near = (np.abs(ox[sl, None] - ox[None, :]) <= 1) & (np.abs(oy[sl, None] - oy[None, :]) <= 1)
+        coeff = np.where(near, 0.0, mass[None, :] * k * k / distance**2)
+        far[occupied[sl]] = np.einsum("ijk,ij->ik", delta, coeff)
+    disp = far[cell]
+
+    # Near field: exact pairs between nodes in the same or adjacent cells
+    sorted_cells = cell[order]
+    cx, cy = sorted_cells // g, sorted_cells % g
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx_, ny_ = cx + dx, cy + dy
+            valid = (nx_ >= 0) & (nx_ < g) & (ny_ >= 0) & (ny_ < g)
+            neighbour = np.where(valid, nx_ * g + ny_, 0)
+            per_node = np.where(valid, counts[neighbour], 0)
+            total = int(per_node.sum())
+            if total == 0:
+                continue
+            i = np.repeat(order, per_node)
+            offsets = np.arange(total) - np.repeat(np.cumsum(per_node) - per_node, per_node)
+            j = order[np.repeat(starts[neighbour], per_node) + offsets]
+            delta = pos[i] - pos[j]
+            distance = np.maximum(np.linalg.norm(delta, axis=1), _MIN_DISTANCE)
+            force = delta * (k * k / distance**2)[:, None]
+            disp[:, 0] += np.bincount(i, weights=force[:, 0], minlength=n)
+            disp[:, 1] += np.bincount(i, weights=force[:, 1], minlength=n)
+    return disp
+
+
+def fruchterman_reingold(n: int,
+                         rows: np.ndarray,
+                         cols: np.ndarray,
+                         weights: np.ndarray,
+                         iterations: int = 50,
+                         seed: int | None = 42,
+                         pos: np.ndarray | None = None,
+                         threshold: float = 1e-4,
+                         progress: LayoutProgress | None = None) -> np.ndarray:
+    """
+    Sparse Fruchterman-Reingold with the networkx force and cooling model.
+
+    Args:
+        n: Number of nodes.
+        rows, cols, weights: Symmetric COO adjacency (see ``graph_arrays``).
+        iterations: Maximum number of iterations.
+        seed: Seed for the uniform initial positions when ``pos`` is None.
+        pos: Optional (n, 2) initial positions.
+        threshold: Stop once the mean node displacement falls below this.
+        progress: Called as ``progress(completed, iterations)``.
+
+    Returns:
+        (n, 2) positions (not rescaled).
+    """
+    if pos is None:
+        pos = np.random.default_rng(seed).random((n, 2))
+    else:
+        pos = np.array(pos, dtype=np.float64)
+    if n == 0:
+        return pos
+
+    k = np.sqrt(1.0 / n)
+    t = max(float(np.ptp(pos[:, 0])), float(np.ptp(pos[:, 1]))) * 0.1
+    dt = t / (iterations + 1)
+    repulsion = _exact_repulsion if n <= EXACT_REPULSION_MAX_NODES else _grid_repulsion
+
+    for iteration in range(iterations):
+        disp = repulsion(pos, k)
+        if rows.size:
+            delta = pos[rows] - pos[cols]
+            distance = np.maximum(np.linalg.norm(delta, axis=1), _MIN_DISTANCE)
+            pull = delta * (weights * distance / k)[:, None]
+            disp[:, 0] -= np.bincount(rows, weights=pull[:, 0], minlength=n)
+            disp[:, 1] -= np.bincount(rows, weights=pull[:, 1], minlength=n)
+
+        length = np.linalg.norm(disp, axis=1)
+        length = np.where(length < _MIN_DISTANCE, 0.1, length)
+        delta_pos = disp * (t / length)[:, None]
+        pos += delta_pos
+        t -= dt
+        if progress is not None:
+            progress(iteration + 1, iterations)
+        if np.linalg.norm(delta_pos) / n < threshold:
+            break
+    return pos
+
+
+def spectral_positions(n: int,
+                       rows: np.ndarray,
+                       cols: np.ndarray,
+                       weights: np.ndarray,
+                       seed: int | None = 42) -> np.ndarray:
+    """
+    Spectral embedding in [0, 1]^2 from the normalized adjacency matrix.
+
+    Uses the second and third eigenvectors of D^-1/2 A D^-1/2 (ARPACK with
+    a seeded start vector, signs fixed), falling back to uniform noise for
+    graphs too small to embed.
+    """
+    rng = np.random.default_rng(seed)
+    if n < 4 or rows.size == 0:
+        return rng.random((n, 2))
+
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import eigsh
+
+    adjacency = coo_matrix((weights, (rows, cols)), shape=(n, n)).tocsr()
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    inv_sqrt = np.where(degree > 0, 1.0 / np.sqrt(np.maximum(degree, 1e-300)), 0.0)
+    normalized = adjacency.multiply(inv_sqrt[:, None]).multiply(inv_sqrt[None, :]).tocsr()
+
+    values, vectors = eigsh(normalized, k=3, which="LA", v0=rng.random(n))
+    vectors = vectors[:, np.argsort(values)[::-1]][:, 1:3] * inv_sqrt[:, None]
+    for col in range(2):
+        if vectors[np.argmax(np.abs(vectors[:, col])), col] < 0:
+            vectors[:, col] = -vectors[:, col]
+
+    lo = vectors.min(axis=0)
+    span = np.where(np.ptp(vectors, axis=0) > 0, np.ptp(vectors, axis=0), 1.0)
+    # Jitter separates nodes with identical embeddings (e.g. twins)
+    return (vectors - lo) / span + rng.uniform(-1e-3, 1e-3, size=(n, 2))
+
+
+def _networkx_layout(G: nx.Graph, iterations: int, seed: int | None,
+                     progress: LayoutProgress | None) -> dict:
+    # Batches of 5 iterations warm-started from the previous positions
+    batch_size = 5
+    current_pos = None
+    for i in range(0, iterations, batch_size):
+        actual_iter = min(batch_size, iterations - i)
+        current_pos = nx.spring_layout(
+            G,
+            weight="weight",
+            iterations=actual_iter,
+            pos=current_pos,
+            seed=seed if i == 0 else None,
+        )
+        if progress is not None:
+            progress(i + actual_iter, iterations)
+    return current_pos
+
+
+def compute_layout(G: nx.Graph,
+                   method: str = "networkx",
+                   iterations: int = 30,
+                   seed: int | None = 42,
+                   progress: LayoutProgress | None = None) -> dict:
+    """
+    Lay out ``G`` with one of ``config.LAYOUT_BACKENDS``.
+
+    Returns:
+        Mapping from node to an (x, y) array, centered and scaled to [-1, 1].
+    """
+    if G.number_of_nodes() == 0:
+        return {}
+    if method == "networkx":
+        return _networkx_layout(G, iterations, seed, progress)
+
+    nodes, rows, cols, weights = graph_arrays(G)
+    if method == "fr":
+        init = None
+    elif method == "spectral_fr":
+        init = spectral_positions(len(nodes), rows, cols, weights, seed)
+    else:
+        raise ValueError(f"Unknown layout backend {method!r}")
+    pos = fruchterman_reingold(
+        len(nodes), rows, cols, weights, iterations=iterations, seed=seed, pos=init, progress=progress
+    )
+    return dict(zip(nodes, rescale(pos), strict=True))
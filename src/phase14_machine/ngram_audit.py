@@ -0,0 +1,192 @@
+"""
+Streaming n-gram overgeneration audit (Phase 14)
+
+``EvaluationEngine.calculate_overgeneration`` holds every real and synthetic
+n-gram as a Python tuple in a set. ``NgramAudit`` instead hashes each
+n-gram to a 64-bit integer: tokens get a stable 64-bit hash and an n-gram
+folds its token hashes through the splitmix64 finalizer. The real corpus
+becomes one sorted unique ``np.uint64`` array per order, and synthetic lines
+are consumed in chunks from any iterable (a generator, a list or an
+``EncodedCorpus``), with the unique synthetic hashes merged as it goes.
+Memory is therefore 8 bytes per distinct n-gram and one chunk of lines,
+independent of how many synthetic lines stream through.
+
+Counts are exact up to hash collisions. Two distinct n-grams of one order
+collide with probability 2^-64, so for D distinct n-grams the expected
+number of merged pairs is below D^2 / 2^65 (about 3e-6 for 10 million).
+"""
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from typing import Any
+
+import numpy as np
+
+from phase1_foundation.core.encoded_corpus import EncodedCorpus
+
+# Synthetic lines hashed per chunk
+STREAM_CHUNK_LINES = 50000
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_FOLD = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _splitmix(x: np.ndarray) -> np.ndarray:
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MIX_1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MIX_2
+    return x ^ (x >> np.uint64(31))
+
+
+def token_hash(token: str) -> int:
+    """Stable 64-bit hash of a token (independent of ``PYTHONHASHSEED``)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _merge_unique(parts: list[np.ndarray]) -> np.ndarray:
+    if not parts:
+        return np.zeros(0, dtype=np.uint64)
+    return np.unique(np.concatenate(parts))
+
+
+class NgramAudit:
+    """
+    Hashed n-gram sets for a real corpus plus a streamed synthetic corpus.
+
+    Args:
+        real_lines: Real manuscript lines (or an ``EncodedCorpus``).
+        orders: N-gram orders to audit.
+        vocab: Optional lexicon clamp; n-grams containing a token outside
+            it are skipped on both sides (as ``calculate_overgeneration``).
+    """
+
+    def __init__(self,
+                 real_lines: Iterable[Sequence[str]],
+                 orders: Sequence[int] = (2, 3),
+                 vocab: set[str] | None = None):
+        if any(n < 1 for n in orders):
+            raise ValueError(f"N-gram orders must be positive, got {list(orders)}")
+        self.orders = tuple(orders)
+        self.vocab = vocab
+        self._hashes: dict[str, int] = {}
+        self.real = {n: _merge_unique(parts) for n, parts in self._hash_stream(real_lines).items()}
+        self._syn = {n: np.zeros(0, dtype=np.uint64) for n in self.orders}
+        self._pending: dict[int, list[np.ndarray]] = {n: [] for n in self.orders}
+        self._pending_size = dict.fromkeys(self.orders, 0)
+        self.syn_lines = 0
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def _token_hashes(self, tokens: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Hash per token and whether it passes the vocabulary clamp."""
+        hashes = self._hashes
+        values = []
+        keep = []
+        for token in tokens:
+            h = hashes.get(token)
+            if h is None:
+                h = hashes[token] = token_hash(token)
+            values.append(h)
+            keep.append(self.vocab is None or token in self.vocab)
+        return np.array(values, dtype=np.uint64), np.array(keep, dtype=bool)
+
+    def _chunk_ngrams(self, hashes: np.ndarray, keep: np.ndarray, offsets: np.ndarray) -> dict[int, np.ndarray]:
+        """Unique n-gram hashes per order for one CSR chunk."""
+        n_tokens = hashes.size
+        line_end = np.repeat(offsets[1:], np.diff(offsets))
+        # Prefix count of clamped-out tokens, so a window is clean when it adds nothing
+        dropped = np.concatenate([[0], np.cumsum(~keep)])
+        starts = np.arange(n_tokens)
+        result = {}
+        for n in self.orders:
+            valid = starts + n <= line_end
+            idx = starts[valid]
+            idx = idx[dropped[idx + n] == dropped[idx]]
+            h = hashes[idx]
+            for k in range(1, n):
+                h = _splitmix(h * _FOLD + hashes[idx + k])
+            result[n] = np.unique(h)
+        return result
+
+    def _chunks(self, lines: Iterable[Sequence[str]]):
+        """Yield ``(n_lines, {order: unique hashes})`` for successive chunks of ``lines``."""
+        if isinstance(lines, EncodedCorpus):
+            vocab_hashes, vocab_keep = self._token_hashes(lines.vocab)
+            for start in range(0, len(lines), STREAM_CHUNK_LINES):
+                chunk = lines.slice(start, min(start + STREAM_CHUNK_LINES, len(lines)))
+                yield len(chunk), self._chunk_ngrams(
+                    vocab_hashes[chunk.tokens], vocab_keep[chunk.tokens], chunk.offsets
+                )
+            return
+
+        iterator = iter(lines)
+        while True:
+            block = list(islice(iterator, STREAM_CHUNK_LINES))
+            if not block:
+                return
+            lengths = np.fromiter((len(line) for line in block), dtype=np.int64, count=len(block))
+            offsets = np.zeros(len(block) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            hashes, keep = self._token_hashes(t for line in block for t in line)
+            yield len(block), self._chunk_ngrams(hashes, keep, offsets)
+
+    def _hash_stream(self, lines: Iterable[Sequence[str]]) -> dict[int, list[np.ndarray]]:
+        parts: dict[int, list[np.ndarray]] = {n: [] for n in self.orders}
+        for _n_lines, chunk in self._chunks(lines):
+            for n, h in chunk.items():
+                parts[n].append(h)
+        return parts
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def update(self, syn_lines: Iterable[Sequence[str]]) -> "NgramAudit":
+        """Consume synthetic lines (any iterable, read once in chunks)."""
+        for n_lines, chunk in self._chunks(syn_lines):
+            self.syn_lines += n_lines
+            for n, h in chunk.items():
+                self._pending[n].append(h)
+                self._pending_size[n] += h.size
+                # Amortized merge: fold pending chunks in once they outgrow the merged set
+                if self._pending_size[n] > max(self._syn[n].size, STREAM_CHUNK_LINES):
+                    self._consolidate(n)
+        return self
+
+    def _consolidate(self, n: int) -> None:
+        if self._pending[n]:
+            self._syn[n] = _merge_unique([self._syn[n], *self._pending[n]])
+            self._pending[n] = []
+            self._pending_size[n] = 0
+
+    def synthetic(self, n: int) -> np.ndarray:
+        """Sorted unique synthetic n-gram hashes of order ``n`` seen so far."""
+        self._consolidate(n)
+        return self._syn[n]
+
+    def results(self) -> dict[int, dict[str, Any]]:
+        """
+        Per-order counts.
+
+        Returns:
+            ``{n: {"real_count", "syn_count", "overlap", "unattested_count", "rate"}}``
+            where ``rate`` is the unattested fraction of distinct synthetic n-grams.
+        """
+        res = {}
+        for n in self.orders:
+            real, syn = self.real[n], self.synthetic(n)
+            overlap = int(np.intersect1d(real, syn, assume_unique=True).size)
+            unattested = int(syn.size) - overlap
+            res[n] = {
+                "real_count": int(real.size),
+                "syn_count": int(syn.size),
+                "overlap": overlap,
+                "unattested_count": unattested,
+                "rate": unattested / syn.size if syn.size else 0,
+            }
+        return res
@@ -0,0 +1,342 @@
+"""
+Persistent cache for solved palettes (Phase 14)
+
+Most Phase 14 runners rebuild the same palette from identical inputs:
+``ingest_data`` -> ``solve_grid`` -> ``cluster_lattice`` -> ``reorder_windows``.
+``PaletteCache`` stores those outputs under ``results/cache/phase14/`` as
+content-addressed compressed ``.npz`` files::
+
+    layout-<sha256>.npz    words (str), pos float64[n, 2]
+    lattice-<sha256>.npz   words (str), windows int32[n]
+
+A layout entry is keyed by a hash of the token stream, the slip pairs,
+``top_n``, ``iterations``, ``seed`` and the resolved layout backend; a
+lattice entry adds ``num_windows``, whether windows were spectrally
+reordered and the resolved clustering method. Lattices fitted by a
+warm-started ``cluster_lattice_sweep`` are stored under a key that also
+names the sweep grid, so they never stand in for an independent fit.
+Words are stored in solver order, so the rebuilt dictionaries (including
+key and list order) are identical to a fresh solve.
+
+Hits are recorded through ``ComputationTracker`` as
+``ComputationMethod.CACHED``. Reads refresh a file's mtime and writes evict
+least recently used entries until the directory fits ``max_bytes``.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from phase1_foundation.config import (
+    ComputationMethod,
+    get_cluster_method,
+    get_layout_backend,
+    get_tracker,
+)
+from phase14_machine.palette_solver import GlobalPaletteSolver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("results/cache/phase14")
+
+# LRU size cap for the cache directory
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the solver output for identical inputs changes
+CACHE_VERSION = 2
+
+_COMPONENT = "GlobalPaletteSolver"
+
+
+def _hash_inputs(lines: Sequence[Sequence[str]], slips: Sequence[dict[str, Any]]) -> Any:
+    digest = hashlib.sha256(f"palette-v{CACHE_VERSION}".encode())
+    for line in lines:
+        digest.update("\x1f".join(line).encode("utf-8"))
+        digest.update(b"\x1e")
+    digest.update(b"\x1d")
+    # ingest_data only reads the slipped word and the word physically above it
+    for s in slips:
+        digest.update(f"{s['word']}\x1f{s['actual_context'][0]}\x1e".encode())
+    return digest
+
+
+def layout_key(lines: Sequence[Sequence[str]],
+               slips: Sequence[dict[str, Any]] = (),
+               top_n: int | None = 8000,
+               iterations: int = 30,
+               seed: int | None = 42,
+               layout: str | None = None) -> str:
+    """Cache key for ``ingest_data`` + ``solve_grid`` with these inputs."""
+    digest = _hash_inputs(lines, slips)
+    # Mirror ingest_data, which treats a falsy top_n as 8000
+    digest.update(repr((top_n or 8000, iterations, seed, get_layout_backend(layout))).encode())
+    return digest.hexdigest()
+
+
+def lattice_key(layout_hash: str,
+                num_windows: int,
+                reorder: bool,
+                method: str | None = None,
+                sweep: Sequence[int] | None = None) -> str:
+    """
+    Cache key for ``cluster_lattice`` (and ``reorder_windows``) on a cached layout.
+
+    Args:
+        method: Clustering backend, resolved with ``get_cluster_method``.
+        sweep: K grid of a warm-started ``cluster_lattice_sweep``; ``None``
+            for an independent ``cluster_lattice`` fit.
+    """
+    parts = f"{layout_hash}:{num_windows}:{int(reorder)}:{get_cluster_method(method)}"
+    if sweep is not None:
+        parts += ":sweep=" + ",".join(str(k) for k in sorted(set(sweep)))
+    return hashlib.sha256(parts.encode()).hexdigest()
+
+
+class PaletteCache:
+    """
+    Content-addressed on-disk cache of solved palettes.
+
+    Args:
+        cache_dir: Directory holding the ``.npz`` entries.
+        max_bytes: Total size the directory is trimmed to after each write.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.cache_dir / f"{kind}-{key}.npz"
+
+    def _read(self, kind: str, key: str) -> dict[str, np.ndarray] | None:
+        path = self._path(kind, key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Discarding unreadable palette cache entry %s: %s", path.name, exc)
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return arrays
+
+    def _write(self, kind: str, key: str, **arrays: np.ndarray) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp, self._path(kind, key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def entries(self) -> list[Path]:
+        """Cache files, least recently used first."""
+        if not self.cache_dir.is_dir():
+            return []
+        return sorted(self.cache_dir.glob("*.npz"), key=lambda p: p.stat().st_mtime_ns)
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.entries())
+
+    def evict(self) -> int:
+        """Delete least recently used entries until under ``max_bytes``; returns the count removed."""
+        entries = self.entries()
+        sizes = [p.stat().st_size for p in entries]
+        total = sum(sizes)
+        removed = 0
+        for path, size in zip(entries, sizes, strict=True):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+
+    def _record_hit(self, category: str, key: str, row_count: int, parameters: dict[str, Any]) -> None:
+        get_tracker().record_computation(
+            component=_COMPONENT,
+            category=category,
+            method=ComputationMethod.CACHED,
+            row_count=row_count,
+            parameters=parameters,
+            details=key,
+        )
+
+    # ------------------------------------------------------------------
+    # Solver stages
+    # ------------------------------------------------------------------
+
+    def solve_grid(self,
+                   lines: Sequence[Sequence[str]],
+                   slips: Sequence[dict[str, Any]] = (),
+                   top_n: int | None = 8000,
+                   iterations: int = 30,
+                   seed: int | None = 42,
+                   layout: str | None = None) -> dict[str, tuple[float, float]]:
+        """
+        ``GlobalPaletteSolver`` ``ingest_data`` + ``solve_grid``, cached.
+
+        Returns:
+            A dictionary mapping each word to its (x, y) coordinates.
+        """
+        key = layout_key(lines, slips, top_n, iterations, seed, layout)
+        parameters = {"top_n": top_n, "iterations": iterations, "seed": seed, "layout": get_layout_backend(layout)}
+        cached = self._read("layout", key)
+        if cached is not None:
+            self._record_hit("palette_layout", key, len(cached["words"]), parameters)
+            return {str(w): (float(x), float(y)) for w, (x, y) in zip(cached["words"], cached["pos"], strict=True)}
+
+        solver = GlobalPaletteSolver()
+        solver.ingest_data(list(slips), lines, top_n=top_n)
+        solved_pos = solver.solve_grid(iterations=iterations, layout=layout, seed=seed)
+        get_tracker().record_computed(_COMPONENT, "palette_layout", len(solved_pos), parameters)
+        self._write(
+            "layout", key,
+            words=np.array(list(solved_pos), dtype=str),
+            pos=np.array(list(solved_pos.values()), dtype=np.float64).reshape(-1, 2),
+        )
+        return solved_pos
+
+    def solve_lattice(self,
+                      lines: Sequence[Sequence[str]],
+                      slips: Sequence[dict[str, Any]] = (),
+                      top_n: int | None = 8000,
+                      iterations: int = 30,
+                      seed: int | None = 42,
+                      layout: str | None = None,
+                      num_windows: int = 50,
+                      reorder: bool = True,
+                      method: str | None = None) -> dict[str, Any]:
+        """
+        Full palette pipeline, cached per stage.
+
+        Args:
+            reorder: Apply ``reorder_windows`` on ``lines`` after clustering.
+            method: Clustering backend passed to ``cluster_lattice``.
+
+        Returns:
+            ``{"word_to_window": ..., "window_contents": ...}`` as returned by
+            ``cluster_lattice`` / ``reorder_windows``.
+        """
+        layout_hash = layout_key(lines, slips, top_n, iterations, seed, layout)
+        key = lattice_key(layout_hash, num_windows, reorder, method)
+        parameters = self._lattice_parameters(top_n, iterations, seed, layout, reorder, method)
+        parameters["num_windows"] = num_windows
+        cached = self._read("lattice", key)
+        if cached is not None:
+            self._record_hit("palette_lattice", key, len(cached["words"]), parameters)
+            return _lattice_from_arrays(cached["words"], cached["windows"])
+
+        solved_pos = self.solve_grid(lines, slips, top_n, iterations, seed, layout)
+        lattice = GlobalPaletteSolver().cluster_lattice(
+            solved_pos, num_windows=num_windows, method=method
+        )
+        return self._store_lattice(key, lattice, lines, reorder, parameters)
+
+    def solve_lattice_sweep(self,
+                            lines: Sequence[Sequence[str]],
+                            num_windows: Sequence[int],
+                            slips: Sequence[dict[str, Any]] = (),
+                            top_n: int | None = 8000,
+                            iterations: int = 30,
+                            seed: int | None = 42,
+                            layout: str | None = None,
+                            reorder: bool = True,
+                            method: str | None = None) -> dict[int, dict[str, Any]]:
+        """
+        ``solve_lattice`` for a grid of window counts via ``cluster_lattice_sweep``.
+
+        Each K is cached under a key naming the whole sweep grid, because a
+        warm-started fit depends on the smaller counts fitted before it.
+
+        Returns:
+            Mapping from window count to the lattice, as in ``solve_lattice``.
+        """
+        layout_hash = layout_key(lines, slips, top_n, iterations, seed, layout)
+        parameters = self._lattice_parameters(top_n, iterations, seed, layout, reorder, method)
+        parameters["sweep"] = sorted(set(num_windows))
+        keys = {
+            k: lattice_key(layout_hash, k, reorder, method, sweep=num_windows)
+            for k in num_windows
+        }
+
+        lattices: dict[int, dict[str, Any]] = {}
+        for k, key in keys.items():
+            cached = self._read("lattice", key)
+            if cached is None:
+                break
+            self._record_hit(
+                "palette_lattice", key, len(cached["words"]), {**parameters, "num_windows": k}
+            )
+            lattices[k] = _lattice_from_arrays(cached["words"], cached["windows"])
+        else:
+            return {k: lattices[k] for k in num_windows}
+
+        solved_pos = self.solve_grid(lines, slips, top_n, iterations, seed, layout)
+        sweep = GlobalPaletteSolver().cluster_lattice_sweep(solved_pos, list(keys), method=method)
+        return {
+            k: self._store_lattice(
+                keys[k], sweep[k], lines, reorder, {**parameters, "num_windows": k}
+            )
+            for k in num_windows
+        }
+
+    @staticmethod
+    def _lattice_parameters(top_n: int | None,
+                            iterations: int,
+                            seed: int | None,
+                            layout: str | None,
+                            reorder: bool,
+                            method: str | None) -> dict[str, Any]:
+        return {
+            "top_n": top_n, "iterations": iterations, "seed": seed,
+            "layout": get_layout_backend(layout), "reorder": reorder,
+            "cluster_method": get_cluster_method(method),
+        }
+
+    def _store_lattice(self, key: str, lattice: dict[str, Any], lines: Sequence[Sequence[str]],
+                       reorder: bool, parameters: dict[str, Any]) -> dict[str, Any]:
+        if reorder:
+            lattice = GlobalPaletteSolver.reorder_windows(
+                lattice["word_to_window"], lattice["window_contents"], lines
+            )
+        get_tracker().record_computed(_COMPONENT, "palette_lattice", len(lattice["word_to_window"]), parameters)
+        word_to_window = lattice["word_to_window"]
+        self._write(
+            "lattice", key,
+            words=np.array(list(word_to_window), dtype=str),
+            windows=np.array(list(word_to_window.values()), dtype=np.int32),
+        )
+        return lattice
+
+
+def _lattice_from_arrays(words: np.ndarray, windows: np.ndarray) -> dict[str, Any]:
+    # Windows are listed in order of first appearance, as cluster_lattice builds them
+    word_to_window = {str(w): int(win) for w, win in zip(words, windows, strict=True)}
+    window_contents: dict[int, list[str]] = defaultdict(list)
+    for word, win in word_to_window.items():
+        window_contents[win].append(word)
+    return {"word_to_window": word_to_window, "window_contents": dict(window_contents)}
@@ -11,6 +11,9 @@ from typing import Any
 import networkx as nx
 import numpy as np
 
+from phase1_foundation.config import get_layout_backend
+from phase14_machine.layout import LayoutProgress, compute_layout
+
 
 class GlobalPaletteSolver:
     """
@@ -62,12 +65,21 @@ class GlobalPaletteSolver:
                 if u in keep_tokens and v in keep_tokens:
                     self.G.add_edge(u, v, weight=1.0, type='transition')
 
-    def solve_grid(self, iterations: int = 30) -> dict[str, tuple[float, float]]:
+    def solve_grid(self,
+                   iterations: int = 30,
+                   layout: str | None = None,
+                   seed: int | None = 42,
+                   progress: LayoutProgress | None = None) -> dict[str, tuple[float, float]]:
         """
         Infers 2D coordinates using an iterative force-directed layout.
         
         Args:
             iterations: Total number of optimization steps.
+            layout: Layout backend (see ``phase14_machine.layout``). Defaults
+                to the ``PALETTE_LAYOUT_BACKEND`` environment variable, then
+                ``"networkx"``.
+            seed: Seed for the initial positions.
+            progress: Optional callback invoked as ``progress(completed, total)``.
             
         Returns:
             A dictionary mapping each word to its (x, y) coordinates.
@@ -76,36 +88,26 @@ class GlobalPaletteSolver:
         if num_nodes == 0:
             return {}
 
-        print(f"Solving physical grid for {num_nodes} tokens...")
-
-        # We run iterations in batches to provide status heartbeats
-        batch_size = 5
-        current_pos = None
-
-        for i in range(0, iterations, batch_size):
-            actual_iter = min(batch_size, iterations - i)
-            # Use fixed seed for first batch, then use previous positions for stability
-            current_pos = nx.spring_layout(
-                self.G,
-                weight='weight',
-                iterations=actual_iter,
-                pos=current_pos,
-                seed=42 if i == 0 else None
-            )
-            print(f"  [HEARTBEAT] Completed {i + actual_iter}/{iterations} iterations...")
+        method = get_layout_backend(layout)
+        print(f"Solving physical grid for {num_nodes} tokens ({method} layout)...")
+        current_pos = compute_layout(self.G, method, iterations, seed, progress)
 
         print("Layout optimization complete.")
         return {word: (float(coord[0]), float(coord[1])) for word, coord in current_pos.items()}
 
     def cluster_lattice(self,
                         solved_pos: dict[str, tuple[float, float]],
-                        num_windows: int = 50) -> dict[str, Any]:
+                        num_windows: int = 50,
+                        method: str | None = None) -> dict[str, Any]:
         """
         Groups words into discrete functional windows based on their 2D coordinates.
         
         Args:
             solved_pos: Mapping from word to its physical coordinates.
             num_windows: The number of clusters (windows) to create.
+            method: Clustering backend (see ``phase14_machine.clustering``).
+                Defaults to the ``PHASE14_CLUSTER_METHOD`` environment
+                variable, then ``"kmeans"``.
             
         Returns:
             A dictionary containing the word-to-window map and the window-to-words list.
@@ -113,15 +115,45 @@ class GlobalPaletteSolver:
         if not solved_pos:
             return {"word_to_window": {}, "window_contents": {}}
 
-        from sklearn.cluster import KMeans
+        from phase14_machine.clustering import kmeans
         words = list(solved_pos.keys())
         coords = np.array([solved_pos[w] for w in words])
 
         # KMeans finds the most natural 'windows' in the physical space
         print(f"Clustering {len(words)} tokens into {num_windows} physical windows...")
-        kmeans = KMeans(n_clusters=num_windows, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(coords)
+        labels = kmeans(coords, num_windows, method=method, seed=42).labels
+        return self._lattice_from_labels(words, labels)
+
+    def cluster_lattice_sweep(self,
+                              solved_pos: dict[str, tuple[float, float]],
+                              num_windows: list[int],
+                              method: str | None = None,
+                              warm_start: bool = True) -> dict[int, dict[str, Any]]:
+        """
+        ``cluster_lattice`` for a grid of window counts.
 
+        Counts are fitted in ascending order and each one is warm-started
+        from the centroids of the next smaller count (see
+        ``phase14_machine.clustering.KMeansSweep``).
+
+        Returns:
+            Mapping from window count to the ``cluster_lattice`` result.
+        """
+        if not solved_pos:
+            return {k: {"word_to_window": {}, "window_contents": {}} for k in num_windows}
+
+        from phase14_machine.clustering import KMeansSweep
+        words = list(solved_pos.keys())
+        coords = np.array([solved_pos[w] for w in words])
+        print(f"Clustering {len(words)} tokens for {len(num_windows)} window counts...")
+        sweep = KMeansSweep(coords, method=method, seed=42, warm_start=warm_start)
+        return {
+            k: self._lattice_from_labels(words, result.labels)
+            for k, result in sweep.fit_many(num_windows).items()
+        }
+
+    @staticmethod
+    def _lattice_from_labels(words: list[str], labels: np.ndarray) -> dict[str, Any]:
         word_to_window = {words[i]: int(labels[i]) for i in range(len(words))}
 
         # Build the 'Window Contents' map
@@ -5,59 +5,144 @@ Clusters transition profiles to identify discrete 'Mask' states
 (Volvelle settings) across the manuscript.
 """
 
-from collections import Counter
 from typing import Any
 
 import numpy as np
-from sklearn.cluster import KMeans
+from scipy.sparse import csr_matrix
+
+from phase1_foundation.core.encoded_corpus import LinesLike, as_encoded
+from phase14_machine.clustering import ClusterResult, KMeansSweep, kmeans
 
 
 class StateSpaceSolver:
     """
     Identifies discrete mechanical states by clustering local transition matrices.
     """
-    def build_transition_vectors(self, lines: list[list[str]], window_size: int = 500) -> np.ndarray:
+    def build_transition_vectors(self,
+                                 lines: LinesLike,
+                                 window_size: int = 500,
+                                 step: int = 100,
+                                 top_n: int = 50,
+                                 sparse: bool = False) -> np.ndarray | csr_matrix:
         """
         Produces a feature vector for each window representing its transition profile.
+
+        Windows of ``window_size`` lines start every ``step`` lines. Each
+        vector is the flattened ``top_n x top_n`` matrix of within-line
+        transitions between the ``top_n`` most common tokens, normalized to
+        sum to 1. With ``sparse=True`` the result is a ``scipy.sparse``
+        CSR matrix, which keeps large ``top_n`` tractable.
+        """
+        corpus = as_encoded(lines)
+        # We focus on the top N most common tokens to keep the feature space manageable.
+        # Ties break by first appearance, as Counter.most_common does.
+        counts = corpus.token_counts()
+        first_seen = np.full(corpus.vocab_size, corpus.n_tokens, dtype=np.int64)
+        ids, first = np.unique(corpus.tokens, return_index=True)
+        first_seen[ids] = first
+        top = np.lexsort((first_seen, -counts))[:min(top_n, int(np.count_nonzero(counts)))]
+        k = len(top)
+        rank = np.full(corpus.vocab_size, -1, dtype=np.int64)
+        rank[top] = np.arange(k)
+
+        # Within-line bigrams whose tokens are both in the top N, keyed by
+        # their flattened index into the NxN transition matrix.
+        pos = corpus.bigram_positions()
+        u = rank[corpus.tokens[pos]]
+        v = rank[corpus.tokens[pos + 1]]
+        keep = (u >= 0) & (v >= 0)
+        pos, cells = pos[keep], u[keep] * k + v[keep]
+        line_of = np.searchsorted(corpus.offsets, pos, side="right") - 1
+
+        n_windows = len(range(0, len(corpus) - window_size, step))
+        window_counts = self._sliding_counts(line_of, cells, n_windows, window_size, step, k * k)
+
+        # Normalize
+        totals = np.asarray(window_counts.sum(axis=1)).ravel()
+        window_counts.data /= np.repeat(totals, np.diff(window_counts.indptr))
+        return window_counts if sparse else window_counts.toarray()
+
+    @staticmethod
+    def _sliding_counts(line_of: np.ndarray, cells: np.ndarray, n_windows: int,
+                        window_size: int, step: int, n_cells: int) -> csr_matrix:
+        """
+        Transition counts per window, built incrementally.
+
+        Instead of recounting every window, each line's transitions are
+        added at the first window containing the line and subtracted at
+        the first window past it. The per-window count of a cell is then
+        the running sum of its deltas, which changes only where a line
+        enters or leaves, so the work is proportional to the number of
+        transitions plus the nonzeros of the result.
         """
-        # We focus on the top 50 most common tokens to keep the feature space manageable
-        all_tokens = [t for l in lines for t in l]
-        top_50 = [w for w, c in Counter(all_tokens).most_common(50)]
-        word_to_idx = {w: i for i, w in enumerate(top_50)}
-
-        vectors = []
-        for start in range(0, len(lines) - window_size, 100):
-            window = lines[start:start + window_size]
-            # Transition Matrix (50x50) flattened into a vector of 2500
-            vec = np.zeros(len(top_50) * len(top_50))
-            for line in window:
-                for i in range(len(line) - 1):
-                    u, v = line[i], line[i+1]
-                    if u in word_to_idx and v in word_to_idx:
-                        idx = word_to_idx[u] * len(top_50) + word_to_idx[v]
-                        vec[idx] += 1
-            # Normalize
-            if np.sum(vec) > 0:
-                vec /= np.sum(vec)
-            vectors.append(vec)
-
-        return np.array(vectors)
-
-    def solve_states(self, vectors: np.ndarray, num_states: int = 3) -> dict[str, Any]:
+        # Line L lies in windows i with i * step <= L < i * step + window_size
+        enter = np.maximum(-((window_size - 1 - line_of) // step), 0)
+        leave = np.minimum(line_of // step + 1, n_windows)
+        live = enter < leave
+        enter, leave, cells = enter[live], leave[live], cells[live]
+
+        # Net delta per (cell, window), sorted by cell and then window
+        exits = leave < n_windows
+        keys = np.concatenate([cells * (n_windows + 1) + enter,
+                               cells[exits] * (n_windows + 1) + leave[exits]])
+        deltas = np.concatenate([np.ones(enter.size, dtype=np.int64),
+                                 np.full(int(exits.sum()), -1, dtype=np.int64)])
+        keys, inverse = np.unique(keys, return_inverse=True)
+        deltas = np.bincount(inverse, weights=deltas, minlength=keys.size).astype(np.int64)
+        key_cells, key_windows = np.divmod(keys, n_windows + 1)
+
+        # Running sum within each cell; every count holds until the cell's next delta
+        running = np.cumsum(deltas)
+        group_start = np.flatnonzero(np.r_[True, key_cells[1:] != key_cells[:-1]])
+        group_size = np.diff(np.r_[group_start, keys.size])
+        running -= np.repeat(np.r_[0, running[group_start[1:] - 1]], group_size)
+        until = np.r_[key_windows[1:], n_windows]
+        until[group_start[1:] - 1] = n_windows
+        spans = until - key_windows
+        nonzero = running != 0
+        running, spans, key_cells, key_windows = (
+            running[nonzero], spans[nonzero], key_cells[nonzero], key_windows[nonzero]
+        )
+
+        span_start = np.repeat(np.cumsum(spans) - spans, spans)
+        rows = np.repeat(key_windows, spans) + np.arange(span_start.size) - span_start
+        return csr_matrix(
+            (np.repeat(running, spans).astype(float), (rows, np.repeat(key_cells, spans))),
+            shape=(n_windows, n_cells),
+        )
+
+    def solve_states(self, vectors: np.ndarray, num_states: int = 3, method: str | None = None) -> dict[str, Any]:
         """
         Clusters the transition vectors into discrete states.
+
+        ``method`` selects the clustering backend (see
+        ``phase14_machine.clustering``); ``"gram"`` clusters through the
+        cached window-by-window inner products instead of the
+        2,500-dimensional vectors.
         """
         if vectors.shape[0] < num_states:
             return {"num_states": 0}
 
-        kmeans = KMeans(n_clusters=num_states, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(vectors)
+        result = kmeans(vectors, num_states, method=method, seed=42)
+        return self._states(num_states, result)
 
-        # Calculate cluster centroids (The 'Prototypes' for each mask state)
-        centroids = kmeans.cluster_centers_
+    def solve_state_sweep(self,
+                          vectors: np.ndarray,
+                          state_counts: list[int],
+                          method: str | None = None) -> dict[int, dict[str, Any]]:
+        """``solve_states`` for several state counts, warm-started in ascending order."""
+        feasible = [k for k in state_counts if vectors.shape[0] >= k]
+        fitted = KMeansSweep(vectors, method=method, seed=42).fit_many(feasible) if feasible else {}
+        return {
+            k: self._states(k, fitted[k]) if k in fitted else {"num_states": 0}
+            for k in state_counts
+        }
 
+    @staticmethod
+    def _states(num_states: int, result: ClusterResult) -> dict[str, Any]:
+        # Cluster centroids are the 'Prototypes' for each mask state
         return {
             "num_states": num_states,
-            "labels": labels.tolist(),
-            "state_prototypes": centroids.tolist()
+            "labels": result.labels.tolist(),
+            "state_prototypes": result.centers.tolist()
         }
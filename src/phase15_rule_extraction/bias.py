@@ -4,6 +4,8 @@ from collections import Counter, defaultdict
 
 import numpy as np
 
+from phase1_foundation.core.choice_log import ChoiceLog
+
 
 def calculate_entropy(data):
     """Calculates the Shannon entropy of a dataset."""
@@ -13,14 +15,34 @@ def calculate_entropy(data):
     total = len(data)
     return -sum((c/total) * math.log2(c/total) for c in counts.values())
 
+def _window_stat(wid, count, candidates, ent):
+    # Avoid log(0)
+    max_ent = math.log2(candidates) if candidates > 1 else 0.0
+
+    # Skew is percentage reduction in entropy from max
+    if max_ent > 0:
+        skew = max(0.0, (max_ent - ent) / max_ent)
+    else:
+        skew = 0.0
+
+    return {
+        "window_id": wid,
+        "count": count,
+        "candidates": candidates,
+        "entropy": ent,
+        "max_entropy": max_ent,
+        "skew": skew
+    }
+
 class BiasAnalyzer:
     """Analyzes selection bias and compressibility in choice streams."""
 
     def __init__(self, choices):
         """
         Args:
-            choices (list): List of choice dictionaries containing 'window_id', 
-                            'chosen_index', and 'candidates_count'.
+            choices (list | ChoiceLog): List of choice dictionaries containing
+                'window_id', 'chosen_index', and 'candidates_count', or a
+                ``ChoiceLog``.
         """
         self.choices = choices
 
@@ -34,6 +56,9 @@ class BiasAnalyzer:
         Returns:
             list: List of dictionaries containing stats for each window.
         """
+        if isinstance(self.choices, ChoiceLog):
+            return self._window_bias_columnar(min_samples)
+
         win_choices = defaultdict(list)
         win_candidate_counts = {}
         
@@ -52,26 +77,23 @@ class BiasAnalyzer:
                 
             ent = calculate_entropy(idxs)
             candidates = win_candidate_counts.get(wid, len(set(idxs)))
-            # Avoid log(0)
-            max_ent = math.log2(candidates) if candidates > 1 else 0.0
-            
-            # Skew is percentage reduction in entropy from max
-            if max_ent > 0:
-                skew = max(0.0, (max_ent - ent) / max_ent)
-            else:
-                skew = 0.0
-                
-            window_stats.append({
-                "window_id": wid,
-                "count": len(idxs),
-                "candidates": candidates,
-                "entropy": ent,
-                "max_entropy": max_ent,
-                "skew": skew
-            })
+            window_stats.append(_window_stat(wid, len(idxs), candidates, ent))
             
         return window_stats
 
+    def _window_bias_columnar(self, min_samples):
+        log = self.choices
+        first, sizes, entropies = log.grouped_entropy("chosen_index", "window_id")
+        records = log.records[first]
+        return [
+            _window_stat(wid, count, candidates, ent)
+            for wid, count, candidates, ent in zip(
+                records["window_id"].tolist(), sizes.tolist(),
+                records["candidates_count"].tolist(), entropies.tolist(), strict=True,
+            )
+            if count >= min_samples
+        ]
+
     def analyze_compressibility(self, seed=42):
         """
         Compares compressibility of the actual choice stream vs a uniform random baseline.
@@ -79,8 +101,15 @@ class BiasAnalyzer:
         Returns:
             dict: Compression statistics.
         """
+        if isinstance(self.choices, ChoiceLog):
+            chosen = self.choices.column("chosen_index").tolist()
+            candidate_counts = self.choices.column("candidates_count").tolist()
+        else:
+            chosen = [c.get('chosen_index', 0) for c in self.choices]
+            candidate_counts = [c.get('candidates_count', 1) for c in self.choices]
+
         # Real compression
-        raw_indices = [c.get('chosen_index', 0) % 256 for c in self.choices]
+        raw_indices = [i % 256 for i in chosen]
         raw_bytes = bytes(raw_indices)
         compressed_size = len(zlib.compress(raw_bytes))
         uncompressed_size = len(raw_bytes)
@@ -97,8 +126,8 @@ class BiasAnalyzer:
         # Simulated Uniform Baseline
         rng = np.random.default_rng(seed=seed)
         sim_indices = [
-            rng.integers(0, max(c.get('candidates_count', 1), 1)) % 256
-            for c in self.choices
+            rng.integers(0, max(count, 1)) % 256
+            for count in candidate_counts
         ]
         sim_bytes = bytes(sim_indices)
         sim_compressed_size = len(zlib.compress(sim_bytes))
@@ -4,6 +4,8 @@ from collections import Counter, defaultdict
 import numpy as np
 from scipy import stats
 
+from phase1_foundation.core.choice_log import ChoiceLog, recent_repeats
+
 
 def entropy(counts):
     """Shannon entropy of a count distribution in bits."""
@@ -23,7 +25,8 @@ class SelectionDriverAnalyzer:
     def __init__(self, choices, window_contents, corpus_freq):
         """
         Args:
-            choices (list): List of choice dictionaries.
+            choices (list | ChoiceLog): List of choice dictionaries, or a
+                ``ChoiceLog`` for the vectorized tests.
             window_contents (dict): Window ID -> list of tokens.
             corpus_freq (dict): Token -> frequency mapping.
         """
@@ -33,13 +36,18 @@ class SelectionDriverAnalyzer:
 
     def test_positional_bias(self):
         """Test if chosen_index is biased toward small values (top-of-window)."""
-        positions = []
-        for c in self.choices:
-            if c.get("candidates_count", 0) > 1:
-                rel_pos = c["chosen_index"] / (c["candidates_count"] - 1)
-                positions.append(rel_pos)
+        if isinstance(self.choices, ChoiceLog):
+            counts = self.choices.column("candidates_count")
+            multi = counts > 1
+            positions = self.choices.column("chosen_index")[multi] / (counts[multi] - 1)
+        else:
+            positions = []
+            for c in self.choices:
+                if c.get("candidates_count", 0) > 1:
+                    rel_pos = c["chosen_index"] / (c["candidates_count"] - 1)
+                    positions.append(rel_pos)
 
-        positions = np.array(positions)
+            positions = np.array(positions)
         if len(positions) == 0:
             return {"bits_explained": 0.0, "is_significant": False}
 
@@ -66,6 +74,9 @@ class SelectionDriverAnalyzer:
 
     def test_bigram_context(self):
         """Test if prev_word reduces entropy of chosen_word within window."""
+        if isinstance(self.choices, ChoiceLog):
+            return self._bigram_context_columnar(self.choices)
+
         window_choices = defaultdict(list)
         for c in self.choices:
             window_choices[c["window_id"]].append(c["chosen_word"])
@@ -100,6 +111,24 @@ class SelectionDriverAnalyzer:
                     counts = list(Counter(words).values())
                     h_given_pair += p_pair * entropy(counts)
 
+        return self._bigram_context_result(h_given_window, h_given_pair, eligible_pairs, eligible_total)
+
+    def _bigram_context_columnar(self, log):
+        if len(log) == 0:
+            return {"bits_explained": 0.0, "is_significant": False}
+        h_given_window = log.conditional_entropy("word_id", "window_id")
+
+        with_prev = log[log.column("prev_word_id") >= 0]
+        _first, sizes, entropies = with_prev.grouped_entropy("word_id", "window_id", "prev_word_id")
+        eligible = sizes >= 5
+        eligible_total = int(sizes[eligible].sum())
+        h_given_pair = 0.0
+        if eligible_total > 0:
+            h_given_pair = float(np.dot(sizes[eligible], entropies[eligible]) / eligible_total)
+        return self._bigram_context_result(h_given_window, h_given_pair, int(eligible.sum()), eligible_total)
+
+    @staticmethod
+    def _bigram_context_result(h_given_window, h_given_pair, eligible_pairs, eligible_total):
         info_gain = h_given_window - h_given_pair if eligible_total > 0 else 0
 
         return {
@@ -114,29 +143,10 @@ class SelectionDriverAnalyzer:
 
     def test_suffix_affinity(self):
         """Test if chosen_word shares suffix with prev_word more than expected."""
-        observed_matches = 0
-        expected_rate_sum = 0.0
-        valid_count = 0
-
-        for c in self.choices:
-            prev = c.get("prev_word")
-            chosen = c.get("chosen_word")
-            win_id = c.get("window_id")
-
-            if not prev or not chosen or len(prev) < 2 or len(chosen) < 2:
-                continue
-
-            suffix = prev[-2:]
-            match = chosen[-2:] == suffix
-
-            win_words = self.window_contents.get(win_id, [])
-            matching_in_window = sum(1 for w in win_words if len(w) >= 2 and w[-2:] == suffix)
-            expected = matching_in_window / len(win_words) if win_words else 0
-
-            if match:
-                observed_matches += 1
-            expected_rate_sum += expected
-            valid_count += 1
+        if isinstance(self.choices, ChoiceLog):
+            observed_matches, expected_rate_sum, valid_count = self._suffix_matches_columnar(self.choices)
+        else:
+            observed_matches, expected_rate_sum, valid_count = self._suffix_matches(self.choices)
 
         if valid_count == 0:
             return {"bits_explained": 0.0, "is_significant": False}
@@ -165,22 +175,70 @@ class SelectionDriverAnalyzer:
             "bits_explained": float(abs(observed_rate - expected_rate) * math.log2(max(excess, 0.001))) if excess > 0 else 0.0,
         }
 
+    def _suffix_matches_columnar(self, log):
+        vocab_codes, suffixes = log.suffix_codes(2)
+        prev = vocab_codes[log.column("prev_word_id")]
+        chosen = vocab_codes[log.column("word_id")]
+        valid = (prev >= 0) & (chosen >= 0)
+        windows, prev = log.column("window_id")[valid], prev[valid]
+        observed_matches = int(np.count_nonzero(prev == chosen[valid]))
+
+        # Expected rate per distinct (window, previous suffix), weighted by occurrences
+        pairs = log[valid].group_ids(windows, prev)
+        _uniq, first, occurrences = np.unique(pairs, return_index=True, return_counts=True)
+        expected_rate_sum = 0.0
+        for win_id, code, n in zip(windows[first].tolist(), prev[first].tolist(), occurrences.tolist(), strict=True):
+            win_words = self.window_contents.get(win_id, [])
+            suffix = suffixes[code]
+            matching_in_window = sum(1 for w in win_words if len(w) >= 2 and w[-2:] == suffix)
+            expected_rate_sum += n * (matching_in_window / len(win_words) if win_words else 0)
+        return observed_matches, expected_rate_sum, int(valid.sum())
+
+    def _suffix_matches(self, choices):
+        observed_matches = 0
+        expected_rate_sum = 0.0
+        valid_count = 0
+
+        for c in choices:
+            prev = c.get("prev_word")
+            chosen = c.get("chosen_word")
+            win_id = c.get("window_id")
+
+            if not prev or not chosen or len(prev) < 2 or len(chosen) < 2:
+                continue
+
+            suffix = prev[-2:]
+            match = chosen[-2:] == suffix
+
+            win_words = self.window_contents.get(win_id, [])
+            matching_in_window = sum(1 for w in win_words if len(w) >= 2 and w[-2:] == suffix)
+            expected = matching_in_window / len(win_words) if win_words else 0
+
+            if match:
+                observed_matches += 1
+            expected_rate_sum += expected
+            valid_count += 1
+        return observed_matches, expected_rate_sum, valid_count
+
     def test_frequency_bias(self):
         """Test if globally frequent words are preferentially chosen within windows."""
-        window_word_selections = defaultdict(Counter)
-        for c in self.choices:
-            window_word_selections[c["window_id"]][c["chosen_word"]] += 1
+        if isinstance(self.choices, ChoiceLog):
+            freq_ranks, sel_rates = self._selection_rates_columnar(self.choices)
+        else:
+            window_word_selections = defaultdict(Counter)
+            for c in self.choices:
+                window_word_selections[c["window_id"]][c["chosen_word"]] += 1
 
-        freq_ranks = []
-        sel_rates = []
+            freq_ranks = []
+            sel_rates = []
 
-        for _win_id, selections in window_word_selections.items():
-            total_selections = sum(selections.values())
-            for word, sel_count in selections.items():
-                sel_rate = sel_count / total_selections
-                freq = self.corpus_freq.get(word, 0)
-                freq_ranks.append(freq)
-                sel_rates.append(sel_rate)
+            for _win_id, selections in window_word_selections.items():
+                total_selections = sum(selections.values())
+                for word, sel_count in selections.items():
+                    sel_rate = sel_count / total_selections
+                    freq = self.corpus_freq.get(word, 0)
+                    freq_ranks.append(freq)
+                    sel_rates.append(sel_rate)
 
         if len(freq_ranks) < 2:
             return {"bits_explained": 0.0, "is_significant": False}
@@ -196,8 +254,21 @@ class SelectionDriverAnalyzer:
             "bits_explained": float(bits_explained),
         }
 
+    def _selection_rates_columnar(self, log):
+        """Corpus frequency and within-window selection rate of each (window, word) pair."""
+        windows = log.group_ids("window_id")
+        pairs = log.group_ids(windows, "word_id")
+        _uniq, first, counts = np.unique(pairs, return_index=True, return_counts=True)
+        window_totals = np.bincount(windows)
+        vocab_freq = np.array([self.corpus_freq.get(w, 0) for w in log.vocab])
+        freq = vocab_freq[log.column("word_id")[first]]
+        return freq, counts / window_totals[windows[first]]
+
     def test_recency_bias(self, recent_window=50):
         """Test if recently-used words in the same window are re-chosen more often."""
+        if isinstance(self.choices, ChoiceLog):
+            return self._recency_bias_columnar(self.choices, recent_window)
+
         last_seen = {}
         recency_scores = []
 
@@ -236,6 +307,26 @@ class SelectionDriverAnalyzer:
                 shuffled_last_seen[key] = j
             null_scores.append(np.mean(null_recency))
 
+        return self._recency_result(observed_recent_rate, null_scores, recent_window)
+
+    def _recency_bias_columnar(self, log, recent_window):
+        if len(log) == 0:
+            return {"bits_explained": 0.0, "is_significant": False}
+        keys = log.group_ids("window_id", "word_id")
+        observed_recent_rate = recent_repeats(keys, recent_window).mean()
+
+        # Same shuffles as the list path: RandomState.shuffle permutes an
+        # index array exactly as it permutes the list of choices
+        rng = np.random.RandomState(42)
+        null_scores = []
+        for _ in range(50):
+            order = np.arange(keys.size)
+            rng.shuffle(order)
+            null_scores.append(recent_repeats(keys[order], recent_window).mean())
+        return self._recency_result(observed_recent_rate, null_scores, recent_window)
+
+    @staticmethod
+    def _recency_result(observed_recent_rate, null_scores, recent_window):
         null_mean = np.mean(null_scores)
         null_std = np.std(null_scores)
         z = (observed_recent_rate - null_mean) / null_std if null_std > 0 else 0
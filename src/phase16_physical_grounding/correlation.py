@@ -3,6 +3,8 @@ from collections import Counter, defaultdict
 import numpy as np
 from scipy.stats import spearmanr
 
+from phase1_foundation.core.choice_log import ChoiceLog
+
 
 class EffortCorrelationAnalyzer:
     """Analyzes the correlation between physical effort (strokes) and selection bias."""
@@ -10,7 +12,8 @@ class EffortCorrelationAnalyzer:
     def __init__(self, choices, costs):
         """
         Args:
-            choices (list): List of choice dictionaries.
+            choices (list | ChoiceLog): List of choice dictionaries, or a
+                ``ChoiceLog``.
             costs (dict): Mapping from word to its physical effort score.
         """
         self.choices = choices
@@ -23,28 +26,31 @@ class EffortCorrelationAnalyzer:
         Returns:
             dict: Correlation statistics.
         """
-        # 1. Compute per-window selection frequency
-        win_word_counts = defaultdict(Counter)
-        win_totals = defaultdict(int)
-        for c in self.choices:
-            wid = c.get('window_id')
-            word = c.get('chosen_word')
-            if wid is None or word is None:
-                continue
-            win_word_counts[wid][word] += 1
-            win_totals[wid] += 1
+        if isinstance(self.choices, ChoiceLog):
+            efforts, frequencies = self._effort_frequency_pairs_columnar(min_window_samples)
+        else:
+            # 1. Compute per-window selection frequency
+            win_word_counts = defaultdict(Counter)
+            win_totals = defaultdict(int)
+            for c in self.choices:
+                wid = c.get('window_id')
+                word = c.get('chosen_word')
+                if wid is None or word is None:
+                    continue
+                win_word_counts[wid][word] += 1
+                win_totals[wid] += 1
 
-        # 2. Build pairs for correlation
-        efforts = []
-        frequencies = []
-        for wid, word_counts in win_word_counts.items():
-            total = win_totals[wid]
-            if total < min_window_samples:
-                continue
-            for word, count in word_counts.items():
-                if word in self.costs:
-                    efforts.append(self.costs[word])
-                    frequencies.append(count / total)
+            # 2. Build pairs for correlation
+            efforts = []
+            frequencies = []
+            for wid, word_counts in win_word_counts.items():
+                total = win_totals[wid]
+                if total < min_window_samples:
+                    continue
+                for word, count in word_counts.items():
+                    if word in self.costs:
+                        efforts.append(self.costs[word])
+                        frequencies.append(count / total)
 
         if len(efforts) < 10:
             return {
@@ -62,15 +68,33 @@ class EffortCorrelationAnalyzer:
             "is_significant": bool(p_value < 0.01 and abs(rho) > 0.1)
         }
 
+    def _vocab_costs(self):
+        """Effort per word ID of the choice log (NaN where unknown)."""
+        return np.array([self.costs.get(w, np.nan) for w in self.choices.vocab], dtype=float)
+
+    def _effort_frequency_pairs_columnar(self, min_window_samples):
+        log = self.choices
+        windows = log.group_ids("window_id")
+        pairs = log.group_ids(windows, "word_id")
+        _uniq, first, counts = np.unique(pairs, return_index=True, return_counts=True)
+        totals = np.bincount(windows)[windows[first]]
+        efforts = self._vocab_costs()[log.column("word_id")[first]]
+        keep = (totals >= min_window_samples) & ~np.isnan(efforts)
+        return efforts[keep].tolist(), (counts[keep] / totals[keep]).tolist()
+
     def analyze_effort_gradient(self, limit=10000):
         """
         Analyzes the physical effort stability between consecutive selections.
         """
-        effort_seq = []
-        for c in self.choices[:limit]:
-            word = c.get('chosen_word')
-            if word and word in self.costs:
-                effort_seq.append(self.costs[word])
+        if isinstance(self.choices, ChoiceLog):
+            efforts = self._vocab_costs()[self.choices.column("word_id")[:limit]]
+            effort_seq = efforts[~np.isnan(efforts)].tolist()
+        else:
+            effort_seq = []
+            for c in self.choices[:limit]:
+                word = c.get('chosen_word')
+                if word and word in self.costs:
+                    effort_seq.append(self.costs[word])
         
         if not effort_seq:
             return 0.0
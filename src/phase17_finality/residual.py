@@ -3,6 +3,8 @@ from collections import Counter, defaultdict
 
 import numpy as np
 
+from phase1_foundation.core.choice_log import ChoiceLog
+
 
 def entropy_bits(counts):
     """Shannon entropy of a count distribution in bits."""
@@ -42,10 +44,14 @@ class ResidualBandwidthAnalyzer:
     def __init__(self, choices):
         """
         Args:
-            choices (list): List of choice dictionaries.
+            choices (list | ChoiceLog): List of choice dictionaries, or a
+                ``ChoiceLog`` for the vectorized entropy chain.
         """
         self.choices = choices
-        self.choices_with_recency = self._prepare_recency()
+        if isinstance(choices, ChoiceLog):
+            self.choices_with_recency = None
+        else:
+            self.choices_with_recency = self._prepare_recency()
 
     def _prepare_recency(self):
         last_seen = {}
@@ -61,6 +67,9 @@ class ResidualBandwidthAnalyzer:
 
     def compute_entropy_chain(self):
         """Progressively condition choice entropy on each driver."""
+        if isinstance(self.choices, ChoiceLog):
+            return self._entropy_chain_columnar(self.choices)
+
         # 1. H(choice | window)
         groups_w = defaultdict(list)
         for c in self.choices:
@@ -99,6 +108,24 @@ class ResidualBandwidthAnalyzer:
             groups_wpprs[(c.get("window_id"), prev, pos_b, c["is_recent"], suffix)].append(c.get("chosen_word"))
         h_all_drivers = conditional_entropy(groups_wpprs)
 
+        return self._chain([h_window, h_window_prev, h_window_prev_pos,
+                            h_window_prev_pos_rec, h_all_drivers])
+
+    def _entropy_chain_columnar(self, log):
+        drivers = [
+            "window_id",
+            "prev_word_id",
+            log.position_buckets(),
+            log.recency(50),
+            log.prev_suffix_ids(),
+        ]
+        return self._chain([
+            log.conditional_entropy("word_id", *drivers[:n]) for n in range(1, len(drivers) + 1)
+        ])
+
+    @staticmethod
+    def _chain(entropies):
+        h_window, h_window_prev, h_window_prev_pos, h_window_prev_pos_rec, h_all_drivers = entropies
         chain = [
             {"conditioning": "window", "h": h_window},
             {"conditioning": "window + prev_word", "h": h_window_prev},
@@ -4,7 +4,7 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
-from phase1_foundation.core.geometry import Box
+from phase1_foundation.core.geometry import Box, BoxArray, GridIndex
 from phase1_foundation.core.id_factory import DeterministicIDFactory
 from phase1_foundation.storage.metadata import (
     AnchorMethodRecord,
@@ -120,65 +120,60 @@ class AnchorEngine:
 
             logger.debug("%s regions=%d words=%d", page_id, len(regions), len(words))
 
-            count = 0
+            region_boxes = BoxArray.from_boxes([self._to_box(r.bbox) for r in regions])
+            word_boxes = BoxArray.from_boxes([self._to_box(w.bbox) for w in words])
 
-            # O(N*M) check
-            for r_idx, region in enumerate(regions):
-                r_box = self._to_box(region.bbox)
+            # A word can only anchor to a region if the boxes intersect or the
+            # word's centroid lies within threshold_dist of the region's
+            # centroid; both imply the word box meets the region box grown to
+            # cover centroid +/- threshold_dist. Only those pairs are scored.
+            cx, cy = region_boxes.centroids
+            search = region_boxes.expanded(
+                cx - threshold_dist, cy - threshold_dist, cx + threshold_dist, cy + threshold_dist
+            )
+            r_idx, w_idx = GridIndex(word_boxes).intersecting_pairs(search)
 
-                for w_idx, word in enumerate(words):
-                    w_box = self._to_box(word.bbox)
+            iou = region_boxes.iou(r_idx, word_boxes, w_idx)
+            inside = region_boxes.contains(r_idx, word_boxes, w_idx)
+            dist = region_boxes.distance(r_idx, word_boxes, w_idx)
 
+            count = 0
+
+            with self.store.bulk_writer() as writer:
+                for r, w, pair_iou, pair_inside, pair_dist in zip(
+                    r_idx.tolist(), w_idx.tolist(), iou.tolist(), inside.tolist(), dist.tolist(), strict=True
+                ):
                     # 1. Check Overlap / Inside
-                    iou = r_box.iou(w_box)
-                    if iou > 0:
-                        relation = "overlaps"
-                        if r_box.contains(w_box):
-                            relation = "inside"
-
-                        self.store.add_anchor(
-                            id=self._anchor_id(
-                                method_id=method_id,
-                                page_id=page_id,
-                                source_id=word.id,
-                                target_id=region.id,
-                                relation_type=relation,
-                            ),
-                            run_id=run_id,
-                            page_id=page_id,
-                            source_type="word",
-                            source_id=word.id,
-                            target_type="region",
-                            target_id=region.id,
-                            relation_type=relation,
+                    if pair_iou > 0:
+                        relation = "inside" if pair_inside else "overlaps"
+                        score = pair_iou
+                    # 2. Check Near (Distance); overlaps are not double counted
+                    elif pair_dist < threshold_dist:
+                        relation = "near"
+                        score = 1.0 - pair_dist  # Higher score = closer
+                    else:
+                        continue
+
+                    region, word = regions[r], words[w]
+                    writer.add_anchor(
+                        id=self._anchor_id(
                             method_id=method_id,
-                            score=iou
-                        )
-                        count += 1
-                        continue # Don't double count as "near" if it overlaps
-
-                    # 2. Check Near (Distance)
-                    dist = r_box.distance(w_box)
-                    if dist < threshold_dist:
-                        self.store.add_anchor(
-                            id=self._anchor_id(
-                                method_id=method_id,
-                                page_id=page_id,
-                                source_id=word.id,
-                                target_id=region.id,
-                                relation_type="near",
-                            ),
-                            run_id=run_id,
                             page_id=page_id,
-                            source_type="word",
                             source_id=word.id,
-                            target_type="region",
                             target_id=region.id,
-                            relation_type="near",
-                            method_id=method_id,
-                            score=1.0 - dist # Higher score = closer
-                        )
-                        count += 1
+                            relation_type=relation,
+                        ),
+                        run_id=run_id,
+                        page_id=page_id,
+                        source_type="word",
+                        source_id=word.id,
+                        target_type="region",
+                        target_id=region.id,
+                        relation_type=relation,
+                        method_id=method_id,
+                        score=score
+                    )
+                    count += 1
 
             return count
         finally:
@@ -54,6 +54,8 @@ anchors_app = typer.Typer()
 decisions_app = typer.Typer()
 sensitivity_app = typer.Typer()
 hypotheses_app = typer.Typer()
+db_app = typer.Typer()
+snapshot_app = typer.Typer()
 
 app.add_typer(data_app, name="data", help="Data management commands")
 app.add_typer(transcription_app, name="transcription", help="Transcription management (Token-level text data)")
@@ -68,6 +70,8 @@ app.add_typer(anchors_app, name="anchors", help="Anchor management commands")
 app.add_typer(decisions_app, name="decisions", help="Decision management commands")
 app.add_typer(sensitivity_app, name="sensitivity", help="Sensitivity phase2_analysis commands")
 app.add_typer(hypotheses_app, name="hypotheses", help="Hypothesis testing commands")
+app.add_typer(db_app, name="db", help="Database schema migration commands")
+app.add_typer(snapshot_app, name="snapshot", help="Columnar token-stream snapshots (Parquet)")
 
 # Phase 2 CLI apps
 admissibility_app = typer.Typer()
@@ -142,6 +146,55 @@ def status():
 
         console.print(table)
 
+@db_app.command("upgrade")
+def db_upgrade(
+    revision: str = typer.Option("head", help="Target Alembic revision")
+):
+    """
+    Upgrade an existing database schema in place (adds missing indexes, etc.).
+    """
+    from phase1_foundation.storage.schema import upgrade_schema
+
+    get_metadata_store()
+    new_revision = upgrade_schema(DB_PATH, revision)
+    console.print(f"[bold green]Schema at revision {new_revision}.[/bold green]")
+
+@db_app.command("current")
+def db_current():
+    """
+    Show the schema revision recorded in the database.
+    """
+    from phase1_foundation.storage.schema import current_revision, head_revision
+
+    get_metadata_store()
+    console.print(f"Database revision: {current_revision(DB_PATH) or 'unversioned'}")
+    console.print(f"Code head revision: {head_revision()}")
+
+@snapshot_app.command("build")
+def snapshot_build(
+    dataset: list[str] = typer.Option(None, help="Dataset ID to snapshot (repeatable; default: all)"),
+    source: list[str] = typer.Option(None, help="Source ID to snapshot (repeatable; 'all' = every source combined)"),
+    output_dir: Path = typer.Option(None, help="Snapshot root directory (default: data/derived/snapshots)")
+):
+    """
+    Materialize token streams into Parquet snapshots keyed by database content hash.
+    """
+    from phase1_foundation.core.snapshot import SNAPSHOT_DIR, build_snapshots
+
+    with active_run(config={"command": "snapshot build", "dataset": dataset, "source": source}) as run:
+        store = get_metadata_store()
+        source_ids = [None if s == "all" else s for s in source] if source else None
+        paths = build_snapshots(
+            store,
+            dataset_ids=dataset or None,
+            source_ids=source_ids,
+            snapshot_dir=output_dir or SNAPSHOT_DIR,
+        )
+        for path in paths:
+            console.print(f"Wrote {path}")
+        store.save_run(run)
+        console.print(f"[bold green]Built {len(paths)} snapshots.[/bold green]")
+
 @data_app.command("register")
 def register_dataset(
     path: Path = typer.Argument(..., help="Path to the dataset directory"),
@@ -288,6 +288,120 @@ DEFAULT_SEED = 42
 MAX_PAGES_PER_TEST = 50
 MAX_TOKENS_ANALYZED = 10000
 
+# Storage
+BULK_WRITE_CHUNK_SIZE = 5000
+
+# SQLite connection profiles for MetadataStore engines. Each entry maps PRAGMA
+# names to values applied on every new DBAPI connection. "default" leaves
+# SQLite untouched; "performance" enables WAL so one writer and several
+# readers can share data/voynich.db concurrently.
+SQLITE_PROFILES: dict[str, dict[str, Any]] = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,  # 256 MiB
+        "cache_size": -65536,  # negative = KiB, i.e. 64 MiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,  # ms to wait on a locked database
+    },
+}
+
+
+def get_sqlite_profile(name: str | None = None) -> dict[str, Any]:
+    """
+    Resolve SQLite PRAGMA settings for a named profile.
+
+    Args:
+        name: Profile name. Defaults to the ``METADATA_DB_PROFILE`` environment
+            variable, falling back to ``"default"``.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    profile = (name or os.getenv("METADATA_DB_PROFILE", "default")).strip().lower()
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile {profile!r}. Allowed: {sorted(SQLITE_PROFILES)}"
+        )
+    return dict(SQLITE_PROFILES[profile])
+
+
+# Backend for QueryEngine aggregates and the foundation metrics. "duckdb"
+# runs them as single SQL queries over the attached SQLite file (or a
+# Parquet snapshot) and requires the optional ``duckdb`` extra.
+QUERY_BACKENDS = ("sqlalchemy", "duckdb")
+
+
+def get_query_backend(name: str | None = None) -> str:
+    """
+    Resolve the analytical query backend.
+
+    Args:
+        name: Backend name. Defaults to the ``METADATA_QUERY_BACKEND``
+            environment variable, falling back to ``"sqlalchemy"``.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    backend = (name or os.getenv("METADATA_QUERY_BACKEND", "sqlalchemy")).strip().lower()
+    if backend not in QUERY_BACKENDS:
+        raise ValueError(
+            f"Unknown query backend {backend!r}. Allowed: {list(QUERY_BACKENDS)}"
+        )
+    return backend
+
+
+# Force-directed layout used by GlobalPaletteSolver.solve_grid. "networkx"
+# reproduces the original spring_layout batches; "fr" and "spectral_fr"
+# are the sparse NumPy solvers in phase14_machine.layout.
+LAYOUT_BACKENDS = ("networkx", "fr", "spectral_fr")
+
+
+def get_layout_backend(name: str | None = None) -> str:
+    """
+    Resolve the palette layout backend.
+
+    Args:
+        name: Backend name. Defaults to the ``PALETTE_LAYOUT_BACKEND``
+            environment variable, falling back to ``"networkx"``.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    backend = (name or os.getenv("PALETTE_LAYOUT_BACKEND", "networkx")).strip().lower()
+    if backend not in LAYOUT_BACKENDS:
+        raise ValueError(
+            f"Unknown layout backend {backend!r}. Allowed: {list(LAYOUT_BACKENDS)}"
+        )
+    return backend
+
+
+# Clustering used by GlobalPaletteSolver.cluster_lattice and
+# StateSpaceSolver.solve_states. "kmeans" is the original KMeans(n_init=10);
+# "minibatch" and "gram" are described in phase14_machine.clustering.
+CLUSTER_METHODS = ("kmeans", "minibatch", "gram")
+
+
+def get_cluster_method(name: str | None = None) -> str:
+    """
+    Resolve the Phase 14 clustering backend.
+
+    Args:
+        name: Method name. Defaults to the ``PHASE14_CLUSTER_METHOD``
+            environment variable, falling back to ``"kmeans"``.
+
+    Raises:
+        ValueError: If the method name is unknown.
+    """
+    method = (name or os.getenv("PHASE14_CLUSTER_METHOD", "kmeans")).strip().lower()
+    if method not in CLUSTER_METHODS:
+        raise ValueError(
+            f"Unknown cluster method {method!r}. Allowed: {list(CLUSTER_METHODS)}"
+        )
+    return method
+
+
 SCRAMBLED_CONTROL_PARAMS = {
     "jar_count_range": (2, 6),
     "word_count_range": (40, 120),
@@ -77,28 +77,29 @@ class SelfCitationGenerator(ControlGenerator):
         from phase1_foundation.core.id_factory import DeterministicIDFactory
         id_factory = DeterministicIDFactory(seed=seed)
 
-        self.store.add_control_dataset(
-            id=dataset_id,
-            source_dataset_id=str(metadata.get("source_dataset_id", "unknown")),
-            type="self_citation",
-            params=metadata,
-            seed=seed,
-        )
-        self.store.add_dataset(dataset_id, "generated_self_citation")
-        self.store.add_transcription_source("synthetic", "Synthetic Control Generator")
-
-        # Partition into dummy pages
-        tokens_per_page = 1000
-        for p_idx, start in enumerate(range(0, len(tokens), tokens_per_page)):
-            page_id = f"{dataset_id}_p{p_idx}"
-            self.store.add_page(page_id, dataset_id, "synthetic", f"hash_{page_id}", 1000, 1500)
-
-            end = start + tokens_per_page
-            page_tokens = tokens[start:end]
-
-            trans_line_id = id_factory.next_uuid(f"line:{page_id}")
-            self.store.add_transcription_line(trans_line_id, "synthetic", page_id, 0, " ".join(page_tokens))
-
-            for w_idx, token in enumerate(page_tokens):
-                token_id = id_factory.next_uuid(f"token:{trans_line_id}:{w_idx}")
-                self.store.add_transcription_token(token_id, trans_line_id, w_idx, token)
+        with self.store.bulk_writer() as writer:
+            writer.add_control_dataset(
+                id=dataset_id,
+                source_dataset_id=str(metadata.get("source_dataset_id", "unknown")),
+                type="self_citation",
+                params=metadata,
+                seed=seed,
+            )
+            writer.add_dataset(dataset_id, "generated_self_citation")
+            writer.add_transcription_source("synthetic", "Synthetic Control Generator")
+
+            # Partition into dummy pages
+            tokens_per_page = 1000
+            for p_idx, start in enumerate(range(0, len(tokens), tokens_per_page)):
+                page_id = f"{dataset_id}_p{p_idx}"
+                writer.add_page(page_id, dataset_id, "synthetic", f"hash_{page_id}", 1000, 1500)
+
+                end = start + tokens_per_page
+                page_tokens = tokens[start:end]
+
+                trans_line_id = id_factory.next_uuid(f"line:{page_id}")
+                writer.add_transcription_line(trans_line_id, "synthetic", page_id, 0, " ".join(page_tokens))
+
+                for w_idx, token in enumerate(page_tokens):
+                    token_id = id_factory.next_uuid(f"token:{trans_line_id}:{w_idx}")
+                    writer.add_transcription_token(token_id, trans_line_id, w_idx, token)
@@ -48,55 +48,56 @@ class SyntheticNullGenerator(ControlGenerator):
         # Register control dataset with normalization provenance.
         params_with_policy = dict(params)
         params_with_policy["normalization"] = normalization
-        self.store.add_control_dataset(
-            id=control_id,
-            source_dataset_id=source_dataset_id,
-            type="synthetic_null",
-            params=params_with_policy,
-            seed=seed,
-        )
-        self.store.add_transcription_source("synthetic", "Synthetic Control Generator")
-
-        num_pages = int(params.get("num_pages", 5))
-        lines_per_page = int(params.get("lines_per_page", 24))
-        tokens_per_line = int(params.get("tokens_per_line", 8))
-        id_factory = DeterministicIDFactory(seed=seed)
-
-        for i in range(num_pages):
-            page_id = f"{control_id}_p{i+1}"
-            self.store.add_page(
-                page_id=page_id,
-                dataset_id=control_id,
-                image_path="synthetic_path",
-                checksum=f"synthetic_checksum_{page_id}",
-                width=1000,
-                height=1500,
+        with self.store.bulk_writer() as writer:
+            writer.add_control_dataset(
+                id=control_id,
+                source_dataset_id=source_dataset_id,
+                type="synthetic_null",
+                params=params_with_policy,
+                seed=seed,
             )
+            writer.add_transcription_source("synthetic", "Synthetic Control Generator")
 
-            for line_index in range(lines_per_page):
-                line_tokens = [rng.choice(vocabulary) for _ in range(tokens_per_line)]
-                line_content = " ".join(line_tokens)
+            num_pages = int(params.get("num_pages", 5))
+            lines_per_page = int(params.get("lines_per_page", 24))
+            tokens_per_line = int(params.get("tokens_per_line", 8))
+            id_factory = DeterministicIDFactory(seed=seed)
 
-                line_id = id_factory.next_uuid(f"line:{page_id}:{line_index}")
-                self.store.add_transcription_line(
-                    id=line_id,
-                    source_id="synthetic",
+            for i in range(num_pages):
+                page_id = f"{control_id}_p{i+1}"
+                writer.add_page(
                     page_id=page_id,
-                    line_index=line_index,
-                    content=line_content,
+                    dataset_id=control_id,
+                    image_path="synthetic_path",
+                    checksum=f"synthetic_checksum_{page_id}",
+                    width=1000,
+                    height=1500,
                 )
 
-                for token_index, token in enumerate(line_tokens):
-                    token_id = id_factory.next_uuid(
-                        f"token:{page_id}:{line_index}:{token_index}"
-                    )
-                    self.store.add_transcription_token(
-                        id=token_id,
-                        line_id=line_id,
-                        token_index=token_index,
-                        content=token,
+                for line_index in range(lines_per_page):
+                    line_tokens = [rng.choice(vocabulary) for _ in range(tokens_per_line)]
+                    line_content = " ".join(line_tokens)
+
+                    line_id = id_factory.next_uuid(f"line:{page_id}:{line_index}")
+                    writer.add_transcription_line(
+                        id=line_id,
+                        source_id="synthetic",
+                        page_id=page_id,
+                        line_index=line_index,
+                        content=line_content,
                     )
 
+                    for token_index, token in enumerate(line_tokens):
+                        token_id = id_factory.next_uuid(
+                            f"token:{page_id}:{line_index}:{token_index}"
+                        )
+                        writer.add_transcription_token(
+                            id=token_id,
+                            line_id=line_id,
+                            token_index=token_index,
+                            content=token,
+                        )
+
         return control_id
 
     def _load_source_vocabulary(self, source_dataset_id: str) -> list[str]:
@@ -0,0 +1,371 @@
+"""Columnar log of scribal choices.
+
+``HighFidelityVolvelle`` records the context of every generated or traced
+token. ``ChoiceLog`` keeps those records in one NumPy structured array::
+
+    kind              int8    KIND_GENERATED or KIND_TRACE
+    window_id         int32   window the token was chosen from
+    chosen_index      int32   index of the token in the window (-1: OOV recovery)
+    candidates_count  int32   window size
+    token_pos         int32   position of the token in its line
+    line_no           int32   traced line number (-1 for generated tokens)
+    word_id           int32   chosen token, as an index into ``vocab``
+    prev_word_id      int32   previous token (-1: none)
+    mask_state        int32   mask rotation (-1 for traced tokens)
+    scribe            int8    index into ``scribes`` (-1 for traced tokens)
+    oov_recovered     bool    window predicted from the suffix map
+
+Token text is stored once in ``vocab``. A record costs 35 bytes, against
+several hundred for the equivalent dict.
+
+Like ``EncodedCorpus``, the class implements the read-only sequence
+protocol, here over the original choice dicts. Code written against
+``list[dict]`` therefore accepts it unchanged. Hot paths use ``records``
+and the group-by helpers (``group_ids``, ``grouped_entropy``,
+``conditional_entropy``) instead.
+
+``save``/``load`` use ``.npz`` or, with the optional ``duckdb`` extra
+(``pyarrow``), Parquet.
+"""
+
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+KIND_GENERATED = 0
+KIND_TRACE = 1
+
+CHOICE_DTYPE = np.dtype([
+    ("kind", np.int8),
+    ("window_id", np.int32),
+    ("chosen_index", np.int32),
+    ("candidates_count", np.int32),
+    ("token_pos", np.int32),
+    ("line_no", np.int32),
+    ("word_id", np.int32),
+    ("prev_word_id", np.int32),
+    ("mask_state", np.int32),
+    ("scribe", np.int8),
+    ("oov_recovered", np.bool_),
+])
+
+# Upper bounds of the token_pos buckets used by the Phase 17 entropy chain
+POSITION_BUCKET_EDGES = (0, 2, 5, 9)
+
+
+def _factorize(values: np.ndarray) -> np.ndarray:
+    """Dense integer codes for ``values``, numbered in order of first appearance."""
+    if values.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    _uniq, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+    rank = np.empty(first.size, dtype=np.int64)
+    rank[np.argsort(first, kind="stable")] = np.arange(first.size)
+    return rank[inverse.ravel()]
+
+
+def recent_repeats(keys: np.ndarray, gap: int) -> np.ndarray:
+    """Whether each key also occurs at most ``gap`` positions earlier."""
+    order = np.argsort(keys, kind="stable")
+    same = keys[order][1:] == keys[order][:-1]
+    recent = np.zeros(keys.size, dtype=bool)
+    recent[order[1:]] = same & (np.diff(order) <= gap)
+    return recent
+
+
+def _entropy_terms(counts: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    p = counts / totals
+    return -p * np.log2(p)
+
+
+class ChoiceLog:
+    """Choice records as a structured array plus a token vocabulary.
+
+    Records can be appended one at a time (``record``/``append``); they are
+    buffered and packed into ``records`` on first access. Integer indexing
+    returns a choice dict; a slice or an index/boolean array returns a new
+    ``ChoiceLog`` sharing the vocabulary.
+
+    Attributes:
+        vocab: Token text for each word ID.
+        scribes: Scribe name for each scribe index.
+    """
+
+    def __init__(self,
+                 records: np.ndarray | None = None,
+                 vocab: list[str] | None = None,
+                 scribes: list[str] | None = None) -> None:
+        self.vocab = list(vocab or [])
+        self.scribes = list(scribes or [])
+        self._records = (
+            np.zeros(0, dtype=CHOICE_DTYPE) if records is None else np.asarray(records, dtype=CHOICE_DTYPE)
+        )
+        self._pending: list[tuple] = []
+        self._index = {w: i for i, w in enumerate(self.vocab)}
+
+    @classmethod
+    def from_records(cls, choices: Iterable[dict[str, Any]], scribes: list[str] | None = None) -> "ChoiceLog":
+        """Encode choice dicts as written by ``HighFidelityVolvelle``."""
+        log = cls(scribes=scribes)
+        for entry in choices:
+            log.append(entry)
+        return log
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
+
+    def _word_id(self, word: str | None) -> int:
+        if word is None:
+            return -1
+        word_id = self._index.get(word)
+        if word_id is None:
+            word_id = self._index[word] = len(self.vocab)
+            self.vocab.append(word)
+        return word_id
+
+    def _scribe_id(self, scribe: str | None) -> int:
+        if scribe is None:
+            return -1
+        if scribe not in self.scribes:
+            self.scribes.append(scribe)
+        return self.scribes.index(scribe)
+
+    def record(self,
+               window_id: int,
+               chosen_index: int,
+               candidates_count: int,
+               token_pos: int,
+               word: str,
+               prev_word: str | None,
+               kind: int = KIND_GENERATED,
+               line_no: int = -1,
+               mask_state: int = -1,
+               scribe: str | None = None,
+               oov_recovered: bool = False) -> None:
+        """Append one choice."""
+        self._pending.append((
+            kind, window_id, chosen_index, candidates_count, token_pos, line_no,
+            self._word_id(word), self._word_id(prev_word), mask_state, self._scribe_id(scribe),
+            oov_recovered,
+        ))
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """Append one choice given as a dict (the inverse of ``self[i]``)."""
+        self.record(
+            window_id=entry["window_id"],
+            chosen_index=entry.get("chosen_index", 0),
+            candidates_count=entry.get("candidates_count", 0),
+            token_pos=entry.get("token_pos", 0),
+            word=entry["chosen_word"],
+            prev_word=entry.get("prev_word"),
+            kind=KIND_TRACE if entry.get("type") == "real_trace" else KIND_GENERATED,
+            line_no=entry.get("line_no", -1),
+            mask_state=entry.get("mask_state", -1),
+            scribe=entry.get("scribe"),
+            oov_recovered=bool(entry.get("oov_recovered", False)),
+        )
+
+    @property
+    def records(self) -> np.ndarray:
+        """All records as a ``CHOICE_DTYPE`` structured array."""
+        if self._pending:
+            pending = np.array(self._pending, dtype=CHOICE_DTYPE)
+            self._records = np.concatenate([self._records, pending])
+            self._pending = []
+        return self._records
+
+    # ------------------------------------------------------------------
+    # Sequence protocol (choice dicts)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._records.size + len(self._pending)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice | np.ndarray):
+            return ChoiceLog(self.records[key], self.vocab, self.scribes)
+        return self._to_dict(self.records[key].item())
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for row in self.records.tolist():
+            yield self._to_dict(row)
+
+    def __repr__(self) -> str:
+        return f"ChoiceLog(choices={len(self)}, vocab={len(self.vocab)})"
+
+    def _to_dict(self, row: tuple) -> dict[str, Any]:
+        (kind, window_id, chosen_index, candidates_count, token_pos, line_no,
+         word_id, prev_word_id, mask_state, scribe, oov_recovered) = row
+        prev_word = self.vocab[prev_word_id] if prev_word_id >= 0 else None
+        if kind == KIND_TRACE:
+            entry = {
+                "type": "real_trace",
+                "line_no": line_no,
+                "token_pos": token_pos,
+                "window_id": window_id,
+                "candidates_count": candidates_count,
+                "chosen_word": self.vocab[word_id],
+                "chosen_index": chosen_index,
+                "prev_word": prev_word,
+            }
+            if oov_recovered:
+                entry["oov_recovered"] = True
+            return entry
+        return {
+            "window_id": window_id,
+            "candidates_count": candidates_count,
+            "chosen_word": self.vocab[word_id],
+            "chosen_index": chosen_index,
+            "token_pos": token_pos,
+            "prev_word": prev_word,
+            "mask_state": mask_state,
+            "scribe": self.scribes[scribe] if scribe >= 0 else None,
+        }
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """All choices as dicts, e.g. for JSON output."""
+        return list(self)
+
+    def nbytes(self) -> int:
+        """Bytes held by the record array (excluding the vocabulary)."""
+        return int(self.records.nbytes)
+
+    # ------------------------------------------------------------------
+    # Derived columns
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        return self.records[name]
+
+    def position_buckets(self) -> np.ndarray:
+        """``token_pos`` binned into 0, 1-2, 3-5, 6-9 and 10+ (buckets 0-4)."""
+        return np.searchsorted(POSITION_BUCKET_EDGES, self.column("token_pos"), side="left")
+
+    def recency(self, gap: int = 50) -> np.ndarray:
+        """Whether the same word was chosen from the same window at most ``gap`` choices earlier."""
+        return recent_repeats(self.group_ids("window_id", "word_id"), gap)
+
+    def suffix_codes(self, length: int = 2) -> tuple[np.ndarray, list[str]]:
+        """Suffix code per word ID, and the suffix text per code.
+
+        Words shorter than ``length`` get -1. The code array has one extra
+        trailing -1, so indexing it with ``prev_word_id`` maps "no previous
+        word" to -1 as well.
+        """
+        codes: dict[str, int] = {}
+        vocab_codes = np.array(
+            [codes.setdefault(w[-length:], len(codes)) if len(w) >= length else -1 for w in self.vocab] + [-1],
+            dtype=np.int64,
+        )
+        return vocab_codes, list(codes)
+
+    def prev_suffix_ids(self, length: int = 2) -> np.ndarray:
+        """Suffix code of the previous word (-1: none or shorter than ``length``)."""
+        vocab_codes, _suffixes = self.suffix_codes(length)
+        return vocab_codes[self.column("prev_word_id")]
+
+    # ------------------------------------------------------------------
+    # Group-by helpers
+    # ------------------------------------------------------------------
+
+    def _values(self, key: str | np.ndarray) -> np.ndarray:
+        return self.column(key) if isinstance(key, str) else np.asarray(key)
+
+    def group_ids(self, *by: str | np.ndarray) -> np.ndarray:
+        """Dense group ID per record for the combination of ``by`` columns.
+
+        Each entry of ``by`` is a column name or an array with one value per
+        record. Groups are numbered in order of first appearance.
+        """
+        ids = np.zeros(len(self), dtype=np.int64)
+        for key in by:
+            codes = _factorize(self._values(key))
+            ids = _factorize(ids * (int(codes.max(initial=0)) + 1) + codes)
+        return ids
+
+    def grouped_entropy(self, target: str | np.ndarray,
+                        *by: str | np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Entropy of ``target`` within each group of ``by``.
+
+        Returns:
+            Per group, in order of first appearance: the index of its first
+            record, its size, and the Shannon entropy of ``target`` in bits.
+        """
+        groups = self.group_ids(*by)
+        pairs = self.group_ids(groups, target)
+        if groups.size == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0)
+        _uniq, first = np.unique(groups, return_index=True)
+        sizes = np.bincount(groups)
+        pair_counts = np.bincount(pairs)
+        pair_group = np.zeros(pair_counts.size, dtype=np.int64)
+        pair_group[pairs] = groups
+        terms = _entropy_terms(pair_counts, sizes[pair_group])
+        return first, sizes, np.bincount(pair_group, weights=terms, minlength=sizes.size)
+
+    def conditional_entropy(self, target: str | np.ndarray, *by: str | np.ndarray) -> float:
+        """H(target | by) in bits: the size-weighted mean of ``grouped_entropy``."""
+        _first, sizes, entropies = self.grouped_entropy(target, *by)
+        if sizes.size == 0:
+            return 0.0
+        return float(np.dot(sizes, entropies) / sizes.sum())
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        """Write to ``.npz`` or ``.parquet`` (chosen by the suffix)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            pa, pq = _require_pyarrow()
+            records = self.records
+            table = pa.table({name: records[name] for name in CHOICE_DTYPE.names})
+            metadata = {b"choice_log": json.dumps({"vocab": self.vocab, "scribes": self.scribes}).encode()}
+            pq.write_table(table.replace_schema_metadata(metadata), path)
+        elif path.suffix == ".npz":
+            np.savez_compressed(
+                path,
+                records=self.records,
+                vocab=np.array(self.vocab, dtype=str),
+                scribes=np.array(self.scribes, dtype=str),
+            )
+        else:
+            raise ValueError(f"Unsupported choice log format: {path.suffix} (use .npz or .parquet)")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ChoiceLog":
+        """Read a log written by ``save``."""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            _pa, pq = _require_pyarrow()
+            table = pq.read_table(path)
+            meta = json.loads(table.schema.metadata[b"choice_log"])
+            records = np.zeros(table.num_rows, dtype=CHOICE_DTYPE)
+            for name in CHOICE_DTYPE.names:
+                records[name] = table.column(name).to_numpy()
+            return cls(records, meta["vocab"], meta["scribes"])
+        if path.suffix == ".npz":
+            with np.load(path) as data:
+                return cls(data["records"], data["vocab"].tolist(), data["scribes"].tolist())
+        raise ValueError(f"Unsupported choice log format: {path.suffix} (use .npz or .parquet)")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet choice logs require pyarrow. Install the optional extra: pip install -e '.[duckdb]'"
+        ) from exc
+    return pa, pq
+
+
+ChoicesLike = Sequence[dict[str, Any]] | ChoiceLog
@@ -6,14 +6,30 @@ tokenized lines.  Every Phase 12+ script should use ``load_canonical_lines``
 construction matches the vocabulary used during validation.
 """
 
+import logging
 import re
 
 from phase1_foundation.core.queries import get_lines_from_store
 from phase1_foundation.storage.metadata import MetadataStore
 
+logger = logging.getLogger(__name__)
+
 # Default canonical source — Zandbergen-Landini IVTFF 2.0
 DEFAULT_SOURCE_ID = "zandbergen_landini"
 
+# Manuscript sections by inclusive folio-number range
+SECTIONS: dict[str, tuple[int, int]] = {
+    "Herbal A": (1, 57),
+    "Herbal B": (58, 66),
+    "Astro": (67, 74),
+    "Biological": (75, 84),
+    "Cosmo": (85, 86),
+    "Pharma": (87, 102),
+    "Stars": (103, 116),
+}
+
+_RE_FOLIO_NUM = re.compile(r"f(\d+)")
+
 # Compiled regexes for token sanitization
 _RE_INLINE_META = re.compile(r"<!.*?>")       # e.g. <!00:00>
 _RE_ANGLE_TAGS = re.compile(r"<.*?>")         # e.g. <%>, <$>
@@ -39,11 +55,37 @@ def sanitize_token(token: str) -> str:
     return t.strip()
 
 
+def folio_number(folio_id: str) -> int:
+    """Extract the numeric folio number from a page ID (``"f75r"`` -> 75; 0 if absent)."""
+    match = _RE_FOLIO_NUM.search(folio_id)
+    return int(match.group(1)) if match else 0
+
+
+def folio_section(folio_id: str) -> str:
+    """Map a page ID to its manuscript section, or ``"Other"``."""
+    num = folio_number(folio_id)
+    for name, (lo, hi) in SECTIONS.items():
+        if lo <= num <= hi:
+            return name
+    return "Other"
+
+
+def folio_hand(folio_id: str) -> str:
+    """Map a page ID to its Currier hand (``"Hand1"``/``"Hand2"``/``"Unknown"``)."""
+    num = folio_number(folio_id)
+    if 0 < num <= 66:
+        return "Hand1"
+    if 75 <= num <= 84 or 103 <= num <= 116:
+        return "Hand2"
+    return "Unknown"
+
+
 def load_canonical_lines(
     store: MetadataStore,
     dataset_id: str = "voynich_real",
     source_id: str | None = DEFAULT_SOURCE_ID,
     sanitize: bool = True,
+    backend: str = "sqlalchemy",
 ) -> list[list[str]]:
     """Load tokenized lines from the canonical transcription source.
 
@@ -57,10 +99,35 @@ def load_canonical_lines(
             all sources (legacy behaviour).  Default is Zandbergen-Landini.
         sanitize: If True (default), apply IVTFF markup removal to every
             token and drop empty results.
+        backend: ``"sqlalchemy"`` (default) runs the ORM join; ``"snapshot"``
+            memory-maps the Parquet snapshot written by
+            ``foundation snapshot build`` and raises if it is missing or
+            stale; ``"auto"`` uses the snapshot when available.
 
     Returns:
         List of lines, each a list of clean token strings.
     """
+    if backend not in ("sqlalchemy", "snapshot", "auto"):
+        raise ValueError(f"Unknown backend {backend!r}. Allowed: sqlalchemy, snapshot, auto")
+    if backend != "sqlalchemy":
+        from phase1_foundation.core.snapshot import SnapshotUnavailableError, load_snapshot_lines
+
+        try:
+            return load_snapshot_lines(store, dataset_id, source_id, sanitize)
+        except (SnapshotUnavailableError, ImportError):
+            if backend == "snapshot":
+                raise
+            logger.debug("No snapshot for %s/%s; using SQLAlchemy path", dataset_id, source_id)
+
+    return _load_lines_from_store(store, dataset_id, source_id, sanitize)
+
+
+def _load_lines_from_store(
+    store: MetadataStore,
+    dataset_id: str,
+    source_id: str | None,
+    sanitize: bool,
+) -> list[list[str]]:
     raw_lines = get_lines_from_store(store, dataset_id, source_id=source_id)
 
     if not sanitize:
@@ -0,0 +1,205 @@
+"""In-memory nearest-neighbour index over region embeddings.
+
+All vectors stored for one ``model_name`` are loaded once into a row-
+normalized float32 matrix, so a cosine top-k lookup is a single
+matrix-vector product plus ``argpartition``. The index can be persisted as
+a sidecar pair under ``index_dir``::
+
+    <model>.npy    float32[n_regions, dim]   normalized vectors (memory-mapped on load)
+    <model>.json   region/page IDs and the region_embeddings fingerprint
+
+A sidecar is reused only while the ``region_embeddings`` fingerprint for
+that model (row count and max ID) still matches the database.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+
+from phase1_foundation.storage.metadata import MetadataStore, RegionEmbeddingRecord, RegionRecord
+
+logger = logging.getLogger(__name__)
+
+_QUERY_CHUNK = 256
+
+
+def _sidecar_stem(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+
+
+def embedding_fingerprint(store: MetadataStore, model_name: str) -> dict[str, int]:
+    """Row count and max ID of ``region_embeddings`` for ``model_name``."""
+    session = store.Session()
+    try:
+        count, max_id = (
+            session.query(func.count(RegionEmbeddingRecord.id), func.max(RegionEmbeddingRecord.id))
+            .filter(RegionEmbeddingRecord.model_name == model_name)
+            .one()
+        )
+        return {"count": int(count), "max_id": int(max_id or 0)}
+    finally:
+        session.close()
+
+
+class EmbeddingIndex:
+    """
+    Cosine-similarity index for one embedding model.
+
+    Rows are ordered by region ID and hold each region's first stored
+    embedding for the model; zero vectors stay zero and score 0.0.
+
+    Attributes:
+        model_name: Embedding model the vectors belong to.
+        region_ids: Region ID of each matrix row (sorted).
+        page_ids: Page ID of each matrix row.
+        matrix: Row-normalized float32 vectors, shape (n_regions, dim).
+        fingerprint: ``embedding_fingerprint`` at build time.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        region_ids: list[str],
+        page_ids: list[str],
+        matrix: np.ndarray,
+        fingerprint: dict[str, int],
+    ):
+        self.model_name = model_name
+        self.region_ids = region_ids
+        self.page_ids = page_ids
+        self.matrix = matrix
+        self.fingerprint = fingerprint
+        self._positions = {region_id: i for i, region_id in enumerate(region_ids)}
+
+    def __len__(self) -> int:
+        return len(self.region_ids)
+
+    @classmethod
+    def build(cls, store: MetadataStore, model_name: str) -> "EmbeddingIndex":
+        """Load every embedding for ``model_name`` in one query."""
+        fingerprint = embedding_fingerprint(store, model_name)
+        session = store.Session()
+        try:
+            rows = (
+                session.query(RegionEmbeddingRecord.region_id, RegionRecord.page_id, RegionEmbeddingRecord.vector)
+                .join(RegionRecord, RegionEmbeddingRecord.region_id == RegionRecord.id)
+                .filter(RegionEmbeddingRecord.model_name == model_name)
+                .order_by(RegionEmbeddingRecord.region_id, RegionEmbeddingRecord.id)
+                .all()
+            )
+        finally:
+            session.close()
+
+        region_ids: list[str] = []
+        page_ids: list[str] = []
+        vectors: list[np.ndarray] = []
+        dim = None
+        for region_id, page_id, blob in rows:
+            if region_ids and region_ids[-1] == region_id:
+                continue
+            if not blob:
+                continue
+            vec = np.frombuffer(blob, dtype=np.float32)
+            if dim is None:
+                dim = vec.size
+            if vec.size != dim:
+                logger.warning(
+                    "Skipping embedding for region %s: dimension %d != %d (model %s)",
+                    region_id, vec.size, dim, model_name,
+                )
+                continue
+            region_ids.append(region_id)
+            page_ids.append(page_id)
+            vectors.append(vec)
+
+        matrix = np.vstack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return cls(model_name, region_ids, page_ids, matrix.astype(np.float32, copy=False), fingerprint)
+
+    @classmethod
+    def load(cls, store: MetadataStore, model_name: str, index_dir: Path) -> "EmbeddingIndex":
+        """Memory-map the sidecar if it matches the database, else rebuild and save it."""
+        index_dir = Path(index_dir)
+        stem = _sidecar_stem(model_name)
+        meta_path = index_dir / f"{stem}.json"
+        matrix_path = index_dir / f"{stem}.npy"
+        if meta_path.exists() and matrix_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("model_name") == model_name and meta.get("fingerprint") == embedding_fingerprint(store, model_name):
+                matrix = np.load(matrix_path, mmap_mode="r")
+                return cls(model_name, meta["region_ids"], meta["page_ids"], matrix, meta["fingerprint"])
+            logger.info("Embedding index sidecar for %s is stale; rebuilding", model_name)
+
+        index = cls.build(store, model_name)
+        index.save(index_dir)
+        return index
+
+    def save(self, index_dir: Path) -> None:
+        """Write the sidecar pair atomically."""
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        stem = _sidecar_stem(self.model_name)
+
+        fd, tmp = tempfile.mkstemp(dir=index_dir, suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.matrix))
+        os.replace(tmp, index_dir / f"{stem}.npy")
+
+        fd, tmp = tempfile.mkstemp(dir=index_dir, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({
+                "model_name": self.model_name,
+                "fingerprint": self.fingerprint,
+                "region_ids": self.region_ids,
+                "page_ids": self.page_ids,
+            }, f)
+        os.replace(tmp, index_dir / f"{stem}.json")
+
+    def position(self, region_id: str) -> int | None:
+        return self._positions.get(region_id)
+
+    def _top_k(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """Row positions of the k best scores; ties go to the lower region ID."""
+        valid = np.flatnonzero(np.isfinite(scores))
+        if valid.size <= k:
+            candidates = valid
+        else:
+            # Keep every entry tied with the k-th best so the cut is deterministic.
+            kth = np.partition(scores[valid], valid.size - k)[valid.size - k]
+            candidates = valid[scores[valid] >= kth]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order][:k]
+
+    def search(self, region_ids: list[str], k: int = 10) -> dict[str, list[dict[str, Any]]]:
+        """Top-k most similar other regions for each indexed query region.
+
+        Region IDs missing from the index map to an empty list.
+        """
+        results: dict[str, list[dict[str, Any]]] = {region_id: [] for region_id in region_ids}
+        positions = [(rid, self._positions[rid]) for rid in results if rid in self._positions]
+        if not positions or k <= 0:
+            return results
+
+        for start in range(0, len(positions), _QUERY_CHUNK):
+            chunk = positions[start:start + _QUERY_CHUNK]
+            rows = np.array([pos for _rid, pos in chunk])
+            scores = np.asarray(self.matrix[rows] @ self.matrix.T, dtype=np.float64)
+            scores[np.arange(len(chunk)), rows] = -np.inf  # exclude the query region
+            for (region_id, _pos), row_scores in zip(chunk, scores, strict=True):
+                results[region_id] = [
+                    {
+                        "region_id": self.region_ids[j],
+                        "score": float(row_scores[j]),
+                        "page_id": self.page_ids[j],
+                    }
+                    for j in self._top_k(row_scores, k).tolist()
+                ]
+        return results
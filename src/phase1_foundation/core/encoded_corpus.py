@@ -0,0 +1,330 @@
+"""Integer-encoded corpus representation.
+
+Analyzers across the phases consume ``list[list[str]]`` and re-hash token
+strings in their inner loops. ``EncodedCorpus`` stores the same lines in
+CSR form::
+
+    vocab    list[str]            token ID -> token text
+    tokens   int32[n_tokens]      token IDs of all lines, concatenated
+    offsets  int64[n_lines + 1]   line i is tokens[offsets[i]:offsets[i + 1]]
+
+plus optional per-line ``page``/``section``/``hand`` side arrays, stored as
+int32 codes into a label table. Token IDs are assigned in order of first
+appearance, so encoding the same lines twice yields identical arrays.
+
+The class also implements the read-only sequence protocol over decoded
+lines, so any function written against ``list[list[str]]`` accepts it
+unchanged; hot paths call ``as_encoded`` to get at the integer arrays.
+"""
+
+import logging
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_DTYPE = np.int32
+OFFSET_DTYPE = np.int64
+SIDE_FIELDS = ("page", "section", "hand")
+
+
+def _encode_labels(values: Sequence[str]) -> tuple[np.ndarray, list[str]]:
+    index: dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(v, len(index)) for v in values), dtype=TOKEN_DTYPE, count=len(values)
+    )
+    return codes, list(index)
+
+
+class EncodedCorpus:
+    """Lines of tokens as a vocabulary plus CSR integer arrays.
+
+    Slicing with a ``slice`` of step 1 returns a new corpus whose ``tokens``
+    array is a view into this one; only the (line-sized) offsets are
+    rebased. Integer indexing returns the decoded line as ``list[str]``.
+
+    Attributes:
+        vocab: Token text for each token ID.
+        tokens: Concatenated token IDs (int32).
+        offsets: Line boundaries into ``tokens`` (int64, length n_lines + 1).
+        side: Mapping of side-array name to ``(codes, labels)``; ``codes``
+            holds one int32 per line indexing into ``labels``.
+    """
+
+    __slots__ = ("vocab", "tokens", "offsets", "side", "_index")
+
+    def __init__(
+        self,
+        vocab: list[str],
+        tokens: np.ndarray,
+        offsets: np.ndarray,
+        side: dict[str, tuple[np.ndarray, list[str]]] | None = None,
+    ) -> None:
+        tokens = np.asarray(tokens, dtype=TOKEN_DTYPE)
+        offsets = np.asarray(offsets, dtype=OFFSET_DTYPE)
+        if offsets.ndim != 1 or offsets.size == 0 or offsets[0] != 0 or offsets[-1] != tokens.size:
+            raise ValueError("offsets must start at 0 and end at len(tokens)")
+        side = dict(side or {})
+        for name, (codes, _labels) in side.items():
+            if len(codes) != offsets.size - 1:
+                raise ValueError(f"Side array '{name}' has {len(codes)} entries for {offsets.size - 1} lines")
+
+        self.vocab = vocab
+        self.tokens = tokens
+        self.offsets = offsets
+        self.side = side
+        self._index: dict[str, int] | None = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Sequence[Sequence[str]],
+        vocab: Sequence[str] | None = None,
+        pages: Sequence[str] | None = None,
+        sections: Sequence[str] | None = None,
+        hands: Sequence[str] | None = None,
+    ) -> "EncodedCorpus":
+        """Encode tokenized lines.
+
+        Args:
+            lines: Tokenized lines.
+            vocab: Optional starting vocabulary, e.g. to encode a synthetic
+                corpus with the IDs of the real one. Unseen tokens are
+                appended.
+            pages, sections, hands: Optional per-line labels.
+        """
+        index: dict[str, int] = {t: i for i, t in enumerate(vocab or ())}
+        lengths = np.fromiter((len(line) for line in lines), dtype=OFFSET_DTYPE, count=len(lines))
+        offsets = np.zeros(len(lines) + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(lengths, out=offsets[1:])
+        tokens = np.fromiter(
+            (index.setdefault(t, len(index)) for t in chain.from_iterable(lines)),
+            dtype=TOKEN_DTYPE,
+            count=int(offsets[-1]),
+        )
+
+        side = {}
+        for name, values in zip(SIDE_FIELDS, (pages, sections, hands), strict=True):
+            if values is not None:
+                side[name] = _encode_labels(values)
+        return cls(list(index), tokens, offsets, side)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        store,
+        dataset_id: str = "voynich_real",
+        source_id: str | None = "zandbergen_landini",
+        sanitize: bool = True,
+        snapshot_dir: Path | None = None,
+    ) -> "EncodedCorpus":
+        """Build a corpus, with page/section/hand arrays, from a Parquet snapshot.
+
+        Raises:
+            SnapshotUnavailableError: If no snapshot matches the current database.
+        """
+        from phase1_foundation.core.snapshot import SNAPSHOT_DIR, read_snapshot_table
+
+        table = read_snapshot_table(
+            store, dataset_id, source_id, sanitize, snapshot_dir or SNAPSHOT_DIR,
+            columns=["token", "line", "page", "section", "hand"],
+        )
+        token_col = table.column("token").combine_chunks().dictionary_encode()
+        vocab_ids = token_col.indices.to_numpy(zero_copy_only=False)
+        # Re-number so IDs follow first appearance, matching from_lines().
+        uniq, first = np.unique(vocab_ids, return_index=True)
+        order = uniq[np.argsort(first, kind="stable")]
+        remap = np.empty(len(token_col.dictionary), dtype=TOKEN_DTYPE)
+        remap[order] = np.arange(order.size, dtype=TOKEN_DTYPE)
+        dictionary = token_col.dictionary.to_pylist()
+        vocab = [dictionary[i] for i in order]
+        tokens = remap[vocab_ids] if vocab_ids.size else np.empty(0, dtype=TOKEN_DTYPE)
+
+        line = table.column("line").to_numpy()
+        n_lines = int(line[-1]) + 1 if line.size else 0
+        offsets = np.zeros(n_lines + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(np.bincount(line, minlength=n_lines), out=offsets[1:])
+
+        starts = offsets[:-1]
+        side = {}
+        for name in SIDE_FIELDS:
+            side[name] = _encode_labels(table.column(name).take(starts).to_pylist())
+        return cls(vocab, tokens, offsets, side)
+
+    # ------------------------------------------------------------------
+    # Sequence protocol (decoded lines)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.offsets.size - 1
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return self.select(np.arange(start, stop, step))
+            return self.slice(start, stop)
+        return self.decode(self.line_ids(key))
+
+    def __iter__(self) -> Iterator[list[str]]:
+        vocab = self.vocab
+        tokens = self.tokens.tolist()
+        bounds = self.offsets.tolist()
+        for a, b in zip(bounds[:-1], bounds[1:], strict=True):
+            yield [vocab[t] for t in tokens[a:b]]
+
+    def __repr__(self) -> str:
+        return f"EncodedCorpus(lines={len(self)}, tokens={self.n_tokens}, vocab={len(self.vocab)})"
+
+    # ------------------------------------------------------------------
+    # Integer views
+    # ------------------------------------------------------------------
+
+    @property
+    def n_tokens(self) -> int:
+        return int(self.tokens.size)
+
+    @property
+    def vocab_size(self) -> int:
+        return len(self.vocab)
+
+    @property
+    def token_index(self) -> dict[str, int]:
+        """Token text -> token ID (built on first use)."""
+        if self._index is None:
+            self._index = {t: i for i, t in enumerate(self.vocab)}
+        return self._index
+
+    def line_ids(self, i: int) -> np.ndarray:
+        """Token IDs of line ``i`` as a view into ``tokens``."""
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("line index out of range")
+        return self.tokens[self.offsets[i]:self.offsets[i + 1]]
+
+    def line_lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def line_of_token(self) -> np.ndarray:
+        """Line number of every token position."""
+        return np.repeat(np.arange(len(self), dtype=OFFSET_DTYPE), self.line_lengths())
+
+    def position_in_line(self) -> np.ndarray:
+        """0-based position of every token within its line."""
+        return np.arange(self.n_tokens, dtype=OFFSET_DTYPE) - np.repeat(self.offsets[:-1], self.line_lengths())
+
+    def bigram_positions(self) -> np.ndarray:
+        """Token positions ``i`` where ``(i, i + 1)`` is a bigram inside one line."""
+        if self.n_tokens < 2:
+            return np.empty(0, dtype=OFFSET_DTYPE)
+        mask = np.ones(self.n_tokens - 1, dtype=bool)
+        # A line ending at position e - 1 must not pair with position e.
+        ends = self.offsets[1:-1]
+        mask[ends[(ends > 0) & (ends < self.n_tokens)] - 1] = False
+        return np.flatnonzero(mask)
+
+    def bigrams(self) -> tuple[np.ndarray, np.ndarray]:
+        """``(prev, next)`` token IDs of all within-line bigrams."""
+        pos = self.bigram_positions()
+        return self.tokens[pos], self.tokens[pos + 1]
+
+    def token_counts(self) -> np.ndarray:
+        """Occurrences of each token ID (length ``vocab_size``)."""
+        return np.bincount(self.tokens, minlength=self.vocab_size)
+
+    def encode(self, tokens: Sequence[str]) -> np.ndarray:
+        """Token IDs for ``tokens`` under this vocabulary; unknown tokens map to -1."""
+        index = self.token_index
+        return np.fromiter((index.get(t, -1) for t in tokens), dtype=TOKEN_DTYPE, count=len(tokens))
+
+    def decode(self, ids: np.ndarray) -> list[str]:
+        vocab = self.vocab
+        return [vocab[t] for t in ids.tolist()]
+
+    # ------------------------------------------------------------------
+    # Line selection
+    # ------------------------------------------------------------------
+
+    def slice(self, start: int, stop: int) -> "EncodedCorpus":
+        """Lines ``start:stop`` sharing this corpus' token buffer."""
+        start = max(0, min(start, len(self)))
+        stop = max(start, min(stop, len(self)))
+        base = self.offsets[start]
+        tokens = self.tokens[base:self.offsets[stop]]
+        offsets = self.offsets[start:stop + 1] - base
+        side = {name: (codes[start:stop], labels) for name, (codes, labels) in self.side.items()}
+        sub = EncodedCorpus(self.vocab, tokens, offsets, side)
+        sub._index = self._index
+        return sub
+
+    def select(self, line_numbers: np.ndarray) -> "EncodedCorpus":
+        """Copy of the lines at ``line_numbers`` (in the given order)."""
+        line_numbers = np.asarray(line_numbers, dtype=OFFSET_DTYPE)
+        lengths = self.line_lengths()[line_numbers]
+        offsets = np.zeros(line_numbers.size + 1, dtype=OFFSET_DTYPE)
+        np.cumsum(lengths, out=offsets[1:])
+        starts = np.repeat(self.offsets[line_numbers], lengths)
+        within = np.arange(int(offsets[-1]), dtype=OFFSET_DTYPE) - np.repeat(offsets[:-1], lengths)
+        tokens = self.tokens[starts + within]
+        side = {name: (codes[line_numbers], labels) for name, (codes, labels) in self.side.items()}
+        sub = EncodedCorpus(self.vocab, tokens, offsets, side)
+        sub._index = self._index
+        return sub
+
+    def labels(self, name: str) -> list[str]:
+        """Decoded per-line values of side array ``name`` (page, section or hand)."""
+        if name not in self.side:
+            raise KeyError(f"Corpus has no '{name}' side array")
+        codes, labels = self.side[name]
+        return [labels[c] for c in codes.tolist()]
+
+    def where(self, name: str, value: str) -> "EncodedCorpus":
+        """Lines whose side array ``name`` equals ``value``."""
+        if name not in self.side:
+            raise KeyError(f"Corpus has no '{name}' side array")
+        codes, labels = self.side[name]
+        if value not in labels:
+            return self.select(np.empty(0, dtype=OFFSET_DTYPE))
+        return self.select(np.flatnonzero(codes == labels.index(value)))
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def to_lines(self) -> list[list[str]]:
+        return list(self)
+
+    def flat_tokens(self) -> list[str]:
+        """All tokens in reading order, ignoring line boundaries."""
+        return self.decode(self.tokens)
+
+    def nbytes(self) -> int:
+        """Bytes held by the integer arrays (excluding the vocabulary)."""
+        total = self.tokens.nbytes + self.offsets.nbytes
+        return total + sum(codes.nbytes for codes, _labels in self.side.values())
+
+
+LinesLike = Sequence[Sequence[str]] | EncodedCorpus
+
+
+def as_encoded(lines: LinesLike) -> EncodedCorpus:
+    """Return ``lines`` as an ``EncodedCorpus``, encoding only when needed."""
+    if isinstance(lines, EncodedCorpus):
+        return lines
+    return EncodedCorpus.from_lines(lines)
+
+
+def as_lines(lines: LinesLike) -> list[list[str]]:
+    """Return ``lines`` as ``list[list[str]]`` for code that needs real lists."""
+    if isinstance(lines, EncodedCorpus):
+        return lines.to_lines()
+    return [list(line) for line in lines]
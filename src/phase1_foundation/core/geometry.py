@@ -1,7 +1,9 @@
 import logging
 import math
+from collections.abc import Sequence
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 logger = logging.getLogger(__name__)
@@ -199,3 +201,158 @@ class Transform(BaseModel):
         new_ty = c2 * tx1 + d2 * ty1 + ty2
 
         return Transform(matrix=(new_a, new_b, new_c, new_d, new_tx, new_ty))
+
+
+class BoxArray:
+    """
+    Columnar boxes for vectorized geometry.
+
+    Holds the same coordinates as a list of ``Box`` objects in four float64
+    arrays. The pairwise methods take index arrays ``(a_idx, b_idx)`` and
+    evaluate the ``Box`` formulas element-wise: IoU and containment are
+    identical to ``Box.iou``/``Box.contains``, and centroid distances agree
+    with ``Box.distance`` to within one ulp (NumPy squares by
+    multiplication, Python's ``**`` calls ``pow``).
+    """
+
+    def __init__(self, x_min: np.ndarray, y_min: np.ndarray, x_max: np.ndarray, y_max: np.ndarray):
+        self.x_min = np.asarray(x_min, dtype=np.float64)
+        self.y_min = np.asarray(y_min, dtype=np.float64)
+        self.x_max = np.asarray(x_max, dtype=np.float64)
+        self.y_max = np.asarray(y_max, dtype=np.float64)
+
+    @classmethod
+    def from_boxes(cls, boxes: Sequence[Box]) -> 'BoxArray':
+        coords = np.array(
+            [(b.x_min, b.y_min, b.x_max, b.y_max) for b in boxes], dtype=np.float64
+        ).reshape(-1, 4)
+        return cls(coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3])
+
+    def __len__(self) -> int:
+        return int(self.x_min.size)
+
+    @property
+    def area(self) -> np.ndarray:
+        return (self.x_max - self.x_min) * (self.y_max - self.y_min)
+
+    @property
+    def centroids(self) -> tuple[np.ndarray, np.ndarray]:
+        return (self.x_min + self.x_max) / 2.0, (self.y_min + self.y_max) / 2.0
+
+    def expanded(self, x_min: np.ndarray, y_min: np.ndarray, x_max: np.ndarray, y_max: np.ndarray) -> 'BoxArray':
+        """Per-box union with another set of extents (same length)."""
+        return BoxArray(
+            np.minimum(self.x_min, x_min),
+            np.minimum(self.y_min, y_min),
+            np.maximum(self.x_max, x_max),
+            np.maximum(self.y_max, y_max),
+        )
+
+    def iou(self, a_idx: np.ndarray, other: 'BoxArray', b_idx: np.ndarray) -> np.ndarray:
+        """IoU of ``self[a_idx[k]]`` with ``other[b_idx[k]]`` for every k."""
+        ix_min = np.maximum(self.x_min[a_idx], other.x_min[b_idx])
+        iy_min = np.maximum(self.y_min[a_idx], other.y_min[b_idx])
+        ix_max = np.minimum(self.x_max[a_idx], other.x_max[b_idx])
+        iy_max = np.minimum(self.y_max[a_idx], other.y_max[b_idx])
+        disjoint = (ix_max < ix_min) | (iy_max < iy_min)
+
+        inter = np.where(disjoint, 0.0, (ix_max - ix_min) * (iy_max - iy_min))
+        union = self.area[a_idx] + other.area[b_idx] - inter
+        out = np.zeros(inter.shape, dtype=np.float64)
+        np.divide(inter, union, out=out, where=~disjoint & (union != 0))
+        return out
+
+    def contains(self, a_idx: np.ndarray, other: 'BoxArray', b_idx: np.ndarray) -> np.ndarray:
+        """Whether ``self[a_idx[k]]`` completely contains ``other[b_idx[k]]``."""
+        return (
+            (self.x_min[a_idx] <= other.x_min[b_idx])
+            & (self.y_min[a_idx] <= other.y_min[b_idx])
+            & (self.x_max[a_idx] >= other.x_max[b_idx])
+            & (self.y_max[a_idx] >= other.y_max[b_idx])
+        )
+
+    def intersects(self, a_idx: np.ndarray, other: 'BoxArray', b_idx: np.ndarray) -> np.ndarray:
+        """Closed-interval overlap test (touching boxes intersect)."""
+        return (
+            (np.maximum(self.x_min[a_idx], other.x_min[b_idx]) <= np.minimum(self.x_max[a_idx], other.x_max[b_idx]))
+            & (np.maximum(self.y_min[a_idx], other.y_min[b_idx]) <= np.minimum(self.y_max[a_idx], other.y_max[b_idx]))
+        )
+
+    def distance(self, a_idx: np.ndarray, other: 'BoxArray', b_idx: np.ndarray) -> np.ndarray:
+        """Euclidean distance between centroids."""
+        ax, ay = self.centroids
+        bx, by = other.centroids
+        return np.sqrt((ax[a_idx] - bx[b_idx]) ** 2 + (ay[a_idx] - by[b_idx]) ** 2)
+
+
+class GridIndex:
+    """
+    Uniform-grid spatial index over a ``BoxArray`` in normalized space.
+
+    Every box is registered in each grid cell it touches; a query returns
+    the ``(query, box)`` pairs that share at least one cell, which is a
+    superset of the intersecting pairs. Build and query are vectorized.
+
+    Args:
+        boxes: The boxes to index.
+        cell_size: Grid cell edge length. Defaults to the median box extent,
+            bounded to between 1/256 and 1.
+    """
+
+    MAX_CELLS_PER_AXIS = 256
+
+    def __init__(self, boxes: BoxArray, cell_size: float | None = None):
+        self.boxes = boxes
+        if cell_size is None:
+            extents = np.maximum(boxes.x_max - boxes.x_min, boxes.y_max - boxes.y_min)
+            cell_size = float(np.median(extents)) if len(boxes) else 1.0
+        self.cell_size = min(1.0, max(cell_size, 1.0 / self.MAX_CELLS_PER_AXIS))
+        self.n_cells = int(math.ceil(1.0 / self.cell_size)) + 1
+
+        owner, keys = self._cells(boxes)
+        order = np.argsort(keys, kind="stable")
+        self._items = owner[order]
+        self._keys, self._starts = np.unique(keys[order], return_index=True)
+        self._ends = np.append(self._starts[1:], self._items.size)
+
+    def _cells(self, boxes: BoxArray) -> tuple[np.ndarray, np.ndarray]:
+        """Expand each box into ``(box index, cell key)`` entries."""
+        last = self.n_cells - 1
+        cx0 = np.clip(np.floor(boxes.x_min / self.cell_size), 0, last).astype(np.int64)
+        cy0 = np.clip(np.floor(boxes.y_min / self.cell_size), 0, last).astype(np.int64)
+        cx1 = np.clip(np.floor(boxes.x_max / self.cell_size), 0, last).astype(np.int64)
+        cy1 = np.clip(np.floor(boxes.y_max / self.cell_size), 0, last).astype(np.int64)
+        ny = cy1 - cy0 + 1
+        counts = (cx1 - cx0 + 1) * ny
+
+        owner = np.repeat(np.arange(len(boxes), dtype=np.int64), counts)
+        local = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = cx0[owner] + local // ny[owner]
+        cy = cy0[owner] + local % ny[owner]
+        return owner, cx * self.n_cells + cy
+
+    def candidate_pairs(self, queries: BoxArray) -> tuple[np.ndarray, np.ndarray]:
+        """Unique ``(query index, box index)`` pairs sharing a cell, sorted."""
+        empty = np.empty(0, dtype=np.int64)
+        if len(queries) == 0 or self._keys.size == 0:
+            return empty, empty
+
+        q_owner, q_keys = self._cells(queries)
+        pos = np.searchsorted(self._keys, q_keys)
+        pos = np.minimum(pos, self._keys.size - 1)
+        hit = self._keys[pos] == q_keys
+        q_owner, pos = q_owner[hit], pos[hit]
+
+        starts, lengths = self._starts[pos], self._ends[pos] - self._starts[pos]
+        qi = np.repeat(q_owner, lengths)
+        local = np.arange(int(lengths.sum()), dtype=np.int64) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        bi = self._items[np.repeat(starts, lengths) + local]
+
+        codes = np.unique(qi * len(self.boxes) + bi)
+        return codes // len(self.boxes), codes % len(self.boxes)
+
+    def intersecting_pairs(self, queries: BoxArray) -> tuple[np.ndarray, np.ndarray]:
+        """``(query index, box index)`` pairs whose boxes intersect (closed), sorted."""
+        qi, bi = self.candidate_pairs(queries)
+        keep = queries.intersects(qi, self.boxes, bi)
+        return qi[keep], bi[keep]
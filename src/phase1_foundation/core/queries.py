@@ -1,9 +1,11 @@
 import logging
-import struct
+from pathlib import Path
 from typing import Any
 
-import numpy as np
+from sqlalchemy import func
 
+from phase1_foundation.config import get_query_backend
+from phase1_foundation.core.embedding_index import EmbeddingIndex
 from phase1_foundation.storage.metadata import (
     AnchorRecord,
     GlyphCandidateRecord,
@@ -98,8 +100,83 @@ def get_tokens_and_boundaries(store: MetadataStore, dataset_id: str, source_id:
 
 
 class QueryEngine:
-    def __init__(self, store: MetadataStore):
+    """
+    Read-side queries over a MetadataStore.
+
+    Args:
+        store: The metadata store to query.
+        backend: Backend for aggregate queries ("sqlalchemy" or "duckdb").
+            Defaults to the ``METADATA_QUERY_BACKEND`` environment variable.
+            Both backends return identical results.
+        index_dir: Optional directory for memory-mapped embedding index
+            sidecars. Without it, indexes are kept in memory only.
+    """
+
+    def __init__(self, store: MetadataStore, backend: str | None = None, index_dir: Path | None = None):
         self.store = store
+        self.backend = get_query_backend(backend)
+        self.index_dir = Path(index_dir) if index_dir is not None else None
+        self._embedding_indexes: dict[str, tuple[int, EmbeddingIndex]] = {}
+
+    def _analytics(self):
+        from phase1_foundation.storage.analytics import DuckDBAnalytics
+
+        return DuckDBAnalytics(self.store)
+
+    # --- Aggregates ---
+
+    def token_frequencies(self, dataset_id: str, source_id: str = None) -> list[tuple[str, int]]:
+        """Return ``(token, count)`` pairs, most frequent first, ties by token."""
+        if self.backend == "duckdb":
+            with self._analytics() as analytics:
+                return analytics.token_frequencies(dataset_id, source_id)
+
+        session = self.store.Session()
+        try:
+            n = func.count(TranscriptionTokenRecord.id)
+            query = (
+                session.query(TranscriptionTokenRecord.content, n)
+                .join(TranscriptionLineRecord, TranscriptionTokenRecord.line_id == TranscriptionLineRecord.id)
+                .join(PageRecord, TranscriptionLineRecord.page_id == PageRecord.id)
+                .filter(PageRecord.dataset_id == dataset_id)
+            )
+            if source_id:
+                query = query.filter(TranscriptionLineRecord.source_id == source_id)
+            rows = query.group_by(TranscriptionTokenRecord.content).order_by(
+                n.desc(), TranscriptionTokenRecord.content
+            ).all()
+            return [(token, int(count)) for token, count in rows]
+        finally:
+            session.close()
+
+    def page_statistics(self, dataset_id: str, source_id: str = None) -> list[dict[str, Any]]:
+        """Return per-page line, token and distinct-token counts ordered by page ID."""
+        if self.backend == "duckdb":
+            with self._analytics() as analytics:
+                return analytics.page_statistics(dataset_id, source_id)
+
+        session = self.store.Session()
+        try:
+            query = (
+                session.query(
+                    PageRecord.id,
+                    func.count(func.distinct(TranscriptionLineRecord.id)),
+                    func.count(TranscriptionTokenRecord.id),
+                    func.count(func.distinct(TranscriptionTokenRecord.content)),
+                )
+                .join(TranscriptionLineRecord, TranscriptionLineRecord.page_id == PageRecord.id)
+                .join(TranscriptionTokenRecord, TranscriptionTokenRecord.line_id == TranscriptionLineRecord.id)
+                .filter(PageRecord.dataset_id == dataset_id)
+            )
+            if source_id:
+                query = query.filter(TranscriptionLineRecord.source_id == source_id)
+            rows = query.group_by(PageRecord.id).order_by(PageRecord.id).all()
+            return [
+                {"page_id": page_id, "lines": int(lines), "tokens": int(tokens), "unique_tokens": int(unique)}
+                for page_id, lines, tokens, unique in rows
+            ]
+        finally:
+            session.close()
 
     def get_words_for_token(self, token_content: str) -> list[dict[str, Any]]:
         session = self.store.Session()
@@ -139,79 +216,65 @@ class QueryEngine:
         finally:
             session.close()
 
-    def find_similar_regions(self, region_id: str, limit: int = 10) -> list[dict[str, Any]]:
-        """
-        Find regions similar to the given region using embedding cosine similarity.
-
-        Uses stored region embeddings to compute real similarity scores.
-        Returns empty list if source region has no embedding.
-        """
+    def embedding_index(self, model_name: str) -> EmbeddingIndex:
+        """Return the cosine index for ``model_name``, rebuilding it after embedding writes."""
+        generation = self.store.embedding_generation
+        cached = self._embedding_indexes.get(model_name)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        if self.index_dir is not None:
+            index = EmbeddingIndex.load(self.store, model_name, self.index_dir)
+        else:
+            index = EmbeddingIndex.build(self.store, model_name)
+        self._embedding_indexes[model_name] = (generation, index)
+        return index
+
+    def _embedding_models(self, region_ids: list[str]) -> dict[str, str]:
+        """Model name of each region's first stored embedding."""
         session = self.store.Session()
         try:
-            # Get source region embedding
-            source_embedding = (
-                session.query(RegionEmbeddingRecord)
-                .filter_by(region_id=region_id)
-                .first()
-            )
-
-            if not source_embedding or not source_embedding.vector:
-                return []  # No embedding available for source region
-
-            source_vector = self._bytes_to_vector(source_embedding.vector)
-            if source_vector is None:
-                return []
-
-            # Get all other regions
-            all_regions = (
-                session.query(RegionRecord)
-                .filter(RegionRecord.id != region_id)
+            rows = (
+                session.query(RegionEmbeddingRecord.region_id, RegionEmbeddingRecord.model_name)
+                .filter(RegionEmbeddingRecord.region_id.in_(region_ids))
+                .order_by(RegionEmbeddingRecord.id.desc())
                 .all()
             )
-
-            # Score each region by cosine similarity
-            scored = []
-            for region in all_regions:
-                embedding = (
-                    session.query(RegionEmbeddingRecord)
-                    .filter_by(region_id=region.id)
-                    .first()
-                )
-                if embedding and embedding.vector:
-                    target_vector = self._bytes_to_vector(embedding.vector)
-                    if target_vector is not None:
-                        score = self._cosine_similarity(source_vector, target_vector)
-                        scored.append({
-                            "region_id": region.id,
-                            "score": score,
-                            "page_id": region.page_id
-                        })
-
-            # Sort by score descending and return top results
-            scored.sort(key=lambda x: x["score"], reverse=True)
-            return scored[:limit]
+            # Descending IDs, so the first embedding per region is written last.
+            return dict(rows)
         finally:
             session.close()
 
-    def _bytes_to_vector(self, data: bytes) -> np.ndarray:
-        """Convert binary blob to numpy array."""
-        try:
-            return np.frombuffer(data, dtype=np.float32)
-        except (ValueError, struct.error):
-            return None
-
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Compute cosine similarity between two vectors."""
-        if vec1.shape != vec2.shape:
-            return 0.0
+    def find_similar_regions(self, region_id: str, limit: int = 10, model_name: str = None) -> list[dict[str, Any]]:
+        """
+        Find regions similar to the given region using embedding cosine similarity.
 
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        Compares against the other regions embedded with the same model
+        (by default the model of the source region's first embedding).
+        Returns empty list if source region has no embedding.
+        """
+        return self.find_similar_regions_many([region_id], limit, model_name)[region_id]
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+    def find_similar_regions_many(
+        self, region_ids: list[str], k: int = 10, model_name: str = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Batch form of ``find_similar_regions``: top-``k`` neighbours per region.
 
-        return float(np.dot(vec1, vec2) / (norm1 * norm2))
+        Scores are cosine similarities from one matrix product per query
+        chunk; ties are broken by region ID.
+        """
+        region_ids = list(dict.fromkeys(region_ids))
+        if model_name is not None:
+            return self.embedding_index(model_name).search(region_ids, k)
+
+        results: dict[str, list[dict[str, Any]]] = {region_id: [] for region_id in region_ids}
+        by_model: dict[str, list[str]] = {}
+        for region_id, model in self._embedding_models(region_ids).items():
+            by_model.setdefault(model, []).append(region_id)
+        for model, ids in sorted(by_model.items()):
+            results.update(self.embedding_index(model).search(ids, k))
+        return results
 
     # --- Level 4 Queries ---
 
@@ -0,0 +1,330 @@
+"""Columnar token-stream snapshots of the SQLite store.
+
+``load_canonical_lines`` re-runs a three-way ORM join plus regex sanitization
+on every call. A snapshot materializes that result once per
+``(dataset_id, source_id, sanitize)`` combination into a Parquet file with
+one row per token::
+
+    token       string   token text (sanitized if requested)
+    line        int32    0-based line number within the snapshot
+    line_index  int32    line_index of the source transcription line
+    page        string   page ID (folio)
+    section     string   manuscript section derived from the folio number
+    hand        string   Currier hand derived from the folio number
+
+Snapshots live under ``<snapshot_dir>/<db content hash>/`` so a changed
+database never serves stale tokens. Resolving the content hash hashes the
+database file once and caches it in ``manifest.json`` keyed by the file's
+size and mtime, so warm loads cost a ``stat`` plus a memory-mapped read.
+
+Requires the optional ``duckdb`` extra (``pyarrow``).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from phase1_foundation.core.data_loading import folio_hand, folio_section, sanitize_token
+from phase1_foundation.storage.metadata import (
+    MetadataStore,
+    PageRecord,
+    TranscriptionLineRecord,
+    TranscriptionTokenRecord,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path("data/derived/snapshots")
+SNAPSHOT_FORMAT_VERSION = 1
+_MANIFEST_NAME = "manifest.json"
+_HASH_CHUNK = 1 << 20
+
+
+class SnapshotUnavailableError(FileNotFoundError):
+    """Raised when no up-to-date snapshot exists for the requested combination."""
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Snapshots require pyarrow. Install the optional extra: pip install -e '.[duckdb]'"
+        ) from exc
+    return pa, pq
+
+
+def db_file_path(store: MetadataStore) -> Path:
+    """Return the SQLite file behind ``store`` (also for read-only URI mode)."""
+    url = store.engine.url
+    database = url.database or ""
+    if url.get_backend_name() != "sqlite" or database in ("", ":memory:"):
+        raise ValueError(f"Snapshots require a file-backed SQLite store, got {url}")
+    if database.startswith("file:"):
+        database = database[len("file:"):].split("?", 1)[0]
+    return Path(database).resolve()
+
+
+def _fingerprint(db_path: Path) -> dict[str, int]:
+    """Cheap change detector: size and mtime of the database and its WAL."""
+    fp: dict[str, int] = {}
+    for suffix in ("", "-wal"):
+        path = Path(f"{db_path}{suffix}")
+        if path.exists():
+            stat = path.stat()
+            fp[f"size{suffix}"] = stat.st_size
+            fp[f"mtime_ns{suffix}"] = stat.st_mtime_ns
+    return fp
+
+
+def db_content_hash(db_path: Path) -> str:
+    """SHA-256 over the database file and its WAL (if any)."""
+    digest = hashlib.sha256()
+    for suffix in ("", "-wal"):
+        path = Path(f"{db_path}{suffix}")
+        if not path.exists():
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(snapshot_dir: Path) -> dict[str, Any]:
+    path = snapshot_dir / _MANIFEST_NAME
+    if not path.exists():
+        return {"databases": {}}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning("Ignoring unreadable snapshot manifest at %s", path)
+        return {"databases": {}}
+
+
+def _write_manifest(snapshot_dir: Path, manifest: dict[str, Any]) -> None:
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=snapshot_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, snapshot_dir / _MANIFEST_NAME)
+
+
+def resolve_db_hash(store: MetadataStore, snapshot_dir: Path = SNAPSHOT_DIR) -> str:
+    """Return the content hash of the store's database, using the manifest cache."""
+    snapshot_dir = Path(snapshot_dir)
+    db_path = db_file_path(store)
+    fingerprint = _fingerprint(db_path)
+    manifest = _read_manifest(snapshot_dir)
+    entry = manifest["databases"].get(str(db_path))
+    if entry and entry.get("fingerprint") == fingerprint:
+        return entry["content_hash"]
+
+    content_hash = db_content_hash(db_path)
+    manifest["databases"][str(db_path)] = {
+        "fingerprint": fingerprint,
+        "content_hash": content_hash,
+    }
+    _write_manifest(snapshot_dir, manifest)
+    return content_hash
+
+
+def snapshot_filename(dataset_id: str, source_id: str | None, sanitize: bool) -> str:
+    source = source_id if source_id is not None else "_all"
+    variant = "clean" if sanitize else "raw"
+    return f"{dataset_id}__{source}__{variant}.parquet"
+
+
+def snapshot_path(
+    store: MetadataStore,
+    dataset_id: str,
+    source_id: str | None,
+    sanitize: bool,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+) -> Path:
+    """Path of the snapshot for the store's current database content."""
+    content_hash = resolve_db_hash(store, snapshot_dir)
+    return Path(snapshot_dir) / content_hash[:16] / snapshot_filename(dataset_id, source_id, sanitize)
+
+
+def _fetch_rows(store: MetadataStore, dataset_id: str, source_id: str | None):
+    """Token rows in the same order as ``get_lines_from_store``."""
+    session = store.Session()
+    try:
+        query = (
+            session.query(
+                TranscriptionTokenRecord.content,
+                TranscriptionTokenRecord.line_id,
+                TranscriptionLineRecord.line_index,
+                PageRecord.id,
+            )
+            .join(TranscriptionLineRecord, TranscriptionTokenRecord.line_id == TranscriptionLineRecord.id)
+            .join(PageRecord, TranscriptionLineRecord.page_id == PageRecord.id)
+            .filter(PageRecord.dataset_id == dataset_id)
+        )
+        if source_id:
+            query = query.filter(TranscriptionLineRecord.source_id == source_id)
+        return query.order_by(
+            PageRecord.id,
+            TranscriptionLineRecord.line_index,
+            TranscriptionTokenRecord.token_index,
+        ).all()
+    finally:
+        session.close()
+
+
+def _build_columns(rows, sanitize: bool) -> dict[str, list]:
+    columns: dict[str, list] = {
+        "token": [], "line": [], "line_index": [], "page": [], "section": [], "hand": [],
+    }
+    line_no = -1
+    last_line_id = None
+    line_has_tokens = False
+    for content, line_id, line_index, page_id in rows:
+        if line_id != last_line_id:
+            # Sanitized lines that end up empty are dropped, so only advance
+            # the line counter once a line contributes a token.
+            last_line_id = line_id
+            line_has_tokens = False
+        token = sanitize_token(content) if sanitize else content
+        if sanitize and not token:
+            continue
+        if not line_has_tokens:
+            line_no += 1
+            line_has_tokens = True
+        columns["token"].append(token)
+        columns["line"].append(line_no)
+        columns["line_index"].append(line_index)
+        columns["page"].append(page_id)
+        columns["section"].append(folio_section(page_id))
+        columns["hand"].append(folio_hand(page_id))
+    return columns
+
+
+def build_snapshot(
+    store: MetadataStore,
+    dataset_id: str,
+    source_id: str | None,
+    sanitize: bool,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+) -> Path:
+    """Materialize one ``(dataset_id, source_id, sanitize)`` combination."""
+    pa, pq = _require_pyarrow()
+    path = snapshot_path(store, dataset_id, source_id, sanitize, snapshot_dir)
+    columns = _build_columns(_fetch_rows(store, dataset_id, source_id), sanitize)
+
+    table = pa.table({
+        "token": pa.array(columns["token"], type=pa.string()),
+        "line": pa.array(columns["line"], type=pa.int32()),
+        "line_index": pa.array(columns["line_index"], type=pa.int32()),
+        "page": pa.array(columns["page"], type=pa.string()).dictionary_encode(),
+        "section": pa.array(columns["section"], type=pa.string()).dictionary_encode(),
+        "hand": pa.array(columns["hand"], type=pa.string()).dictionary_encode(),
+    })
+    table = table.replace_schema_metadata({
+        "format_version": str(SNAPSHOT_FORMAT_VERSION),
+        "dataset_id": dataset_id,
+        "source_id": source_id if source_id is not None else "",
+        "sanitize": "1" if sanitize else "0",
+        "db_content_hash": path.parent.name,
+    })
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".parquet.tmp")
+    pq.write_table(table, tmp)
+    os.replace(tmp, path)
+    logger.info("Wrote snapshot %s (%d tokens)", path, table.num_rows)
+    return path
+
+
+def list_combinations(store: MetadataStore) -> list[tuple[str, str]]:
+    """Distinct ``(dataset_id, source_id)`` pairs that have transcription lines."""
+    session = store.Session()
+    try:
+        rows = (
+            session.query(PageRecord.dataset_id, TranscriptionLineRecord.source_id)
+            .join(TranscriptionLineRecord, TranscriptionLineRecord.page_id == PageRecord.id)
+            .distinct()
+            .order_by(PageRecord.dataset_id, TranscriptionLineRecord.source_id)
+            .all()
+        )
+        return [(dataset_id, source_id) for dataset_id, source_id in rows]
+    finally:
+        session.close()
+
+
+def build_snapshots(
+    store: MetadataStore,
+    dataset_ids: list[str] | None = None,
+    source_ids: list[str | None] | None = None,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+) -> list[Path]:
+    """Build clean and raw snapshots for every matching dataset/source pair.
+
+    A ``None`` entry in ``source_ids`` adds the all-sources variant
+    (``load_canonical_lines(source_id=None)``) for each selected dataset.
+    """
+    available = list_combinations(store)
+    if dataset_ids:
+        available = [p for p in available if p[0] in dataset_ids]
+    pairs: list[tuple[str, str | None]] = list(available)
+    if source_ids is not None:
+        pairs = [p for p in available if p[1] in source_ids]
+        if None in source_ids:
+            pairs.extend((dataset_id, None) for dataset_id in sorted({p[0] for p in available}))
+
+    paths = []
+    for dataset_id, source_id in pairs:
+        for sanitize in (True, False):
+            paths.append(build_snapshot(store, dataset_id, source_id, sanitize, snapshot_dir))
+    return paths
+
+
+def read_snapshot_table(
+    store: MetadataStore,
+    dataset_id: str,
+    source_id: str | None,
+    sanitize: bool,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+    columns: list[str] | None = None,
+):
+    """Memory-map a snapshot as a ``pyarrow.Table``.
+
+    Raises:
+        SnapshotUnavailableError: If no snapshot matches the current database.
+    """
+    _pa, pq = _require_pyarrow()
+    path = snapshot_path(store, dataset_id, source_id, sanitize, snapshot_dir)
+    if not path.exists():
+        raise SnapshotUnavailableError(
+            f"No snapshot at {path} for the current database. "
+            "Run 'foundation snapshot build' to create it."
+        )
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+def load_snapshot_lines(
+    store: MetadataStore,
+    dataset_id: str,
+    source_id: str | None,
+    sanitize: bool,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+) -> list[list[str]]:
+    """Snapshot-backed equivalent of ``load_canonical_lines``."""
+    table = read_snapshot_table(
+        store, dataset_id, source_id, sanitize, snapshot_dir, columns=["token", "line"]
+    )
+    tokens = table.column("token").to_pylist()
+    if not tokens:
+        return []
+    line = table.column("line").to_numpy()
+    bounds = np.flatnonzero(np.diff(line)) + 1
+    starts = [0, *bounds.tolist()]
+    ends = [*bounds.tolist(), len(tokens)]
+    return [tokens[a:b] for a, b in zip(starts, ends, strict=True)]
@@ -2,6 +2,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Literal
 
+from phase1_foundation.config import get_query_backend
 from phase1_foundation.core.profiling import timing_profile
 from phase1_foundation.storage.metadata import MetadataStore
 
@@ -63,8 +64,17 @@ class MetricResult:
 
 
 class Metric(ABC):
-    def __init__(self, store: MetadataStore):
+    """
+    Base class for foundation metrics.
+
+    Args:
+        store: The metadata store to read from.
+        backend: Query backend ("sqlalchemy" or "duckdb"). Defaults to the
+            ``METADATA_QUERY_BACKEND`` environment variable.
+    """
+    def __init__(self, store: MetadataStore, backend: str | None = None):
         self.store = store
+        self.backend = get_query_backend(backend)
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -7,6 +7,7 @@ Real implementations that compute metrics from actual database records.
 import logging
 import math
 from collections import Counter
+from typing import Any
 
 from phase1_foundation.metrics.interface import Metric, MetricResult
 from phase1_foundation.storage.metadata import (
@@ -38,19 +39,18 @@ class RepetitionRate(Metric):
         Formula: repeated_tokens / total_tokens
         where repeated_tokens counts tokens that appear more than once.
         """
+        if self.backend == "duckdb":
+            result = self._calculate_duckdb(dataset_id)
+            if result is not None:
+                return result
+
         session = self.store.Session()
         try:
             # Get all pages for this dataset
             pages = session.query(PageRecord).filter_by(dataset_id=dataset_id).all()
 
             if not pages:
-                return [MetricResult(
-                    metric_name="RepetitionRate",
-                    dataset_id=dataset_id,
-                    scope="global",
-                    value=float("nan"),
-                    details={"error": "no_pages_found"}
-                )]
+                return self._error_result(dataset_id, "no_pages_found")
 
             page_ids = [p.id for p in pages]
 
@@ -68,45 +68,80 @@ class RepetitionRate(Metric):
                 tokens = self._get_tokens_via_alignments(session, page_ids)
 
             if not tokens:
-                return [MetricResult(
-                    metric_name="RepetitionRate",
-                    dataset_id=dataset_id,
-                    scope="global",
-                    value=float("nan"),
-                    details={"error": "no_tokens_found"}
-                )]
+                return self._error_result(dataset_id, "no_tokens_found")
 
             # Count token frequencies
             token_contents = [t[0] if hasattr(t, '__getitem__') and not isinstance(t, str) else t for t in tokens]
             token_counts = Counter(token_contents)
 
-            total_tokens = len(token_contents)
-            unique_tokens = len(token_counts)
-
             # Repetition rate: tokens that appear more than once / total occurrences
             repeated_occurrences = sum(count for count in token_counts.values() if count > 1)
-            token_repetition_rate = repeated_occurrences / total_tokens if total_tokens > 0 else 0.0
-
-            # Supplementary statistic: 1 - type/token ratio.
-            vocabulary_coverage = 1 - (unique_tokens / total_tokens) if total_tokens > 0 else 0.0
+            # Ties break by token so the top list does not depend on row order.
+            top_tokens = sorted(token_counts.items(), key=lambda kv: (-kv[1], kv[0]))[:5]
 
-            return [MetricResult(
-                metric_name="RepetitionRate",
-                dataset_id=dataset_id,
-                scope="global",
-                value=token_repetition_rate,
-                details={
-                    "total_tokens": total_tokens,
-                    "unique_tokens": unique_tokens,
-                    "token_repetition_rate": token_repetition_rate,
-                    "vocabulary_coverage": vocabulary_coverage,
-                    "top_5_tokens": dict(token_counts.most_common(5)),
-                }
-            )]
+            return self._result(
+                dataset_id, len(token_contents), len(token_counts), repeated_occurrences, top_tokens
+            )
 
         finally:
             session.close()
 
+    def _calculate_duckdb(self, dataset_id: str) -> list[MetricResult] | None:
+        """DuckDB path; returns None to defer to the ORM path's alignment fallback."""
+        from phase1_foundation.storage.analytics import DuckDBAnalytics
+
+        with DuckDBAnalytics(self.store) as analytics:
+            if not analytics.page_ids(dataset_id):
+                return self._error_result(dataset_id, "no_pages_found")
+            summary = analytics.token_summary(dataset_id)
+
+        if summary["total_tokens"] == 0:
+            return None
+        return self._result(
+            dataset_id,
+            summary["total_tokens"],
+            summary["unique_tokens"],
+            summary["repeated_occurrences"],
+            summary["top_tokens"],
+        )
+
+    @staticmethod
+    def _result(
+        dataset_id: str,
+        total_tokens: int,
+        unique_tokens: int,
+        repeated_occurrences: int,
+        top_tokens: list[tuple[str, int]],
+    ) -> list[MetricResult]:
+        token_repetition_rate = repeated_occurrences / total_tokens if total_tokens > 0 else 0.0
+
+        # Supplementary statistic: 1 - type/token ratio.
+        vocabulary_coverage = 1 - (unique_tokens / total_tokens) if total_tokens > 0 else 0.0
+
+        return [MetricResult(
+            metric_name="RepetitionRate",
+            dataset_id=dataset_id,
+            scope="global",
+            value=token_repetition_rate,
+            details={
+                "total_tokens": total_tokens,
+                "unique_tokens": unique_tokens,
+                "token_repetition_rate": token_repetition_rate,
+                "vocabulary_coverage": vocabulary_coverage,
+                "top_5_tokens": dict(top_tokens),
+            }
+        )]
+
+    @staticmethod
+    def _error_result(dataset_id: str, error: str) -> list[MetricResult]:
+        return [MetricResult(
+            metric_name="RepetitionRate",
+            dataset_id=dataset_id,
+            scope="global",
+            value=float("nan"),
+            details={"error": error}
+        )]
+
     def _get_tokens_via_alignments(self, session, page_ids: list[str]) -> list[str]:
         """Get token content via word alignments if direct transcription path fails."""
         tokens = (
@@ -141,30 +176,26 @@ class ClusterTightness(Metric):
 
         Formula: 1 / (1 + mean_distance_from_centroid)
         """
+        if self.backend == "duckdb":
+            return self._calculate_duckdb(dataset_id)
+
         session = self.store.Session()
         try:
-            import numpy as np
-
             # Get all pages for this dataset
             pages = session.query(PageRecord).filter_by(dataset_id=dataset_id).all()
 
             if not pages:
-                logger.warning("ClusterTightness: no pages found for dataset %s", dataset_id)
-                return [MetricResult(
-                    metric_name="ClusterTightness",
-                    dataset_id=dataset_id,
-                    scope="global",
-                    value=float("nan"),
-                    details={"status": "no_data", "error": "no_pages_found", "method": "none"}
-                )]
+                return self._no_pages_result(dataset_id)
 
             page_ids = [p.id for p in pages]
 
-            # Get all region embeddings for these pages
+            # Get all region embeddings for these pages, in a stable order
+            # so the centroid sum is reproducible.
             embeddings = (
                 session.query(RegionEmbeddingRecord)
                 .join(RegionRecord, RegionEmbeddingRecord.region_id == RegionRecord.id)
                 .filter(RegionRecord.page_id.in_(page_ids))
+                .order_by(RegionEmbeddingRecord.id)
                 .all()
             )
 
@@ -176,77 +207,119 @@ class ClusterTightness(Metric):
                 )
                 return self._compute_from_bboxes(session, page_ids, dataset_id)
 
-            # Convert binary vectors to numpy arrays
-            vectors = []
-            for emb in embeddings:
-                try:
-                    vec = np.frombuffer(emb.vector, dtype=np.float32)
-                    vectors.append(vec)
-                except Exception as e:
-                    logger.warning("Failed to decode embedding %s: %s", emb.id, e)
-                    continue
-
-            if len(vectors) < 2:
+            return self._tightness_from_vectors(
+                dataset_id, [(emb.id, emb.vector) for emb in embeddings]
+            )
+
+        except Exception:
+            # numpy not available or other error, use bbox fallback
+            logger.warning(
+                "Error in embedding-based ClusterTightness for %s; falling back to bboxes",
+                dataset_id,
+                exc_info=True,
+            )
+            return self._compute_from_bboxes(session, page_ids, dataset_id)
+        finally:
+            session.close()
+
+    def _calculate_duckdb(self, dataset_id: str) -> list[MetricResult]:
+        """DuckDB path: one joined query per input instead of per-page ORM loads."""
+        from phase1_foundation.storage.analytics import DuckDBAnalytics
+
+        with DuckDBAnalytics(self.store) as analytics:
+            if not analytics.page_ids(dataset_id):
+                return self._no_pages_result(dataset_id)
+            try:
+                embeddings = analytics.region_embedding_vectors(dataset_id)
+                if embeddings:
+                    return self._tightness_from_vectors(dataset_id, embeddings)
                 logger.warning(
-                    "ClusterTightness: insufficient embeddings (%d) for dataset %s",
-                    len(vectors),
+                    "ClusterTightness falling back to bbox computation for dataset %s",
                     dataset_id,
                 )
-                return [MetricResult(
-                    metric_name="ClusterTightness",
-                    dataset_id=dataset_id,
-                    scope="global",
-                    value=float("nan"),
-                    details={
-                        "status": "no_data",
-                        "error": "insufficient_embeddings",
-                        "count": len(vectors),
-                        "method": "embeddings",
-                    },
-                )]
-
-            # Stack into matrix
-            vectors = np.array(vectors)
-
-            if vectors.ndim != 2:
-                raise ValueError(f"Expected 2D embedding array, got {vectors.ndim}D")
-
-            # Compute centroid
-            centroid = np.mean(vectors, axis=0)
-
-            # Compute distances from centroid
-            distances = np.linalg.norm(vectors - centroid, axis=1)
-            mean_distance = float(np.mean(distances))
-
-            # Compute tightness: 1 / (1 + mean_distance)
-            tightness = 1.0 / (1.0 + mean_distance)
+            except Exception:
+                logger.warning(
+                    "Error in embedding-based ClusterTightness for %s; falling back to bboxes",
+                    dataset_id,
+                    exc_info=True,
+                )
+            return self._tightness_from_bboxes(dataset_id, analytics.region_bboxes(dataset_id, "mid"))
+
+    @staticmethod
+    def _no_pages_result(dataset_id: str) -> list[MetricResult]:
+        logger.warning("ClusterTightness: no pages found for dataset %s", dataset_id)
+        return [MetricResult(
+            metric_name="ClusterTightness",
+            dataset_id=dataset_id,
+            scope="global",
+            value=float("nan"),
+            details={"status": "no_data", "error": "no_pages_found", "method": "none"}
+        )]
 
+    def _tightness_from_vectors(self, dataset_id: str, embeddings: list[tuple[Any, bytes]]) -> list[MetricResult]:
+        """Embedding-space tightness from ``(embedding_id, vector blob)`` pairs."""
+        import numpy as np
+
+        # Convert binary vectors to numpy arrays
+        vectors = []
+        for emb_id, blob in embeddings:
+            try:
+                vec = np.frombuffer(blob, dtype=np.float32)
+                vectors.append(vec)
+            except Exception as e:
+                logger.warning("Failed to decode embedding %s: %s", emb_id, e)
+                continue
+
+        if len(vectors) < 2:
+            logger.warning(
+                "ClusterTightness: insufficient embeddings (%d) for dataset %s",
+                len(vectors),
+                dataset_id,
+            )
             return [MetricResult(
                 metric_name="ClusterTightness",
                 dataset_id=dataset_id,
                 scope="global",
-                value=tightness,
+                value=float("nan"),
                 details={
+                    "status": "no_data",
+                    "error": "insufficient_embeddings",
+                    "count": len(vectors),
                     "method": "embeddings",
-                    "computation_path": "embeddings",
-                    "embedding_count": len(vectors),
-                    "mean_distance": mean_distance,
-                    "std_distance": float(np.std(distances)),
-                    "min_distance": float(np.min(distances)),
-                    "max_distance": float(np.max(distances)),
-                }
+                },
             )]
 
-        except Exception:
-            # numpy not available or other error, use bbox fallback
-            logger.warning(
-                "Error in embedding-based ClusterTightness for %s; falling back to bboxes",
-                dataset_id,
-                exc_info=True,
-            )
-            return self._compute_from_bboxes(session, page_ids, dataset_id)
-        finally:
-            session.close()
+        # Stack into matrix
+        vectors = np.array(vectors)
+
+        if vectors.ndim != 2:
+            raise ValueError(f"Expected 2D embedding array, got {vectors.ndim}D")
+
+        # Compute centroid
+        centroid = np.mean(vectors, axis=0)
+
+        # Compute distances from centroid
+        distances = np.linalg.norm(vectors - centroid, axis=1)
+        mean_distance = float(np.mean(distances))
+
+        # Compute tightness: 1 / (1 + mean_distance)
+        tightness = 1.0 / (1.0 + mean_distance)
+
+        return [MetricResult(
+            metric_name="ClusterTightness",
+            dataset_id=dataset_id,
+            scope="global",
+            value=tightness,
+            details={
+                "method": "embeddings",
+                "computation_path": "embeddings",
+                "embedding_count": len(vectors),
+                "mean_distance": mean_distance,
+                "std_distance": float(np.std(distances)),
+                "min_distance": float(np.min(distances)),
+                "max_distance": float(np.max(distances)),
+            }
+        )]
 
     def _compute_from_bboxes(self, session, page_ids: list[str], dataset_id: str) -> list[MetricResult]:
         """
@@ -258,13 +331,17 @@ class ClusterTightness(Metric):
             session.query(RegionRecord)
             .filter(RegionRecord.page_id.in_(page_ids))
             .filter(RegionRecord.scale == "mid")  # Use mid-scale regions
+            .order_by(RegionRecord.id)
             .all()
         )
+        return self._tightness_from_bboxes(dataset_id, [r.bbox for r in regions])
 
-        if len(regions) < 2:
+    def _tightness_from_bboxes(self, dataset_id: str, bboxes: list[dict[str, Any] | None]) -> list[MetricResult]:
+        """Bbox-center tightness from the bboxes of a dataset's mid-scale regions."""
+        if len(bboxes) < 2:
             logger.warning(
                 "ClusterTightness bbox fallback: insufficient regions (%d) for dataset %s",
-                len(regions),
+                len(bboxes),
                 dataset_id,
             )
             return [MetricResult(
@@ -275,15 +352,14 @@ class ClusterTightness(Metric):
                 details={
                     "status": "no_data",
                     "error": "insufficient_regions",
-                    "count": len(regions),
+                    "count": len(bboxes),
                     "method": "bboxes",
                 },
             )]
 
         # Extract centroids from bboxes
         centroids = []
-        for r in regions:
-            bbox = r.bbox
+        for bbox in bboxes:
             if bbox:
                 cx = (bbox.get("x_min", 0) + bbox.get("x_max", 1)) / 2
                 cy = (bbox.get("y_min", 0) + bbox.get("y_max", 1)) / 2
@@ -324,7 +400,7 @@ class ClusterTightness(Metric):
             details={
                 "method": "bboxes",
                 "computation_path": "bboxes",
-                "region_count": len(regions),
+                "region_count": len(bboxes),
                 "mean_distance": mean_distance,
             }
         )]
@@ -1,6 +1,6 @@
 import logging
 
-from phase1_foundation.core.geometry import Box
+from phase1_foundation.core.geometry import Box, BoxArray, GridIndex
 from phase1_foundation.storage.metadata import MetadataStore, RegionRecord
 
 logger = logging.getLogger(__name__)
@@ -18,27 +18,31 @@ class GraphBuilder:
             # Fetch all regions for the page
             regions = session.query(RegionRecord).filter_by(page_id=page_id).all()
 
-            # Compare all pairs (O(N^2) - okay for Level 2B scale)
-            for i, r1 in enumerate(regions):
-                b1 = Box(**r1.bbox)
-                for j, r2 in enumerate(regions):
-                    if i == j:
-                        continue
+            boxes = BoxArray.from_boxes([Box(**r.bbox) for r in regions])
 
-                    b2 = Box(**r2.bbox)
+            # Containment and overlap both require the boxes to intersect, so
+            # only grid-neighbouring pairs are scored (sorted by (i, j), the
+            # order of the former all-pairs loop).
+            i_idx, j_idx = GridIndex(boxes).intersecting_pairs(boxes)
+            distinct = i_idx != j_idx
+            i_idx, j_idx = i_idx[distinct], j_idx[distinct]
+            contains = boxes.contains(i_idx, boxes, j_idx)
+            iou = boxes.iou(i_idx, boxes, j_idx)
 
-                    # Contains
-                    # Check if b1 contains b2
-                    # Simple check: b2 inside b1
-                    if (b2.x_min >= b1.x_min and b2.x_max <= b1.x_max and
-                        b2.y_min >= b1.y_min and b2.y_max <= b1.y_max):
-                        self.store.add_region_edge(r1.id, r2.id, "contains", 1.0)
-                        self.store.add_region_edge(r2.id, r1.id, "contained_by", 1.0)
+            with self.store.bulk_writer() as writer:
+                for i, j, pair_contains, pair_iou in zip(
+                    i_idx.tolist(), j_idx.tolist(), contains.tolist(), iou.tolist(), strict=True
+                ):
+                    r1, r2 = regions[i], regions[j]
+
+                    # Contains: b2 inside b1
+                    if pair_contains:
+                        writer.add_region_edge(r1.id, r2.id, "contains", 1.0)
+                        writer.add_region_edge(r2.id, r1.id, "contained_by", 1.0)
 
                     # Overlaps
-                    iou = b1.iou(b2)
-                    if iou > 0:
-                        self.store.add_region_edge(r1.id, r2.id, "overlaps", iou)
+                    if pair_iou > 0:
+                        writer.add_region_edge(r1.id, r2.id, "overlaps", pair_iou)
 
                     # Near (simple distance check between centers)
                     # Not implementing full distance logic here to save space,
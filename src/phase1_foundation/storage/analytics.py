@@ -0,0 +1,218 @@
+"""DuckDB analytical backend for MetadataStore aggregates.
+
+The SQLAlchemy path answers aggregate questions (token frequencies,
+per-page statistics, metric inputs) by streaming ORM rows into Python
+loops. ``DuckDBAnalytics`` attaches the store's SQLite file read-only and
+computes the same aggregates with one vectorized SQL query each. When a
+raw Parquet snapshot (see ``phase1_foundation.core.snapshot``) exists for
+the current database content, token queries read it instead.
+
+Every method orders its output deterministically (count descending, then
+key ascending) and returns the same values as the SQLAlchemy
+implementation it mirrors, so the backend can be switched by config via
+``METADATA_QUERY_BACKEND=duckdb``.
+
+Requires the optional ``duckdb`` extra.
+"""
+
+import glob
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from phase1_foundation.storage.metadata import MetadataStore
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_ALIAS = "meta"
+
+
+def _require_duckdb():
+    try:
+        import duckdb
+    except ImportError as exc:
+        raise ImportError(
+            "The DuckDB backend requires duckdb. Install the optional extra: pip install -e '.[duckdb]'"
+        ) from exc
+    return duckdb
+
+
+def _load_sqlite_extension(conn) -> None:
+    """Load DuckDB's sqlite extension, falling back to the PyPI-packaged build."""
+    try:
+        conn.execute("LOAD sqlite")
+        return
+    except Exception:
+        pass
+    try:
+        conn.execute("INSTALL sqlite")
+        conn.execute("LOAD sqlite")
+        return
+    except Exception as exc:
+        install_error = exc
+    try:
+        import duckdb_extension_sqlite_scanner as packaged
+    except ImportError:
+        raise install_error from None
+    pattern = os.path.join(os.path.dirname(packaged.__file__), "extensions", "*", "*.duckdb_extension")
+    for path in glob.glob(pattern):
+        conn.execute(f"LOAD '{path}'")
+        return
+    raise install_error
+
+
+class DuckDBAnalytics:
+    """
+    Read-only DuckDB view over a MetadataStore database.
+
+    Args:
+        store: A file-backed SQLite MetadataStore.
+        snapshot_dir: If given, token aggregates read the matching raw
+            Parquet snapshot from this directory when one is up to date.
+    """
+
+    def __init__(self, store: MetadataStore, snapshot_dir: Path | None = None):
+        from phase1_foundation.core.snapshot import db_file_path
+
+        duckdb = _require_duckdb()
+        self.store = store
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
+        self.db_path = db_file_path(store)
+        self.conn = duckdb.connect()
+        _load_sqlite_extension(self.conn)
+        self.conn.execute(
+            f"ATTACH '{self.db_path}' AS {_SQLITE_ALIAS} (TYPE sqlite, READ_ONLY)"
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "DuckDBAnalytics":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Token relation
+    # ------------------------------------------------------------------
+
+    def _snapshot_file(self, dataset_id: str, source_id: str | None) -> Path | None:
+        if self.snapshot_dir is None:
+            return None
+        from phase1_foundation.core.snapshot import snapshot_path
+
+        path = snapshot_path(self.store, dataset_id, source_id, False, self.snapshot_dir)
+        return path if path.exists() else None
+
+    def _tokens_sql(self, dataset_id: str, source_id: str | None) -> tuple[str, list[Any]]:
+        """SQL yielding ``(token, line_key, page_id)`` rows for a dataset."""
+        snapshot = self._snapshot_file(dataset_id, source_id)
+        if snapshot is not None:
+            return "SELECT token, line AS line_key, page AS page_id FROM read_parquet(?)", [str(snapshot)]
+
+        sql = f"""
+            SELECT t.content AS token, t.line_id AS line_key, l.page_id AS page_id
+            FROM {_SQLITE_ALIAS}.transcription_tokens t
+            JOIN {_SQLITE_ALIAS}.transcription_lines l ON t.line_id = l.id
+            JOIN {_SQLITE_ALIAS}.pages p ON l.page_id = p.id
+            WHERE p.dataset_id = ?
+        """
+        params: list[Any] = [dataset_id]
+        if source_id:
+            sql += " AND l.source_id = ?"
+            params.append(source_id)
+        return sql, params
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def page_ids(self, dataset_id: str) -> list[str]:
+        rows = self.conn.execute(
+            f"SELECT id FROM {_SQLITE_ALIAS}.pages WHERE dataset_id = ? ORDER BY id", [dataset_id]
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def token_frequencies(self, dataset_id: str, source_id: str | None = None) -> list[tuple[str, int]]:
+        """``(token, count)`` pairs, most frequent first, ties by token."""
+        sql, params = self._tokens_sql(dataset_id, source_id)
+        return [
+            (token, int(count))
+            for token, count in self.conn.execute(
+                f"SELECT token, COUNT(*) AS n FROM ({sql}) GROUP BY token ORDER BY n DESC, token",
+                params,
+            ).fetchall()
+        ]
+
+    def token_summary(self, dataset_id: str, source_id: str | None = None, top_k: int = 5) -> dict[str, Any]:
+        """Totals needed by RepetitionRate, computed in one pass."""
+        sql, params = self._tokens_sql(dataset_id, source_id)
+        total, unique, repeated = self.conn.execute(
+            f"""
+            WITH counts AS (SELECT token, COUNT(*) AS n FROM ({sql}) GROUP BY token)
+            SELECT COALESCE(SUM(n), 0), COUNT(*), COALESCE(SUM(n) FILTER (WHERE n > 1), 0)
+            FROM counts
+            """,
+            params,
+        ).fetchone()
+        top = self.conn.execute(
+            f"SELECT token, COUNT(*) AS n FROM ({sql}) GROUP BY token ORDER BY n DESC, token LIMIT ?",
+            [*params, top_k],
+        ).fetchall()
+        return {
+            "total_tokens": int(total),
+            "unique_tokens": int(unique),
+            "repeated_occurrences": int(repeated),
+            "top_tokens": [(token, int(n)) for token, n in top],
+        }
+
+    def page_statistics(self, dataset_id: str, source_id: str | None = None) -> list[dict[str, Any]]:
+        """Per-page line, token and distinct-token counts, ordered by page ID."""
+        sql, params = self._tokens_sql(dataset_id, source_id)
+        rows = self.conn.execute(
+            f"""
+            SELECT page_id, COUNT(DISTINCT line_key), COUNT(*), COUNT(DISTINCT token)
+            FROM ({sql})
+            GROUP BY page_id
+            ORDER BY page_id
+            """,
+            params,
+        ).fetchall()
+        return [
+            {"page_id": page_id, "lines": int(lines), "tokens": int(tokens), "unique_tokens": int(unique)}
+            for page_id, lines, tokens, unique in rows
+        ]
+
+    def region_embedding_vectors(self, dataset_id: str) -> list[tuple[int, bytes]]:
+        """``(embedding_id, vector blob)`` for every region embedding of a dataset."""
+        return [
+            (int(emb_id), bytes(vector))
+            for emb_id, vector in self.conn.execute(
+                f"""
+                SELECT e.id, e.vector
+                FROM {_SQLITE_ALIAS}.region_embeddings e
+                JOIN {_SQLITE_ALIAS}.regions r ON e.region_id = r.id
+                JOIN {_SQLITE_ALIAS}.pages p ON r.page_id = p.id
+                WHERE p.dataset_id = ?
+                ORDER BY e.id
+                """,
+                [dataset_id],
+            ).fetchall()
+        ]
+
+    def region_bboxes(self, dataset_id: str, scale: str) -> list[dict[str, Any] | None]:
+        """Decoded bboxes of a dataset's regions at ``scale``, ordered by region ID."""
+        rows = self.conn.execute(
+            f"""
+            SELECT r.bbox
+            FROM {_SQLITE_ALIAS}.regions r
+            JOIN {_SQLITE_ALIAS}.pages p ON r.page_id = p.id
+            WHERE p.dataset_id = ? AND r.scale = ?
+            ORDER BY r.id
+            """,
+            [dataset_id, scale],
+        ).fetchall()
+        return [json.loads(bbox) if bbox is not None else None for (bbox,) in rows]
@@ -0,0 +1,305 @@
+"""
+Batched writer for MetadataStore.
+
+The ``MetadataStore.add_*`` helpers open a session, merge one record and
+commit, which costs one transaction per row. ``BulkWriter`` buffers rows per
+table and flushes them with a single executemany per table, using an
+``INSERT ... ON CONFLICT DO UPDATE`` upsert for tables keyed by deterministic
+string IDs so reruns keep the same refresh semantics as ``session.merge``.
+
+Usage::
+
+    with store.bulk_writer(chunk_size=5000) as writer:
+        writer.add_transcription_line(line_id, "synthetic", page_id, 0, content)
+        for i, token in enumerate(tokens):
+            writer.add_transcription_token(token_ids[i], line_id, i, token)
+"""
+
+import logging
+from typing import Any
+
+from sqlalchemy import Table
+
+from phase1_foundation.config import BULK_WRITE_CHUNK_SIZE
+from phase1_foundation.storage.metadata import (
+    AnchorMethodRecord,
+    AnchorRecord,
+    Base,
+    ControlDatasetRecord,
+    DatasetRecord,
+    GlyphCandidateRecord,
+    LineRecord,
+    PageRecord,
+    RegionEdgeRecord,
+    RegionEmbeddingRecord,
+    RegionRecord,
+    TranscriptionLineRecord,
+    TranscriptionSourceRecord,
+    TranscriptionTokenRecord,
+    WordAlignmentRecord,
+    WordRecord,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _dialect_insert(dialect_name: str):
+    """Return the dialect-specific ``insert`` construct supporting upserts, if any."""
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    return None
+
+
+class BulkWriter:
+    """
+    Buffers typed rows per table and flushes them in chunks.
+
+    Each flush writes every buffered table in foreign-key dependency order
+    inside one transaction. Tables with string primary keys are upserted
+    (last write wins, like ``session.merge``); tables with autoincrement keys
+    are appended. Rows still buffered when the ``with`` block raises are
+    discarded; chunks already flushed stay committed.
+    """
+
+    def __init__(self, store, chunk_size: int | None = None):
+        self.store = store
+        self.chunk_size = int(chunk_size or BULK_WRITE_CHUNK_SIZE)
+        if self.chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {self.chunk_size}")
+        # Upsert tables buffer rows keyed by primary key so repeated IDs collapse
+        # to the last write within a chunk; append tables buffer plain lists.
+        self._upserts: dict[str, dict[Any, dict[str, Any]]] = {}
+        self._appends: dict[str, list[dict[str, Any]]] = {}
+        self._pending = 0
+        self.rows_written = 0
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows not yet written."""
+        return self._pending
+
+    def discard(self) -> None:
+        """Drop all buffered rows without writing them."""
+        self._upserts.clear()
+        self._appends.clear()
+        self._pending = 0
+
+    def _buffer_upsert(self, model, row: dict[str, Any]) -> None:
+        table = model.__table__
+        key = tuple(row[col.name] for col in table.primary_key.columns)
+        bucket = self._upserts.setdefault(table.name, {})
+        if key not in bucket:
+            self._pending += 1
+        bucket[key] = row
+        self._maybe_flush()
+
+    def _buffer_append(self, model, row: dict[str, Any]) -> None:
+        self._appends.setdefault(model.__table__.name, []).append(row)
+        self._pending += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self._pending >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered rows in one transaction. Returns rows written."""
+        if not self._pending:
+            return 0
+
+        insert = _dialect_insert(self.store.engine.dialect.name)
+        written = 0
+        if insert is None:
+            written = self._flush_with_merge()
+        else:
+            with self.store.engine.begin() as conn:
+                for table in Base.metadata.sorted_tables:
+                    upserts = self._upserts.get(table.name)
+                    if upserts:
+                        conn.execute(self._upsert_statement(insert, table, upserts), list(upserts.values()))
+                        written += len(upserts)
+                    appends = self._appends.get(table.name)
+                    if appends:
+                        conn.execute(table.insert(), appends)
+                        written += len(appends)
+
+        if RegionEmbeddingRecord.__tablename__ in self._appends:
+            self.store.embedding_generation += 1
+        logger.debug("BulkWriter flushed %d rows", written)
+        self.rows_written += written
+        self.discard()
+        return written
+
+    @staticmethod
+    def _upsert_statement(insert, table: Table, rows: dict[Any, dict[str, Any]]):
+        pk_names = [col.name for col in table.primary_key.columns]
+        sample = next(iter(rows.values()))
+        stmt = insert(table)
+        update_cols = {name: stmt.excluded[name] for name in sample if name not in pk_names}
+        if not update_cols:
+            return stmt.on_conflict_do_nothing(index_elements=pk_names)
+        return stmt.on_conflict_do_update(index_elements=pk_names, set_=update_cols)
+
+    def _flush_with_merge(self) -> int:
+        """Fallback for dialects without ON CONFLICT: one session, one commit."""
+        models = {mapper.local_table.name: mapper.class_ for mapper in Base.registry.mappers}
+        written = 0
+        with self.store.session_scope() as session:
+            for table in Base.metadata.sorted_tables:
+                model = models.get(table.name)
+                for row in (self._upserts.get(table.name) or {}).values():
+                    session.merge(model(**row))
+                    written += 1
+                for row in self._appends.get(table.name) or []:
+                    session.add(model(**row))
+                    written += 1
+        return written
+
+    # --- Level 1 ---
+
+    def add_dataset(self, dataset_id: str, path: str, checksum: str = None):
+        self._buffer_upsert(DatasetRecord, {"id": dataset_id, "path": str(path), "checksum": checksum})
+
+    def add_page(self, page_id: str, dataset_id: str, image_path: str, checksum: str, width: int = None, height: int = None):
+        self._buffer_upsert(PageRecord, {
+            "id": page_id,
+            "dataset_id": dataset_id,
+            "image_path": str(image_path),
+            "checksum": checksum,
+            "width": width,
+            "height": height,
+        })
+
+    # --- Level 2A ---
+
+    def add_line(self, id: str, page_id: str, line_index: int, bbox: dict, confidence: float = None):
+        self._buffer_upsert(LineRecord, {
+            "id": id,
+            "page_id": page_id,
+            "line_index": line_index,
+            "bbox": bbox,
+            "confidence": confidence,
+        })
+
+    def add_word(self, id: str, line_id: str, word_index: int, bbox: dict, features: dict = None, confidence: float = None):
+        self._buffer_upsert(WordRecord, {
+            "id": id,
+            "line_id": line_id,
+            "word_index": word_index,
+            "bbox": bbox,
+            "features": features,
+            "confidence": confidence,
+        })
+
+    def add_glyph_candidate(self, id: str, word_id: str, glyph_index: int, bbox: dict, confidence: float = None):
+        self._buffer_upsert(GlyphCandidateRecord, {
+            "id": id,
+            "word_id": word_id,
+            "glyph_index": glyph_index,
+            "bbox": bbox,
+            "confidence": confidence,
+        })
+
+    def add_transcription_source(self, id: str, name: str, citation: str = None):
+        self._buffer_upsert(TranscriptionSourceRecord, {"id": id, "name": name, "citation": citation})
+
+    def add_transcription_line(self, id: str, source_id: str, page_id: str, line_index: int, content: str):
+        self._buffer_upsert(TranscriptionLineRecord, {
+            "id": id,
+            "source_id": source_id,
+            "page_id": page_id,
+            "line_index": line_index,
+            "content": content,
+        })
+
+    def add_transcription_token(self, id: str, line_id: str, token_index: int, content: str):
+        self._buffer_upsert(TranscriptionTokenRecord, {
+            "id": id,
+            "line_id": line_id,
+            "token_index": token_index,
+            "content": content,
+        })
+
+    def add_word_alignment(self, word_id: str, token_id: str, type: str, score: float = None):
+        self._buffer_append(WordAlignmentRecord, {
+            "word_id": word_id,
+            "token_id": token_id,
+            "type": type,
+            "score": score,
+        })
+
+    # --- Level 2B ---
+
+    def add_region(self, id: str, page_id: str, scale: str, method: str, bbox: dict, features: dict = None, confidence: float = None):
+        self._buffer_upsert(RegionRecord, {
+            "id": id,
+            "page_id": page_id,
+            "scale": scale,
+            "method": method,
+            "bbox": bbox,
+            "features": features,
+            "confidence": confidence,
+        })
+
+    def add_region_edge(self, source_id: str, target_id: str, type: str, weight: float = None):
+        self._buffer_append(RegionEdgeRecord, {
+            "source_region_id": source_id,
+            "target_region_id": target_id,
+            "type": type,
+            "weight": weight,
+        })
+
+    def add_region_embedding(self, region_id: str, model_name: str, vector: bytes):
+        self._buffer_append(RegionEmbeddingRecord, {
+            "region_id": region_id,
+            "model_name": model_name,
+            "vector": vector,
+        })
+
+    # --- Level 3 ---
+
+    def add_control_dataset(self, id: str, source_dataset_id: str, type: str, params: dict, seed: int):
+        self._buffer_upsert(ControlDatasetRecord, {
+            "id": id,
+            "source_dataset_id": source_dataset_id,
+            "type": type,
+            "params": params,
+            "seed": seed,
+        })
+
+    # --- Level 4 ---
+
+    def add_anchor_method(self, id: str, name: str, description: str = None, parameters: dict = None):
+        self._buffer_upsert(AnchorMethodRecord, {
+            "id": id,
+            "name": name,
+            "description": description,
+            "parameters": parameters,
+        })
+
+    def add_anchor(self, id: str, run_id: str, page_id: str, source_type: str, source_id: str, target_type: str, target_id: str, relation_type: str, method_id: str, score: float = None):
+        self._buffer_upsert(AnchorRecord, {
+            "id": id,
+            "run_id": run_id,
+            "page_id": page_id,
+            "source_type": source_type,
+            "source_id": source_id,
+            "target_type": target_type,
+            "target_id": target_id,
+            "relation_type": relation_type,
+            "score": score,
+            "method_id": method_id,
+        })
@@ -9,14 +9,20 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
     String,
     Text,
     create_engine,
+    event,
 )
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
+from phase1_foundation.config import get_sqlite_profile
+from phase1_foundation.storage.schema import ensure_schema
+
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
@@ -56,6 +62,9 @@ class PageRecord(Base):
     refers to the manuscript leaf designation carried in ``id``.
     """
     __tablename__ = 'pages'
+    __table_args__ = (
+        Index("ix_pages_dataset_id", "dataset_id"),
+    )
 
     id = Column(String, primary_key=True) # PageID string (e.g. "f1r")
     dataset_id = Column(String, ForeignKey('datasets.id'), nullable=False)
@@ -111,6 +120,9 @@ class ObjectRecord(Base):
 
 class LineRecord(Base):
     __tablename__ = 'lines'
+    __table_args__ = (
+        Index("ix_lines_page_id_line_index", "page_id", "line_index"),
+    )
     id = Column(String, primary_key=True) # UUID
     page_id = Column(String, ForeignKey('pages.id'), nullable=False)
     line_index = Column(Integer, nullable=False)
@@ -123,6 +135,9 @@ class LineRecord(Base):
 
 class WordRecord(Base):
     __tablename__ = 'words'
+    __table_args__ = (
+        Index("ix_words_line_id_word_index", "line_id", "word_index"),
+    )
     id = Column(String, primary_key=True) # UUID
     line_id = Column(String, ForeignKey('lines.id'), nullable=False)
     word_index = Column(Integer, nullable=False)
@@ -141,6 +156,9 @@ class GlyphCandidateRecord(Base):
     Represents a candidate glyph before final identification.
     """
     __tablename__ = 'glyph_candidates'
+    __table_args__ = (
+        Index("ix_glyph_candidates_word_id_glyph_index", "word_id", "glyph_index"),
+    )
     id = Column(String, primary_key=True) # UUID
     word_id = Column(String, ForeignKey('words.id'), nullable=False)
     glyph_index = Column(Integer, nullable=False)
@@ -168,6 +186,10 @@ class TranscriptionLineRecord(Base):
     line_index: 0-based relative order of the line on the page (usually top-to-bottom).
     """
     __tablename__ = 'transcription_lines'
+    __table_args__ = (
+        Index("ix_transcription_lines_page_id_line_index", "page_id", "line_index"),
+        Index("ix_transcription_lines_source_id_page_id", "source_id", "page_id"),
+    )
     id = Column(String, primary_key=True) # UUID
     source_id = Column(String, ForeignKey('transcription_sources.id'), nullable=False)
     page_id = Column(String, ForeignKey('pages.id'), nullable=False)
@@ -185,6 +207,9 @@ class TranscriptionTokenRecord(Base):
     token_index: 0-based relative order of the token within the line (usually left-to-right).
     """
     __tablename__ = 'transcription_tokens'
+    __table_args__ = (
+        Index("ix_transcription_tokens_line_id_token_index", "line_id", "token_index"),
+    )
     id = Column(String, primary_key=True) # UUID
     line_id = Column(String, ForeignKey('transcription_lines.id'), nullable=False)
     token_index = Column(Integer, nullable=False)
@@ -198,6 +223,10 @@ class TranscriptionTokenRecord(Base):
 
 class WordAlignmentRecord(Base):
     __tablename__ = 'word_alignments'
+    __table_args__ = (
+        Index("ix_word_alignments_word_id", "word_id"),
+        Index("ix_word_alignments_token_id", "token_id"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     word_id = Column(String, ForeignKey('words.id'), nullable=True) # Nullable for transcript-only
     token_id = Column(String, ForeignKey('transcription_tokens.id'), nullable=True) # Nullable for image-only
@@ -225,6 +254,9 @@ class GlyphAlignmentRecord(Base):
 
 class RegionRecord(Base):
     __tablename__ = 'regions'
+    __table_args__ = (
+        Index("ix_regions_page_id", "page_id"),
+    )
     id = Column(String, primary_key=True) # UUID
     page_id = Column(String, ForeignKey('pages.id'), nullable=False)
     scale = Column(String, nullable=False) # primitive, mid, large
@@ -251,6 +283,9 @@ class RegionEdgeRecord(Base):
 
 class RegionEmbeddingRecord(Base):
     __tablename__ = 'region_embeddings'
+    __table_args__ = (
+        Index("ix_region_embeddings_region_id_model_name", "region_id", "model_name"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     region_id = Column(String, ForeignKey('regions.id'), nullable=False)
     model_name = Column(String, nullable=False)
@@ -306,6 +341,11 @@ class AnchorMethodRecord(Base):
 
 class AnchorRecord(Base):
     __tablename__ = 'anchors'
+    __table_args__ = (
+        Index("ix_anchors_page_id", "page_id"),
+        Index("ix_anchors_source_id", "source_id"),
+        Index("ix_anchors_target_id", "target_id"),
+    )
     id = Column(String, primary_key=True) # UUID
     run_id = Column(String, ForeignKey('runs.id'), nullable=False)
     page_id = Column(String, ForeignKey('pages.id'), nullable=False)
@@ -484,11 +524,58 @@ class AdmissibilityEvidenceRecord(Base):
     constraint = relationship("AdmissibilityConstraintRecord", back_populates="evidence")
 
 
+def _read_only_sqlite_url(db_url: str) -> str:
+    """Rewrite ``sqlite:///path`` as a read-only SQLite URI connection string."""
+    url = make_url(db_url)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        raise ValueError(f"Read-only mode requires a file-backed SQLite URL, got {db_url!r}")
+    return f"sqlite:///file:{url.database}?mode=ro&uri=true"
+
+
+def _install_sqlite_pragmas(engine, pragmas: dict, read_only: bool) -> None:
+    """Apply PRAGMA settings on every new DBAPI connection of ``engine``."""
+    if read_only:
+        # journal_mode/synchronous are writer settings; query_only guards the URI mode.
+        pragmas = {k: v for k, v in pragmas.items() if k not in ("journal_mode", "synchronous")}
+        pragmas["query_only"] = "ON"
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
 class MetadataStore:
-    def __init__(self, db_url: str):
+    """
+    SQLAlchemy-backed ledger for every research level.
+
+    Args:
+        db_url: SQLAlchemy database URL, e.g. ``sqlite:///data/voynich.db``.
+        profile: SQLite PRAGMA profile name from ``config.SQLITE_PROFILES``.
+            Defaults to the ``METADATA_DB_PROFILE`` environment variable.
+        read_only: Open a file-backed SQLite database through a read-only URI
+            and skip schema creation, so analysis processes can read while a
+            single writer populates the database (use with a WAL profile).
+    """
+    def __init__(self, db_url: str, profile: str | None = None, read_only: bool = False):
+        self.read_only = read_only
+        if read_only:
+            db_url = _read_only_sqlite_url(db_url)
         self.engine = create_engine(db_url)
-        Base.metadata.create_all(self.engine)
+        if self.engine.dialect.name == "sqlite":
+            _install_sqlite_pragmas(self.engine, get_sqlite_profile(profile), read_only)
+        if not read_only:
+            ensure_schema(self.engine, Base.metadata)
         self.Session = sessionmaker(bind=self.engine)
+        # Bumped on every region embedding write so cached embedding
+        # indexes (see core/embedding_index.py) know to rebuild.
+        self.embedding_generation = 0
 
     @contextmanager
     def session_scope(self):
@@ -509,6 +596,17 @@ class MetadataStore:
         finally:
             session.close()
 
+    def bulk_writer(self, chunk_size: int | None = None):
+        """Return a batched writer that buffers rows and flushes them in chunks.
+
+        Usage::
+
+            with store.bulk_writer() as writer:
+                writer.add_transcription_token(token_id, line_id, 0, "daiin")
+        """
+        from phase1_foundation.storage.bulk import BulkWriter
+        return BulkWriter(self, chunk_size=chunk_size)
+
     def _persist_run_record(self, run_context) -> None:
         session = self.Session()
         try:
@@ -745,6 +843,7 @@ class MetadataStore:
             )
             session.add(record)
             session.commit()
+            self.embedding_generation += 1
         finally:
             session.close()
 
@@ -0,0 +1,61 @@
+"""Add secondary indexes on hot foreign-key columns.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+
+Indexes are created only for tables that already exist and skipped when an
+index of the same name is present, so the revision is safe to apply to any
+``data/voynich.db`` produced by earlier ``create_all`` runs.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES: list[tuple[str, str, list[str]]] = [
+    ("ix_pages_dataset_id", "pages", ["dataset_id"]),
+    ("ix_lines_page_id_line_index", "lines", ["page_id", "line_index"]),
+    ("ix_words_line_id_word_index", "words", ["line_id", "word_index"]),
+    ("ix_glyph_candidates_word_id_glyph_index", "glyph_candidates", ["word_id", "glyph_index"]),
+    ("ix_transcription_lines_page_id_line_index", "transcription_lines", ["page_id", "line_index"]),
+    ("ix_transcription_lines_source_id_page_id", "transcription_lines", ["source_id", "page_id"]),
+    ("ix_transcription_tokens_line_id_token_index", "transcription_tokens", ["line_id", "token_index"]),
+    ("ix_word_alignments_word_id", "word_alignments", ["word_id"]),
+    ("ix_word_alignments_token_id", "word_alignments", ["token_id"]),
+    ("ix_regions_page_id", "regions", ["page_id"]),
+    ("ix_region_embeddings_region_id_model_name", "region_embeddings", ["region_id", "model_name"]),
+    ("ix_anchors_page_id", "anchors", ["page_id"]),
+    ("ix_anchors_source_id", "anchors", ["source_id"]),
+    ("ix_anchors_target_id", "anchors", ["target_id"]),
+]
+
+
+def _existing_indexes() -> dict[str, set[str]]:
+    inspector = sa.inspect(op.get_bind())
+    return {
+        table: {ix["name"] for ix in inspector.get_indexes(table)}
+        for table in inspector.get_table_names()
+    }
+
+
+def upgrade() -> None:
+    """Create missing indexes on existing tables."""
+    existing = _existing_indexes()
+    for name, table, columns in INDEXES:
+        if table in existing and name not in existing[table]:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop the indexes created by this revision."""
+    existing = _existing_indexes()
+    for name, table, _columns in reversed(INDEXES):
+        if name in existing.get(table, set()):
+            op.drop_index(name, table_name=table)
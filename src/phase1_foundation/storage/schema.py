@@ -0,0 +1,91 @@
+"""
+Schema migration helpers for MetadataStore databases.
+
+Wraps the Alembic environment in ``storage/migrations`` so existing
+databases can be upgraded in place without an ``alembic.ini`` on disk::
+
+    from phase1_foundation.storage.schema import upgrade_schema
+    upgrade_schema("sqlite:///data/voynich.db")
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+
+def alembic_config(db_url: str) -> Config:
+    """Build an in-memory Alembic config pointing at the bundled migrations."""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.set_main_option("sqlalchemy.url", db_url)
+    return config
+
+
+@lru_cache(maxsize=1)
+def _script_directory() -> ScriptDirectory:
+    return ScriptDirectory(str(MIGRATIONS_DIR))
+
+
+def head_revision() -> str:
+    """Return the newest revision shipped with the code."""
+    return _script_directory().get_current_head()
+
+
+def current_revision(db_url: str) -> str | None:
+    """Return the revision recorded in the database, or None if unversioned."""
+    engine = create_engine(db_url)
+    try:
+        with engine.connect() as conn:
+            return MigrationContext.configure(conn).get_current_revision()
+    finally:
+        engine.dispose()
+
+
+def upgrade_schema(db_url: str, revision: str = "head") -> str | None:
+    """Apply migrations up to ``revision`` and return the resulting revision."""
+    before = current_revision(db_url)
+    command.upgrade(alembic_config(db_url), revision)
+    after = current_revision(db_url)
+    logger.info("Schema upgraded %s -> %s for %s", before, after, db_url)
+    return after
+
+
+def downgrade_schema(db_url: str, revision: str) -> str | None:
+    """Revert migrations down to ``revision`` and return the resulting revision."""
+    command.downgrade(alembic_config(db_url), revision)
+    return current_revision(db_url)
+
+
+def ensure_schema(engine: Engine, metadata) -> bool:
+    """Create missing tables unless the database is already at head.
+
+    ``create_all`` issues a table probe per model on every call. When the
+    database records the head revision and already holds every table in
+    ``metadata``, that work is skipped. Fresh databases are stamped at head
+    after creation since ``create_all`` builds the full indexed schema.
+
+    Returns True if ``create_all`` ran.
+    """
+    head = head_revision()
+    with engine.connect() as conn:
+        revision = MigrationContext.configure(conn).get_current_revision()
+        existing = set(inspect(conn).get_table_names())
+    if revision == head and set(metadata.tables).issubset(existing):
+        return False
+
+    metadata.create_all(engine)
+    if not existing:
+        with engine.begin() as conn:
+            MigrationContext.configure(conn).stamp(_script_directory(), head)
+    return True
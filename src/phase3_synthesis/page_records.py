@@ -0,0 +1,33 @@
+"""
+Bulk loading of page records for Phase 3 metrics.
+
+The profile extractor and the refinement feature computer both fetch every
+record of a batch of pages with one grouped query per record type, instead
+of one query per page. They share the steps below: resolving which of the
+requested pages exist and ordering rows the way the per-page queries they
+replaced returned them.
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy import literal_column
+
+from phase1_foundation.storage.metadata import PageRecord
+
+PageDataT = TypeVar("PageDataT")
+
+
+def rowid_order(model):
+    """Order by insertion, which the former per-page queries returned implicitly."""
+    return literal_column(f"{model.__tablename__}.rowid")
+
+
+def new_page_data(
+    session,
+    page_ids: list[str],
+    factory: Callable[[str], PageDataT],
+) -> dict[str, PageDataT]:
+    """Empty ``factory(page_id)`` containers for the requested pages present in the store."""
+    found = session.query(PageRecord.id).filter(PageRecord.id.in_(page_ids)).all()
+    return {page_id: factory(page_id) for (page_id,) in found}
@@ -9,9 +9,12 @@ import logging
 import math
 import os
 import random
-from collections import Counter
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from typing import Any
 
+from sqlalchemy import func
+
 from phase3_synthesis.interface import (
     GapDefinition,
     GapStrength,
@@ -19,11 +22,13 @@ from phase3_synthesis.interface import (
     PageProfile,
     SectionProfile,
 )
+from phase3_synthesis.page_records import new_page_data, rowid_order
 
 logger = logging.getLogger(__name__)
 
 from phase1_foundation.storage.metadata import (
     AnchorRecord,
+    GlyphAlignmentRecord,
     GlyphCandidateRecord,
     LineRecord,
     MetadataStore,
@@ -50,6 +55,23 @@ class NeutralTokenGenerator:
     def generate_tokens(self, count: int) -> list[str]:
         return [self.generate_token() for _ in range(count)]
 
+@dataclass
+class _PageData:
+    """Database records behind one page profile, loaded in bulk."""
+    page_id: str
+    jar_regions: list[tuple[str, dict | None]] = field(default_factory=list)
+    text_block_count: int = 0
+    line_count: int = 0
+    word_count: int = 0
+    # (word_id, glyph symbols in glyph order) for words with at least one glyph
+    word_glyphs: list[tuple[str, list[str]]] = field(default_factory=list)
+    anchor_count: int = 0
+    word_anchors_per_region: defaultdict = field(default_factory=lambda: defaultdict(int))
+    anchor_bbox_pairs: list[tuple[dict, dict]] = field(default_factory=list)
+    has_transcription: bool = False
+    tokens: list[str] = field(default_factory=list)
+
+
 class PharmaceuticalProfileExtractor:
     """
     Extracts structural profiles from the pharmaceutical (jar) section.
@@ -119,150 +141,218 @@ class PharmaceuticalProfileExtractor:
 
     def extract_page_profile(self, page_id: str) -> PageProfile:
         """Extract structural profile for a single page."""
-        if self.store is None:
-            return self._extract_simulated_profile(page_id)
+        return self.extract_page_profiles([page_id])[0]
+
+    def extract_page_profiles(self, page_ids: list[str]) -> list[PageProfile]:
+        """
+        Extract profiles for several pages in one pass.
 
-        return self._extract_real_profile(page_id)
+        All records for the pages are fetched with a handful of grouped
+        queries (see ``_load_page_data``) and the metrics are computed in
+        memory. Pages missing from the store get simulated profiles, in
+        order, exactly as ``extract_page_profile`` would produce them.
+        """
+        if self.store is None:
+            return [self._extract_simulated_profile(page_id) for page_id in page_ids]
 
-    def _extract_real_profile(self, page_id: str) -> PageProfile:
-        """Extract profile from actual database records."""
         session = self.store.Session()
         try:
-            # Find the page
-            page = session.query(PageRecord).filter_by(id=page_id).first()
-            if not page:
-                # Fall back to simulated if page not found
-                return self._extract_simulated_profile(page_id)
+            data = self._load_page_data(session, page_ids)
+        finally:
+            session.close()
 
-            # Count jars (mid-scale regions, typically visual elements)
-            jar_regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=page.id, scale="mid")
-                .all()
+        return [
+            self._build_real_profile(data[page_id]) if page_id in data
+            else self._extract_simulated_profile(page_id)
+            for page_id in page_ids
+        ]
+
+    def _load_page_data(self, session, page_ids: list[str]) -> dict[str, "_PageData"]:
+        """Fetch everything the page metrics need with one query per record type."""
+        data = new_page_data(session, page_ids, _PageData)
+        if not data:
+            return data
+        found = list(data)
+
+        # Regions by scale: mid = jars, coarse = text blocks
+        regions = (
+            session.query(RegionRecord.id, RegionRecord.page_id, RegionRecord.scale, RegionRecord.bbox)
+            .filter(RegionRecord.page_id.in_(found), RegionRecord.scale.in_(("mid", "coarse")))
+            .order_by(rowid_order(RegionRecord))
+            .all()
+        )
+        for region_id, page_id, scale, bbox in regions:
+            if scale == "mid":
+                data[page_id].jar_regions.append((region_id, bbox))
+            else:
+                data[page_id].text_block_count += 1
+
+        for page_id, count in (
+            session.query(LineRecord.page_id, func.count(LineRecord.id))
+            .filter(LineRecord.page_id.in_(found))
+            .group_by(LineRecord.page_id)
+            .all()
+        ):
+            data[page_id].line_count = count
+
+        for page_id, count in (
+            session.query(LineRecord.page_id, func.count(WordRecord.id))
+            .join(WordRecord, WordRecord.line_id == LineRecord.id)
+            .filter(LineRecord.page_id.in_(found))
+            .group_by(LineRecord.page_id)
+            .all()
+        ):
+            data[page_id].word_count = count
+
+        # Glyphs with their first alignment symbol, grouped per word in glyph order
+        glyphs = (
+            session.query(
+                LineRecord.page_id,
+                GlyphCandidateRecord.word_id,
+                GlyphCandidateRecord.id,
+                GlyphAlignmentRecord.symbol,
+            )
+            .join(WordRecord, WordRecord.line_id == LineRecord.id)
+            .join(GlyphCandidateRecord, GlyphCandidateRecord.word_id == WordRecord.id)
+            .outerjoin(GlyphAlignmentRecord, GlyphAlignmentRecord.glyph_id == GlyphCandidateRecord.id)
+            .filter(LineRecord.page_id.in_(found))
+            .order_by(
+                LineRecord.page_id,
+                GlyphCandidateRecord.word_id,
+                GlyphCandidateRecord.glyph_index,
+                GlyphCandidateRecord.id,
+                GlyphAlignmentRecord.id,
+            )
+            .all()
+        )
+        last_glyph = None
+        for page_id, word_id, glyph_id, symbol in glyphs:
+            if glyph_id == last_glyph:
+                continue  # keep only the first alignment of each glyph
+            last_glyph = glyph_id
+            word_glyphs = data[page_id].word_glyphs
+            if not word_glyphs or word_glyphs[-1][0] != word_id:
+                word_glyphs.append((word_id, []))
+            word_glyphs[-1][1].append(symbol if symbol is not None else f"g_{glyph_id}")
+
+        # Anchors with the bboxes of their source word and target region
+        anchors = (
+            session.query(
+                AnchorRecord.page_id,
+                AnchorRecord.target_id,
+                AnchorRecord.source_type,
+                WordRecord.bbox,
+                RegionRecord.bbox,
             )
-            jar_count = len(jar_regions)
+            .outerjoin(WordRecord, WordRecord.id == AnchorRecord.source_id)
+            .outerjoin(RegionRecord, RegionRecord.id == AnchorRecord.target_id)
+            .filter(AnchorRecord.page_id.in_(found))
+            .order_by(rowid_order(AnchorRecord))
+            .all()
+        )
+        for page_id, target_id, source_type, word_bbox, region_bbox in anchors:
+            page = data[page_id]
+            page.anchor_count += 1
+            if source_type == "word":
+                page.word_anchors_per_region[target_id] += 1
+            if word_bbox and region_bbox:
+                page.anchor_bbox_pairs.append((word_bbox, region_bbox))
+
+        tokens = (
+            session.query(TranscriptionLineRecord.page_id, TranscriptionTokenRecord.content)
+            .join(TranscriptionTokenRecord, TranscriptionTokenRecord.line_id == TranscriptionLineRecord.id)
+            .filter(TranscriptionLineRecord.page_id.in_(found))
+            .order_by(
+                TranscriptionLineRecord.page_id,
+                TranscriptionLineRecord.line_index,
+                TranscriptionLineRecord.id,
+                TranscriptionTokenRecord.token_index,
+            )
+            .all()
+        )
+        for page_id, content in tokens:
+            data[page_id].tokens.append(content)
+        for (page_id,) in (
+            session.query(TranscriptionLineRecord.page_id)
+            .filter(TranscriptionLineRecord.page_id.in_(found))
+            .distinct()
+            .all()
+        ):
+            data[page_id].has_transcription = True
 
-            # Count lines
-            lines = session.query(LineRecord).filter_by(page_id=page.id).all()
-            total_lines = len(lines)
+        return data
 
-            # Count words
-            total_words = 0
-            for line in lines:
-                word_count = (
-                    session.query(WordRecord)
-                    .filter_by(line_id=line.id)
-                    .count()
-                )
-                total_words += word_count
+    def _build_real_profile(self, page: "_PageData") -> PageProfile:
+        """Build a page profile from preloaded database records."""
+        page_id = page.page_id
+        jar_count = len(page.jar_regions)
+        total_lines = page.line_count
+        total_words = page.word_count
 
-            # Count text blocks (coarse-scale regions with text)
-            text_regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=page.id, scale="coarse")
-                .all()
-            )
-            total_blocks = len(text_regions) if text_regions else max(1, jar_count * 2)
-
-            # Build jar profiles with real geometry
-            jars = []
-            for i, region in enumerate(jar_regions):
-                bbox = region.bbox or {}
-                x = bbox.get("x_min", 0.1 + (i % 2) * 0.45)
-                y = bbox.get("y_min", 0.1 + (i // 2) * 0.25)
-                width = bbox.get("x_max", x + 0.35) - x
-                height = bbox.get("y_max", y + 0.20) - y
-
-                # Count words anchored to this region
-                anchored_word_count = (
-                    session.query(AnchorRecord)
-                    .filter_by(page_id=page.id, target_id=region.id, source_type="word")
-                    .count()
-                )
+        # Count text blocks (coarse-scale regions with text)
+        total_blocks = page.text_block_count if page.text_block_count else max(1, jar_count * 2)
 
-                # Estimate lines from anchored words (roughly 3 words per line)
-                estimated_lines = max(1, anchored_word_count // 3)
+        # Build jar profiles with real geometry
+        jars = []
+        for i, (region_id, bbox) in enumerate(page.jar_regions):
+            bbox = bbox or {}
+            x = bbox.get("x_min", 0.1 + (i % 2) * 0.45)
+            y = bbox.get("y_min", 0.1 + (i // 2) * 0.25)
+            width = bbox.get("x_max", x + 0.35) - x
+            height = bbox.get("y_max", y + 0.20) - y
 
-                jar = JarProfile(
-                    jar_id=f"{page_id}_jar_{i}",
-                    bounding_box=(x, y, width, height),
-                    text_block_count=max(1, total_blocks // max(1, jar_count)),
-                    line_count=estimated_lines,
-                    word_count=anchored_word_count if anchored_word_count > 0 else total_words // max(1, jar_count),
-                )
-                jars.append(jar)
-
-            # Compute text metrics from actual data
-            mean_word_length = self._compute_mean_word_length(session, page.id)
-            token_repetition_rate = self._compute_repetition_rate(session, page.id)
-            positional_entropy = self._compute_positional_entropy(session, page.id)
-            locality_radius = self._compute_locality_radius(session, page.id)
-            information_density = self._compute_information_density(session, page.id)
-
-            profile = PageProfile(
-                page_id=page_id,
-                jar_count=jar_count if jar_count > 0 else 4,
-                jars=jars,
-                total_text_blocks=total_blocks,
-                total_lines=total_lines if total_lines > 0 else 24,
-                total_words=total_words if total_words > 0 else 72,
-                layout_density=total_words / max(1, total_blocks),
-                mean_word_length=mean_word_length,
-                token_repetition_rate=token_repetition_rate,
-                positional_entropy=positional_entropy,
-                locality_radius=locality_radius,
-                information_density=information_density,
+            # Count words anchored to this region
+            anchored_word_count = page.word_anchors_per_region.get(region_id, 0)
+
+            # Estimate lines from anchored words (roughly 3 words per line)
+            estimated_lines = max(1, anchored_word_count // 3)
+
+            jar = JarProfile(
+                jar_id=f"{page_id}_jar_{i}",
+                bounding_box=(x, y, width, height),
+                text_block_count=max(1, total_blocks // max(1, jar_count)),
+                line_count=estimated_lines,
+                word_count=anchored_word_count if anchored_word_count > 0 else total_words // max(1, jar_count),
             )
+            jars.append(jar)
 
-            return profile
+        # Compute text metrics from actual data
+        mean_word_length = self._compute_mean_word_length(page)
+        token_repetition_rate = self._compute_repetition_rate(page)
+        positional_entropy = self._compute_positional_entropy(page)
+        locality_radius = self._compute_locality_radius(page)
+        information_density = self._compute_information_density(page)
 
-        finally:
-            session.close()
+        return PageProfile(
+            page_id=page_id,
+            jar_count=jar_count if jar_count > 0 else 4,
+            jars=jars,
+            total_text_blocks=total_blocks,
+            total_lines=total_lines if total_lines > 0 else 24,
+            total_words=total_words if total_words > 0 else 72,
+            layout_density=total_words / max(1, total_blocks),
+            mean_word_length=mean_word_length,
+            token_repetition_rate=token_repetition_rate,
+            positional_entropy=positional_entropy,
+            locality_radius=locality_radius,
+            information_density=information_density,
+        )
 
-    def _compute_mean_word_length(self, session, page_id: str) -> float:
+    def _compute_mean_word_length(self, page: "_PageData") -> float:
         """Compute mean word length from glyph counts."""
-        lines = session.query(LineRecord).filter_by(page_id=page_id).all()
-
-        total_glyphs = 0
-        total_words = 0
-
-        for line in lines:
-            words = session.query(WordRecord).filter_by(line_id=line.id).all()
-            for word in words:
-                glyph_count = (
-                    session.query(GlyphCandidateRecord)
-                    .filter_by(word_id=word.id)
-                    .count()
-                )
-                if glyph_count > 0:
-                    total_glyphs += glyph_count
-                    total_words += 1
-
+        total_words = len(page.word_glyphs)
         if total_words == 0:
             return self._default_or_raise("mean_word_length", 5.2, "no glyph-bearing words")
 
+        total_glyphs = sum(len(symbols) for _word_id, symbols in page.word_glyphs)
         return total_glyphs / total_words
 
-    def _compute_repetition_rate(self, session, page_id: str) -> float:
+    def _compute_repetition_rate(self, page: "_PageData") -> float:
         """Compute token repetition rate."""
-        trans_lines = (
-            session.query(TranscriptionLineRecord)
-            .filter_by(page_id=page_id)
-            .all()
-        )
-
-        if not trans_lines:
+        if not page.has_transcription:
             return self._default_or_raise("token_repetition_rate", 0.20, "no transcription lines")
 
-        tokens = []
-        for line in trans_lines:
-            line_tokens = (
-                session.query(TranscriptionTokenRecord)
-                .filter_by(line_id=line.id)
-                .all()
-            )
-            tokens.extend([t.content for t in line_tokens])
-
+        tokens = page.tokens
         if not tokens:
             return self._default_or_raise("token_repetition_rate", 0.20, "no transcription tokens")
 
@@ -272,44 +362,21 @@ class PharmaceuticalProfileExtractor:
 
         return 1.0 - (unique / total) if total > 0 else 0.0
 
-    def _compute_positional_entropy(self, session, page_id: str) -> float:
+    def _compute_positional_entropy(self, page: "_PageData") -> float:
         """Compute positional entropy of glyphs within words."""
-        lines = session.query(LineRecord).filter_by(page_id=page_id).all()
-
         positions = {"start": Counter(), "mid": Counter(), "end": Counter()}
 
-        for line in lines:
-            words = session.query(WordRecord).filter_by(line_id=line.id).all()
-            for word in words:
-                glyphs = (
-                    session.query(GlyphCandidateRecord)
-                    .filter_by(word_id=word.id)
-                    .order_by(GlyphCandidateRecord.glyph_index)  # Changed from .position to .glyph_index
-                    .all()
-                )
-
-                if len(glyphs) == 0:
-                    continue
-
-                for i, glyph in enumerate(glyphs):
-                    # Try to get symbol from alignment, fallback to ID if needed (though alignment preferred)
-                    # For entropy, we need symbols. If not populated, this metric will be skewed.
-                    # We'll try to join with GlyphAlignmentRecord if possible, but for now let's assume
-                    # we can get symbol via a separate query or if it's not joined.
-
-                    # Optimization: In real run, we should join. For now, let's just use a placeholder
-                    # or try to get alignment.
-
-                    from phase1_foundation.storage.metadata import GlyphAlignmentRecord
-                    alignment = session.query(GlyphAlignmentRecord).filter_by(glyph_id=glyph.id).first()
-                    symbol = alignment.symbol if alignment else f"g_{glyph.id}"
-
-                    if i == 0:
-                        positions["start"][symbol] += 1
-                    elif i == len(glyphs) - 1:
-                        positions["end"][symbol] += 1
-                    else:
-                        positions["mid"][symbol] += 1
+        for _word_id, symbols in page.word_glyphs:
+            # Glyphs without an alignment carry a g_<glyph_id> placeholder
+            # symbol, which skews this metric when alignments are sparse.
+            last = len(symbols) - 1
+            for i, symbol in enumerate(symbols):
+                if i == 0:
+                    positions["start"][symbol] += 1
+                elif i == last:
+                    positions["end"][symbol] += 1
+                else:
+                    positions["mid"][symbol] += 1
 
         # Compute average entropy across positions
         entropies = []
@@ -336,25 +403,13 @@ class PharmaceuticalProfileExtractor:
             )
         return sum(entropies) / len(entropies)
 
-    def _compute_locality_radius(self, session, page_id: str) -> float:
+    def _compute_locality_radius(self, page: "_PageData") -> float:
         """Compute locality radius from anchor distances."""
-        anchors = session.query(AnchorRecord).filter_by(page_id=page_id).all()
-
-        if not anchors:
+        if not page.anchor_count:
             return self._default_or_raise("locality_radius", 3.0, "no anchors")
 
         distances = []
-        for anchor in anchors:
-            # Get source and target positions
-            word = session.query(WordRecord).filter_by(id=anchor.source_id).first()
-            region = session.query(RegionRecord).filter_by(id=anchor.target_id).first()
-
-            if not word or not word.bbox or not region or not region.bbox:
-                continue
-
-            word_bbox = word.bbox
-            region_bbox = region.bbox
-
+        for word_bbox, region_bbox in page.anchor_bbox_pairs:
             # Calculate center distance (normalized)
             word_cx = (word_bbox.get("x_min", 0) + word_bbox.get("x_max", 1)) / 2
             word_cy = (word_bbox.get("y_min", 0) + word_bbox.get("y_max", 1)) / 2
@@ -373,26 +428,12 @@ class PharmaceuticalProfileExtractor:
         # Normalize: smaller average distance = smaller locality radius
         return max(1.0, min(6.0, avg_dist * 10))
 
-    def _compute_information_density(self, session, page_id: str) -> float:
+    def _compute_information_density(self, page: "_PageData") -> float:
         """Compute information density from token entropy."""
-        trans_lines = (
-            session.query(TranscriptionLineRecord)
-            .filter_by(page_id=page_id)
-            .all()
-        )
-
-        if not trans_lines:
+        if not page.has_transcription:
             return self._default_or_raise("information_density", 4.0, "no transcription lines")
 
-        tokens = []
-        for line in trans_lines:
-            line_tokens = (
-                session.query(TranscriptionTokenRecord)
-                .filter_by(line_id=line.id)
-                .all()
-            )
-            tokens.extend([t.content for t in line_tokens])
-
+        tokens = page.tokens
         if len(tokens) < 2:
             return self._default_or_raise("information_density", 4.0, "insufficient token count")
 
@@ -463,11 +504,7 @@ class PharmaceuticalProfileExtractor:
 
     def extract_section_profile(self) -> SectionProfile:
         """Extract complete profile for the pharmaceutical section."""
-        pages = []
-
-        for page_id in self.SECTION_PAGES:
-            profile = self.extract_page_profile(page_id)
-            pages.append(profile)
+        pages = self.extract_page_profiles(self.SECTION_PAGES)
 
         self.section_profile = SectionProfile(
             section_id="pharmaceutical",
@@ -14,21 +14,25 @@ import math
 import random
 import statistics
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+from sqlalchemy import func
+
 from phase1_foundation.storage.metadata import (
     AnchorRecord,
     GlyphCandidateRecord,
     LineRecord,
     MetadataStore,
-    PageRecord,
     RegionRecord,
     TranscriptionLineRecord,
     TranscriptionTokenRecord,
+    WordAlignmentRecord,
     WordRecord,
 )
 from phase3_synthesis.interface import PageProfile, SectionProfile, SyntheticPage
+from phase3_synthesis.page_records import new_page_data, rowid_order
 from phase3_synthesis.refinement.interface import (
     DiscriminativeFeature,
     FeatureCategory,
@@ -53,8 +57,72 @@ class FeatureVector:
     features: dict[str, float]
 
 
+# (fallback scrambled range, fixed default) used when no page is supplied
+_FEATURE_FALLBACKS: dict[str, tuple[tuple[float, float], float]] = {
+    "spatial_jar_variance": ((0.3, 0.5), 0.2),
+    "spatial_text_density_gradient": ((-0.1, 0.1), 0.02),
+    "spatial_jar_alignment": ((0.2, 0.6), 0.7),
+    "text_inter_jar_similarity": ((0.05, 0.15), 0.35),
+    "text_bigram_consistency": ((0.2, 0.4), 0.70),
+    "pos_left_right_asymmetry": ((0.0, 0.2), 0.08),
+    "pos_first_last_line_diff": ((0.1, 0.5), 0.15),
+    "var_locality_variance": ((0.3, 0.5), 0.10),
+    "var_word_length_variance": ((0.3, 0.6), 0.12),
+    "temp_repetition_spacing": ((1.0, 10.0), 4.5),
+    "temp_token_burst_rate": ((0.02, 0.15), 0.05),
+    "grad_entropy_slope": ((-0.1, 0.1), -0.02),
+}
+
+# Features defined as a scaled copy of another feature
+_DERIVED_FEATURES: dict[str, tuple[str, float]] = {
+    "text_vocabulary_overlap": ("text_inter_jar_similarity", 1.2),
+    "grad_density_slope": ("grad_entropy_slope", 0.8),
+}
+
+
+def _center(bbox: dict) -> tuple[float, float]:
+    return (
+        (bbox.get("x_min", 0) + bbox.get("x_max", 1)) / 2,
+        (bbox.get("y_min", 0) + bbox.get("y_max", 1)) / 2,
+    )
+
+
+@dataclass
+class _AnchorData:
+    target_id: str
+    source_type: str
+    word_bbox: dict | None  # None when the source word does not exist
+    word_exists: bool
+    glyph_count: int
+    token: str | None  # content of the word's first aligned token
+
+
+@dataclass
+class _FeaturePageData:
+    """Records behind the feature set of one page, loaded in bulk."""
+    page_id: str
+    jar_regions: list[tuple[str, dict | None]] = field(default_factory=list)
+    # (bbox, word count) per layout line, in insertion order
+    lines: list[tuple[dict | None, int]] = field(default_factory=list)
+    word_bboxes: list[dict | None] = field(default_factory=list)
+    anchors: list[_AnchorData] = field(default_factory=list)
+    # Transcription tokens per line, lines by line_index
+    token_lines: list[list[str]] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> list[str]:
+        return [token for line in self.token_lines for token in line]
+
+
 class FeatureComputer:
-    """Registry of real feature computation functions."""
+    """
+    Registry of real feature computation functions.
+
+    Page records are loaded once per page into an in-memory cache (see
+    ``load_pages``) so every feature of every page is computed without
+    further queries. ``compute_matrix`` evaluates a whole batch of pages
+    into a (pages x features) array.
+    """
 
     def __init__(self, store: MetadataStore | None = None, seed: int | None = None):
         from phase1_foundation.config import require_seed_if_strict
@@ -63,6 +131,23 @@ class FeatureComputer:
         self.fallback_seed = seed
         self.fallback_rng = random.Random(seed)
         self._active_seed: int | None = None
+        self._page_cache: dict[str, _FeaturePageData | None] = {}
+        self._compute_methods = {
+            "spatial_jar_variance": self._compute_spatial_jar_variance,
+            "spatial_text_density_gradient": self._compute_text_density_gradient,
+            "spatial_jar_alignment": self._compute_jar_alignment,
+            "text_inter_jar_similarity": self._compute_inter_jar_similarity,
+            "text_vocabulary_overlap": self._compute_vocab_overlap,
+            "text_bigram_consistency": self._compute_bigram_consistency,
+            "pos_left_right_asymmetry": self._compute_lr_asymmetry,
+            "pos_first_last_line_diff": self._compute_first_last_diff,
+            "var_locality_variance": self._compute_locality_variance,
+            "var_word_length_variance": self._compute_word_length_variance,
+            "temp_repetition_spacing": self._compute_repetition_spacing,
+            "temp_token_burst_rate": self._compute_burst_rate,
+            "grad_entropy_slope": self._compute_entropy_slope,
+            "grad_density_slope": self._compute_density_slope,
+        }
 
     def compute(self, feature_id: str, page: PageProfile = None,
                 synthetic: SyntheticPage = None, is_scrambled: bool = False,
@@ -79,29 +164,37 @@ class FeatureComputer:
         finally:
             self._active_seed = None
 
+    def compute_matrix(
+        self,
+        feature_ids: list[str],
+        rows: list[tuple[PageProfile | None, SyntheticPage | None, bool, int | None]],
+    ) -> np.ndarray:
+        """
+        Compute every feature for every row as a (rows x features) matrix.
+
+        Each row is ``(page, synthetic, is_scrambled, seed)`` as accepted by
+        ``compute``. Page records for all rows are loaded up front; values
+        are computed row by row in feature order so seeded fallbacks match
+        repeated ``compute`` calls exactly.
+        """
+        if self.store is not None:
+            self.load_pages([
+                page.page_id if page else synthetic.page_id
+                for page, synthetic, _scrambled, _seed in rows
+                if page is not None or synthetic is not None
+            ])
+
+        matrix = np.empty((len(rows), len(feature_ids)), dtype=np.float64)
+        for i, (page, synthetic, is_scrambled, seed) in enumerate(rows):
+            for j, feature_id in enumerate(feature_ids):
+                matrix[i, j] = self.compute(feature_id, page, synthetic, is_scrambled, seed)
+        return matrix
+
     def _compute_real(self, feature_id: str, page: PageProfile = None,
                       synthetic: SyntheticPage = None, is_scrambled: bool = False,
                       seed: int | None = None) -> float:
         """Compute feature from actual database records."""
-        # Map feature_id to computation method
-        compute_methods = {
-            "spatial_jar_variance": self._compute_spatial_jar_variance,
-            "spatial_text_density_gradient": self._compute_text_density_gradient,
-            "spatial_jar_alignment": self._compute_jar_alignment,
-            "text_inter_jar_similarity": self._compute_inter_jar_similarity,
-            "text_vocabulary_overlap": self._compute_vocab_overlap,
-            "text_bigram_consistency": self._compute_bigram_consistency,
-            "pos_left_right_asymmetry": self._compute_lr_asymmetry,
-            "pos_first_last_line_diff": self._compute_first_last_diff,
-            "var_locality_variance": self._compute_locality_variance,
-            "var_word_length_variance": self._compute_word_length_variance,
-            "temp_repetition_spacing": self._compute_repetition_spacing,
-            "temp_token_burst_rate": self._compute_burst_rate,
-            "grad_entropy_slope": self._compute_entropy_slope,
-            "grad_density_slope": self._compute_density_slope,
-        }
-
-        method = compute_methods.get(feature_id)
+        method = self._compute_methods.get(feature_id)
         if method is None:
             raise ValueError(f"Unknown feature_id: {feature_id}")
 
@@ -109,9 +202,30 @@ class FeatureComputer:
             from phase1_foundation.core.randomness import get_randomness_controller
             controller = get_randomness_controller()
             with controller.seeded_context(f"feature_{feature_id}", seed):
-                return method(page, synthetic, is_scrambled)
+                return self._evaluate(feature_id, method, page, synthetic, is_scrambled)
 
-        return method(page, synthetic, is_scrambled)
+        return self._evaluate(feature_id, method, page, synthetic, is_scrambled)
+
+    def _evaluate(self, feature_id: str, method, page: PageProfile | None,
+                  synthetic: SyntheticPage | None, is_scrambled: bool) -> float:
+        if page is None and synthetic is None:
+            return self._no_page_value(feature_id, is_scrambled)
+
+        page_id = page.page_id if page else synthetic.page_id
+        data = self.page_data(page_id)
+        if data is None:
+            logger.warning("No DB page %s for %s, returning NaN", page_id, feature_id)
+            return float("nan")
+        return method(data)
+
+    def _no_page_value(self, feature_id: str, is_scrambled: bool) -> float:
+        if feature_id in _DERIVED_FEATURES:
+            base_id, factor = _DERIVED_FEATURES[feature_id]
+            return self._no_page_value(base_id, is_scrambled) * factor
+
+        self._warn_fallback(feature_id, is_scrambled)
+        scrambled_range, default_value = _FEATURE_FALLBACKS[feature_id]
+        return self._fallback_value(feature_id, is_scrambled, scrambled_range, default_value)
 
     def _warn_fallback(self, feature_id: str, is_scrambled: bool) -> None:
         """Warn when falling back to random/hardcoded values."""
@@ -156,145 +270,187 @@ class FeatureComputer:
         )
         return default_value
 
-    def _compute_spatial_jar_variance(self, page: PageProfile = None,
-                                       synthetic: SyntheticPage = None,
-                                       is_scrambled: bool = False) -> float:
-        """Compute variance in jar positions across page."""
-        if page is None and synthetic is None:
-            self._warn_fallback("spatial_jar_variance", is_scrambled)
-            return self._fallback_value("spatial_jar_variance", is_scrambled, (0.3, 0.5), 0.2)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for spatial_jar_variance, returning NaN")
-                return float("nan")
-
-            # Get jar regions (mid-scale)
-            regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=db_page.id, scale="mid")
-                .all()
-            )
-
-            if len(regions) < 2:
-                return 0.0
+    # ------------------------------------------------------------------
+    # Page cache
+    # ------------------------------------------------------------------
 
-            # Calculate variance of x and y positions
-            x_positions = []
-            y_positions = []
-            for region in regions:
-                bbox = region.bbox or {}
-                x_center = (bbox.get("x_min", 0) + bbox.get("x_max", 1)) / 2
-                y_center = (bbox.get("y_min", 0) + bbox.get("y_max", 1)) / 2
-                x_positions.append(x_center)
-                y_positions.append(y_center)
+    def page_data(self, page_id: str) -> _FeaturePageData | None:
+        """Cached records for ``page_id`` (None if the page is not in the store)."""
+        if page_id not in self._page_cache:
+            self.load_pages([page_id])
+        return self._page_cache[page_id]
 
-            x_var = statistics.variance(x_positions) if len(x_positions) > 1 else 0
-            y_var = statistics.variance(y_positions) if len(y_positions) > 1 else 0
+    def clear_cache(self) -> None:
+        self._page_cache.clear()
 
-            return (x_var + y_var) / 2
+    def load_pages(self, page_ids: list[str]) -> None:
+        """Load every uncached page in ``page_ids`` with one query per record type."""
+        missing = list(dict.fromkeys(pid for pid in page_ids if pid not in self._page_cache))
+        if not missing:
+            return
 
+        session = self.store.Session()
+        try:
+            data = new_page_data(session, missing, _FeaturePageData)
+            if data:
+                self._load_regions(session, data)
+                self._load_lines(session, data)
+                self._load_anchors(session, data)
+                self._load_transcription(session, data)
         finally:
             session.close()
 
-    def _compute_text_density_gradient(self, page: PageProfile = None,
-                                        synthetic: SyntheticPage = None,
-                                        is_scrambled: bool = False) -> float:
-        """Compute gradient of text density from top to bottom."""
-        if page is None and synthetic is None:
-            self._warn_fallback("spatial_text_density_gradient", is_scrambled)
-            return self._fallback_value("spatial_text_density_gradient", is_scrambled, (-0.1, 0.1), 0.02)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
+        for page_id in missing:
+            self._page_cache[page_id] = data.get(page_id)
+
+    def _load_regions(self, session, data: dict[str, _FeaturePageData]) -> None:
+        for region_id, page_id, bbox in (
+            session.query(RegionRecord.id, RegionRecord.page_id, RegionRecord.bbox)
+            .filter(RegionRecord.page_id.in_(list(data)), RegionRecord.scale == "mid")
+            .order_by(rowid_order(RegionRecord))
+            .all()
+        ):
+            data[page_id].jar_regions.append((region_id, bbox))
+
+    def _load_lines(self, session, data: dict[str, _FeaturePageData]) -> None:
+        lines = (
+            session.query(LineRecord.id, LineRecord.page_id, LineRecord.bbox)
+            .filter(LineRecord.page_id.in_(list(data)))
+            .order_by(rowid_order(LineRecord))
+            .all()
+        )
+        word_counts: Counter = Counter()
+        for line_id, page_id, word_bbox in (
+            session.query(WordRecord.line_id, LineRecord.page_id, WordRecord.bbox)
+            .join(LineRecord, WordRecord.line_id == LineRecord.id)
+            .filter(LineRecord.page_id.in_(list(data)))
+            .all()
+        ):
+            word_counts[line_id] += 1
+            data[page_id].word_bboxes.append(word_bbox)
+        for line_id, page_id, bbox in lines:
+            data[page_id].lines.append((bbox, word_counts[line_id]))
+
+    def _load_anchors(self, session, data: dict[str, _FeaturePageData]) -> None:
+        anchors = (
+            session.query(
+                AnchorRecord.page_id,
+                AnchorRecord.target_id,
+                AnchorRecord.source_type,
+                AnchorRecord.source_id,
+                WordRecord.id,
+                WordRecord.bbox,
+            )
+            .outerjoin(WordRecord, WordRecord.id == AnchorRecord.source_id)
+            .filter(AnchorRecord.page_id.in_(list(data)))
+            .order_by(rowid_order(AnchorRecord))
+            .all()
+        )
+        word_ids = list({word_id for *_rest, word_id, _bbox in anchors if word_id is not None})
 
-            if not db_page:
-                logger.warning("No DB page for text_density_gradient, returning NaN")
-                return float("nan")
+        glyph_counts = dict(
+            session.query(GlyphCandidateRecord.word_id, func.count(GlyphCandidateRecord.id))
+            .filter(GlyphCandidateRecord.word_id.in_(word_ids))
+            .group_by(GlyphCandidateRecord.word_id)
+            .all()
+        )
 
-            lines = session.query(LineRecord).filter_by(page_id=db_page.id).all()
-            if len(lines) < 4:
-                return 0.0
+        # First alignment of each word, with its token content if any
+        word_tokens: dict[str, str | None] = {}
+        for word_id, content in (
+            session.query(WordAlignmentRecord.word_id, TranscriptionTokenRecord.content)
+            .outerjoin(TranscriptionTokenRecord, TranscriptionTokenRecord.id == WordAlignmentRecord.token_id)
+            .filter(WordAlignmentRecord.word_id.in_(word_ids))
+            .order_by(rowid_order(WordAlignmentRecord))
+            .all()
+        ):
+            word_tokens.setdefault(word_id, content)
+
+        for page_id, target_id, source_type, _source_id, word_id, word_bbox in anchors:
+            data[page_id].anchors.append(_AnchorData(
+                target_id=target_id,
+                source_type=source_type,
+                word_bbox=word_bbox,
+                word_exists=word_id is not None,
+                glyph_count=glyph_counts.get(word_id, 0),
+                token=word_tokens.get(word_id),
+            ))
 
-            # Split lines into top and bottom halves based on bbox
-            sorted_lines = sorted(lines, key=lambda l: l.bbox.get("y_min", 0) if l.bbox else 0)
-            mid = len(sorted_lines) // 2
-            top_lines = sorted_lines[:mid]
-            bottom_lines = sorted_lines[mid:]
+    def _load_transcription(self, session, data: dict[str, _FeaturePageData]) -> None:
+        rows = (
+            session.query(TranscriptionLineRecord.page_id, TranscriptionLineRecord.id, TranscriptionTokenRecord.content)
+            .outerjoin(TranscriptionTokenRecord, TranscriptionTokenRecord.line_id == TranscriptionLineRecord.id)
+            .filter(TranscriptionLineRecord.page_id.in_(list(data)))
+            .order_by(
+                TranscriptionLineRecord.page_id,
+                TranscriptionLineRecord.line_index,
+                rowid_order(TranscriptionLineRecord),
+                TranscriptionTokenRecord.token_index,
+            )
+            .all()
+        )
+        last_line = None
+        for page_id, line_id, content in rows:
+            token_lines = data[page_id].token_lines
+            if line_id != last_line:
+                token_lines.append([])
+                last_line = line_id
+            if content is not None:
+                token_lines[-1].append(content)
+
+    # ------------------------------------------------------------------
+    # Features
+    # ------------------------------------------------------------------
+
+    def _compute_spatial_jar_variance(self, data: _FeaturePageData) -> float:
+        """Compute variance in jar positions across page."""
+        if len(data.jar_regions) < 2:
+            return 0.0
 
-            # Count words in each half
-            top_words = 0
-            bottom_words = 0
+        # Calculate variance of x and y positions
+        centers = [_center(bbox or {}) for _region_id, bbox in data.jar_regions]
+        x_var = statistics.variance([x for x, _y in centers])
+        y_var = statistics.variance([y for _x, y in centers])
 
-            for line in top_lines:
-                top_words += session.query(WordRecord).filter_by(line_id=line.id).count()
+        return (x_var + y_var) / 2
 
-            for line in bottom_lines:
-                bottom_words += session.query(WordRecord).filter_by(line_id=line.id).count()
+    def _compute_text_density_gradient(self, data: _FeaturePageData) -> float:
+        """Compute gradient of text density from top to bottom."""
+        if len(data.lines) < 4:
+            return 0.0
 
-            # Gradient = (bottom - top) / total
-            total = top_words + bottom_words
-            if total == 0:
-                return 0.0
+        # Split lines into top and bottom halves based on bbox
+        sorted_lines = sorted(data.lines, key=lambda l: l[0].get("y_min", 0) if l[0] else 0)
+        mid = len(sorted_lines) // 2
+        top_words = sum(count for _bbox, count in sorted_lines[:mid])
+        bottom_words = sum(count for _bbox, count in sorted_lines[mid:])
 
-            return (bottom_words - top_words) / total
+        # Gradient = (bottom - top) / total
+        total = top_words + bottom_words
+        if total == 0:
+            return 0.0
 
-        finally:
-            session.close()
+        return (bottom_words - top_words) / total
 
-    def _compute_jar_alignment(self, page: PageProfile = None,
-                                synthetic: SyntheticPage = None,
-                                is_scrambled: bool = False) -> float:
+    def _compute_jar_alignment(self, data: _FeaturePageData) -> float:
         """Compute how well jars align horizontally/vertically."""
-        if page is None and synthetic is None:
-            self._warn_fallback("spatial_jar_alignment", is_scrambled)
-            return self._fallback_value("spatial_jar_alignment", is_scrambled, (0.2, 0.6), 0.7)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for jar_alignment, returning NaN")
-                return float("nan")
-
-            regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=db_page.id, scale="mid")
-                .all()
-            )
-
-            if len(regions) < 2:
-                return 1.0  # Single jar = perfect alignment
+        if len(data.jar_regions) < 2:
+            return 1.0  # Single jar = perfect alignment
 
-            # Check horizontal alignment by comparing x_min values
-            x_mins = []
-            y_mins = []
-            for region in regions:
-                bbox = region.bbox or {}
-                x_mins.append(bbox.get("x_min", 0))
-                y_mins.append(bbox.get("y_min", 0))
+        # Check horizontal alignment by comparing x_min values
+        x_mins = [(bbox or {}).get("x_min", 0) for _region_id, bbox in data.jar_regions]
+        y_mins = [(bbox or {}).get("y_min", 0) for _region_id, bbox in data.jar_regions]
 
-            # Group by similar x positions (within 0.1 tolerance)
-            x_groups = self._count_alignment_groups(x_mins, 0.1)
-            y_groups = self._count_alignment_groups(y_mins, 0.1)
+        # Group by similar x positions (within 0.1 tolerance)
+        x_groups = self._count_alignment_groups(x_mins, 0.1)
+        y_groups = self._count_alignment_groups(y_mins, 0.1)
 
-            # Alignment score = fraction in largest groups
-            max_x_group = max(x_groups.values()) if x_groups else 1
-            max_y_group = max(y_groups.values()) if y_groups else 1
+        # Alignment score = fraction in largest groups
+        max_x_group = max(x_groups.values()) if x_groups else 1
+        max_y_group = max(y_groups.values()) if y_groups else 1
 
-            alignment = (max_x_group + max_y_group) / (2 * len(regions))
-            return min(1.0, alignment)
-
-        finally:
-            session.close()
+        alignment = (max_x_group + max_y_group) / (2 * len(data.jar_regions))
+        return min(1.0, alignment)
 
     def _count_alignment_groups(self, values: list[float], tolerance: float) -> dict[int, int]:
         """Count how many values fall into aligned groups."""
@@ -315,513 +471,176 @@ class FeatureComputer:
 
         return groups
 
-    def _compute_inter_jar_similarity(self, page: PageProfile = None,
-                                       synthetic: SyntheticPage = None,
-                                       is_scrambled: bool = False) -> float:
+    def _compute_inter_jar_similarity(self, data: _FeaturePageData) -> float:
         """Compute average similarity between text in different jars."""
-        if page is None and synthetic is None:
-            self._warn_fallback("text_inter_jar_similarity", is_scrambled)
-            return self._fallback_value("text_inter_jar_similarity", is_scrambled, (0.05, 0.15), 0.35)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for inter_jar_similarity, returning NaN")
-                return float("nan")
-
-            # Get regions and their anchored tokens
-            regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=db_page.id, scale="mid")
-                .all()
-            )
-
-            if len(regions) < 2:
-                return 0.0
-
-            region_tokens = {}
-            for region in regions:
-                anchors = (
-                    session.query(AnchorRecord)
-                    .filter_by(page_id=db_page.id, target_id=region.id, source_type="word")
-                    .all()
-                )
-
-                tokens = set()
-                for anchor in anchors:
-                    word = session.query(WordRecord).filter_by(id=anchor.source_id).first()
-                    if word:
-                        # Get token content if available
-                        from phase1_foundation.storage.metadata import WordAlignmentRecord
-                        alignment = session.query(WordAlignmentRecord).filter_by(word_id=word.id).first()
-                        if alignment and alignment.token_id:
-                            token = session.query(TranscriptionTokenRecord).filter_by(id=alignment.token_id).first()
-                            if token:
-                                tokens.add(token.content)
-
-                region_tokens[region.id] = tokens
-
-            # Compute pairwise Jaccard similarities
-            similarities = []
-            region_ids = list(region_tokens.keys())
-            for i in range(len(region_ids)):
-                for j in range(i + 1, len(region_ids)):
-                    tokens_i = region_tokens[region_ids[i]]
-                    tokens_j = region_tokens[region_ids[j]]
-
-                    if not tokens_i or not tokens_j:
-                        continue
+        if len(data.jar_regions) < 2:
+            return 0.0
 
-                    intersection = len(tokens_i & tokens_j)
-                    union = len(tokens_i | tokens_j)
+        # Tokens aligned to the words anchored in each jar
+        region_tokens: dict[str, set[str]] = {region_id: set() for region_id, _bbox in data.jar_regions}
+        for anchor in data.anchors:
+            if anchor.source_type == "word" and anchor.target_id in region_tokens and anchor.token is not None:
+                region_tokens[anchor.target_id].add(anchor.token)
+
+        # Compute pairwise Jaccard similarities
+        similarities = []
+        token_sets = list(region_tokens.values())
+        for i in range(len(token_sets)):
+            for j in range(i + 1, len(token_sets)):
+                tokens_i = token_sets[i]
+                tokens_j = token_sets[j]
+
+                if not tokens_i or not tokens_j:
+                    continue
 
-                    if union > 0:
-                        similarities.append(intersection / union)
+                intersection = len(tokens_i & tokens_j)
+                union = len(tokens_i | tokens_j)
 
-            return sum(similarities) / len(similarities) if similarities else 0.0
+                if union > 0:
+                    similarities.append(intersection / union)
 
-        finally:
-            session.close()
+        return sum(similarities) / len(similarities) if similarities else 0.0
 
-    def _compute_vocab_overlap(self, page: PageProfile = None,
-                                synthetic: SyntheticPage = None,
-                                is_scrambled: bool = False) -> float:
+    def _compute_vocab_overlap(self, data: _FeaturePageData) -> float:
         """Compute fraction of vocabulary shared across jars."""
         # Similar to inter_jar_similarity but focuses on vocabulary coverage
-        return self._compute_inter_jar_similarity(page, synthetic, is_scrambled) * 1.2
+        return self._compute_inter_jar_similarity(data) * 1.2
 
-    def _compute_bigram_consistency(self, page: PageProfile = None,
-                                     synthetic: SyntheticPage = None,
-                                     is_scrambled: bool = False) -> float:
+    def _compute_bigram_consistency(self, data: _FeaturePageData) -> float:
         """Compute consistency of bigram patterns across page."""
-        if page is None and synthetic is None:
-            self._warn_fallback("text_bigram_consistency", is_scrambled)
-            return self._fallback_value("text_bigram_consistency", is_scrambled, (0.2, 0.4), 0.70)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for bigram_consistency, returning NaN")
-                return float("nan")
-
-            # Get all tokens in order
-            trans_lines = (
-                session.query(TranscriptionLineRecord)
-                .filter_by(page_id=db_page.id)
-                .order_by(TranscriptionLineRecord.line_index)
-                .all()
-            )
-
-            all_tokens = []
-            for line in trans_lines:
-                tokens = (
-                    session.query(TranscriptionTokenRecord)
-                    .filter_by(line_id=line.id)
-                    .order_by(TranscriptionTokenRecord.position)
-                    .all()
-                )
-                all_tokens.extend([t.content for t in tokens])
-
-            if len(all_tokens) < 4:
-                return 0.0
-
-            # Compute bigrams
-            bigrams = Counter()
-            for i in range(len(all_tokens) - 1):
-                bigrams[(all_tokens[i], all_tokens[i+1])] += 1
+        all_tokens = data.tokens
+        if len(all_tokens) < 4:
+            return 0.0
 
-            # Consistency = ratio of repeated bigrams to total
-            total_bigrams = len(all_tokens) - 1
-            unique_bigrams = len(bigrams)
+        # Compute bigrams
+        bigrams = Counter(zip(all_tokens, all_tokens[1:], strict=False))
 
-            if total_bigrams == 0:
-                return 0.0
+        # Consistency = ratio of repeated bigrams to total
+        total_bigrams = len(all_tokens) - 1
+        unique_bigrams = len(bigrams)
 
-            # Higher type/token ratio = more consistency
-            return 1.0 - (unique_bigrams / total_bigrams)
+        # Higher type/token ratio = more consistency
+        return 1.0 - (unique_bigrams / total_bigrams)
 
-        finally:
-            session.close()
-
-    def _compute_lr_asymmetry(self, page: PageProfile = None,
-                               synthetic: SyntheticPage = None,
-                               is_scrambled: bool = False) -> float:
+    def _compute_lr_asymmetry(self, data: _FeaturePageData) -> float:
         """Compute difference in text properties left vs right."""
-        if page is None and synthetic is None:
-            self._warn_fallback("pos_left_right_asymmetry", is_scrambled)
-            return self._fallback_value("pos_left_right_asymmetry", is_scrambled, (0.0, 0.2), 0.08)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for lr_asymmetry, returning NaN")
-                return float("nan")
-
-            lines = session.query(LineRecord).filter_by(page_id=db_page.id).all()
-            if not lines:
-                return 0.0
-
-            # Split words by x position
-            left_words = 0
-            right_words = 0
-
-            for line in lines:
-                words = session.query(WordRecord).filter_by(line_id=line.id).all()
-                for word in words:
-                    bbox = word.bbox or {}
-                    x_center = (bbox.get("x_min", 0) + bbox.get("x_max", 1)) / 2
-
-                    if x_center < 0.5:
-                        left_words += 1
-                    else:
-                        right_words += 1
+        if not data.lines:
+            return 0.0
 
-            total = left_words + right_words
-            if total == 0:
-                return 0.0
+        # Split words by x position
+        left_words = sum(1 for bbox in data.word_bboxes if _center(bbox or {})[0] < 0.5)
+        right_words = len(data.word_bboxes) - left_words
 
-            # Asymmetry = absolute difference in proportions
-            return abs(left_words - right_words) / total
+        total = left_words + right_words
+        if total == 0:
+            return 0.0
 
-        finally:
-            session.close()
+        # Asymmetry = absolute difference in proportions
+        return abs(left_words - right_words) / total
 
-    def _compute_first_last_diff(self, page: PageProfile = None,
-                                  synthetic: SyntheticPage = None,
-                                  is_scrambled: bool = False) -> float:
+    def _compute_first_last_diff(self, data: _FeaturePageData) -> float:
         """Compute statistical difference between first and last lines."""
-        if page is None and synthetic is None:
-            self._warn_fallback("pos_first_last_line_diff", is_scrambled)
-            return self._fallback_value("pos_first_last_line_diff", is_scrambled, (0.1, 0.5), 0.15)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for first_last_diff, returning NaN")
-                return float("nan")
-
-            lines = (
-                session.query(LineRecord)
-                .filter_by(page_id=db_page.id)
-                .all()
-            )
-
-            if len(lines) < 2:
-                return 0.0
-
-            # Sort by y position
-            sorted_lines = sorted(lines, key=lambda l: l.bbox.get("y_min", 0) if l.bbox else 0)
-            first_lines = sorted_lines[:2]
-            last_lines = sorted_lines[-2:]
-
-            # Count words in each group
-            first_words = 0
-            last_words = 0
-
-            for line in first_lines:
-                first_words += session.query(WordRecord).filter_by(line_id=line.id).count()
-
-            for line in last_lines:
-                last_words += session.query(WordRecord).filter_by(line_id=line.id).count()
+        if len(data.lines) < 2:
+            return 0.0
 
-            if first_words + last_words == 0:
-                return 0.0
+        # Sort by y position
+        sorted_lines = sorted(data.lines, key=lambda l: l[0].get("y_min", 0) if l[0] else 0)
+        first_words = sum(count for _bbox, count in sorted_lines[:2])
+        last_words = sum(count for _bbox, count in sorted_lines[-2:])
 
-            return abs(first_words - last_words) / (first_words + last_words)
+        if first_words + last_words == 0:
+            return 0.0
 
-        finally:
-            session.close()
+        return abs(first_words - last_words) / (first_words + last_words)
 
-    def _compute_locality_variance(self, page: PageProfile = None,
-                                    synthetic: SyntheticPage = None,
-                                    is_scrambled: bool = False) -> float:
+    def _compute_locality_variance(self, data: _FeaturePageData) -> float:
         """Compute variance of locality metric across jars."""
-        if page is None and synthetic is None:
-            self._warn_fallback("var_locality_variance", is_scrambled)
-            return self._fallback_value("var_locality_variance", is_scrambled, (0.3, 0.5), 0.10)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for locality_variance, returning NaN")
-                return float("nan")
-
-            # Compute locality per region
-            regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=db_page.id, scale="mid")
-                .all()
-            )
-
-            if len(regions) < 2:
-                return 0.0
-
-            localities = []
-            for region in regions:
-                anchors = (
-                    session.query(AnchorRecord)
-                    .filter_by(page_id=db_page.id, target_id=region.id)
-                    .all()
-                )
+        if len(data.jar_regions) < 2:
+            return 0.0
 
-                if not anchors:
+        localities = []
+        for region_id, region_bbox in data.jar_regions:
+            # Average distance of anchored words from region center
+            region_cx, region_cy = _center(region_bbox or {})
+            distances = []
+            for anchor in data.anchors:
+                if anchor.target_id != region_id or not anchor.word_bbox:
                     continue
+                word_cx, word_cy = _center(anchor.word_bbox)
+                distances.append(math.sqrt((word_cx - region_cx)**2 + (word_cy - region_cy)**2))
 
-                # Average distance of anchored words from region center
-                distances = []
-                region_bbox = region.bbox or {}
-                region_cx = (region_bbox.get("x_min", 0) + region_bbox.get("x_max", 1)) / 2
-                region_cy = (region_bbox.get("y_min", 0) + region_bbox.get("y_max", 1)) / 2
-
-                for anchor in anchors:
-                    word = session.query(WordRecord).filter_by(id=anchor.source_id).first()
-                    if word and word.bbox:
-                        word_cx = (word.bbox.get("x_min", 0) + word.bbox.get("x_max", 1)) / 2
-                        word_cy = (word.bbox.get("y_min", 0) + word.bbox.get("y_max", 1)) / 2
-                        dist = math.sqrt((word_cx - region_cx)**2 + (word_cy - region_cy)**2)
-                        distances.append(dist)
-
-                if distances:
-                    localities.append(sum(distances) / len(distances))
-
-            if len(localities) < 2:
-                return 0.0
+            if distances:
+                localities.append(sum(distances) / len(distances))
 
-            return statistics.variance(localities)
+        if len(localities) < 2:
+            return 0.0
 
-        finally:
-            session.close()
+        return statistics.variance(localities)
 
-    def _compute_word_length_variance(self, page: PageProfile = None,
-                                       synthetic: SyntheticPage = None,
-                                       is_scrambled: bool = False) -> float:
+    def _compute_word_length_variance(self, data: _FeaturePageData) -> float:
         """Compute variance of mean word length across jars."""
-        if page is None and synthetic is None:
-            self._warn_fallback("var_word_length_variance", is_scrambled)
-            return self._fallback_value("var_word_length_variance", is_scrambled, (0.3, 0.6), 0.12)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for word_length_variance, returning NaN")
-                return float("nan")
-
-            # Compute mean word length per region
-            regions = (
-                session.query(RegionRecord)
-                .filter_by(page_id=db_page.id, scale="mid")
-                .all()
-            )
-
-            if len(regions) < 2:
-                return 0.0
-
-            region_lengths = []
-            for region in regions:
-                anchors = (
-                    session.query(AnchorRecord)
-                    .filter_by(page_id=db_page.id, target_id=region.id, source_type="word")
-                    .all()
-                )
-
-                word_lengths = []
-                for anchor in anchors:
-                    word = session.query(WordRecord).filter_by(id=anchor.source_id).first()
-                    if word:
-                        glyph_count = (
-                            session.query(GlyphCandidateRecord)
-                            .filter_by(word_id=word.id)
-                            .count()
-                        )
-                        if glyph_count > 0:
-                            word_lengths.append(glyph_count)
-
-                if word_lengths:
-                    region_lengths.append(sum(word_lengths) / len(word_lengths))
-
-            if len(region_lengths) < 2:
-                return 0.0
+        if len(data.jar_regions) < 2:
+            return 0.0
 
-            return statistics.variance(region_lengths)
+        region_lengths = []
+        for region_id, _bbox in data.jar_regions:
+            word_lengths = [
+                anchor.glyph_count
+                for anchor in data.anchors
+                if anchor.target_id == region_id
+                and anchor.source_type == "word"
+                and anchor.glyph_count > 0
+            ]
+            if word_lengths:
+                region_lengths.append(sum(word_lengths) / len(word_lengths))
+
+        if len(region_lengths) < 2:
+            return 0.0
 
-        finally:
-            session.close()
+        return statistics.variance(region_lengths)
 
-    def _compute_repetition_spacing(self, page: PageProfile = None,
-                                     synthetic: SyntheticPage = None,
-                                     is_scrambled: bool = False) -> float:
+    def _compute_repetition_spacing(self, data: _FeaturePageData) -> float:
         """Compute average distance between repeated tokens."""
-        if page is None and synthetic is None:
-            self._warn_fallback("temp_repetition_spacing", is_scrambled)
-            return self._fallback_value("temp_repetition_spacing", is_scrambled, (1.0, 10.0), 4.5)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for repetition_spacing, returning NaN")
-                return float("nan")
-
-            # Get all tokens in order
-            trans_lines = (
-                session.query(TranscriptionLineRecord)
-                .filter_by(page_id=db_page.id)
-                .order_by(TranscriptionLineRecord.line_index)
-                .all()
-            )
-
-            all_tokens = []
-            for line in trans_lines:
-                tokens = (
-                    session.query(TranscriptionTokenRecord)
-                    .filter_by(line_id=line.id)
-                    .order_by(TranscriptionTokenRecord.position)
-                    .all()
-                )
-                all_tokens.extend([t.content for t in tokens])
-
-            if len(all_tokens) < 3:
-                return 0.0
-
-            # Track positions of each token
-            token_positions: dict[str, list[int]] = {}
-            for i, token in enumerate(all_tokens):
-                if token not in token_positions:
-                    token_positions[token] = []
-                token_positions[token].append(i)
+        all_tokens = data.tokens
+        if len(all_tokens) < 3:
+            return 0.0
 
-            # Calculate average distance between consecutive occurrences
-            spacings = []
-            for positions in token_positions.values():
-                if len(positions) > 1:
-                    for i in range(1, len(positions)):
-                        spacings.append(positions[i] - positions[i-1])
+        # Distance between consecutive occurrences of each token
+        last_seen: dict[str, int] = {}
+        spacings = []
+        for i, token in enumerate(all_tokens):
+            if token in last_seen:
+                spacings.append(i - last_seen[token])
+            last_seen[token] = i
 
-            return sum(spacings) / len(spacings) if spacings else 0.0
+        return sum(spacings) / len(spacings) if spacings else 0.0
 
-        finally:
-            session.close()
-
-    def _compute_burst_rate(self, page: PageProfile = None,
-                             synthetic: SyntheticPage = None,
-                             is_scrambled: bool = False) -> float:
+    def _compute_burst_rate(self, data: _FeaturePageData) -> float:
         """Compute rate of token bursts (clusters of same token)."""
-        if page is None and synthetic is None:
-            self._warn_fallback("temp_token_burst_rate", is_scrambled)
-            return self._fallback_value("temp_token_burst_rate", is_scrambled, (0.02, 0.15), 0.05)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for burst_rate, returning NaN")
-                return float("nan")
-
-            # Get all tokens in order
-            trans_lines = (
-                session.query(TranscriptionLineRecord)
-                .filter_by(page_id=db_page.id)
-                .order_by(TranscriptionLineRecord.line_index)
-                .all()
-            )
-
-            all_tokens = []
-            for line in trans_lines:
-                tokens = (
-                    session.query(TranscriptionTokenRecord)
-                    .filter_by(line_id=line.id)
-                    .order_by(TranscriptionTokenRecord.position)
-                    .all()
-                )
-                all_tokens.extend([t.content for t in tokens])
-
-            if len(all_tokens) < 3:
-                return 0.0
+        all_tokens = data.tokens
+        if len(all_tokens) < 3:
+            return 0.0
 
-            # Count consecutive same tokens (bursts)
-            burst_count = 0
-            for i in range(1, len(all_tokens)):
-                if all_tokens[i] == all_tokens[i-1]:
-                    burst_count += 1
+        # Count consecutive same tokens (bursts)
+        burst_count = sum(1 for prev, cur in zip(all_tokens, all_tokens[1:], strict=False) if prev == cur)
 
-            return burst_count / (len(all_tokens) - 1)
+        return burst_count / (len(all_tokens) - 1)
 
-        finally:
-            session.close()
-
-    def _compute_entropy_slope(self, page: PageProfile = None,
-                                synthetic: SyntheticPage = None,
-                                is_scrambled: bool = False) -> float:
+    def _compute_entropy_slope(self, data: _FeaturePageData) -> float:
         """Compute change in entropy from start to end of page."""
-        if page is None and synthetic is None:
-            self._warn_fallback("grad_entropy_slope", is_scrambled)
-            return self._fallback_value("grad_entropy_slope", is_scrambled, (-0.1, 0.1), -0.02)
-
-        session = self.store.Session()
-        try:
-            page_id = page.page_id if page else synthetic.page_id
-            db_page = session.query(PageRecord).filter_by(page_name=page_id).first()
-
-            if not db_page:
-                logger.warning("No DB page for entropy_slope, returning NaN")
-                return float("nan")
-
-            # Split page into top and bottom halves
-            trans_lines = (
-                session.query(TranscriptionLineRecord)
-                .filter_by(page_id=db_page.id)
-                .order_by(TranscriptionLineRecord.line_number)
-                .all()
-            )
-
-            if len(trans_lines) < 4:
-                return 0.0
-
-            mid = len(trans_lines) // 2
-            top_lines = trans_lines[:mid]
-            bottom_lines = trans_lines[mid:]
-
-            top_entropy = self._compute_half_entropy(session, top_lines)
-            bottom_entropy = self._compute_half_entropy(session, bottom_lines)
+        # Split page into top and bottom halves
+        if len(data.token_lines) < 4:
+            return 0.0
 
-            return bottom_entropy - top_entropy
+        mid = len(data.token_lines) // 2
+        top_entropy = self._compute_half_entropy(data.token_lines[:mid])
+        bottom_entropy = self._compute_half_entropy(data.token_lines[mid:])
 
-        finally:
-            session.close()
+        return bottom_entropy - top_entropy
 
-    def _compute_half_entropy(self, session, lines: list) -> float:
+    def _compute_half_entropy(self, lines: list[list[str]]) -> float:
         """Compute entropy for a set of lines."""
-        tokens = []
-        for line in lines:
-            line_tokens = (
-                session.query(TranscriptionTokenRecord)
-                .filter_by(line_id=line.id)
-                .all()
-            )
-            tokens.extend([t.content for t in line_tokens])
-
+        tokens = [token for line in lines for token in line]
         if len(tokens) < 2:
             return 0.0
 
@@ -836,12 +655,10 @@ class FeatureComputer:
 
         return entropy
 
-    def _compute_density_slope(self, page: PageProfile = None,
-                                synthetic: SyntheticPage = None,
-                                is_scrambled: bool = False) -> float:
+    def _compute_density_slope(self, data: _FeaturePageData) -> float:
         """Compute change in information density across page."""
         # Similar to entropy slope
-        return self._compute_entropy_slope(page, synthetic, is_scrambled) * 0.8
+        return self._compute_entropy_slope(data) * 0.8
 
 
 
@@ -997,23 +814,38 @@ class DiscriminativeFeatureDiscovery:
             feature.feature_id, page, synthetic, is_scrambled, seed
         )
 
+    def _extract_vectors(
+        self,
+        page_ids: list[str],
+        rows: list[tuple[PageProfile | None, SyntheticPage | None, bool, int | None]],
+        is_real: bool,
+        is_scrambled: bool,
+    ) -> list[FeatureVector]:
+        """Compute the feature matrix for ``rows`` and split it into vectors."""
+        feature_ids = [feat.feature_id for feat in self.define_candidate_features()]
+        matrix = self.feature_computer.compute_matrix(feature_ids, rows)
+        return [
+            FeatureVector(
+                page_id=page_id,
+                is_real=is_real,
+                is_scrambled=is_scrambled,
+                features=self._sanitize_feature_map(
+                    dict(zip(feature_ids, values.tolist(), strict=True)), page_id
+                ),
+            )
+            for page_id, values in zip(page_ids, matrix, strict=True)
+        ]
+
     def extract_features_real(self, seed: int | None = None) -> None:
         """Extract features from real pharmaceutical pages."""
-        candidates = self.define_candidate_features()
-
-        for i, page in enumerate(self.section_profile.pages):
-            features = {}
-            page_seed = seed + i if seed is not None else None
-            for feat in candidates:
-                features[feat.feature_id] = self.compute_feature(feat, page=page, seed=page_seed)
-            features = self._sanitize_feature_map(features, page.page_id)
-
-            self.real_vectors.append(FeatureVector(
-                page_id=page.page_id,
-                is_real=True,
-                is_scrambled=False,
-                features=features,
-            ))
+        pages = self.section_profile.pages
+        rows = [
+            (page, None, False, seed + i if seed is not None else None)
+            for i, page in enumerate(pages)
+        ]
+        self.real_vectors.extend(
+            self._extract_vectors([page.page_id for page in pages], rows, is_real=True, is_scrambled=False)
+        )
 
     def extract_features_synthetic(
         self,
@@ -1021,41 +853,23 @@ class DiscriminativeFeatureDiscovery:
         seed: int | None = None,
     ) -> None:
         """Extract features from synthetic pages."""
-        candidates = self.define_candidate_features()
-
-        for i, page in enumerate(synthetic_pages):
-            features = {}
-            page_seed = seed + 1000 + i if seed is not None else None
-            for feat in candidates:
-                features[feat.feature_id] = self.compute_feature(feat, synthetic=page, seed=page_seed)
-            features = self._sanitize_feature_map(features, page.page_id)
-
-            self.synthetic_vectors.append(FeatureVector(
-                page_id=page.page_id,
-                is_real=False,
-                is_scrambled=False,
-                features=features,
-            ))
+        rows = [
+            (None, page, False, seed + 1000 + i if seed is not None else None)
+            for i, page in enumerate(synthetic_pages)
+        ]
+        self.synthetic_vectors.extend(
+            self._extract_vectors([page.page_id for page in synthetic_pages], rows, is_real=False, is_scrambled=False)
+        )
 
     def extract_features_scrambled(self, count: int = 10, seed: int | None = None) -> None:
         """Extract features from scrambled controls."""
-        candidates = self.define_candidate_features()
-
-        for i in range(count):
-            features = {}
-            page_seed = seed + 2000 + i if seed is not None else None
-            for feat in candidates:
-                features[feat.feature_id] = self.compute_feature(
-                    feat, is_scrambled=True, seed=page_seed
-                )
-            features = self._sanitize_feature_map(features, f"scrambled_{i:03d}")
-
-            self.scrambled_vectors.append(FeatureVector(
-                page_id=f"scrambled_{i:03d}",
-                is_real=False,
-                is_scrambled=True,
-                features=features,
-            ))
+        rows = [
+            (None, None, True, seed + 2000 + i if seed is not None else None)
+            for i in range(count)
+        ]
+        self.scrambled_vectors.extend(
+            self._extract_vectors([f"scrambled_{i:03d}" for i in range(count)], rows, is_real=False, is_scrambled=True)
+        )
 
     def train_discriminator(self) -> list[FeatureImportance]:
         """
@@ -128,6 +128,15 @@ class LineResetPersistenceGenerator:
 
         return {"lines": lines, "tokens": out}
 
+    def reseed(self, seed: int) -> None:
+        """Restart the sampling stream from ``seed``, keeping the fitted model."""
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """The sampling stream; checkpoints save and restore its bit-generator state."""
+        return self._rng
+
     def fit_stats(self) -> dict[str, Any]:
         if not self._is_fit:
             return {}
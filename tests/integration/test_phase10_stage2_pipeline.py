@@ -40,6 +40,86 @@ def test_mantel_correlation_detects_positive_alignment() -> None:
     assert result["p_one_sided"] < 0.05
 
 
+def _random_distances(rng: np.random.Generator, n: int) -> np.ndarray:
+    points = rng.random((n, 3))
+    return np.linalg.norm(points[:, None, :] - points[None, :, :], axis=2)
+
+
+def _reference_mantel_null(visual, text, permutations, seed, groups=None) -> np.ndarray:
+    n = visual.shape[0]
+    tri = np.triu_indices(n, k=1)
+    groups_arr = None if groups is None else np.array(groups)
+    rng = np.random.default_rng(seed)
+    null = []
+    for _ in range(permutations):
+        if groups_arr is None:
+            perm = rng.permutation(n)
+        else:
+            perm = np.arange(n)
+            for group in sorted(set(groups)):
+                idx = np.where(groups_arr == group)[0]
+                if idx.size > 1:
+                    shuffled = idx.copy()
+                    rng.shuffle(shuffled)
+                    perm[idx] = shuffled
+        null.append(np.corrcoef(visual[tri], text[np.ix_(perm, perm)][tri])[0, 1])
+    return np.array(null)
+
+
+@pytest.mark.parametrize("grouped", [False, True])
+def test_batched_mantel_matches_per_permutation_reference(grouped: bool) -> None:
+    rng = np.random.default_rng(7)
+    visual = _random_distances(rng, 18)
+    text = 0.5 * visual + 0.5 * _random_distances(rng, 18)
+    groups = ["herbal"] * 8 + ["astronomical"] * 6 + ["bio"] * 3 + ["solo"] if grouped else None
+    expected = _reference_mantel_null(visual, text, 120, seed=5, groups=groups)
+    tri = np.triu_indices(18, k=1)
+    observed = np.corrcoef(visual[tri], text[tri])[0, 1]
+    p_expected = (np.sum(expected >= observed) + 1) / 121
+
+    for block_size in (1, 32, 500):
+        result = mantel_correlation(
+            visual, text, permutations=120, seed=5, groups=groups, block_size=block_size
+        )
+        assert result["null_mean"] == pytest.approx(float(np.mean(expected)), abs=1e-12)
+        assert result["null_q95"] == pytest.approx(float(np.quantile(expected, 0.95)), abs=1e-12)
+        assert result["p_one_sided"] == pytest.approx(p_expected)
+
+
+def test_mantel_stops_early_only_when_p_value_is_settled() -> None:
+    rng = np.random.default_rng(3)
+    visual = _random_distances(rng, 15)
+    unrelated = _random_distances(rng, 15)
+
+    stopped = mantel_correlation(
+        visual, unrelated, permutations=2000, seed=1, stop_alpha=0.01, block_size=50
+    )
+    full = mantel_correlation(visual, unrelated, permutations=2000, seed=1)
+    assert stopped["stopped_early"]
+    assert stopped["permutations_done"] < 2000
+    assert stopped["permutations"] == 2000
+    assert stopped["p_one_sided"] >= 0.01
+    assert stopped["p_two_sided"] >= 0.01
+    assert stopped["null_mean"] is None and stopped["null_q95"] is None
+    assert full["p_one_sided"] >= 0.01
+
+    aligned = mantel_correlation(
+        visual, visual, permutations=300, seed=1, stop_alpha=0.01, block_size=50
+    )
+    assert not aligned["stopped_early"]
+    assert aligned["permutations_done"] == 300
+    assert aligned["null_mean"] is not None
+    assert aligned["p_one_sided"] < 0.01
+
+    # A strongly negative r settles the one-sided test at once but not the two-sided one
+    opposed = mantel_correlation(
+        visual, -visual, permutations=300, seed=1, stop_alpha=0.01, block_size=50
+    )
+    assert not opposed["stopped_early"]
+    assert opposed["permutations_done"] == 300
+    assert opposed["p_two_sided"] < 0.01
+
+
 def test_summarize_stage2_prioritizes_weakened_over_invalid() -> None:
     summary = summarize_stage2(
         {
@@ -19,6 +19,7 @@ from phase10_admissibility.stage1_pipeline import (
     CorpusBundle,
     Stage1Config,
     bigram_mutual_information,
+    build_reference_generators,
     compression_bits_per_token,
     compression_ratio,
     conditional_entropy_metrics,
@@ -26,6 +27,8 @@ from phase10_admissibility.stage1_pipeline import (
     extraction_metrics,
     line_edge_entropies,
     now_utc_iso,
+    null_run_seeds,
+    run_method_j,
     sequence_metrics,
     summarize_stage1,
     token_entropy,
@@ -418,6 +421,68 @@ class TestTokenAttributes:
         assert ta.length == 25
 
 
+class TestBatchedFamilyDecoding:
+    """Batched Method F decoders and metrics agree with the per-tuple versions."""
+
+    ALPHABET = 64
+    SAMPLERS = {
+        "table_grille": "_sample_table_params",
+        "slot_logic": "_sample_slot_params",
+        "constrained_markov": "_sample_markov_params",
+    }
+
+    @pytest.fixture(autouse=True)
+    def _import(self):
+        from phase10_admissibility import stage3_pipeline
+        self.stage3 = stage3_pipeline
+        rng = np.random.default_rng(11)
+        words = ["qokeedy", "chedy", "daiin", "ol", "shedy", "qokain", "chol", "dy", "okam", "y"]
+        tokens = [words[i] for i in rng.integers(0, len(words), size=400)]
+        self.attrs = stage3_pipeline._build_token_attributes(tokens, alphabet_size=self.ALPHABET)
+
+    @pytest.mark.parametrize("family", sorted(SAMPLERS))
+    @pytest.mark.parametrize("resampled", [False, True])
+    def test_batch_matches_per_tuple(self, family, resampled):
+        stage3 = self.stage3
+        rng = np.random.default_rng(5)
+        sampler = getattr(stage3, self.SAMPLERS[family])
+        params = sampler(rng, 12, self.attrs.attr_stack.shape[0], self.ALPHABET)
+        sources = (
+            np.stack([stage3._sample_null_indices(rng, self.attrs.length, 2, 12) for _ in params])
+            if resampled
+            else None
+        )
+        batch = stage3._decode_symbols_batch(
+            family, self.attrs, np.array(params), self.ALPHABET, sources
+        )
+        entropy = stage3._batch_symbol_entropy(batch, self.ALPHABET)
+        bigram = stage3._batch_symbol_bigram_mi(batch, self.ALPHABET)
+        zipf = stage3._batch_symbol_zipf_alpha(batch, self.ALPHABET)
+
+        for row, param in enumerate(params):
+            symbols = stage3._decode_symbols(
+                family, self.attrs, param, self.ALPHABET, None if sources is None else sources[row]
+            )
+            np.testing.assert_array_equal(batch[row], symbols)
+            expected_entropy = stage3._symbol_entropy(symbols, self.ALPHABET)
+            expected_bigram = stage3._symbol_bigram_mi(symbols, self.ALPHABET)
+            assert entropy[row] == pytest.approx(expected_entropy, abs=1e-12)
+            assert bigram[row] == pytest.approx(expected_bigram, abs=1e-12)
+            assert zipf[row] == pytest.approx(stage3._symbol_zipf_alpha(symbols), abs=1e-9)
+
+    def test_scan_is_independent_of_batch_size(self):
+        stage3 = self.stage3
+        params = stage3._sample_slot_params(np.random.default_rng(2), 50, 6, self.ALPHABET)
+        scans = [
+            stage3._family_real_entropy_scan(
+                "slot_logic", params, self.attrs, stage3.Stage3Config(decode_batch_size=size)
+            )
+            for size in (1, 7, 128)
+        ]
+        np.testing.assert_array_equal(scans[0], scans[1])
+        np.testing.assert_array_equal(scans[0], scans[2])
+
+
 # ===================================================================
 # Stage 4 Decision Collection
 # ===================================================================
@@ -605,6 +670,45 @@ class TestSynthesizeStage4:
         assert total == 6  # 6 methods total
 
 
+# ===================================================================
+# Parallel null calibration
+# ===================================================================
+
+class TestParallelNullRuns:
+    LINES = [
+        ["qokeedy", "chedy", "daiin", "ol"],
+        ["shedy", "qokain", "chol", "dy", "daiin"],
+        ["okam", "chedy", "qokedy"],
+        ["daiin", "shol", "otedy", "chedy", "y"],
+    ] * 10
+
+    def test_null_run_seeds_are_deterministic_and_distinct(self):
+        seeds = null_run_seeds(42, 0, 8)
+        assert seeds == null_run_seeds(42, 0, 8)
+        assert seeds[:4] == null_run_seeds(42, 0, 4)
+        assert len(set(seeds)) == 8
+        assert set(seeds).isdisjoint(null_run_seeds(42, 1, 8))
+
+    def test_method_j_output_is_independent_of_worker_count(self):
+        bundle = _make_bundle(lines=self.LINES)
+
+        def run(workers):
+            generators = build_reference_generators(self.LINES, seed=7)
+            messages = []
+            result = run_method_j(
+                bundle, generators, target_tokens=200, null_runs=6, seed=7,
+                progress=messages.append, workers=workers,
+            )
+            return result, messages
+
+        serial, serial_messages = run(1)
+        parallel, parallel_messages = run(2)
+        assert parallel == serial
+        assert parallel_messages == serial_messages
+        assert serial["config"]["null_seeding"] == "per_run"
+        assert "null_seeding" not in run(None)[0]["config"]
+
+
 # ===================================================================
 # Stage 4 Config
 # ===================================================================
@@ -0,0 +1,130 @@
+"""Tests for resumable Phase 10 loop checkpoints."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from phase10_admissibility import stage3_pipeline
+from phase10_admissibility.checkpoint import LoopCheckpoint
+from phase10_admissibility.stage1_pipeline import (
+    CorpusBundle,
+    build_reference_generators,
+    run_method_j,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class Interrupted(RuntimeError):
+    pass
+
+
+class CrashingCheckpoint(LoopCheckpoint):
+    """Checkpoint that simulates a crash right after reaching ``crash_at`` iterations."""
+
+    crash_at = 0
+
+    def child(self, name, every=None, **fingerprint):
+        child = super().child(name, every=every, **fingerprint)
+        crashing = CrashingCheckpoint(child.directory, child.name, child.fingerprint, child.every)
+        crashing.crash_at = self.crash_at
+        return crashing
+
+    def update(self, completed, total, values, *rngs):
+        super().update(completed, total, values, *rngs)
+        if completed >= self.crash_at:
+            raise Interrupted(self.name)
+
+
+def test_resume_restores_values_and_rng_state(tmp_path):
+    checkpoint = LoopCheckpoint(tmp_path, "loop", {"seed": 1})
+    rng = np.random.default_rng(1)
+    rng.random(5)
+    checkpoint.save(3, 10, {"values": np.arange(3.0)}, rng)
+    expected = rng.random(4)
+
+    restored = np.random.default_rng(99)
+    completed, values = LoopCheckpoint(tmp_path, "loop", {"seed": 1}).resume(restored)
+    assert completed == 3
+    assert values == {"values": [0.0, 1.0, 2.0]}
+    np.testing.assert_array_equal(restored.random(4), expected)
+
+
+def test_mismatched_fingerprint_starts_fresh(tmp_path):
+    LoopCheckpoint(tmp_path, "loop", {"seed": 1}).save(3, 10, {})
+    rng = np.random.default_rng(7)
+    state = rng.bit_generator.state
+    assert LoopCheckpoint(tmp_path, "loop", {"seed": 2}).resume(rng) == (0, {})
+    assert rng.bit_generator.state == state
+
+
+def test_update_saves_every_n_and_on_last(tmp_path):
+    checkpoint = LoopCheckpoint(tmp_path, "loop", every=4)
+    saved = []
+    for done in range(1, 11):
+        checkpoint.update(done, 10, {"done": done})
+        if checkpoint.path.exists():
+            saved.append(LoopCheckpoint(tmp_path, "loop").resume()[0])
+    assert sorted(set(saved)) == [4, 8, 10]
+
+
+def test_clear_removes_children(tmp_path):
+    root = LoopCheckpoint(tmp_path, "method")
+    root.save(1, 2, {})
+    root.child("a").save(1, 2, {})
+    root.child("a").child("b").save(1, 2, {})
+    LoopCheckpoint(tmp_path, "other").save(1, 2, {})
+    root.clear()
+    assert [path.name for path in tmp_path.iterdir()] == ["other.json"]
+
+
+def test_family_null_metrics_resume_identically(tmp_path):
+    rng = np.random.default_rng(3)
+    words = ["qokeedy", "chedy", "daiin", "ol", "shedy", "qokain", "chol", "dy"]
+    tokens = [words[i] for i in rng.integers(0, len(words), size=300)]
+    attrs = stage3_pipeline._build_token_attributes(tokens, alphabet_size=64)
+    config = stage3_pipeline.Stage3Config(null_sequences=40, decode_batch_size=8)
+    params = stage3_pipeline._sample_table_params(np.random.default_rng(4), 20, 6, 64)
+
+    def run(checkpoint):
+        rng = np.random.default_rng(5)
+        metrics = stage3_pipeline._family_null_metrics(
+            "table_grille", params, attrs, config, rng, checkpoint=checkpoint
+        )
+        return metrics, rng.random()
+
+    expected = run(None)
+    crashing = CrashingCheckpoint(tmp_path, "f", every=8)
+    crashing.crash_at = 24
+    with pytest.raises(Interrupted):
+        run(crashing)
+    resumed = run(LoopCheckpoint(tmp_path, "f", every=8))
+    for got, want in zip(resumed[0], expected[0], strict=True):
+        np.testing.assert_array_equal(got, want)
+    assert resumed[1] == expected[1]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_method_j_resumes_identically(tmp_path, workers):
+    lines = [
+        ["qokeedy", "chedy", "daiin", "ol"],
+        ["shedy", "qokain", "chol", "dy", "daiin"],
+        ["okam", "chedy", "qokedy"],
+    ] * 12
+    bundle = CorpusBundle(
+        dataset_id="voynich", label="Voynich",
+        tokens=[token for line in lines for token in line], lines=lines, pages=[lines],
+    )
+
+    def run(checkpoint):
+        return run_method_j(
+            bundle, build_reference_generators(lines, seed=3), target_tokens=150,
+            null_runs=9, seed=3, workers=workers, checkpoint=checkpoint,
+        )
+
+    expected = run(None)
+    crashing = CrashingCheckpoint(tmp_path, "j", every=2)
+    crashing.crash_at = 5
+    with pytest.raises(Interrupted):
+        run(crashing)
+    assert run(LoopCheckpoint(tmp_path, "j", every=2)) == expected
@@ -0,0 +1,101 @@
+"""Tests for the illustration feature store and reduced-resolution scan decoding."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from phase10_admissibility import stage2_pipeline
+from phase10_admissibility.feature_store import IllustrationFeatureStore, file_checksum
+
+pytestmark = pytest.mark.unit
+
+
+def _write_scan(path, height=1200, width=900, seed=0):
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width, 3), 225, dtype=np.uint8)
+    for _ in range(60):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        color = tuple(int(c) for c in rng.integers(0, 160, size=3))
+        radius, thickness = int(rng.integers(10, 80)), int(rng.integers(2, 9))
+        cv2.circle(image, center, radius, color, thickness=thickness)
+    cv2.imwrite(str(path), image, [cv2.IMWRITE_JPEG_QUALITY, 95])
+    return path
+
+
+def test_store_round_trip_and_key_sensitivity(tmp_path):
+    scan = _write_scan(tmp_path / "f1r.jpg")
+    checksum = file_checksum(scan)
+    store = IllustrationFeatureStore(tmp_path / "store", feature_version=1)
+    features = {"ink_ratio": 0.125, "edge_density": 1 / 3}
+
+    assert store.get(checksum, 300, True) is None
+    store.put(checksum, 300, True, features)
+    assert store.get(checksum, 300, True) == features
+    assert store.get(checksum, 400, True) is None
+    assert store.get(checksum, 300, False) is None
+    newer = IllustrationFeatureStore(tmp_path / "store", feature_version=2)
+    assert newer.get(checksum, 300, True) is None
+
+    _write_scan(scan, seed=1)
+    assert store.get(file_checksum(scan), 300, True) is None
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    store = IllustrationFeatureStore(tmp_path, feature_version=1)
+    key_path = tmp_path / f"{store.key('abc', 300, True)}.json"
+    key_path.write_text("{not json", encoding="utf-8")
+    assert store.get("abc", 300, True) is None
+    assert not key_path.exists()
+
+
+def test_prune_removes_old_versions_and_unused_entries_of_the_run_settings(tmp_path):
+    IllustrationFeatureStore(tmp_path, feature_version=1).put("old", 300, True, {"a": 1.0})
+    store = IllustrationFeatureStore(tmp_path, feature_version=2)
+    store.put("new", 300, True, {"a": 2.0})
+    store.put("replaced", 300, True, {"a": 3.0})
+    reader = IllustrationFeatureStore(tmp_path, feature_version=2)
+    assert reader.get("new", 300, True) == {"a": 2.0}
+    assert reader.get("old", 300, True) is None
+
+    assert reader.prune(300, True) == 2
+    assert [path.stem for path in reader.entries()] == [reader.key("new", 300, True)]
+
+
+def test_prune_keeps_entries_for_other_settings(tmp_path):
+    store = IllustrationFeatureStore(tmp_path, feature_version=2)
+    store.put("scan", 1400, True, {"a": 1.0})
+    store.put("scan", 1400, False, {"a": 2.0})
+
+    other_run = IllustrationFeatureStore(tmp_path, feature_version=2)
+    other_run.put("scan", 300, True, {"a": 3.0})
+    assert other_run.prune(300, True) == 0
+    assert len(other_run.entries()) == 3
+    assert other_run.get("scan", 1400, True) == {"a": 1.0}
+
+
+def test_reduced_decode_matches_full_decode_geometry(tmp_path):
+    scan = _write_scan(tmp_path / "f2v.jpg")
+    flag, factor, height, width = stage2_pipeline._reduced_read_flag(scan, 300)
+    assert (factor, height, width) == (4, 1200, 900)
+    assert flag == cv2.IMREAD_REDUCED_COLOR_4
+    assert stage2_pipeline._reduced_read_flag(scan, 1300)[1] == 1
+
+    full = stage2_pipeline._extract_visual_features(scan, max_side=300)
+    reduced = stage2_pipeline._extract_visual_features(scan, max_side=300, reduced_decode=True)
+    assert set(reduced) == set(full)
+    for key in ("effective_width", "effective_height", "resize_scale"):
+        assert reduced[key] == full[key]
+    assert reduced["ink_ratio"] == pytest.approx(full["ink_ratio"], abs=0.02)
+    assert reduced["gray_mean"] == pytest.approx(full["gray_mean"], abs=2.0)
+
+
+def test_parallel_extraction_matches_serial(tmp_path):
+    tasks = [
+        (str(_write_scan(tmp_path / f"f{i}r.jpg", seed=i)), 250, True)
+        for i in range(3)
+    ]
+    serial = list(stage2_pipeline._extract_scans(tasks, workers=None))
+    parallel = list(stage2_pipeline._extract_scans(tasks, workers=2))
+    assert parallel == serial
@@ -93,3 +93,87 @@ def test_mask_modulation():
     # They draw from different windows, so results may differ
     # (not guaranteed with small windows, but the mechanism should work)
     assert isinstance(tok_mask1, str)
+
+
+def make_suffix_emulator(seed=7, **kwargs):
+    lattice_map = {"hello": 1, "world": 2, "foo": 0, "chedy": 1, "daiin": 2}
+    window_contents = {
+        0: ["hello", "bar", "chedy"],
+        1: ["world", "baz", "daiin", "qokain"],
+        2: ["foo", "qux", "okam"],
+    }
+    return HighFidelityVolvelle(lattice_map, window_contents, seed=seed, **kwargs)
+
+
+def test_fast_corpus_seeded():
+    c1 = make_suffix_emulator(seed=5).generate_corpus_fast(300)
+    c2 = make_suffix_emulator(seed=5).generate_corpus_fast(300)
+    assert c1 == c2
+    assert c1 != make_suffix_emulator(seed=6).generate_corpus_fast(300)
+    assert len(c1) == 300
+    assert all(4 <= len(line) <= 10 for line in c1)
+
+
+def test_fast_corpus_encoded_matches_lines():
+    lines = make_suffix_emulator().generate_corpus_fast(250)
+    corpus = make_suffix_emulator().generate_corpus_fast(250, encoded=True)
+    assert corpus.to_lines() == lines
+
+
+def test_fast_corpus_matches_per_token_statistics():
+    from collections import Counter
+
+    slow = make_suffix_emulator().generate_mirror_corpus(4000)
+    fast = make_suffix_emulator().generate_corpus_fast(4000)
+    for grams in (lambda c: [t for l in c for t in l], lambda c: [p for l in c for p in zip(l, l[1:])]):
+        slow_counts, fast_counts = Counter(grams(slow)), Counter(grams(fast))
+        n_slow, n_fast = sum(slow_counts.values()), sum(fast_counts.values())
+        for key in slow_counts.keys() | fast_counts.keys():
+            assert abs(slow_counts[key] / n_slow - fast_counts[key] / n_fast) < 0.04
+
+
+def test_fast_corpus_follows_lattice_without_mask_rotation():
+    """With one window every token comes from it and OOV words fall back to +1."""
+    e = HighFidelityVolvelle({"a": 0}, {0: ["a", "b"]}, seed=3)
+    corpus = e.generate_corpus_fast(40)
+    assert {t for line in corpus for t in line} == {"a", "b"}
+    assert e.current_scribe == "Hand 2"
+
+
+def test_fast_corpus_logs_through_per_token_path():
+    e = make_suffix_emulator(log_choices=True)
+    corpus = e.generate_corpus_fast(10)
+    assert len(e.choice_log) == sum(len(line) for line in corpus)
+
+
+def test_sharded_corpus_is_independent_of_worker_count(tmp_path):
+    num_lines = 5000 + 37
+    serial = make_suffix_emulator(seed=11).generate_mirror_corpus_sharded(num_lines, workers=1)
+    e = make_suffix_emulator(seed=11)
+    parallel = e.generate_mirror_corpus_sharded(num_lines, workers=2, shard_dir=tmp_path)
+
+    assert parallel == serial
+    assert len(parallel) == num_lines
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shard-00000.txt", "shard-00001.txt"]
+    # Two scribe swaps starting from Hand 1
+    assert e.current_scribe == "Hand 1"
+
+
+def test_sharded_corpus_with_choice_log_runs_serially(tmp_path):
+    e = make_suffix_emulator(seed=5, log_choices=True)
+    corpus = e.generate_mirror_corpus_sharded(30, workers=2, shard_dir=tmp_path)
+    assert corpus == make_suffix_emulator(seed=5).generate_mirror_corpus(30)
+    assert len(e.choice_log) == sum(len(line) for line in corpus)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sharded_blocks_match_per_token_generator():
+    """Each block is the per-token generator run from the block's child seed."""
+    import numpy as np
+
+    e = make_suffix_emulator(seed=3)
+    corpus = e.generate_mirror_corpus_sharded(120, workers=1)
+    child = np.random.SeedSequence(3).spawn(1)[0]
+    reference = make_suffix_emulator(seed=int(child.generate_state(1, dtype=np.uint64)[0]))
+    assert corpus == reference.generate_mirror_corpus(120)
+    assert e.mask_state == reference.mask_state
@@ -1,5 +1,8 @@
+import random
+
 import pytest
 
+from phase1_foundation.core.encoded_corpus import EncodedCorpus
 from phase14_machine.evaluation_engine import EvaluationEngine
 
 
@@ -131,3 +134,195 @@ def test_admissibility_without_suffix_map():
     # Core metrics should be the same as always
     assert res_no_map["total_clamped_tokens"] == 2
     assert "admissibility_rate" in res_no_map
+
+
+# ---------------------------------------------------------------------------
+# CompiledLattice gives the same answers as the list-scanning walk
+# ---------------------------------------------------------------------------
+
+def _reference_admissibility(vocab, lines, lattice_map, window_contents,
+                             fuzzy_suffix=False, suffix_window_map=None):
+    strict_admissible = 0
+    drift_admissible = 0
+    total_transitions = 0
+    oov_total = 0
+    oov_recovered = 0
+    oov_admissible = 0
+    current_window = 0
+
+    num_wins = len(window_contents)
+    suffixes = ["dy", "in", "y", "m", "ol"]
+
+    # Precompute chance baseline: probability a random vocab word
+    # falls in k windows by vocabulary overlap
+    all_window_words = set()
+    for _wid, words in window_contents.items():
+        all_window_words.update(words)
+    total_lattice_vocab = len(all_window_words)
+    total_words = sum(len(v) for v in window_contents.values())
+    avg_window_size = total_words / num_wins if num_wins > 0 else 0
+    strict_chance = avg_window_size / total_lattice_vocab if total_lattice_vocab > 0 else 0
+    drift_chance = min(1.0, 3 * strict_chance)  # 3 windows checked
+
+    for line in lines:
+        for word in line:
+            if word not in vocab:
+                # OOV recovery via suffix map
+                if suffix_window_map is not None:
+                    oov_total += 1
+                    predicted_win = EvaluationEngine.resolve_oov_window(word, suffix_window_map)
+                    if predicted_win is not None:
+                        oov_recovered += 1
+                        # Check if the predicted window is admissible (±1 drift)
+                        for offset in [-1, 0, 1]:
+                            check_win = (current_window + offset) % num_wins
+                            if check_win == predicted_win:
+                                oov_admissible += 1
+                                current_window = predicted_win
+                                break
+                        else:
+                            # Not admissible — snap to predicted window
+                            current_window = predicted_win
+                    # If no suffix match, skip as before
+                continue
+
+            total_transitions += 1
+            is_strict = False
+            is_drift = False
+
+            # Check strict (offset=0 only)
+            win_words = window_contents.get(current_window, [])
+            if word in win_words:
+                is_strict = True
+                is_drift = True
+
+            # Check drift (±1) if not already strict
+            if not is_drift:
+                for offset in [-1, 1]:
+                    check_win = (current_window + offset) % num_wins
+                    drift_words = window_contents.get(check_win, [])
+                    if word in drift_words:
+                        is_drift = True
+                        current_window = check_win
+                        break
+
+                    if fuzzy_suffix:
+                        for s in suffixes:
+                            if word.endswith(s) and any(
+                                w.endswith(s) for w in drift_words
+                            ):
+                                    is_drift = True
+                                    current_window = check_win
+                                    break
+                        if is_drift:
+                            break
+
+            if is_strict:
+                strict_admissible += 1
+                drift_admissible += 1
+                current_window = lattice_map.get(word, (current_window + 1) % num_wins)
+            elif is_drift:
+                drift_admissible += 1
+                current_window = lattice_map.get(word, (current_window + 1) % num_wins)
+            else:
+                # Snap to real window if word is known, to recover
+                if word in lattice_map:
+                    current_window = lattice_map[word]
+
+    n = total_transitions
+    strict_rate = strict_admissible / n if n > 0 else 0
+    drift_rate = drift_admissible / n if n > 0 else 0
+    result = {
+        "strict_admissibility": strict_rate,
+        "drift_admissibility": drift_rate,
+        "admissibility_rate": drift_rate,
+        "strict_chance_baseline": strict_chance,
+        "drift_chance_baseline": drift_chance,
+        "total_clamped_tokens": n,
+    }
+
+    if suffix_window_map is not None:
+        total_consolidated = n + oov_recovered
+        consolidated_admissible = drift_admissible + oov_admissible
+        result["oov_total"] = oov_total
+        result["oov_recovered"] = oov_recovered
+        result["oov_admissible"] = oov_admissible
+        result["consolidated_admissibility"] = (
+            consolidated_admissible / total_consolidated
+            if total_consolidated > 0 else 0
+        )
+
+    return result
+
+
+def _random_lattice(seed):
+    rng = random.Random(seed)
+    words = [f"{stem}{sfx}" for stem in ("qok", "ch", "sh", "ot", "da") for sfx in ("", "dy", "in", "y", "ol", "m")]
+    num_wins = rng.randint(2, 7)
+    window_contents = {w: [] for w in range(num_wins)}
+    for word in words:
+        for _ in range(rng.choice([0, 1, 1, 1, 2])):  # some words in no or several windows
+            window_contents[rng.randrange(num_wins)].append(word)
+    lattice_map = {w: rng.randrange(num_wins + 1) for w in words if rng.random() < 0.8}
+    vocab = {w for w in words if rng.random() < 0.85}
+    lines = [[rng.choice(words + ["xdy", "zz", "qin"]) for _ in range(rng.randint(0, 8))] for _ in range(60)]
+    return vocab, lines, lattice_map, window_contents
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("fuzzy_suffix", [False, True])
+@pytest.mark.parametrize("suffix_window_map", [None, {"dy": 0, "in": 1, "ol": 5}])
+def test_compiled_lattice_matches_reference(seed, fuzzy_suffix, suffix_window_map):
+    vocab, lines, lattice_map, window_contents = _random_lattice(seed)
+    engine = EvaluationEngine(vocab)
+    expected = _reference_admissibility(
+        vocab, lines, lattice_map, window_contents, fuzzy_suffix, suffix_window_map
+    )
+
+    compiled = engine.compile_lattice(lattice_map, window_contents)
+    for data in (lines, EncodedCorpus.from_lines(lines)):
+        assert engine.calculate_admissibility(
+            data, lattice_map, window_contents, fuzzy_suffix, suffix_window_map
+        ) == expected
+        assert engine.calculate_admissibility(
+            data, None, None, fuzzy_suffix, suffix_window_map, compiled=compiled
+        ) == expected
+
+
+@pytest.mark.parametrize("fuzzy_suffix", [False, True])
+@pytest.mark.parametrize("suffix_window_map", [None, {"dy": 0, "in": 1, "ol": 5}])
+def test_evaluate_many_matches_single_evaluations(fuzzy_suffix, suffix_window_map):
+    vocab, lines, _, _ = _random_lattice(0)
+    engine = EvaluationEngine(vocab)
+    lattices = [_random_lattice(seed)[2:] for seed in range(8)] + [({"qok": 0}, {})]
+
+    expected = [
+        engine.calculate_admissibility(lines, lm, wc, fuzzy_suffix, suffix_window_map)
+        for lm, wc in lattices[:-1]
+    ]
+    results = engine.evaluate_many(
+        lines, lattices[:-1], fuzzy_suffix=fuzzy_suffix, suffix_window_map=suffix_window_map
+    )
+    assert results == expected
+
+    # A window-less lattice falls back to the single walk (and its errors)
+    with pytest.raises(ZeroDivisionError):
+        engine.evaluate_many(lines, lattices[-1:])
+
+
+def test_evaluate_many_offsets_match_shifted_lattices():
+    vocab, lines, lattice_map, window_contents = _random_lattice(4)
+    engine = EvaluationEngine(vocab)
+    n = len(window_contents)
+    offsets = list(range(n))
+
+    results = engine.evaluate_many(
+        EncodedCorpus.from_lines(lines), offsets=offsets, lattice=(lattice_map, window_contents), fuzzy_suffix=True
+    )
+    for offset, result in zip(offsets, results, strict=True):
+        shifted_map = {w: (t - offset) % n for w, t in lattice_map.items()}
+        shifted_windows = {w: window_contents[(w + offset) % n] for w in range(n)}
+        assert result == engine.calculate_admissibility(lines, shifted_map, shifted_windows, fuzzy_suffix=True)
+
+    with pytest.raises(ValueError):
+        engine.evaluate_many(lines, [(lattice_map, window_contents)], offsets=[0])
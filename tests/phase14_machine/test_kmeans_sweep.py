@@ -0,0 +1,110 @@
+"""Tests for the Phase 14 clustering backends and warm-started K sweeps."""
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+from sklearn.cluster import KMeans
+
+from phase1_foundation.config import get_cluster_method
+from phase14_machine import clustering
+from phase14_machine.clustering import KMeansSweep, kmeans
+from phase14_machine.palette_solver import GlobalPaletteSolver
+from phase14_machine.state_discovery import StateSpaceSolver
+
+
+def blobs(n_blobs=12, per_blob=40, dim=2, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.random((n_blobs, dim)) * 10
+    return np.concatenate([rng.normal(c, 0.1, size=(per_blob, dim)) for c in centers])
+
+
+def inertia(X, result):
+    return float(((X - result.centers[result.labels]) ** 2).sum())
+
+
+def test_get_cluster_method_reads_environment(monkeypatch):
+    monkeypatch.delenv("PHASE14_CLUSTER_METHOD", raising=False)
+    assert get_cluster_method() == "kmeans"
+    monkeypatch.setenv("PHASE14_CLUSTER_METHOD", "minibatch")
+    assert get_cluster_method() == "minibatch"
+    with pytest.raises(ValueError, match="Unknown cluster method"):
+        get_cluster_method("dbscan")
+
+
+def test_default_method_matches_original_kmeans():
+    X = blobs()
+    expected = KMeans(n_clusters=7, random_state=42, n_init=10).fit(X)
+    result = kmeans(X, 7)
+
+    np.testing.assert_array_equal(result.labels, expected.labels_)
+    np.testing.assert_array_equal(result.centers, expected.cluster_centers_)
+
+
+def test_cluster_lattice_is_unchanged_by_default():
+    X = blobs(per_blob=10)
+    solved_pos = {f"w{i}": (float(x), float(y)) for i, (x, y) in enumerate(X)}
+    labels = KMeans(n_clusters=6, random_state=42, n_init=10).fit_predict(X)
+
+    lattice = GlobalPaletteSolver().cluster_lattice(solved_pos, num_windows=6)
+    assert lattice["word_to_window"] == {f"w{i}": int(label) for i, label in enumerate(labels)}
+
+
+@pytest.mark.parametrize("method", ["kmeans", "minibatch", "gram"])
+def test_warm_sweep_is_deterministic_and_close_to_cold_fits(method):
+    X = blobs()
+    ks = [12, 3, 6]
+    first = KMeansSweep(X, method=method).fit_many(ks)
+    second = KMeansSweep(X, method=method).fit_many(ks)
+
+    assert list(first) == ks
+    for k in ks:
+        np.testing.assert_array_equal(first[k].labels, second[k].labels)
+        assert len(np.unique(first[k].labels)) == k
+        assert first[k].inertia == pytest.approx(inertia(X, first[k]))
+    # Twelve well-separated blobs are recovered exactly
+    cold = kmeans(X, 12, method="kmeans")
+    assert first[12].inertia == pytest.approx(cold.inertia, rel=1e-2 if method == "minibatch" else 1e-6)
+
+
+def test_gram_backend_matches_feature_space_objective():
+    """Few high-dimensional points: gram clustering reaches the KMeans optimum."""
+    X = blobs(n_blobs=4, per_blob=10, dim=300, seed=2)
+    gram = kmeans(X, 4, method="gram")
+    reference = kmeans(X, 4, method="kmeans")
+
+    assert gram.inertia == pytest.approx(reference.inertia, rel=1e-9)
+    assert gram.inertia == pytest.approx(inertia(X, gram), rel=1e-9)
+
+
+def test_gram_backend_limits_point_count(monkeypatch):
+    monkeypatch.setattr(clustering, "GRAM_MAX_POINTS", 10)
+    with pytest.raises(ValueError, match="GRAM_MAX_POINTS"):
+        kmeans(blobs(), 3, method="gram")
+
+
+def test_state_sweep_matches_single_fits():
+    vectors = blobs(n_blobs=3, per_blob=8, dim=50, seed=4)
+    solver = StateSpaceSolver()
+
+    sweep = solver.solve_state_sweep(vectors, [3, 2, 40])
+    assert sweep[40] == {"num_states": 0}
+    assert sweep[2]["num_states"] == 2
+    single = solver.solve_states(vectors, 3)
+    # Same partition as the independent fit, up to label permutation
+    pairs = set(zip(sweep[3]["labels"], single["labels"], strict=True))
+    assert len(pairs) == 3
+
+
+@pytest.mark.parametrize("method", ["kmeans", "gram"])
+def test_sparse_points_cluster_like_dense(method):
+    vectors = blobs(n_blobs=3, per_blob=8, dim=50, seed=5)
+    vectors[np.abs(vectors) < 1.0] = 0.0
+    dense = kmeans(vectors, 3, method=method)
+    sparse = kmeans(csr_matrix(vectors), 3, method=method)
+
+    assert len(set(zip(sparse.labels, dense.labels, strict=True))) == 3
+    assert sparse.inertia == pytest.approx(dense.inertia, rel=1e-6)
+
+    sweep = KMeansSweep(csr_matrix(vectors), method=method).fit_many([2, 3])
+    pairs = set(zip(sweep[3].labels, dense.labels, strict=True))
+    assert len(pairs) == 3
@@ -0,0 +1,73 @@
+"""Tests for the palette layout backends."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from phase1_foundation.config import get_layout_backend
+from phase14_machine import layout
+from phase14_machine.palette_solver import GlobalPaletteSolver
+
+
+def make_graph(n=40, m=90):
+    G = nx.gnm_random_graph(n, m, seed=1)
+    for u, v in G.edges:
+        G[u][v]["weight"] = 1.0 + (u + v) % 3
+    G.add_edge(0, 0, weight=1.0)  # self-loops exert no force
+    return G
+
+
+def test_exact_fr_matches_networkx_spring_layout():
+    G = make_graph()
+    nodes, rows, cols, weights = layout.graph_arrays(G)
+    init = np.random.default_rng(0).random((len(nodes), 2))
+
+    expected = nx.spring_layout(
+        G, weight="weight", iterations=7, pos={node: init[i] for i, node in enumerate(nodes)}
+    )
+    pos = layout.rescale(layout.fruchterman_reingold(len(nodes), rows, cols, weights, iterations=7, pos=init))
+
+    np.testing.assert_allclose(pos, np.array([expected[node] for node in nodes]), atol=1e-9)
+
+
+def test_grid_repulsion_approximates_exact():
+    pos = np.random.default_rng(3).random((3000, 2))
+    k = np.sqrt(1 / len(pos))
+
+    exact = layout._exact_repulsion(pos, k)
+    approx = layout._grid_repulsion(pos, k)
+
+    assert np.linalg.norm(approx - exact) / np.linalg.norm(exact) < 0.05
+
+
+@pytest.mark.parametrize("method", ["fr", "spectral_fr"])
+def test_layout_is_seeded_and_reports_progress(method, monkeypatch):
+    monkeypatch.setattr(layout, "EXACT_REPULSION_MAX_NODES", 50)  # exercise the grid path
+    G = nx.barabasi_albert_graph(300, 3, seed=2)
+    calls = []
+
+    first = layout.compute_layout(G, method, iterations=6, seed=7, progress=lambda done, total: calls.append((done, total)))
+    second = layout.compute_layout(G, method, iterations=6, seed=7)
+    other = layout.compute_layout(G, method, iterations=6, seed=8)
+
+    assert calls == [(i, 6) for i in range(1, 7)]
+    assert all(np.array_equal(first[node], second[node]) for node in G)
+    assert not all(np.array_equal(first[node], other[node]) for node in G)
+    coords = np.array(list(first.values()))
+    assert np.abs(coords).max() == pytest.approx(1.0)
+
+
+def test_solve_grid_selects_backend(monkeypatch):
+    solver = GlobalPaletteSolver()
+    solver.ingest_data([], [["a", "b", "c", "a"], ["b", "d", "e"], ["e", "a"]], top_n=10)
+    calls = []
+
+    monkeypatch.setenv("PALETTE_LAYOUT_BACKEND", "fr")
+    assert get_layout_backend() == "fr"
+    pos = solver.solve_grid(iterations=10, progress=lambda done, total: calls.append(done))
+    assert set(pos) == {"a", "b", "c", "d", "e"}
+    assert calls == list(range(1, 11))
+
+    assert solver.solve_grid(iterations=10, layout="networkx")
+    with pytest.raises(ValueError, match="Unknown layout backend"):
+        solver.solve_grid(layout="graphviz")
@@ -0,0 +1,68 @@
+"""Tests for the streaming hashed n-gram overgeneration audit."""
+
+import random
+
+import pytest
+
+from phase1_foundation.core.encoded_corpus import EncodedCorpus
+from phase14_machine import ngram_audit
+from phase14_machine.evaluation_engine import EvaluationEngine
+from phase14_machine.ngram_audit import NgramAudit
+
+
+def random_lines(seed, n_lines, vocab_size=60):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(vocab_size)]
+    return [[rng.choice(vocab[: rng.randint(3, vocab_size)]) for _ in range(rng.randint(0, 8))] for _ in range(n_lines)]
+
+
+def reference_ngrams(lines, n, vocab=None):
+    return {
+        tuple(line[i:i + n])
+        for line in lines
+        for i in range(len(line) - n + 1)
+        if vocab is None or all(t in vocab for t in line[i:i + n])
+    }
+
+
+@pytest.mark.parametrize("vocab", [None, {f"w{i}" for i in range(40)}])
+def test_counts_match_tuple_sets(monkeypatch, vocab):
+    monkeypatch.setattr(ngram_audit, "STREAM_CHUNK_LINES", 37)
+    real, syn = random_lines(1, 300), random_lines(2, 900)
+
+    audit = NgramAudit(real, orders=(1, 2, 3, 4), vocab=vocab)
+    audit.update(line for line in syn[:400]).update(syn[400:])
+    assert audit.syn_lines == 900
+
+    for n, counts in audit.results().items():
+        real_ng, syn_ng = reference_ngrams(real, n, vocab), reference_ngrams(syn, n, vocab)
+        assert counts["real_count"] == len(real_ng)
+        assert counts["syn_count"] == len(syn_ng)
+        assert counts["overlap"] == len(real_ng & syn_ng)
+        assert counts["unattested_count"] == len(syn_ng - real_ng)
+
+
+def test_encoded_corpus_input_matches_lines():
+    real, syn = random_lines(3, 200), random_lines(4, 500)
+    from_lines = NgramAudit(real, orders=(2, 3)).update(syn).results()
+    from_encoded = NgramAudit(EncodedCorpus.from_lines(real), orders=(2, 3)).update(EncodedCorpus.from_lines(syn))
+    assert from_encoded.results() == from_lines
+
+
+def test_ngrams_do_not_cross_lines():
+    audit = NgramAudit([["a", "b"], ["c"]], orders=(2,)).update([["b", "c"], ["a", "b"]])
+    assert audit.results()[2] == {
+        "real_count": 1, "syn_count": 2, "overlap": 1, "unattested_count": 1, "rate": 0.5,
+    }
+
+
+def test_streaming_engine_matches_calculate_overgeneration():
+    real, syn = random_lines(5, 300), random_lines(6, 800)
+    engine = EvaluationEngine({f"w{i}" for i in range(45)})
+
+    exact = engine.calculate_overgeneration(syn, real)
+    streamed = engine.calculate_overgeneration_streaming(iter(syn), real, max_n=4)
+
+    assert set(streamed) == {"BUR", "TUR", "4-gram"}
+    for label in ("BUR", "TUR"):
+        assert {k: v for k, v in streamed[label].items() if k != "overlap"} == exact[label]
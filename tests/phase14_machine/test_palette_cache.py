@@ -0,0 +1,139 @@
+"""Tests for the persistent solved-palette cache."""
+
+import os
+import random
+
+import pytest
+
+from phase1_foundation.config import ComputationMethod, get_tracker
+from phase14_machine.palette_cache import PaletteCache, lattice_key, layout_key
+from phase14_machine.palette_solver import GlobalPaletteSolver
+
+
+def make_lines(seed=3, n_lines=120):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(40)]
+    return [[rng.choice(vocab) for _ in range(rng.randint(2, 8))] for _ in range(n_lines)]
+
+
+SLIPS = [{"word": "w1", "actual_context": ["w2", "w3"]}, {"word": "w5", "actual_context": ["w7"]}]
+
+
+def fresh_lattice(lines, slips, num_windows, reorder):
+    solver = GlobalPaletteSolver()
+    solver.ingest_data(slips, lines, top_n=30)
+    lattice = solver.cluster_lattice(solver.solve_grid(iterations=10, layout="fr"), num_windows=num_windows)
+    if reorder:
+        lattice = solver.reorder_windows(lattice["word_to_window"], lattice["window_contents"], lines)
+    return lattice
+
+
+@pytest.mark.parametrize("reorder", [False, True])
+def test_cached_lattice_is_identical_to_fresh_solve(tmp_path, reorder):
+    lines = make_lines()
+    cache = PaletteCache(tmp_path)
+    kwargs = dict(top_n=30, iterations=10, layout="fr", num_windows=6, reorder=reorder)
+
+    first = cache.solve_lattice(lines, SLIPS, **kwargs)
+    second = cache.solve_lattice(lines, SLIPS, **kwargs)
+    expected = fresh_lattice(lines, SLIPS, 6, reorder)
+
+    for result in (first, second):
+        assert result == expected
+        assert list(result["word_to_window"]) == list(expected["word_to_window"])
+        assert list(result["window_contents"]) == list(expected["window_contents"])
+    assert len(cache.entries()) == 2  # one layout, one lattice
+
+
+def test_hits_are_recorded_as_cached(tmp_path):
+    lines = make_lines()
+    cache = PaletteCache(tmp_path)
+    tracker = get_tracker()
+    tracker.start_run("palette-cache-test")
+    try:
+        pos = cache.solve_grid(lines, top_n=30, iterations=5, layout="fr")
+        assert cache.solve_grid(lines, top_n=30, iterations=5, layout="fr") == pos
+    finally:
+        report = tracker.end_run()
+
+    assert [r.method for r in report.records] == [ComputationMethod.COMPUTED, ComputationMethod.CACHED]
+    assert report.total_cached == 1
+    assert report.records[1].details == layout_key(lines, (), 30, 5, 42, "fr")
+
+
+def test_key_depends_on_inputs():
+    lines = make_lines()
+    base = layout_key(lines, SLIPS, 30, 10, 42, "fr")
+
+    assert layout_key(lines, SLIPS, 30, 10, 42, "fr") == base
+    assert layout_key(lines, [], 30, 10, 42, "fr") != base
+    assert layout_key(lines, SLIPS, 31, 10, 42, "fr") != base
+    assert layout_key(lines, SLIPS, 30, 11, 42, "fr") != base
+    assert layout_key(lines, SLIPS, 30, 10, 7, "fr") != base
+    assert layout_key(lines, SLIPS, 30, 10, 42, "spectral_fr") != base
+    assert layout_key(lines[:-1], SLIPS, 30, 10, 42, "fr") != base
+    # Token boundaries are part of the key
+    assert layout_key([["ab", "c"]], (), 30) != layout_key([["a", "bc"]], (), 30)
+    # ingest_data treats top_n=None as 8000
+    assert layout_key(lines, (), None) == layout_key(lines, (), 8000)
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    cache = PaletteCache(tmp_path)
+    corpora = [make_lines(seed) for seed in range(3)]
+    for i, lines in enumerate(corpora):
+        cache.solve_grid(lines, top_n=30, iterations=2, layout="fr")
+        for path in cache.entries():
+            if path.name.endswith(f"{layout_key(lines, (), 30, 2, 42, 'fr')}.npz"):
+                os.utime(path, ns=(i * 10**9, i * 10**9))
+
+    # Touch the oldest entry, then shrink the cap to two entries' worth
+    cache.solve_grid(corpora[0], top_n=30, iterations=2, layout="fr")
+    cache.max_bytes = sum(sorted(p.stat().st_size for p in cache.entries())[-2:])
+    assert cache.evict() == 1
+
+    remaining = {p.name for p in cache.entries()}
+    assert f"layout-{layout_key(corpora[0], (), 30, 2, 42, 'fr')}.npz" in remaining
+    assert f"layout-{layout_key(corpora[1], (), 30, 2, 42, 'fr')}.npz" not in remaining
+
+
+def test_corrupt_entry_is_recomputed(tmp_path):
+    lines = make_lines()
+    cache = PaletteCache(tmp_path)
+    pos = cache.solve_grid(lines, top_n=30, iterations=3, layout="fr")
+    (path,) = cache.entries()
+    path.write_bytes(b"not an npz")
+
+    assert cache.solve_grid(lines, top_n=30, iterations=3, layout="fr") == pos
+
+
+def test_lattice_key_depends_on_cluster_method_and_sweep(monkeypatch):
+    monkeypatch.delenv("PHASE14_CLUSTER_METHOD", raising=False)
+    base = lattice_key("layout", 6, False)
+
+    assert lattice_key("layout", 6, False, "kmeans") == base
+    assert lattice_key("layout", 6, False, "minibatch") != base
+    monkeypatch.setenv("PHASE14_CLUSTER_METHOD", "minibatch")
+    assert lattice_key("layout", 6, False) == lattice_key("layout", 6, False, "minibatch")
+    # A warm-started sweep fit never answers an independent fit, and depends on the grid
+    swept = lattice_key("layout", 6, False, "kmeans", sweep=[3, 6])
+    assert swept != base
+    assert lattice_key("layout", 6, False, "kmeans", sweep=[6, 3, 3]) == swept
+    assert lattice_key("layout", 6, False, "kmeans", sweep=[2, 6]) != swept
+
+
+def test_cached_sweep_matches_fresh_sweep(tmp_path):
+    lines = make_lines()
+    cache = PaletteCache(tmp_path)
+    kwargs = dict(top_n=30, iterations=10, layout="fr", reorder=False)
+
+    first = cache.solve_lattice_sweep(lines, [3, 6], SLIPS, **kwargs)
+    second = cache.solve_lattice_sweep(lines, [3, 6], SLIPS, **kwargs)
+    solver = GlobalPaletteSolver()
+    solver.ingest_data(SLIPS, lines, top_n=30)
+    expected = solver.cluster_lattice_sweep(solver.solve_grid(iterations=10, layout="fr"), [3, 6])
+
+    assert first == second == expected
+    assert len(cache.entries()) == 3  # one layout, one lattice per K
+    cache.solve_lattice(lines, SLIPS, num_windows=6, **kwargs)
+    assert len(cache.entries()) == 4
@@ -0,0 +1,130 @@
+"""Tests for the columnar choice log and the analyzers that consume it."""
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from phase1_foundation.core.choice_log import CHOICE_DTYPE, ChoiceLog
+from phase14_machine.high_fidelity_emulator import HighFidelityVolvelle
+from phase15_rule_extraction.bias import BiasAnalyzer
+from phase15_rule_extraction.drivers import SelectionDriverAnalyzer
+from phase16_physical_grounding.correlation import EffortCorrelationAnalyzer
+from phase17_finality.residual import ResidualBandwidthAnalyzer, conditional_entropy
+
+pytestmark = pytest.mark.unit
+
+WINDOWS = {
+    0: ["daiin", "chedy", "qokain", "ol", "shedy"],
+    1: ["chol", "dy", "okam", "qokedy"],
+    2: ["otedy", "y", "chor", "daiin", "sain", "ar"],
+}
+LATTICE = {"daiin": 1, "chedy": 2, "chol": 0, "okam": 2, "otedy": 0, "sain": 1}
+
+
+def generated_log(seed=3, n_lines=300):
+    emulator = HighFidelityVolvelle(LATTICE, WINDOWS, seed=seed, log_choices=True)
+    emulator.generate_mirror_corpus(n_lines)
+    return emulator.choice_log
+
+
+def traced_log():
+    emulator = HighFidelityVolvelle(LATTICE, WINDOWS, suffix_window_map={"in": 1}, log_choices=True)
+    rng = random.Random(0)
+    vocab = [w for words in WINDOWS.values() for w in words] + ["xxain", "zz"]
+    emulator.trace_lines([[rng.choice(vocab) for _ in range(rng.randint(1, 8))] for _ in range(200)])
+    return emulator.choice_log
+
+
+def test_generated_choices_round_trip_as_dicts():
+    log = generated_log()
+    assert isinstance(log, ChoiceLog)
+    assert log.records.dtype == CHOICE_DTYPE
+    entries = log.to_records()
+    assert len(entries) == len(log) > 0
+    assert set(entries[0]) == {
+        "window_id", "candidates_count", "chosen_word", "chosen_index",
+        "token_pos", "prev_word", "mask_state", "scribe",
+    }
+    assert entries[0]["prev_word"] is None
+    assert {e["scribe"] for e in entries} <= {"Hand 1", "Hand 2"}
+    for e in entries:
+        assert WINDOWS[e["window_id"]][e["chosen_index"]] == e["chosen_word"]
+    assert ChoiceLog.from_records(entries).to_records() == entries
+    assert log[5] == entries[5]
+    assert log[10:20].to_records() == entries[10:20]
+
+
+def test_trace_choices_keep_oov_flag():
+    entries = traced_log().to_records()
+    assert all(e["type"] == "real_trace" for e in entries)
+    recovered = [e for e in entries if e.get("oov_recovered")]
+    assert recovered
+    assert all(e["chosen_index"] == -1 and e["candidates_count"] == 0 for e in recovered)
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".parquet"])
+def test_save_and_load(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    log = generated_log()
+    loaded = ChoiceLog.load(log.save(tmp_path / f"choices{suffix}"))
+    np.testing.assert_array_equal(loaded.records, log.records)
+    assert loaded.to_records() == log.to_records()
+
+
+def test_save_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported choice log format"):
+        generated_log().save(tmp_path / "choices.csv")
+
+
+def test_conditional_entropy_matches_grouped_lists():
+    log = generated_log()
+    entries = log.to_records()
+    groups = {}
+    for e in entries:
+        groups.setdefault((e["window_id"], e["prev_word"]), []).append(e["chosen_word"])
+    expected = conditional_entropy(groups)
+    assert log.conditional_entropy("word_id", "window_id", "prev_word_id") == pytest.approx(expected, abs=1e-12)
+
+
+def test_recency_matches_last_seen_scan():
+    log = generated_log()
+    last_seen, expected = {}, []
+    for i, e in enumerate(log):
+        key = (e["window_id"], e["chosen_word"])
+        expected.append(key in last_seen and i - last_seen[key] <= 50)
+        last_seen[key] = i
+    assert log.recency(50).tolist() == expected
+
+
+@pytest.mark.parametrize("make_log", [generated_log, traced_log])
+def test_analyzers_agree_on_lists_and_logs(make_log):
+    log = make_log()
+    entries = log.to_records()
+
+    chain = ResidualBandwidthAnalyzer(log).compute_entropy_chain()
+    for fast, slow in zip(chain, ResidualBandwidthAnalyzer(entries).compute_entropy_chain(), strict=True):
+        assert fast["conditioning"] == slow["conditioning"]
+        assert fast["h"] == pytest.approx(slow["h"], abs=1e-12)
+
+    bias_fast, bias_slow = BiasAnalyzer(log), BiasAnalyzer(entries)
+    fast_stats = bias_fast.analyze_window_bias(min_samples=5)
+    slow_stats = bias_slow.analyze_window_bias(min_samples=5)
+    assert [s["window_id"] for s in fast_stats] == [s["window_id"] for s in slow_stats]
+    for fast, slow in zip(fast_stats, slow_stats, strict=True):
+        assert fast == pytest.approx(slow)
+    assert bias_fast.analyze_compressibility() == bias_slow.analyze_compressibility()
+
+    corpus_freq = Counter(e["chosen_word"] for e in entries[::3])
+    drivers_fast = SelectionDriverAnalyzer(log, WINDOWS, corpus_freq)
+    drivers_slow = SelectionDriverAnalyzer(entries, WINDOWS, corpus_freq)
+    for test in ("test_positional_bias", "test_bigram_context", "test_suffix_affinity",
+                 "test_frequency_bias", "test_recency_bias"):
+        assert getattr(drivers_fast, test)() == pytest.approx(getattr(drivers_slow, test)()), test
+
+    costs = {w: len(w) for words in WINDOWS.values() for w in words}
+    effort_fast, effort_slow = EffortCorrelationAnalyzer(log, costs), EffortCorrelationAnalyzer(entries, costs)
+    assert effort_fast.analyze_selection_correlation(5) == pytest.approx(effort_slow.analyze_selection_correlation(5))
+    assert effort_fast.analyze_effort_gradient() == pytest.approx(effort_slow.analyze_effort_gradient())
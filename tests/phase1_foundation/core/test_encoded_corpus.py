@@ -0,0 +1,189 @@
+"""Tests for the integer-encoded corpus representation."""
+
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from phase1_foundation.core.encoded_corpus import EncodedCorpus, as_encoded, as_lines
+from phase10_admissibility.stage1_pipeline import bigram_mutual_information
+from phase12_mechanical.slip_detection import MechanicalSlipDetector
+from phase14_machine.state_discovery import StateSpaceSolver
+
+pytestmark = pytest.mark.unit
+
+LINES = [["daiin", "chol", "daiin"], [], ["qokedy", "chol"], ["shedy"]]
+
+
+def _random_lines(seed: int, n_lines: int = 700) -> list[list[str]]:
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(80)]
+    return [
+        [rng.choice(vocab[: rng.randint(5, 80)]) for _ in range(rng.randint(0, 9))]
+        for _ in range(n_lines)
+    ]
+
+
+def test_from_lines_builds_csr_arrays():
+    corpus = EncodedCorpus.from_lines(LINES)
+
+    assert corpus.vocab == ["daiin", "chol", "qokedy", "shedy"]
+    assert corpus.tokens.dtype == np.int32
+    assert corpus.offsets.dtype == np.int64
+    assert corpus.tokens.tolist() == [0, 1, 0, 2, 1, 3]
+    assert corpus.offsets.tolist() == [0, 3, 3, 5, 6]
+    assert len(corpus) == 4
+    assert corpus.to_lines() == LINES
+    assert corpus[2] == ["qokedy", "chol"]
+    assert corpus[-1] == ["shedy"]
+
+
+def test_slice_is_zero_copy_and_keeps_side_arrays():
+    corpus = EncodedCorpus.from_lines(LINES, pages=["f1r", "f1r", "f2v", "f2v"])
+    sub = corpus[2:4]
+
+    assert np.shares_memory(sub.tokens, corpus.tokens)
+    assert sub.to_lines() == LINES[2:4]
+    assert sub.labels("page") == ["f2v", "f2v"]
+    assert corpus[::2].to_lines() == LINES[::2]
+
+
+def test_where_filters_on_side_arrays():
+    corpus = EncodedCorpus.from_lines(LINES, sections=["Herbal A", "Stars", "Herbal A", "Stars"])
+
+    assert corpus.where("section", "Herbal A").to_lines() == [LINES[0], LINES[2]]
+    assert len(corpus.where("section", "Cosmo")) == 0
+    with pytest.raises(KeyError):
+        corpus.where("hand", "Hand1")
+
+
+def test_shared_vocab_and_encode():
+    real = EncodedCorpus.from_lines(LINES)
+    synthetic = EncodedCorpus.from_lines([["chol", "otedy"]], vocab=real.vocab)
+
+    assert synthetic.tokens.tolist() == [1, 4]
+    assert real.encode(["shedy", "otedy"]).tolist() == [3, -1]
+
+
+def test_bigrams_stay_within_lines():
+    prev, nxt = EncodedCorpus.from_lines(LINES).bigrams()
+    assert list(zip(prev.tolist(), nxt.tolist(), strict=True)) == [(0, 1), (1, 0), (2, 1)]
+
+
+def test_adapters_round_trip():
+    corpus = as_encoded(LINES)
+    assert as_encoded(corpus) is corpus
+    assert as_lines(corpus) == LINES
+    assert as_lines(iter(LINES)) == LINES
+
+
+def test_from_snapshot_matches_from_lines(store, tmp_path):
+    pytest.importorskip("pyarrow")
+    from phase1_foundation.core.data_loading import load_canonical_lines
+    from phase1_foundation.core.snapshot import build_snapshot
+
+    store.add_dataset("voynich_real", "/data")
+    store.add_page("f1r", "voynich_real", "f1r.jpg", "h1", 10, 10)
+    store.add_page("f76v", "voynich_real", "f76v.jpg", "h2", 10, 10)
+    store.add_transcription_source("zandbergen_landini", "ZL")
+    store.add_transcription_line("l1", "zandbergen_landini", "f1r", 0, "daiin.chol")
+    store.add_transcription_token("t1", "l1", 0, "daiin")
+    store.add_transcription_token("t2", "l1", 1, "chol")
+    store.add_transcription_line("l2", "zandbergen_landini", "f76v", 0, "qokedy.daiin")
+    store.add_transcription_token("t3", "l2", 0, "qokedy")
+    store.add_transcription_token("t4", "l2", 1, "daiin")
+
+    build_snapshot(store, "voynich_real", "zandbergen_landini", True, tmp_path)
+    corpus = EncodedCorpus.from_snapshot(store, snapshot_dir=tmp_path)
+    expected = EncodedCorpus.from_lines(load_canonical_lines(store))
+
+    assert corpus.vocab == expected.vocab
+    assert corpus.tokens.tolist() == expected.tokens.tolist()
+    assert corpus.offsets.tolist() == expected.offsets.tolist()
+    assert corpus.labels("section") == ["Herbal A", "Biological"]
+    assert corpus.labels("hand") == ["Hand1", "Hand2"]
+
+
+# ---------------------------------------------------------------------------
+# Consumers give the same answers as their string-based originals
+# ---------------------------------------------------------------------------
+
+def _reference_transition_counts(lines):
+    counts = Counter()
+    for line in lines:
+        for i in range(len(line) - 1):
+            counts[((line[i], i + 1), line[i + 1])] += 1
+    return counts
+
+
+def _reference_transition_vectors(lines, window_size, step=100, top_n=50):
+    top_50 = [w for w, _ in Counter(t for l in lines for t in l).most_common(top_n)]
+    word_to_idx = {w: i for i, w in enumerate(top_50)}
+    vectors = []
+    for start in range(0, len(lines) - window_size, step):
+        vec = np.zeros(len(top_50) * len(top_50))
+        for line in lines[start:start + window_size]:
+            for i in range(len(line) - 1):
+                u, v = line[i], line[i + 1]
+                if u in word_to_idx and v in word_to_idx:
+                    vec[word_to_idx[u] * len(top_50) + word_to_idx[v]] += 1
+        if np.sum(vec) > 0:
+            vec /= np.sum(vec)
+        vectors.append(vec)
+    return np.array(vectors)
+
+
+def _reference_mutual_information(sequence):
+    prev, nxt = sequence[:-1], sequence[1:]
+    n = len(prev)
+    prev_counts, next_counts = Counter(prev), Counter(nxt)
+    mi = 0.0
+    for (a, b), c_ab in Counter(zip(prev, nxt, strict=False)).items():
+        p_ab = c_ab / n
+        mi += p_ab * math.log2(p_ab / ((prev_counts[a] / n) * (next_counts[b] / n)))
+    return mi
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_slip_model_matches_string_counting(seed):
+    lines = _random_lines(seed)
+    for data in (lines, EncodedCorpus.from_lines(lines)):
+        detector = MechanicalSlipDetector(min_transition_count=2)
+        detector.build_model(data)
+        assert detector.transition_counts == _reference_transition_counts(lines)
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_transition_vectors_match_string_counting(seed):
+    lines = _random_lines(seed)
+    expected = _reference_transition_vectors(lines, window_size=200)
+    for data in (lines, EncodedCorpus.from_lines(lines)):
+        np.testing.assert_array_equal(
+            StateSpaceSolver().build_transition_vectors(data, window_size=200), expected
+        )
+
+
+@pytest.mark.parametrize(("window_size", "step", "top_n"), [(200, 100, 50), (130, 40, 80), (50, 70, 10)])
+def test_sparse_sliding_transition_vectors(window_size, step, top_n):
+    lines = _random_lines(4)
+    expected = _reference_transition_vectors(lines, window_size, step=step, top_n=top_n)
+    solver = StateSpaceSolver()
+
+    sparse = solver.build_transition_vectors(lines, window_size, step=step, top_n=top_n, sparse=True)
+    assert sparse.format == "csr"
+    assert sparse.shape == expected.shape
+    np.testing.assert_array_equal(sparse.toarray(), expected)
+    np.testing.assert_array_equal(
+        solver.build_transition_vectors(lines, window_size, step=step, top_n=top_n), expected
+    )
+
+
+def test_bigram_mutual_information_is_bit_identical():
+    lines = _random_lines(3)
+    flat = [t for line in lines for t in line]
+    expected = _reference_mutual_information(flat)
+
+    assert bigram_mutual_information(flat) == expected
+    assert bigram_mutual_information(EncodedCorpus.from_lines(lines)) == expected
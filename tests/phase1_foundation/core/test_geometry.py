@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from phase1_foundation.core.geometry import Box, Point, Polygon
+from phase1_foundation.core.geometry import Box, BoxArray, GridIndex, Point, Polygon
 
 pytestmark = pytest.mark.unit
 
@@ -51,3 +52,137 @@ def test_polygon_invalid():
     ]
     with pytest.raises(ValueError):
         Polygon(points=points)
+
+
+def _random_boxes(rng, n, max_size):
+    boxes = []
+    for _ in range(n):
+        w, h = rng.uniform(0.0, max_size, size=2)
+        x, y = rng.uniform(0.0, 1.0 - w), rng.uniform(0.0, 1.0 - h)
+        boxes.append(Box(x_min=x, y_min=y, x_max=x + w, y_max=y + h))
+    # Exact duplicates and touching edges exercise the closed-interval cases.
+    boxes.append(boxes[0].model_copy())
+    b = boxes[1]
+    boxes.append(Box(x_min=b.x_max, y_min=b.y_min, x_max=min(1.0, b.x_max + 0.05), y_max=b.y_max))
+    return boxes
+
+
+def test_box_array_matches_box_methods():
+    rng = np.random.default_rng(0)
+    a, b = _random_boxes(rng, 30, 0.3), _random_boxes(rng, 40, 0.3)
+    arr_a, arr_b = BoxArray.from_boxes(a), BoxArray.from_boxes(b)
+    ai, bi = np.divmod(np.arange(len(a) * len(b)), len(b))
+
+    assert arr_a.iou(ai, arr_b, bi).tolist() == [a[i].iou(b[j]) for i, j in zip(ai, bi)]
+    assert arr_a.contains(ai, arr_b, bi).tolist() == [a[i].contains(b[j]) for i, j in zip(ai, bi)]
+    np.testing.assert_allclose(
+        arr_a.distance(ai, arr_b, bi), [a[i].distance(b[j]) for i, j in zip(ai, bi)], rtol=1e-15
+    )
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.001, 0.5])
+def test_grid_index_finds_exactly_the_intersecting_pairs(cell_size):
+    rng = np.random.default_rng(1)
+    indexed, queries = _random_boxes(rng, 200, 0.08), _random_boxes(rng, 50, 0.4)
+    grid = GridIndex(BoxArray.from_boxes(indexed), cell_size=cell_size)
+
+    qi, bi = grid.intersecting_pairs(BoxArray.from_boxes(queries))
+
+    expected = [
+        (i, j)
+        for i, q in enumerate(queries)
+        for j, b in enumerate(indexed)
+        if max(q.x_min, b.x_min) <= min(q.x_max, b.x_max) and max(q.y_min, b.y_min) <= min(q.y_max, b.y_max)
+    ]
+    assert list(zip(qi.tolist(), bi.tolist())) == expected
+
+
+def test_grid_index_handles_empty_inputs():
+    empty = BoxArray.from_boxes([])
+    qi, bi = GridIndex(empty).intersecting_pairs(BoxArray.from_boxes([Box(x_min=0, y_min=0, x_max=1, y_max=1)]))
+    assert qi.size == 0 and bi.size == 0
+
+
+def _seed_layout(store, rng):
+    store.add_dataset("ds", "/data")
+    store.add_page("p1", "ds", "p1.jpg", "h", 100, 100)
+    store.add_line("l1", "p1", 0, {"x_min": 0.0, "y_min": 0.0, "x_max": 1.0, "y_max": 1.0}, 1.0)
+    with store.bulk_writer() as writer:
+        for i, box in enumerate(_random_boxes(rng, 60, 0.1)):
+            writer.add_word(f"w{i:03d}", "l1", i, box.model_dump(), {}, 1.0)
+        for i, box in enumerate(_random_boxes(rng, 25, 0.3)):
+            writer.add_region(f"r{i:03d}", "p1", "mid", "grid", box.model_dump(), {}, 1.0)
+
+
+def test_anchor_engine_matches_all_pairs_reference(store):
+    from phase1_foundation.anchors.engine import AnchorEngine
+    from phase1_foundation.storage.metadata import (
+        AnchorRecord,
+        LineRecord,
+        RegionRecord,
+        WordRecord,
+    )
+
+    _seed_layout(store, np.random.default_rng(2))
+    engine = AnchorEngine(store, seed=3)
+    method_id = engine.register_method("geometric_v1", parameters={"distance_threshold": 0.15})
+    count = engine.compute_page_anchors("p1", method_id, run_id="run1")
+
+    session = store.Session()
+    try:
+        regions = session.query(RegionRecord).filter_by(page_id="p1").all()
+        words = session.query(WordRecord).join(LineRecord).filter(LineRecord.page_id == "p1").all()
+        expected = {}
+        for region in regions:
+            r_box = Box(**region.bbox)
+            for word in words:
+                w_box = Box(**word.bbox)
+                iou = r_box.iou(w_box)
+                if iou > 0:
+                    expected[(word.id, region.id)] = ("inside" if r_box.contains(w_box) else "overlaps", iou)
+                elif r_box.distance(w_box) < 0.15:
+                    expected[(word.id, region.id)] = ("near", 1.0 - r_box.distance(w_box))
+        got = {
+            (a.source_id, a.target_id): (a.relation_type, a.score)
+            for a in session.query(AnchorRecord).filter_by(page_id="p1").all()
+        }
+    finally:
+        session.close()
+
+    assert count == len(expected)
+    assert got.keys() == expected.keys()
+    for key, (relation, score) in expected.items():
+        assert got[key][0] == relation
+        assert got[key][1] == pytest.approx(score, rel=1e-12)
+
+
+def test_graph_builder_matches_all_pairs_reference(store):
+    from phase1_foundation.regions.graph import GraphBuilder
+    from phase1_foundation.storage.metadata import RegionEdgeRecord, RegionRecord
+
+    _seed_layout(store, np.random.default_rng(4))
+    GraphBuilder(store).build_graph("p1")
+
+    session = store.Session()
+    try:
+        regions = session.query(RegionRecord).filter_by(page_id="p1").all()
+        expected = []
+        for i, r1 in enumerate(regions):
+            b1 = Box(**r1.bbox)
+            for j, r2 in enumerate(regions):
+                if i == j:
+                    continue
+                b2 = Box(**r2.bbox)
+                if b1.contains(b2):
+                    expected += [(r1.id, r2.id, "contains", 1.0), (r2.id, r1.id, "contained_by", 1.0)]
+                if b1.iou(b2) > 0:
+                    expected.append((r1.id, r2.id, "overlaps", b1.iou(b2)))
+        got = [
+            (e.source_region_id, e.target_region_id, e.type, e.weight)
+            for e in session.query(RegionEdgeRecord).order_by(RegionEdgeRecord.id).all()
+        ]
+    finally:
+        session.close()
+
+    assert got == expected
+
@@ -70,3 +70,59 @@ def test_query_engine_find_similar_regions_uses_embedding_similarity(tmp_path):
     assert len(results) == 2
     assert results[0]["region_id"] == "r2"
     assert results[0]["score"] > results[1]["score"]
+
+
+def _brute_force_neighbours(vectors, region_id, k):
+    q = vectors[region_id]
+    scored = []
+    for other, v in vectors.items():
+        if other == region_id:
+            continue
+        denom = np.linalg.norm(q) * np.linalg.norm(v)
+        scored.append((other, float(np.dot(q, v) / denom) if denom else 0.0))
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:k]
+
+
+def test_find_similar_regions_many_matches_brute_force(tmp_path):
+    store = MetadataStore(f"sqlite:///{tmp_path}/emb.db")
+    store.add_dataset("ds", "generated")
+    store.add_page("p1", "ds", "img.jpg", "hash", 100, 100)
+    rng = np.random.default_rng(0)
+    vectors = {}
+    with store.bulk_writer() as writer:
+        for i in range(40):
+            region_id = f"r{i:02d}"
+            vectors[region_id] = rng.standard_normal(16).astype(np.float32)
+            writer.add_region(region_id, "p1", "mid", "grid", {"x": i, "y": 0, "w": 1, "h": 1})
+            writer.add_region_embedding(region_id, "emb", vectors[region_id].tobytes())
+
+    engine = QueryEngine(store)
+    results = engine.find_similar_regions_many(["r00", "r17", "missing"], k=5)
+
+    assert results["missing"] == []
+    for region_id in ("r00", "r17"):
+        got = [(r["region_id"], r["score"]) for r in results[region_id]]
+        expected = _brute_force_neighbours(vectors, region_id, 5)
+        assert [rid for rid, _ in got] == [rid for rid, _ in expected]
+        np.testing.assert_allclose([s for _, s in got], [s for _, s in expected], rtol=1e-5)
+
+
+def test_embedding_index_invalidated_by_writes_and_sidecar(tmp_path):
+    store = _build_store(tmp_path)
+    index_dir = tmp_path / "index"
+    engine = QueryEngine(store, index_dir=index_dir)
+
+    assert [r["region_id"] for r in engine.find_similar_regions("r1", limit=5)] == ["r2", "r3"]
+    assert (index_dir / "emb.npy").exists()
+
+    store.add_region("r4", "p1", "coarse", "dummy", {"x": 3, "y": 0, "w": 1, "h": 1}, {}, 1.0)
+    store.add_region_embedding("r4", "emb", np.array([1.0, 0.0], dtype=np.float32).tobytes())
+    results = engine.find_similar_regions("r1", limit=1)
+    assert results[0]["region_id"] == "r4"
+    assert results[0]["score"] == pytest.approx(1.0)
+
+    # A fresh engine memory-maps the refreshed sidecar instead of rebuilding.
+    reloaded = QueryEngine(store, index_dir=index_dir).embedding_index("emb")
+    assert isinstance(reloaded.matrix, np.memmap)
+    assert reloaded.region_ids == ["r1", "r2", "r3", "r4"]
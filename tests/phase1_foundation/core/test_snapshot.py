@@ -0,0 +1,110 @@
+"""Tests for Parquet token-stream snapshots."""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from phase1_foundation.core.data_loading import (
+    folio_hand,
+    folio_section,
+    load_canonical_lines,
+)
+from phase1_foundation.core.snapshot import (
+    SnapshotUnavailableError,
+    build_snapshot,
+    build_snapshots,
+    load_snapshot_lines,
+    read_snapshot_table,
+    resolve_db_hash,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def snapshot_store(store):
+    store.add_dataset("voynich_real", "/data")
+    store.add_page("f1r", "voynich_real", "f1r.jpg", "h1", 10, 10)
+    store.add_page("f76v", "voynich_real", "f76v.jpg", "h2", 10, 10)
+    store.add_transcription_source("zandbergen_landini", "ZL")
+    store.add_transcription_source("other", "Other")
+    store.add_transcription_line("l1", "zandbergen_landini", "f1r", 0, "daiin.<%>chol")
+    store.add_transcription_token("t1", "l1", 0, "daiin")
+    store.add_transcription_token("t2", "l1", 1, "<%>chol")
+    store.add_transcription_line("l2", "zandbergen_landini", "f1r", 1, "<$>")
+    store.add_transcription_token("t3", "l2", 0, "<$>")
+    store.add_transcription_line("l3", "zandbergen_landini", "f76v", 0, "qokedy.shedy")
+    store.add_transcription_token("t4", "l3", 0, "qokedy")
+    store.add_transcription_token("t5", "l3", 1, "shedy")
+    store.add_transcription_line("l4", "other", "f76v", 0, "otedy")
+    store.add_transcription_token("t6", "l4", 0, "otedy")
+    return store
+
+
+def test_folio_metadata_helpers():
+    assert folio_section("f1r") == "Herbal A"
+    assert folio_section("f76v") == "Biological"
+    assert folio_section("fRos") == "Other"
+    assert folio_hand("f1r") == "Hand1"
+    assert folio_hand("f76v") == "Hand2"
+    assert folio_hand("f70r") == "Unknown"
+
+
+@pytest.mark.parametrize("source_id", ["zandbergen_landini", None])
+@pytest.mark.parametrize("sanitize", [True, False])
+def test_snapshot_lines_match_sqlalchemy_path(snapshot_store, tmp_path, source_id, sanitize):
+    snap_dir = tmp_path / "snapshots"
+    build_snapshot(snapshot_store, "voynich_real", source_id, sanitize, snap_dir)
+
+    expected = load_canonical_lines(snapshot_store, "voynich_real", source_id, sanitize)
+    assert load_snapshot_lines(snapshot_store, "voynich_real", source_id, sanitize, snap_dir) == expected
+
+
+def test_snapshot_carries_page_section_and_hand(snapshot_store, tmp_path):
+    snap_dir = tmp_path / "snapshots"
+    build_snapshot(snapshot_store, "voynich_real", "zandbergen_landini", True, snap_dir)
+    table = read_snapshot_table(snapshot_store, "voynich_real", "zandbergen_landini", True, snap_dir)
+
+    assert table.column("token").to_pylist() == ["daiin", "chol", "qokedy", "shedy"]
+    assert table.column("line").to_pylist() == [0, 0, 1, 1]
+    assert table.column("page").to_pylist() == ["f1r", "f1r", "f76v", "f76v"]
+    assert table.column("section").to_pylist() == ["Herbal A"] * 2 + ["Biological"] * 2
+    assert table.column("hand").to_pylist() == ["Hand1"] * 2 + ["Hand2"] * 2
+
+
+def test_snapshot_goes_stale_when_database_changes(snapshot_store, tmp_path):
+    snap_dir = tmp_path / "snapshots"
+    build_snapshot(snapshot_store, "voynich_real", "zandbergen_landini", True, snap_dir)
+    first_hash = resolve_db_hash(snapshot_store, snap_dir)
+
+    snapshot_store.add_transcription_token("t7", "l3", 2, "chedy")
+
+    assert resolve_db_hash(snapshot_store, snap_dir) != first_hash
+    with pytest.raises(SnapshotUnavailableError):
+        load_snapshot_lines(snapshot_store, "voynich_real", "zandbergen_landini", True, snap_dir)
+
+
+def test_load_canonical_lines_backends(snapshot_store, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    expected = load_canonical_lines(snapshot_store)
+
+    with pytest.raises(SnapshotUnavailableError):
+        load_canonical_lines(snapshot_store, backend="snapshot")
+    assert load_canonical_lines(snapshot_store, backend="auto") == expected
+
+    build_snapshots(snapshot_store)
+    assert load_canonical_lines(snapshot_store, backend="snapshot") == expected
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        load_canonical_lines(snapshot_store, backend="duck")
+
+
+def test_build_snapshots_covers_every_pair(snapshot_store, tmp_path):
+    paths = build_snapshots(snapshot_store, snapshot_dir=tmp_path / "snapshots")
+    names = sorted(p.name for p in paths)
+    assert names == [
+        "voynich_real__other__clean.parquet",
+        "voynich_real__other__raw.parquet",
+        "voynich_real__zandbergen_landini__clean.parquet",
+        "voynich_real__zandbergen_landini__raw.parquet",
+    ]
@@ -0,0 +1,101 @@
+"""Parity tests for the DuckDB analytical backend."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("duckdb")
+
+from phase1_foundation.config import get_query_backend
+from phase1_foundation.core.queries import QueryEngine
+from phase1_foundation.metrics.library import ClusterTightness, RepetitionRate
+from phase1_foundation.storage.analytics import DuckDBAnalytics
+
+pytestmark = pytest.mark.unit
+
+TOKENS = {
+    ("f1r", 0): ["daiin", "chol", "daiin"],
+    ("f1r", 1): ["shedy", "qokedy", "chol"],
+    ("f2v", 0): ["otedy", "daiin", "otedy", "qokedy"],
+}
+
+
+@pytest.fixture
+def analytics_store(store):
+    try:
+        DuckDBAnalytics(store).close()
+    except Exception as exc:  # pragma: no cover - depends on extension availability
+        pytest.skip(f"DuckDB sqlite extension unavailable: {exc}")
+
+    store.add_dataset("ds1", "/data")
+    store.add_transcription_source("src1", "Source 1")
+    store.add_transcription_source("src2", "Source 2")
+    for (page_id, line_index), tokens in TOKENS.items():
+        if line_index == 0:
+            store.add_page(page_id, "ds1", f"{page_id}.jpg", page_id, 10, 10)
+        source = "src2" if page_id == "f2v" else "src1"
+        line_id = f"{page_id}_{line_index}"
+        store.add_transcription_line(line_id, source, page_id, line_index, ".".join(tokens))
+        for i, token in enumerate(tokens):
+            store.add_transcription_token(f"{line_id}_{i}", line_id, i, token)
+    return store
+
+
+def _add_embeddings(store):
+    rng = np.random.default_rng(7)
+    for i in range(6):
+        region_id = f"r{i}"
+        store.add_region(region_id, "f1r", "mid", "grid", {"x_min": i, "y_min": 0, "x_max": i + 2, "y_max": 3})
+        store.add_region_embedding(region_id, "test", rng.random(8).astype(np.float32).tobytes())
+
+
+def test_get_query_backend_reads_environment(monkeypatch):
+    monkeypatch.delenv("METADATA_QUERY_BACKEND", raising=False)
+    assert get_query_backend() == "sqlalchemy"
+    monkeypatch.setenv("METADATA_QUERY_BACKEND", "duckdb")
+    assert get_query_backend() == "duckdb"
+    with pytest.raises(ValueError, match="Unknown query backend"):
+        get_query_backend("polars")
+
+
+@pytest.mark.parametrize("source_id", [None, "src1"])
+def test_query_engine_aggregates_match(analytics_store, source_id):
+    orm = QueryEngine(analytics_store, backend="sqlalchemy")
+    duck = QueryEngine(analytics_store, backend="duckdb")
+
+    assert duck.token_frequencies("ds1", source_id) == orm.token_frequencies("ds1", source_id)
+    assert duck.page_statistics("ds1", source_id) == orm.page_statistics("ds1", source_id)
+    assert orm.token_frequencies("ds1")[:2] == [("daiin", 3), ("chol", 2)]
+    assert orm.page_statistics("ds1")[0] == {"page_id": "f1r", "lines": 2, "tokens": 6, "unique_tokens": 4}
+
+
+def test_snapshot_relation_matches_sqlite(analytics_store, tmp_path):
+    pytest.importorskip("pyarrow")
+    from phase1_foundation.core.snapshot import build_snapshot
+
+    snap_dir = tmp_path / "snapshots"
+    build_snapshot(analytics_store, "ds1", None, False, snap_dir)
+    with DuckDBAnalytics(analytics_store) as sqlite_side, DuckDBAnalytics(analytics_store, snap_dir) as snap_side:
+        assert snap_side._snapshot_file("ds1", None) is not None
+        assert snap_side.token_frequencies("ds1") == sqlite_side.token_frequencies("ds1")
+        assert snap_side.page_statistics("ds1") == sqlite_side.page_statistics("ds1")
+
+
+@pytest.mark.parametrize("dataset_id", ["ds1", "missing"])
+def test_repetition_rate_matches(analytics_store, dataset_id):
+    orm = RepetitionRate(analytics_store, backend="sqlalchemy").calculate(dataset_id)[0]
+    duck = RepetitionRate(analytics_store, backend="duckdb").calculate(dataset_id)[0]
+
+    assert duck.details == orm.details
+    assert duck.value == orm.value or (np.isnan(duck.value) and np.isnan(orm.value))
+
+
+def test_cluster_tightness_matches(analytics_store):
+    bbox_orm = ClusterTightness(analytics_store, backend="sqlalchemy").calculate("ds1")[0]
+    bbox_duck = ClusterTightness(analytics_store, backend="duckdb").calculate("ds1")[0]
+    assert bbox_duck.details == bbox_orm.details  # no regions -> insufficient_regions
+
+    _add_embeddings(analytics_store)
+    orm = ClusterTightness(analytics_store, backend="sqlalchemy").calculate("ds1")[0]
+    duck = ClusterTightness(analytics_store, backend="duckdb").calculate("ds1")[0]
+    assert orm.details["method"] == "embeddings"
+    assert duck.to_dict() == orm.to_dict()
@@ -0,0 +1,139 @@
+import pytest
+
+from phase1_foundation.anchors.engine import AnchorEngine
+from phase1_foundation.regions.graph import GraphBuilder
+from phase1_foundation.storage.bulk import BulkWriter
+from phase1_foundation.storage.metadata import (
+    AnchorRecord,
+    DatasetRecord,
+    RegionEdgeRecord,
+    TranscriptionTokenRecord,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _count(store, model) -> int:
+    session = store.Session()
+    try:
+        return session.query(model).count()
+    finally:
+        session.close()
+
+
+def test_bulk_writer_returns_writer_bound_to_store(store) -> None:
+    writer = store.bulk_writer(chunk_size=10)
+    assert isinstance(writer, BulkWriter)
+    assert writer.chunk_size == 10
+
+
+def test_bulk_writer_rejects_non_positive_chunk_size(store) -> None:
+    with pytest.raises(ValueError):
+        store.bulk_writer(chunk_size=-1)
+
+
+def test_bulk_writer_flushes_on_exit(populated_store) -> None:
+    with populated_store.bulk_writer() as writer:
+        for idx in range(25):
+            writer.add_transcription_token(f"bulk_t{idx}", "f1r_TL1", 10 + idx, f"tok{idx}")
+        assert writer.pending == 25
+        assert _count(populated_store, TranscriptionTokenRecord) == 3
+
+    assert writer.pending == 0
+    assert writer.rows_written == 25
+    assert _count(populated_store, TranscriptionTokenRecord) == 28
+
+
+def test_bulk_writer_auto_flushes_full_chunks(populated_store) -> None:
+    with populated_store.bulk_writer(chunk_size=10) as writer:
+        for idx in range(25):
+            writer.add_transcription_token(f"bulk_t{idx}", "f1r_TL1", 10 + idx, f"tok{idx}")
+        # Two full chunks written, five rows still buffered.
+        assert writer.pending == 5
+        assert _count(populated_store, TranscriptionTokenRecord) == 23
+
+    assert _count(populated_store, TranscriptionTokenRecord) == 28
+
+
+def test_bulk_writer_upserts_like_merge(store) -> None:
+    store.add_dataset("ds1", "/old", checksum="old")
+    with store.bulk_writer() as writer:
+        writer.add_dataset("ds1", "/first")
+        writer.add_dataset("ds1", "/new", checksum="new")
+        assert writer.pending == 1
+
+    session = store.Session()
+    try:
+        rows = session.query(DatasetRecord).all()
+        assert len(rows) == 1
+        assert rows[0].path == "/new"
+        assert rows[0].checksum == "new"
+        assert rows[0].created_at is not None
+    finally:
+        session.close()
+
+
+def test_bulk_writer_discards_buffer_on_error(populated_store) -> None:
+    with pytest.raises(RuntimeError, match="boom"):
+        with populated_store.bulk_writer() as writer:
+            writer.add_transcription_token("bulk_t0", "f1r_TL1", 10, "tok")
+            raise RuntimeError("boom")
+
+    assert _count(populated_store, TranscriptionTokenRecord) == 3
+
+
+def test_bulk_writer_matches_per_row_helpers(tmp_path) -> None:
+    from phase1_foundation.storage.metadata import MetadataStore
+
+    def _populate(target) -> None:
+        target.add_dataset("ds", "/p")
+        target.add_page("p1", "ds", "img", "h", 10, 10)
+        target.add_line("l1", "p1", 0, {"x": 0, "y": 0, "w": 1, "h": 1})
+        target.add_word("w1", "l1", 0, {"x": 0, "y": 0, "w": 1, "h": 1}, features={"ink": 1})
+        target.add_region("r1", "p1", "mid", "grid", {"x_min": 0, "y_min": 0, "x_max": 1, "y_max": 1})
+        target.add_region_edge("r1", "r1", "overlaps", 0.5)
+
+    per_row = MetadataStore(f"sqlite:///{tmp_path}/per_row.db")
+    bulk = MetadataStore(f"sqlite:///{tmp_path}/bulk.db")
+    _populate(per_row)
+    with bulk.bulk_writer() as writer:
+        _populate(writer)
+
+    from sqlalchemy import text
+
+    for table in ("datasets", "pages", "lines", "words", "regions", "region_edges"):
+        query = text(f"SELECT * FROM {table}")
+        with per_row.engine.connect() as a, bulk.engine.connect() as b:
+            rows_a = [tuple(r[:-1]) for r in a.execute(query)]
+            rows_b = [tuple(r[:-1]) for r in b.execute(query)]
+        assert rows_a == rows_b, table
+
+
+def test_anchor_engine_and_graph_builder_write_through_bulk_writer(populated_store) -> None:
+    populated_store.add_region(
+        "reg1", "f1r", "mid", "grid", {"x_min": 0.0, "y_min": 0.0, "x_max": 0.5, "y_max": 0.5}
+    )
+    populated_store.add_region(
+        "reg2", "f1r", "mid", "grid", {"x_min": 0.1, "y_min": 0.1, "x_max": 0.2, "y_max": 0.2}
+    )
+    populated_store.add_word("f1r_W2", "f1r_L1", 1, {"x": 0.9, "y": 0.9, "w": 0.05, "h": 0.05})
+
+    engine = AnchorEngine(populated_store, seed=7)
+    method_id = engine.register_method("geometric_v1", parameters={"distance_threshold": 0.1})
+    count = engine.compute_page_anchors("f1r", method_id, run_id="run1")
+    assert count == _count(populated_store, AnchorRecord)
+    assert count > 0
+
+    # Rerunning upserts by deterministic anchor id instead of duplicating rows.
+    assert engine.compute_page_anchors("f1r", method_id, run_id="run1") == count
+    assert _count(populated_store, AnchorRecord) == count
+
+    GraphBuilder(populated_store).build_graph("f1r")
+    session = populated_store.Session()
+    try:
+        edges = {(e.source_region_id, e.target_region_id, e.type) for e in session.query(RegionEdgeRecord)}
+    finally:
+        session.close()
+    assert ("reg1", "reg2", "contains") in edges
+    assert ("reg2", "reg1", "contained_by") in edges
+    assert ("reg1", "reg2", "overlaps") in edges
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from phase1_foundation.config import get_sqlite_profile
+from phase1_foundation.storage.metadata import DatasetRecord, MetadataStore
+from phase1_foundation.storage.schema import current_revision, head_revision
+
+pytestmark = pytest.mark.unit
+
+
+def _pragma(store: MetadataStore, name: str):
+    with store.engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_get_sqlite_profile_reads_environment(monkeypatch) -> None:
+    monkeypatch.delenv("METADATA_DB_PROFILE", raising=False)
+    assert get_sqlite_profile() == {}
+
+    monkeypatch.setenv("METADATA_DB_PROFILE", "performance")
+    assert get_sqlite_profile()["journal_mode"] == "WAL"
+
+
+def test_get_sqlite_profile_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown SQLite profile"):
+        get_sqlite_profile("turbo")
+
+
+def test_default_profile_leaves_journal_mode_untouched(tmp_db, monkeypatch) -> None:
+    monkeypatch.delenv("METADATA_DB_PROFILE", raising=False)
+    store = MetadataStore(tmp_db)
+    assert _pragma(store, "journal_mode").lower() == "delete"
+
+
+def test_performance_profile_applies_pragmas(tmp_db) -> None:
+    store = MetadataStore(tmp_db, profile="performance")
+    assert _pragma(store, "journal_mode").lower() == "wal"
+    assert _pragma(store, "synchronous") == 1  # NORMAL
+    assert _pragma(store, "temp_store") == 2  # MEMORY
+    assert _pragma(store, "cache_size") == -65536
+
+
+def test_new_database_is_stamped_and_reopened_without_create_all(tmp_db, monkeypatch) -> None:
+    MetadataStore(tmp_db)
+    assert current_revision(tmp_db) == head_revision()
+
+    from phase1_foundation.storage.metadata import Base
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("create_all should be skipped at head revision")
+
+    monkeypatch.setattr(Base.metadata, "create_all", _fail)
+    MetadataStore(tmp_db)
+
+
+def test_read_only_store_reads_while_writer_uses_wal(tmp_db) -> None:
+    writer = MetadataStore(tmp_db, profile="performance")
+    writer.add_dataset("ds1", "/path")
+
+    reader = MetadataStore(tmp_db, profile="performance", read_only=True)
+    session = reader.Session()
+    try:
+        assert session.query(DatasetRecord).filter_by(id="ds1").one().path == "/path"
+    finally:
+        session.close()
+
+    with pytest.raises(OperationalError):
+        reader.add_dataset("ds2", "/other")
+
+    # The writer keeps working while the reader is open.
+    writer.add_dataset("ds2", "/other")
+
+
+def test_read_only_requires_file_backed_sqlite() -> None:
+    with pytest.raises(ValueError, match="file-backed SQLite"):
+        MetadataStore("sqlite://", read_only=True)
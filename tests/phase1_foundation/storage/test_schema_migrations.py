@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from phase1_foundation.storage.metadata import Base, MetadataStore
+from phase1_foundation.storage.schema import (
+    current_revision,
+    downgrade_schema,
+    head_revision,
+    upgrade_schema,
+)
+
+pytestmark = pytest.mark.unit
+
+HOT_INDEXES = {
+    "transcription_tokens": "ix_transcription_tokens_line_id_token_index",
+    "transcription_lines": "ix_transcription_lines_page_id_line_index",
+    "words": "ix_words_line_id_word_index",
+    "lines": "ix_lines_page_id_line_index",
+    "glyph_candidates": "ix_glyph_candidates_word_id_glyph_index",
+    "anchors": "ix_anchors_target_id",
+    "region_embeddings": "ix_region_embeddings_region_id_model_name",
+    "word_alignments": "ix_word_alignments_token_id",
+}
+
+
+def _index_names(db_url: str, table: str) -> set[str]:
+    engine = create_engine(db_url)
+    try:
+        return {ix["name"] for ix in inspect(engine).get_indexes(table)}
+    finally:
+        engine.dispose()
+
+
+def _legacy_db(db_url: str) -> None:
+    """Create tables the way pre-index releases did: no secondary indexes."""
+    engine = create_engine(db_url)
+    try:
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+    finally:
+        engine.dispose()
+
+
+def test_new_store_declares_hot_indexes(store) -> None:
+    inspector = inspect(store.engine)
+    for table, index_name in HOT_INDEXES.items():
+        assert index_name in {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def test_upgrade_adds_indexes_to_legacy_database(tmp_db) -> None:
+    _legacy_db(tmp_db)
+    assert current_revision(tmp_db) is None
+    assert "ix_transcription_tokens_line_id_token_index" not in _index_names(
+        tmp_db, "transcription_tokens"
+    )
+
+    assert upgrade_schema(tmp_db) == head_revision()
+    for table, index_name in HOT_INDEXES.items():
+        assert index_name in _index_names(tmp_db, table)
+
+
+def test_upgrade_is_idempotent_on_store_created_database(tmp_db) -> None:
+    MetadataStore(tmp_db)
+    upgrade_schema(tmp_db)
+    assert upgrade_schema(tmp_db) == head_revision()
+
+
+def test_downgrade_removes_indexes(tmp_db) -> None:
+    _legacy_db(tmp_db)
+    upgrade_schema(tmp_db)
+    assert downgrade_schema(tmp_db, "base") is None
+    assert "ix_anchors_page_id" not in _index_names(tmp_db, "anchors")
@@ -96,3 +96,66 @@ def test_analyze_runs_without_store_and_returns_summary() -> None:
     assert result["features_tested"] == 14
     assert "importances" in result
     assert isinstance(result["formalizable_features"], list)
+
+
+@pytest.fixture
+def feature_store(store):
+    store.add_dataset("ds1", "/data")
+    store.add_page("f88r", "ds1", "f88r.jpg", "h1", 10, 10)
+    store.add_region("r1", "f88r", "mid", "grid", {"x_min": 0.0, "y_min": 0.0, "x_max": 0.4, "y_max": 0.4})
+    store.add_region("r2", "f88r", "mid", "grid", {"x_min": 0.5, "y_min": 0.0, "x_max": 0.9, "y_max": 0.4})
+    for i, n_words in enumerate([1, 2, 3, 2]):
+        line_id = f"l{i}"
+        store.add_line(line_id, "f88r", i, {"x_min": 0.0, "y_min": 0.1 * i, "x_max": 1.0, "y_max": 0.1 * i + 0.1})
+        for w in range(n_words):
+            x = 0.1 + 0.5 * (w % 2)
+            store.add_word(f"{line_id}_w{w}", line_id, w, {"x_min": x, "y_min": 0.0, "x_max": x + 0.2, "y_max": 0.2})
+    for glyph in range(3):
+        store.add_glyph_candidate(f"g{glyph}", "l1_w0", glyph, {"x_min": 0, "y_min": 0, "x_max": 1, "y_max": 1})
+    store.add_glyph_candidate("g3", "l1_w1", 0, {"x_min": 0, "y_min": 0, "x_max": 1, "y_max": 1})
+
+    store.add_transcription_source("src1", "Source 1")
+    contents = [["daiin", "daiin", "chol"], ["chol", "shedy"], ["daiin", "chol"], ["qokedy"]]
+    for i, tokens in enumerate(contents):
+        store.add_transcription_line(f"t{i}", "src1", "f88r", i, ".".join(tokens))
+        for j, token in enumerate(tokens):
+            store.add_transcription_token(f"t{i}_{j}", f"t{i}", j, token)
+    store.add_word_alignment("l1_w0", "t0_0", "1:1")
+    store.add_word_alignment("l1_w1", "t0_2", "1:1")
+    store.add_word_alignment("l2_w0", "t1_0", "1:1")
+
+    anchors = [("l1_w0", "r1"), ("l2_w0", "r1"), ("l1_w1", "r2")]
+    for k, (word_id, region_id) in enumerate(anchors):
+        store.add_anchor(f"a{k}", "run1", "f88r", "word", word_id, "region", region_id, "overlaps", "m1")
+    return store
+
+
+def test_feature_matrix_from_page_cache(feature_store) -> None:
+    computer = FeatureComputer(feature_store, seed=1)
+    feature_ids = [
+        "spatial_text_density_gradient",
+        "spatial_jar_alignment",
+        "text_inter_jar_similarity",
+        "text_vocabulary_overlap",
+        "temp_token_burst_rate",
+        "temp_repetition_spacing",
+        "var_word_length_variance",
+    ]
+    page = PageProfile(page_id="f88r", jar_count=2)
+    matrix = computer.compute_matrix(
+        feature_ids,
+        [(page, None, False, None), (PageProfile(page_id="missing", jar_count=1), None, False, None)],
+    )
+
+    assert matrix.shape == (2, len(feature_ids))
+    assert matrix[0].tolist() == pytest.approx([
+        (5 - 3) / 8,      # top lines 1+2 words, bottom 3+2
+        (1 + 2) / 4,      # x_min groups {0.0} {0.5}, y_min group of 2
+        1 / 2,            # {daiin, chol} vs {chol}
+        1 / 2 * 1.2,
+        2 / 7,            # daiin daiin, chol chol
+        (1 + 4 + 1 + 3) / 4,
+        (3.0 - 1.0) ** 2 / 2,  # r1 words average 3 glyphs, r2 average 1
+    ])
+    assert all(v != v for v in matrix[1])  # missing page -> NaN
+    assert computer.compute("temp_token_burst_rate", page=page) == matrix[0, 4]
@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+from phase1_foundation.storage.metadata import GlyphAlignmentRecord
+from phase3_synthesis.profile_extractor import PharmaceuticalProfileExtractor
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def pharma_store(store):
+    store.add_dataset("ds1", "/data")
+    store.add_page("f88r", "ds1", "f88r.jpg", "h1", 10, 10)
+    store.add_region("r1", "f88r", "mid", "grid", {"x_min": 0.0, "y_min": 0.0, "x_max": 0.4, "y_max": 0.4})
+    store.add_region("r2", "f88r", "mid", "grid", {"x_min": 0.5, "y_min": 0.0, "x_max": 0.9, "y_max": 0.4})
+    store.add_region("c1", "f88r", "coarse", "grid", {"x_min": 0.0, "y_min": 0.0, "x_max": 1.0, "y_max": 1.0})
+
+    store.add_line("l1", "f88r", 0, {"x_min": 0.0, "y_min": 0.0, "x_max": 1.0, "y_max": 0.2})
+    store.add_word("w1", "l1", 0, {"x_min": 0.0, "y_min": 0.0, "x_max": 0.2, "y_max": 0.2})
+    store.add_word("w2", "l1", 1, {"x_min": 0.6, "y_min": 0.0, "x_max": 0.8, "y_max": 0.2})
+    store.add_word("w3", "l1", 2, {"x_min": 0.8, "y_min": 0.0, "x_max": 0.9, "y_max": 0.2})
+    for glyph_id, word_id, index in [("g2", "w1", 1), ("g1", "w1", 0), ("g3", "w1", 2), ("g4", "w2", 0)]:
+        store.add_glyph_candidate(glyph_id, word_id, index, {"x_min": 0, "y_min": 0, "x_max": 1, "y_max": 1})
+    session = store.Session()
+    session.add_all([
+        GlyphAlignmentRecord(glyph_id="g1", symbol="q"),
+        GlyphAlignmentRecord(glyph_id="g1", symbol="x"),
+        GlyphAlignmentRecord(glyph_id="g2", symbol="o"),
+        GlyphAlignmentRecord(glyph_id="g3", symbol="k"),
+    ])
+    session.commit()
+    session.close()
+
+    for anchor_id, word_id, region_id in [("a1", "w1", "r1"), ("a2", "w2", "r1"), ("a3", "w2", "r2")]:
+        store.add_anchor(anchor_id, "run1", "f88r", "word", word_id, "region", region_id, "overlaps", "m1")
+
+    store.add_transcription_source("src1", "Source 1")
+    store.add_transcription_line("t1", "src1", "f88r", 0, "daiin.chol.daiin.shedy")
+    for i, token in enumerate(["daiin", "chol", "daiin", "shedy"]):
+        store.add_transcription_token(f"t1_{i}", "t1", i, token)
+    return store
+
+
+def test_real_profile_metrics_from_grouped_queries(pharma_store):
+    profile = PharmaceuticalProfileExtractor(pharma_store, seed=42).extract_page_profile("f88r")
+
+    assert profile.jar_count == 2
+    assert profile.total_text_blocks == 1
+    assert profile.total_lines == 1
+    assert profile.total_words == 3
+    assert [jar.word_count for jar in profile.jars] == [2, 1]
+    assert profile.jars[0].bounding_box == pytest.approx((0.0, 0.0, 0.4, 0.4))
+
+    # w1 -> q o k (first alignment wins), w2 -> unaligned placeholder; w3 has no glyphs
+    assert profile.mean_word_length == pytest.approx(2.0)
+    assert profile.positional_entropy == pytest.approx(1 / 3)
+    assert profile.token_repetition_rate == pytest.approx(0.25)
+    distances = [math.hypot(0.1, 0.1), math.hypot(0.5, 0.1), 0.1]
+    assert profile.locality_radius == pytest.approx(sum(distances) / 3 * 10)
+
+
+def test_batch_extraction_matches_single_pages(pharma_store):
+    batch = PharmaceuticalProfileExtractor(pharma_store, seed=42).extract_page_profiles(["f88r", "f89r1"])
+    single = PharmaceuticalProfileExtractor(pharma_store, seed=42)
+
+    assert batch[0] == single.extract_page_profile("f88r")
+    # Missing pages fall back to the seeded simulation, in request order
+    assert batch[1] == single.extract_page_profile("f89r1")
+    assert batch[1].page_id == "f89r1"